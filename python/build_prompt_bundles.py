@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+프롬프트 데이터 번들 빌드 스크립트
+조후/용신 매트릭스, Destiny Code 조언, 물상 데이터베이스, 로케일 문자열을
+mmap용 바이너리 번들로 직렬화합니다 (prompts.data_bundles).
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from prompts.data_bundles import PROMPT_BUNDLE_DIR, build_bundles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프롬프트 데이터 바이너리 번들 빌드")
+    parser.add_argument("--output", type=Path, default=PROMPT_BUNDLE_DIR, help="출력 디렉토리")
+    args = parser.parse_args()
+
+    for name, size in build_bundles(args.output).items():
+        print(f"{name}: {size:,}B")
+    print(f"프롬프트 데이터 번들 빌드 완료: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,19 +2,29 @@
 만세력 계산 API - FastAPI 엔트리포인트
 사주 팔자, 대운, 지장간 계산 서비스 + AI 프롬프트 빌더
 """
+import asyncio
 import logging
 from typing import Dict, List, Any, Optional
 
 # 로거 설정
 logger = logging.getLogger(__name__)
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from schemas.saju import CalculateRequest, CalculateResponse
 from schemas.visualization import VisualizationRequest, VisualizationResponse
-from schemas.prompt import PromptBuildRequest, PromptBuildResponse, PromptMetadata, YearlyPromptBuildRequest, StepPromptRequest
+from schemas.prompt import (
+    PromptBuildRequest,
+    PromptBuildResponse,
+    PromptMetadata,
+    PromptFragmentRef,
+    YearlyPromptBuildRequest,
+    StepPromptRequest,
+    StepBundleRequest,
+    StepBundleResponse,
+)
 from schemas.yearly import (
     YearlyAnalysisRequest,
     YearlyAnalysisStartResponse,
@@ -33,6 +43,7 @@ from schemas.compatibility import (
     CompatibilityAnalysisStatusResponse,
     CompatibilityJobStatus,
 )
+from schemas.jobs import ActiveJob, ActiveJobsResponse
 from schemas.daily import (
     DailyFortuneRequest,
     DailyFortuneStartResponse,
@@ -40,6 +51,7 @@ from schemas.daily import (
 )
 from manseryeok.engine import ManseryeokEngine
 from visualization import SajuVisualizer
+from prompts.fragments import fragment_registry
 from prompts.builder import (
     PromptBuilder,
     PromptBuildRequest as BuilderRequest,
@@ -64,6 +76,7 @@ app = FastAPI(
     version="1.1.0",
 )
 
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -77,6 +90,81 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def warm_prompt_fragments():
+    """시스템 프롬프트 조각 사전 렌더링 (v2.10, 첫 요청 지연 제거)"""
+    from prompts.builder import PROMPT_WARM_LANGUAGES
+    from prompts.data_packs import data_packs
+
+    if not PROMPT_WARM_LANGUAGES:
+        return
+    count = await asyncio.to_thread(PromptBuilder.warm_fragments, PROMPT_WARM_LANGUAGES)
+    stats = data_packs.get_stats()
+    logger.info(
+        f"[Startup] 시스템 프롬프트 조각 {count}개 렌더링 완료 "
+        f"(언어: {','.join(PROMPT_WARM_LANGUAGES)}, 데이터 팩 {len(stats['loaded'])}개, RSS {stats['rss_kb']}KB)"
+    )
+
+
+@app.on_event("startup")
+async def start_job_store_sweeper():
+    """작업 저장소 TTL 정리 루프 시작 (v2.10)"""
+    from services.job_store import start_sweeper
+
+    start_sweeper()
+
+
+@app.on_event("shutdown")
+async def stop_job_store_sweeper():
+    """작업 저장소 정리 루프 중지"""
+    from services.job_store import stop_sweeper
+
+    await stop_sweeper()
+
+
+@app.on_event("startup")
+async def start_job_queue_workers():
+    """영속 작업 큐 워커 시작 (v2.10, 이전 프로세스가 남긴 작업은 임대 만료 후 재개)"""
+    # 서비스 모듈 import 시 작업 종류별 핸들러 등록
+    import services.report_analysis  # noqa: F401
+    import services.yearly_analysis  # noqa: F401
+    import services.compatibility_service  # noqa: F401
+    import services.consultation_service  # noqa: F401
+    import services.reanalyze_service  # noqa: F401
+    from services.job_queue import job_queue
+
+    job_queue.start()
+
+
+@app.on_event("shutdown")
+async def stop_job_queue_workers():
+    """
+    작업 큐 워커 중지 (graceful drain)
+
+    새 작업 임대를 멈추고 실행 중 작업은 JOB_QUEUE_DRAIN_SECONDS까지 완료 대기,
+    남은 작업은 임대 반납 + DB 행을 pending으로 표시 → 다른 프로세스/재시작 후 체크포인트부터 재개
+    """
+    from services.job_queue import job_queue
+
+    await job_queue.stop()
+
+
+@app.on_event("shutdown")
+async def flush_job_status_publishes():
+    """대기 중인 작업 상태 백엔드 기록 실행 (v2.10, 작업 큐 중단 훅의 pending 표시 이후)"""
+    from services.job_store import flush_publishes
+
+    await flush_publishes()
+
+
+@app.on_event("shutdown")
+async def close_supabase_rest_client():
+    """Supabase REST 연결 풀 종료 (v2.10, 작업 큐 중단 훅의 DB 기록 이후)"""
+    from services.supabase_rest import supabase_rest
+
+    await supabase_rest.aclose()
+
+
 @app.post("/api/manseryeok/calculate", response_model=CalculateResponse)
 async def calculate_saju(request: CalculateRequest) -> CalculateResponse:
     """
@@ -116,6 +204,53 @@ async def generate_pillar_image(request: VisualizationRequest) -> VisualizationR
         )
 
 
+def _system_prompt_fields(result, response_mode: str) -> Dict[str, Any]:
+    """
+    시스템 프롬프트 응답 필드 (v2.10)
+
+    reference 모드에서는 본문 대신 조각 참조만 반환합니다.
+    본문은 GET /api/prompts/fragments/{hash}로 한 번만 받아 재사용합니다.
+    """
+    if response_mode != "reference":
+        return {"systemPrompt": result.system_prompt}
+
+    fragment_hash = result.metadata["system_prompt_hash"]
+    fragment = fragment_registry.get_by_hash(fragment_hash)
+    return {
+        "systemPromptRef": PromptFragmentRef(
+            id=fragment.id,
+            hash=fragment_hash,
+            size=len(fragment.text),
+        )
+    }
+
+
+def _step_prompt_response(result, step: str, language: str, response_mode: str) -> PromptBuildResponse:
+    """단계별 프롬프트 빌드 결과 → 응답 모델 (포함 고전 모듈 메타데이터 포함)"""
+    included_modules = ["master"]
+    if step == 'basic':
+        included_modules.extend(["ziping_summary", "qiongtong_summary"])
+    elif step == 'personality':
+        included_modules.append("ten_gods_guide")
+    elif step == 'aptitude':
+        included_modules.append("ziping_summary")
+    elif step == 'fortune':
+        included_modules.extend(["ziping_summary", "qiongtong_summary"])
+
+    return PromptBuildResponse(
+        **_system_prompt_fields(result, response_mode),
+        userPrompt=result.user_prompt,
+        outputSchema=result.output_schema,
+        metadata=PromptMetadata(
+            version=result.metadata.get("version", "1.0.0"),
+            language=result.metadata.get("language", language),
+            includedModules=included_modules,
+            systemPromptHash=result.metadata.get("system_prompt_hash"),
+            generatedAt=result.metadata.get("generated_at", "")
+        )
+    )
+
+
 @app.post("/api/prompts/build", response_model=PromptBuildResponse)
 async def build_prompt(request: PromptBuildRequest) -> PromptBuildResponse:
     """
@@ -156,13 +291,14 @@ async def build_prompt(request: PromptBuildRequest) -> PromptBuildResponse:
 
         # 응답 반환
         return PromptBuildResponse(
-            systemPrompt=result.system_prompt,
+            **_system_prompt_fields(result, request.responseMode),
             userPrompt=result.user_prompt,
             outputSchema=result.output_schema,
             metadata=PromptMetadata(
                 version=result.metadata["version"],
                 language=result.metadata["language"],
                 includedModules=result.metadata["included_modules"],
+                systemPromptHash=result.metadata["system_prompt_hash"],
                 generatedAt=result.metadata["generated_at"]
             )
         )
@@ -173,6 +309,53 @@ async def build_prompt(request: PromptBuildRequest) -> PromptBuildResponse:
         )
 
 
+@app.get("/api/prompts/fragments/{fragment_hash}")
+async def get_prompt_fragment(fragment_hash: str, request: Request) -> Response:
+    """
+    시스템 프롬프트 조각 본문 조회 (v2.10)
+
+    내용 해시로 주소가 정해지므로 변경되지 않습니다 → 장기 immutable 캐시 헤더
+
+    Args:
+        fragment_hash: 조각 내용 해시 (응답 metadata.systemPromptHash)
+
+    Returns:
+        조각 본문 (text/plain)
+    """
+    fragment = fragment_registry.get_by_hash(fragment_hash)
+    if fragment is None:
+        raise HTTPException(status_code=404, detail="프롬프트 조각을 찾을 수 없습니다")
+
+    headers = {
+        "Cache-Control": "public, max-age=31536000, immutable",
+        "ETag": f'"{fragment.hash}"',
+        "X-Fragment-Id": fragment.id,
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=fragment.text, media_type="text/plain; charset=utf-8", headers=headers)
+
+
+@app.get("/api/prompts/stats")
+async def get_prompt_stats() -> dict:
+    """
+    프롬프트 데이터 팩 / 조각 통계 (v2.10)
+
+    Returns:
+        로딩된 데이터 팩별 import 시간(ms) / RSS 증가량(KB), 현재 RSS,
+        데이터 번들별 로딩 방식(mmap/module) / 크기 / 디코딩 횟수,
+        등록 조각 수 / 총 크기 / 재사용 횟수
+    """
+    from prompts.data_packs import data_packs
+    from prompts.data_bundles import get_stats as get_bundle_stats
+
+    return {
+        "data_packs": data_packs.get_stats(),
+        "data_bundles": get_bundle_stats(),
+        "fragments": fragment_registry.get_stats(),
+    }
+
+
 @app.post("/api/prompts/step", response_model=PromptBuildResponse)
 async def build_step_prompt(request: StepPromptRequest) -> PromptBuildResponse:
     """
@@ -217,35 +400,61 @@ async def build_step_prompt(request: StepPromptRequest) -> PromptBuildResponse:
             current_age=request.currentAge,
         )
 
-        # 메타데이터 구성
-        included_modules = ["master"]
-        if request.step == 'basic':
-            included_modules.extend(["ziping_summary", "qiongtong_summary"])
-        elif request.step == 'personality':
-            included_modules.append("ten_gods_guide")
-        elif request.step == 'aptitude':
-            included_modules.append("ziping_summary")
-        elif request.step == 'fortune':
-            included_modules.extend(["ziping_summary", "qiongtong_summary"])
+        return _step_prompt_response(result, request.step, request.language, request.responseMode)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"단계별 프롬프트 빌드 중 오류가 발생했습니다: {str(e)}"
+        )
 
-        # 응답 반환
-        return PromptBuildResponse(
-            systemPrompt=result.system_prompt,
-            userPrompt=result.user_prompt,
-            outputSchema=result.output_schema,
-            metadata=PromptMetadata(
-                version=result.metadata.get("version", "1.0.0"),
-                language=result.metadata.get("language", request.language),
-                includedModules=included_modules,
-                generatedAt=result.metadata.get("generated_at", "")
-            )
+
+@app.post("/api/prompts/steps/bundle", response_model=StepBundleResponse)
+async def build_step_prompt_bundle(request: StepBundleRequest) -> StepBundleResponse:
+    """
+    멀티스텝 전체 단계 프롬프트 일괄 빌드 (v2.10)
+
+    사주/대운/지장간을 한 번만 받아 분석 컨텍스트(십신/상호작용/신살/격국)를 1회 계산하고
+    basic/personality/aptitude/fortune 프롬프트를 한 번에 반환합니다.
+
+    - 시스템 프롬프트: 기본 reference 모드 (GET /api/prompts/fragments/{hash}로 1회 조회 후 재사용)
+    - 이전 단계 결과: userPrompt에 자리표시자(placeholders)로 표시 → basic 결과 값으로 치환 후 사용
+    - tenGodCounts/interactions/sinsals/formation을 보내면 서버 계산값 대신 사용
+
+    Returns:
+        단계별 프롬프트, 자리표시자 목록, 언어, 생성 시각
+    """
+    from prompts.builder import PREVIOUS_RESULT_FIELDS, previous_result_placeholder
+
+    try:
+        results = PromptBuilder.build_step_bundle(
+            pillars=request.pillars,
+            language=request.language,
+            steps=tuple(dict.fromkeys(request.steps)),
+            daewun=request.daewun,
+            jijanggan=request.jijanggan,
+            ten_god_counts=request.tenGodCounts,
+            interactions=request.interactions,
+            sinsals=request.sinsals,
+            formation=request.formation,
+            current_age=request.currentAge,
         )
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"단계별 프롬프트 빌드 중 오류가 발생했습니다: {str(e)}"
+            detail=f"단계 프롬프트 번들 빌드 중 오류가 발생했습니다: {str(e)}"
         )
 
+    steps = {
+        step: _step_prompt_response(result, step, request.language, request.responseMode)
+        for step, result in results.items()
+    }
+    return StepBundleResponse(
+        steps=steps,
+        placeholders=[previous_result_placeholder(path) for path in PREVIOUS_RESULT_FIELDS],
+        language=request.language,
+        generatedAt=next(iter(steps.values())).metadata.generatedAt,
+    )
+
 
 @app.post("/api/prompts/build/yearly", response_model=PromptBuildResponse)
 async def build_yearly_prompt(request: YearlyPromptBuildRequest) -> PromptBuildResponse:
@@ -352,13 +561,14 @@ async def build_yearly_prompt(request: YearlyPromptBuildRequest) -> PromptBuildR
 
         # 응답 반환
         return PromptBuildResponse(
-            systemPrompt=result.system_prompt,
+            **_system_prompt_fields(result, request.responseMode),
             userPrompt=result.user_prompt,
             outputSchema=result.output_schema,
             metadata=PromptMetadata(
                 version=result.metadata["version"],
                 language=result.metadata["language"],
                 includedModules=result.metadata["included_modules"],
+                systemPromptHash=result.metadata["system_prompt_hash"],
                 generatedAt=result.metadata["generated_at"]
             )
         )
@@ -375,6 +585,162 @@ async def health_check():
     return {"status": "healthy", "service": "manseryeok-api", "version": "1.4.0"}
 
 
+@app.get("/api/llm/cache/stats")
+async def get_llm_cache_stats() -> dict:
+    """
+    LLM 응답 캐시 통계
+
+    Returns:
+        항목 수, 적중/미스 횟수, 적중률, 절약된 Gemini 호출 시간 (초), 병합된 호출 수,
+        시스템 프롬프트 컨텍스트 캐시 (등록 핸들 / 재사용 횟수)
+    """
+    from services.llm_cache import get_llm_cache
+    from services.gemini import llm_single_flight, get_gemini_service
+
+    cache = get_llm_cache()
+    stats = cache.get_stats() if cache is not None else {"enabled": False}
+    # 동일 프롬프트 동시 호출 병합 횟수
+    stats["coalesced"] = llm_single_flight.coalesced
+    try:
+        context_cache = get_gemini_service().context_cache
+    except ValueError:
+        context_cache = None
+    stats["context_cache"] = context_cache.get_stats() if context_cache is not None else {"enabled": False}
+    return stats
+
+
+@app.get("/api/llm/latency")
+async def get_llm_latency_stats() -> dict:
+    """
+    Gemini 단계별 지연 시간 + 헤징 + 출력 토큰 통계
+
+    Returns:
+        단계별 p50/p90 (초), 헤징 요청 수 / 비율 / 헤징 승리 횟수,
+        단계별 출력 토큰 p99 / max_output_tokens 상한 / 잘림 횟수
+    """
+    from services.gemini import latency_histogram, hedge_policy, output_budget
+
+    return {
+        "steps": latency_histogram.snapshot(),
+        "hedging": hedge_policy.get_stats(),
+        "output_tokens": output_budget.snapshot(),
+    }
+
+
+def _too_many_requests(rejected) -> HTTPException:
+    """수용 한도 초과 → 429 + Retry-After (v2.10)"""
+    return HTTPException(
+        status_code=429,
+        detail=rejected.reason,
+        headers={"Retry-After": str(rejected.retry_after)},
+    )
+
+
+def _job_stores() -> tuple:
+    """리포트 / 신년 / 궁합 작업 저장소 (v2.10)"""
+    from services.report_analysis import job_store as report_job_store
+    from services.yearly_analysis import job_store as yearly_job_store
+    from services.compatibility_service import compatibility_job_store
+
+    return (report_job_store, yearly_job_store, compatibility_job_store)
+
+
+@app.get("/api/jobs/stats")
+async def get_job_store_stats() -> dict:
+    """
+    작업 저장소 통계 (v2.10)
+
+    Returns:
+        저장소별 (report / yearly / compatibility) 항목 수, 추정 바이트, 상태별 분포,
+        DB 저장 완료 수, 결과 해제 수, 제거 횟수 (ttl / max_age / capacity),
+        작업 큐 종류/상태별 행 수 + 워커 수 + 처리 통계, 수용 제어 통계, 공유 상태 백엔드,
+        Supabase REST 연결 풀 사용 통계, 진행 상태 쓰기 병합 통계, 현재 RSS
+    """
+    from prompts.data_packs import current_rss_kb
+
+    from services.admission import admission_controller
+    from services.job_queue import job_queue
+    from services.progress_writer import progress_writers
+    from services.status_backend import status_backend
+    from services.supabase_rest import supabase_rest
+
+    return {
+        "stores": {store.name: store.get_stats() for store in _job_stores()},
+        "queue": job_queue.get_stats(),
+        "admission": admission_controller.get_stats(),
+        "status_backend": status_backend.get_stats(),
+        "supabase_rest": supabase_rest.get_stats(),
+        "progress_writers": {writer.name: writer.get_stats() for writer in progress_writers},
+        "rss_kb": current_rss_kb(),
+    }
+
+
+@app.get("/api/jobs/active", response_model=ActiveJobsResponse)
+async def list_active_jobs(user_id: str) -> ActiveJobsResponse:
+    """
+    사용자의 진행 중 작업 목록 (v2.10, user_id 색인 조회)
+
+    - **user_id**: 사용자 ID
+
+    Returns:
+        리포트 / 신년 / 궁합 작업 중 종료되지 않은 작업 (생성 순)
+    """
+    jobs = []
+    for store in _job_stores():
+        for job in store.list_active(user_id):
+            status = job["status"]
+            jobs.append(ActiveJob(
+                job_id=job["job_id"],
+                job_type=store.name,
+                status=getattr(status, "value", status),
+                progress_percent=job.get("progress_percent", 0),
+                current_step=job.get("current_step"),
+                report_id=job.get("report_id"),
+                analysis_id=job.get("analysis_id"),
+                created_at=job["created_at"],
+                updated_at=job["updated_at"],
+            ))
+    jobs.sort(key=lambda job: job.created_at)
+    return ActiveJobsResponse(user_id=user_id, jobs=jobs)
+
+
+@app.get("/api/jobs/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    request: Request,
+    user_id: Optional[str] = None,
+    last_event_id: Optional[int] = None,
+):
+    """
+    작업 진행 이벤트 스트림 (v2.10, Server-Sent Events)
+
+    - **job_id**: 리포트 / 신년 / 궁합 작업 ID
+    - **user_id**: 지정 시 작업 소유자와 다르면 404
+    - **last_event_id**: 이어받을 마지막 이벤트 ID (Last-Event-ID 헤더 우선)
+
+    Returns:
+        text/event-stream (snapshot / progress / step / partial / done 이벤트, 주기적 ping)
+    """
+    from fastapi.responses import StreamingResponse
+
+    from services.job_events import find_job_store, job_event_stream
+
+    store = await find_job_store(_job_stores(), job_id)
+    job = await store.fetch(job_id, results=False) if store else None
+    if not job or (user_id and job.get("user_id") != user_id):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+    header_id = request.headers.get("last-event-id", "")
+    if header_id.isdigit():
+        last_event_id = int(header_id)
+
+    return StreamingResponse(
+        job_event_stream(store, job_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # ============================================
 # 신년 분석 API (비동기 작업)
 # ============================================
@@ -397,18 +763,23 @@ async def start_yearly_analysis(request: YearlyAnalysisRequest) -> YearlyAnalysi
     - **profile_id**: 프로필 ID (선택)
 
     Returns:
-        작업 ID, 상태, 메시지
+        작업 ID, 상태, 메시지, 예상 시작 시간
+        (대기 작업 한도 초과 시 429 + Retry-After)
     """
+    from services.admission import AdmissionRejected
     from services.yearly_analysis import yearly_analysis_service
 
     try:
-        job_id = await yearly_analysis_service.start_analysis(request)
+        admission = await yearly_analysis_service.start_analysis(request)
 
         return YearlyAnalysisStartResponse(
-            job_id=job_id,
+            job_id=admission.job_id,
             status=JobStatus.PENDING,
-            message="신년 분석이 시작되었습니다. 상태를 폴링해주세요."
+            message="신년 분석이 시작되었습니다. 상태를 폴링해주세요.",
+            estimated_start_seconds=admission.estimated_start_seconds
         )
+    except AdmissionRejected as e:
+        raise _too_many_requests(e)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -428,7 +799,7 @@ async def get_yearly_analysis_status(job_id: str) -> YearlyAnalysisStatusRespons
     """
     from services.yearly_analysis import yearly_analysis_service
 
-    job = yearly_analysis_service.get_status(job_id)
+    job = await yearly_analysis_service.get_status(job_id)
 
     if not job:
         raise HTTPException(
@@ -516,19 +887,24 @@ async def start_report_analysis(request: ReportAnalysisRequest) -> ReportAnalysi
     - **existing_analysis**: 기존 분석 결과 (재시도용)
 
     Returns:
-        작업 ID, 리포트 ID, 상태, 메시지
+        작업 ID, 리포트 ID, 상태, 메시지, 예상 시작 시간
+        (대기 작업 한도 초과 시 429 + Retry-After)
     """
+    from services.admission import AdmissionRejected
     from services.report_analysis import report_analysis_service
 
     try:
-        job_id = await report_analysis_service.start_analysis(request)
+        admission = await report_analysis_service.start_analysis(request)
 
         return ReportAnalysisStartResponse(
-            job_id=job_id,
+            job_id=admission.job_id,
             report_id=request.report_id,
             status=ReportJobStatus.PENDING,
-            message="리포트 분석이 시작되었습니다. 상태를 폴링해주세요."
+            message="리포트 분석이 시작되었습니다. 상태를 폴링해주세요.",
+            estimated_start_seconds=admission.estimated_start_seconds
         )
+    except AdmissionRejected as e:
+        raise _too_many_requests(e)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -548,7 +924,7 @@ async def get_report_analysis_status(job_id: str) -> ReportAnalysisStatusRespons
     """
     from services.report_analysis import report_analysis_service
 
-    job = report_analysis_service.get_status(job_id)
+    job = await report_analysis_service.get_status(job_id)
 
     if not job:
         raise HTTPException(
@@ -715,16 +1091,21 @@ async def start_consultation_generate(request: dict):
     - **language**: 언어 (ko, en, ja, zh-CN, zh-TW)
 
     Returns:
-        처리 시작 확인
+        처리 시작 확인, 예상 시작 시간
+        (대기 작업 한도 초과 시 429 + Retry-After)
     """
+    from services.admission import AdmissionRejected
     from services.consultation_service import consultation_service
 
     try:
-        await consultation_service.start_generate(request)
+        admission = await consultation_service.start_generate(request)
         return {
             "success": True,
-            "message": "상담 응답 생성이 시작되었습니다."
+            "message": "상담 응답 생성이 시작되었습니다.",
+            "estimated_start_seconds": admission.estimated_start_seconds
         }
+    except AdmissionRejected as e:
+        raise _too_many_requests(e)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -754,19 +1135,24 @@ async def start_compatibility_analysis(request: dict) -> CompatibilityAnalysisSt
     - **user_id**: 사용자 ID
 
     Returns:
-        작업 ID, 상태, 메시지
+        작업 ID, 상태, 메시지, 예상 시작 시간
+        (대기 작업 한도 초과 시 429 + Retry-After)
     """
+    from services.admission import AdmissionRejected
     from services.compatibility_service import compatibility_service
 
     try:
-        job_id = await compatibility_service.start_analysis(request)
+        admission = await compatibility_service.start_analysis(request)
 
         return CompatibilityAnalysisStartResponse(
-            job_id=job_id,
+            job_id=admission.job_id,
             analysis_id=request.get("analysis_id"),
             status=CompatibilityJobStatus.PENDING,
-            message="궁합 분석이 시작되었습니다. 상태를 폴링해주세요."
+            message="궁합 분석이 시작되었습니다. 상태를 폴링해주세요.",
+            estimated_start_seconds=admission.estimated_start_seconds
         )
+    except AdmissionRejected as e:
+        raise _too_many_requests(e)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -787,11 +1173,10 @@ async def get_compatibility_analysis_status(job_id: str) -> CompatibilityAnalysi
     Notes:
         Job Store에 없으면 DB에서 조회 (크래시 복구용)
     """
-    import httpx
-    import os
     from services.compatibility_service import compatibility_service
+    from services.supabase_rest import supabase_rest
 
-    job = compatibility_service.get_status(job_id)
+    job = await compatibility_service.get_status(job_id)
 
     # Job Store에 있으면 그대로 반환
     if job:
@@ -809,36 +1194,28 @@ async def get_compatibility_analysis_status(job_id: str) -> CompatibilityAnalysi
         )
 
     # Job Store에 없으면 DB fallback (서버 재시작 등)
-    SUPABASE_URL = os.getenv("SUPABASE_URL", "")
-    SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
-
-    if SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY:
+    if supabase_rest.configured:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{SUPABASE_URL}/rest/v1/compatibility_analyses?job_id=eq.{job_id}&select=*",
-                    headers={
-                        "apikey": SUPABASE_SERVICE_ROLE_KEY,
-                        "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}",
-                    },
-                    timeout=10.0
+            response = await supabase_rest.get(
+                f"compatibility_analyses?job_id=eq.{job_id}&select=*",
+                timeout=10.0
+            )
+            data = response.json()
+
+            if data and len(data) > 0:
+                analysis = data[0]
+                return CompatibilityAnalysisStatusResponse(
+                    job_id=job_id,
+                    analysis_id=analysis.get("id"),
+                    status=analysis.get("status", "pending"),
+                    progress_percent=analysis.get("progress_percent", 0),
+                    current_step=analysis.get("current_step"),
+                    step_statuses=analysis.get("step_statuses"),
+                    failed_steps=analysis.get("failed_steps", []),
+                    error=analysis.get("error"),
+                    created_at=analysis.get("created_at"),
+                    updated_at=analysis.get("updated_at"),
                 )
-                data = response.json()
-
-                if data and len(data) > 0:
-                    analysis = data[0]
-                    return CompatibilityAnalysisStatusResponse(
-                        job_id=job_id,
-                        analysis_id=analysis.get("id"),
-                        status=analysis.get("status", "pending"),
-                        progress_percent=analysis.get("progress_percent", 0),
-                        current_step=analysis.get("current_step"),
-                        step_statuses=analysis.get("step_statuses"),
-                        failed_steps=analysis.get("failed_steps", []),
-                        error=analysis.get("error"),
-                        created_at=analysis.get("created_at"),
-                        updated_at=analysis.get("updated_at"),
-                    )
         except Exception as e:
             logger.error(f"[Compatibility] DB fallback 조회 실패: {e}")
 
@@ -868,18 +1245,25 @@ async def generate_daily_fortune(request: DailyFortuneRequest) -> DailyFortuneSt
 
     Returns:
         성공 여부, 운세 ID, 상태, 메시지
+        (동시 생성 한도 초과 시 429 + Retry-After)
     """
-    from services.daily_fortune_service import daily_fortune_service
+    from services.admission import AdmissionRejected, admission_controller
+    from services.daily_fortune_service import daily_fortune_key, daily_fortune_service
 
+    # 같은 프로필/날짜 재시도는 하나의 생성으로 병합되므로 한도에 1건으로 집계
+    dedup_key = daily_fortune_key(
+        request.user_id, request.profile_id, request.target_date, request.language
+    )
     try:
-        result = await daily_fortune_service.generate_fortune(
-            user_id=request.user_id,
-            profile_id=request.profile_id,
-            target_date=request.target_date,
-            pillars=request.pillars,
-            daewun=request.daewun,
-            language=request.language
-        )
+        with admission_controller.track("daily", request.user_id, dedup_key):
+            result = await daily_fortune_service.generate_fortune(
+                user_id=request.user_id,
+                profile_id=request.profile_id,
+                target_date=request.target_date,
+                pillars=request.pillars,
+                daewun=request.daewun,
+                language=request.language
+            )
 
         return DailyFortuneStartResponse(
             success=True,
@@ -887,6 +1271,8 @@ async def generate_daily_fortune(request: DailyFortuneRequest) -> DailyFortuneSt
             status="completed",
             message="오늘의 운세 생성이 완료되었습니다."
         )
+    except AdmissionRejected as e:
+        raise _too_many_requests(e)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -910,77 +1296,70 @@ async def get_daily_fortune_status(
     Returns:
         status, progress_percent, step_statuses, error, result(완료시)
     """
-    import os
     import httpx
 
-    SUPABASE_URL = os.getenv("SUPABASE_URL", "")
-    SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
+    from services.supabase_rest import supabase_rest
 
-    if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
+    if not supabase_rest.configured:
         raise HTTPException(status_code=500, detail="Supabase 설정 누락")
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{SUPABASE_URL}/rest/v1/daily_fortunes",
-                params={
-                    "select": "id,status,progress_percent,step_statuses,error,overall_score,summary,career_fortune,wealth_fortune,love_fortune,health_fortune,relationship_fortune,lucky_color,lucky_number,lucky_direction,advice,fortune_date,day_stem,day_branch,day_element",
-                    "user_id": f"eq.{user_id}",
-                    "profile_id": f"eq.{profile_id}",
-                    "fortune_date": f"eq.{date}",
-                    "limit": "1"
-                },
-                headers={
-                    "apikey": SUPABASE_SERVICE_ROLE_KEY,
-                    "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}",
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            if not data:
-                return {
-                    "status": "not_found",
-                    "progress_percent": 0,
-                    "step_statuses": {},
-                    "error": None,
-                    "result": None
-                }
-
-            fortune = data[0]
-            status = fortune.get("status", "pending")
-
-            # 완료된 경우 전체 결과 포함
-            result = None
-            if status == "completed":
-                result = {
-                    "id": fortune.get("id"),
-                    "fortune_date": fortune.get("fortune_date"),
-                    "day_stem": fortune.get("day_stem"),
-                    "day_branch": fortune.get("day_branch"),
-                    "day_element": fortune.get("day_element"),
-                    "overall_score": fortune.get("overall_score"),
-                    "summary": fortune.get("summary"),
-                    "career_fortune": fortune.get("career_fortune"),
-                    "wealth_fortune": fortune.get("wealth_fortune"),
-                    "love_fortune": fortune.get("love_fortune"),
-                    "health_fortune": fortune.get("health_fortune"),
-                    "relationship_fortune": fortune.get("relationship_fortune"),
-                    "lucky_color": fortune.get("lucky_color"),
-                    "lucky_number": fortune.get("lucky_number"),
-                    "lucky_direction": fortune.get("lucky_direction"),
-                    "advice": fortune.get("advice"),
-                }
+        response = await supabase_rest.get(
+            "daily_fortunes",
+            params={
+                "select": "id,status,progress_percent,step_statuses,error,overall_score,summary,career_fortune,wealth_fortune,love_fortune,health_fortune,relationship_fortune,lucky_color,lucky_number,lucky_direction,advice,fortune_date,day_stem,day_branch,day_element",
+                "user_id": f"eq.{user_id}",
+                "profile_id": f"eq.{profile_id}",
+                "fortune_date": f"eq.{date}",
+                "limit": "1"
+            },
+            timeout=10.0
+        )
+        response.raise_for_status()
+        data = response.json()
 
+        if not data:
             return {
-                "status": status,
-                "progress_percent": fortune.get("progress_percent", 0),
-                "step_statuses": fortune.get("step_statuses", {}),
-                "error": fortune.get("error"),
-                "result": result
+                "status": "not_found",
+                "progress_percent": 0,
+                "step_statuses": {},
+                "error": None,
+                "result": None
             }
 
+        fortune = data[0]
+        status = fortune.get("status", "pending")
+
+        # 완료된 경우 전체 결과 포함
+        result = None
+        if status == "completed":
+            result = {
+                "id": fortune.get("id"),
+                "fortune_date": fortune.get("fortune_date"),
+                "day_stem": fortune.get("day_stem"),
+                "day_branch": fortune.get("day_branch"),
+                "day_element": fortune.get("day_element"),
+                "overall_score": fortune.get("overall_score"),
+                "summary": fortune.get("summary"),
+                "career_fortune": fortune.get("career_fortune"),
+                "wealth_fortune": fortune.get("wealth_fortune"),
+                "love_fortune": fortune.get("love_fortune"),
+                "health_fortune": fortune.get("health_fortune"),
+                "relationship_fortune": fortune.get("relationship_fortune"),
+                "lucky_color": fortune.get("lucky_color"),
+                "lucky_number": fortune.get("lucky_number"),
+                "lucky_direction": fortune.get("lucky_direction"),
+                "advice": fortune.get("advice"),
+            }
+
+        return {
+            "status": status,
+            "progress_percent": fortune.get("progress_percent", 0),
+            "step_statuses": fortune.get("step_statuses", {}),
+            "error": fortune.get("error"),
+            "result": result
+        }
+
     except httpx.HTTPError as e:
         raise HTTPException(status_code=500, detail=f"DB 조회 실패: {str(e)}")
 
@@ -0,0 +1,122 @@
+"""
+작업 단위 사주 분석 컨텍스트 (v2.10)
+
+리포트/신년 작업의 각 단계가 십신 분포, 지지 상호작용, 신살, 격국과
+프롬프트용 포맷 블록을 매번 다시 계산하지 않도록 작업 시작 시 한 번만 만들어 공유합니다.
+
+- AnalysisContext.build(): 원국 → 원시 분석 + 언어별 렌더링 블록
+- 생성 후 변경 불가 (frozen dataclass + 읽기 전용 매핑)
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from manseryeok.constants import JIJANGGAN_TABLE
+from manseryeok.formation import determine_formation, formation_to_dict
+from manseryeok.interactions import analyze_pillar_interactions, interactions_to_dict
+from manseryeok.sinsal import analyze_sinsal, sinsals_to_dict
+from manseryeok.ten_gods import extract_ten_gods
+
+from .locale_strings import (
+    format_formation_context,
+    format_interactions_context,
+    format_pillars_table,
+    format_sinsal_context,
+    format_ten_gods_context,
+)
+
+PILLAR_KEYS = ("year", "month", "day", "hour")
+
+# 간단 사주 표기 (신년 단계 프롬프트용)
+PILLAR_BRIEF_NAMES = {
+    'ko': {'year': '연주', 'month': '월주', 'day': '일주', 'hour': '시주'},
+    'en': {'year': 'Year', 'month': 'Month', 'day': 'Day', 'hour': 'Hour'},
+    'ja': {'year': '年柱', 'month': '月柱', 'day': '日柱', 'hour': '時柱'},
+    'zh-CN': {'year': '年柱', 'month': '月柱', 'day': '日柱', 'hour': '时柱'},
+    'zh-TW': {'year': '年柱', 'month': '月柱', 'day': '日柱', 'hour': '時柱'},
+}
+
+
+def extract_jijanggan(pillars: Dict[str, Any]) -> Dict[str, list]:
+    """원국 지지별 지장간"""
+    jijanggan = {}
+    for pillar_name in PILLAR_KEYS:
+        branch = pillars.get(pillar_name, {}).get("branch", "")
+        jijanggan[pillar_name] = list(JIJANGGAN_TABLE.get(branch, [])) if branch else []
+    return jijanggan
+
+
+def format_pillars_brief(pillars: Dict[str, Any], language: str) -> str:
+    """사주 간단 표기 (- 연주: 庚午 형식)"""
+    if not pillars:
+        return "사주 정보 없음"
+    names = PILLAR_BRIEF_NAMES.get(language, PILLAR_BRIEF_NAMES['ko'])
+    lines = []
+    for key in PILLAR_KEYS:
+        pillar = pillars.get(key, {})
+        lines.append(f"- {names[key]}: {pillar.get('stem', '?')}{pillar.get('branch', '?')}")
+    return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class AnalysisContext:
+    """작업 단위 분석 컨텍스트 (불변)"""
+    language: str
+    pillars: Mapping[str, Any]
+    jijanggan: Mapping[str, list]
+    ten_god_counts: Mapping[str, float]
+    formation: Mapping[str, Any]         # formation_to_dict 결과
+    sinsals: Mapping[str, Any]           # sinsals_to_dict 결과
+    interactions: Mapping[str, Any]      # interactions_to_dict 결과
+    blocks: Mapping[str, str]            # 언어별 렌더링 블록
+
+    @classmethod
+    def build(
+        cls,
+        pillars: Dict[str, Any],
+        language: str = 'ko',
+        jijanggan: Optional[Dict[str, list]] = None,
+    ) -> "AnalysisContext":
+        """
+        원국에서 분석 컨텍스트 생성 (작업당 1회)
+
+        Args:
+            pillars: 사주 팔자
+            language: 프롬프트 언어
+            jijanggan: 지장간 (없으면 원국 지지에서 추출)
+        """
+        jijanggan = jijanggan or extract_jijanggan(pillars)
+        ten_god_counts = extract_ten_gods(pillars, jijanggan)
+        formation = formation_to_dict(determine_formation(pillars, jijanggan, ten_god_counts))
+        sinsals = sinsals_to_dict(analyze_sinsal(pillars))
+        interactions = interactions_to_dict(analyze_pillar_interactions(pillars))
+
+        blocks = {
+            "pillars": format_pillars_table(
+                hour=pillars.get('hour', {}),
+                day=pillars.get('day', {}),
+                month=pillars.get('month', {}),
+                year=pillars.get('year', {}),
+                language=language,
+            ),
+            "pillars_brief": format_pillars_brief(pillars, language),
+            "ten_gods": format_ten_gods_context(ten_god_counts, language),
+            "interactions": format_interactions_context(interactions, language),
+            "sinsal": format_sinsal_context(sinsals, language),
+            "formation": format_formation_context(formation, language),
+        }
+
+        return cls(
+            language=language,
+            pillars=MappingProxyType(dict(pillars)),
+            jijanggan=MappingProxyType(jijanggan),
+            ten_god_counts=MappingProxyType(ten_god_counts),
+            formation=MappingProxyType(formation),
+            sinsals=MappingProxyType(sinsals),
+            interactions=MappingProxyType(interactions),
+            blocks=MappingProxyType(blocks),
+        )
+
+    def block(self, name: str) -> str:
+        """렌더링 블록 (없으면 빈 문자열)"""
+        return self.blocks.get(name, "")
@@ -4,14 +4,13 @@
 
 v2.1: locale_strings 모듈로 다국어 문자열 중앙집중화
 """
-from typing import Literal, Optional, Dict, List, Any, TypedDict
+import os
+from itertools import product
+from typing import Literal, Optional, Dict, List, Any, TypedDict, TYPE_CHECKING
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from .master_prompt import MasterPrompt
-from .classics.ziping import ZipingPrompt
-from .classics.qiongtong import QiongtongPrompt
-from .western.destiny_code import DestinyCodePrompt
 from .yearly_prompt import YearlyPrompt
 from .locales import get_locale
 from .schemas import (
@@ -27,12 +26,6 @@ from .classics_summary import (
     get_ten_gods_guide,
     DAY_MASTER_TRAITS,  # Task 2.2: 일간별 특성
 )
-# Task 2.1: 조후 매트릭스
-from .classics.qiongtong_matrix import (
-    JohuEntry,
-    get_johu_entry,
-    build_johu_prompt,
-)
 # v2.1: 로케일 문자열 중앙집중화
 from .locale_strings import (
     get_locale_string,
@@ -49,10 +42,73 @@ from .locale_strings import (
 )
 # Task 5: 점수 계산 및 물상론 통합
 from .mulsangron import generate_event_prediction_template
+# v2.10: 시스템 프롬프트 조각 레지스트리
+from .fragments import PromptFragment, fragment_registry
+# v2.10: 토큰 예산 기반 섹션 조립
+from .token_budget import PromptSection, AssembledPrompt, assemble_sections, estimate_tokens, get_token_budget
+# v2.10: 작업 단위 분석 컨텍스트
+from .analysis_context import AnalysisContext
+# v2.10: 고전/서구 프레임워크 데이터 팩 지연 로딩 (자평진전, 궁통보감, 조후 매트릭스, Destiny Code)
+from .data_packs import data_packs
+
+if TYPE_CHECKING:
+    from .classics.qiongtong_matrix import JohuEntry
 
 
 LocaleType = Literal['ko', 'en', 'ja', 'zh-CN', 'zh-TW']
 
+# 사전 렌더링 대상 언어 / 멀티스텝 단계
+SUPPORTED_LANGUAGES = ('ko', 'en', 'ja', 'zh-CN', 'zh-TW')
+ANALYSIS_STEPS = ('basic', 'personality', 'aptitude', 'fortune')
+
+# v2.10: 단계 번들의 이전 단계 결과 자리표시자 (basic 결과의 같은 경로 값으로 치환)
+PREVIOUS_RESULT_FIELDS = (
+    'basicAnalysis.dayMaster.stem',
+    'basicAnalysis.structure.type',
+    'basicAnalysis.usefulGod.primary',
+)
+
+
+def previous_result_placeholder(path: str) -> str:
+    """이전 단계 결과 자리표시자 (예: {{basicAnalysis.dayMaster.stem}})"""
+    return "{{" + path + "}}"
+
+
+def fill_previous_results(prompt: str, previous_results: Dict[str, Any]) -> str:
+    """
+    자리표시자를 이전 단계 결과 값으로 치환 (값이 없으면 '?')
+
+    Args:
+        prompt: 단계 번들 사용자 프롬프트
+        previous_results: {"basicAnalysis": {...}}
+    """
+    for path in PREVIOUS_RESULT_FIELDS:
+        value: Any = previous_results
+        for key in path.split('.'):
+            value = value.get(key) if isinstance(value, dict) else None
+        prompt = prompt.replace(previous_result_placeholder(path), str(value) if value not in (None, '') else '?')
+    return prompt
+
+
+def _previous_results_placeholders() -> Dict[str, Any]:
+    """PREVIOUS_RESULT_FIELDS → 자리표시자 값을 가진 중첩 dict"""
+    placeholders: Dict[str, Any] = {}
+    for path in PREVIOUS_RESULT_FIELDS:
+        *parents, leaf = path.split('.')
+        node = placeholders
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = previous_result_placeholder(path)
+    return placeholders
+
+# v2.10: 서버 시작 시 사전 렌더링할 언어 (쉼표 구분, all = 전체, 빈 값 = 사전 렌더링 안 함)
+# 나머지 언어는 최초 요청 시 렌더링 → 콜드 스타트 / 워커당 메모리 절감
+_warm_languages_env = os.getenv("PROMPT_WARM_LANGUAGES", "ko").strip()
+PROMPT_WARM_LANGUAGES = (
+    SUPPORTED_LANGUAGES if _warm_languages_env.lower() == "all"
+    else tuple(lang.strip() for lang in _warm_languages_env.split(",") if lang.strip() in SUPPORTED_LANGUAGES)
+)
+
 
 # ============================================
 # 단계별 JSON 스키마 예시 (영문 키 강제)
@@ -286,8 +342,8 @@ class PromptBuilder:
         language = request.language
         options = request.options
 
-        # 시스템 프롬프트 빌드
-        system_prompt = cls._build_system_prompt(
+        # 시스템 프롬프트 (v2.10: 조각 레지스트리에서 참조)
+        system_fragment = cls._system_fragment(
             language=language,
             include_ziping=options.include_ziping,
             include_qiongtong=options.include_qiongtong,
@@ -313,17 +369,89 @@ class PromptBuilder:
             included_modules.append("western")
 
         return PromptBuildResponse(
-            system_prompt=system_prompt,
+            system_prompt=system_fragment.text,
             user_prompt=user_prompt,
             output_schema=OUTPUT_JSON_SCHEMA,
             metadata={
                 "version": cls.VERSION,
                 "language": language,
                 "included_modules": included_modules,
+                "system_prompt_hash": system_fragment.hash,
                 "generated_at": datetime.utcnow().isoformat() + "Z"
             }
         )
 
+    # ============================================
+    # v2.10: 시스템 프롬프트 조각 (한 번 렌더링 후 참조)
+    # ============================================
+
+    @classmethod
+    def _system_fragment(
+        cls,
+        language: LocaleType,
+        include_ziping: bool,
+        include_qiongtong: bool,
+        include_western: bool
+    ) -> PromptFragment:
+        """종합 분석 시스템 프롬프트 조각"""
+        key = ("system", language, include_ziping, include_qiongtong, include_western)
+        return fragment_registry.get_or_render(
+            key,
+            lambda: cls._build_system_prompt(language, include_ziping, include_qiongtong, include_western)
+        )
+
+    @classmethod
+    def _yearly_system_fragment(
+        cls,
+        language: LocaleType,
+        year: int,
+        include_ziping: bool,
+        include_qiongtong: bool,
+        include_western: bool
+    ) -> PromptFragment:
+        """신년 분석 시스템 프롬프트 조각 (연도별)"""
+        key = ("yearly", language, year, include_ziping, include_qiongtong, include_western)
+        return fragment_registry.get_or_render(
+            key,
+            lambda: cls._build_yearly_system_prompt(
+                language, year, include_ziping, include_qiongtong, include_western
+            )
+        )
+
+    @classmethod
+    def _step_system_fragment(
+        cls,
+        step: Literal['basic', 'personality', 'aptitude', 'fortune'],
+        language: LocaleType
+    ) -> PromptFragment:
+        """멀티스텝 단계별 시스템 프롬프트 조각"""
+        key = ("step", language, step)
+        return fragment_registry.get_or_render(
+            key,
+            lambda: cls._build_step_system_prompt(step, language)
+        )
+
+    @classmethod
+    def warm_fragments(cls, languages: Optional[tuple] = None) -> int:
+        """
+        시스템 프롬프트 조각 사전 렌더링 (서버 시작 시)
+
+        (언어 × 모듈 옵션) 종합 분석 + (언어 × 단계) 멀티스텝 조합을 모두 렌더링합니다.
+        신년 분석은 연도별이므로 최초 사용 시 렌더링합니다.
+
+        Args:
+            languages: 렌더링할 언어 (None이면 지원 언어 전체)
+
+        Returns:
+            등록된 조각 수
+        """
+        for language in (SUPPORTED_LANGUAGES if languages is None else languages):
+            for flags in product((True, False), repeat=3):
+                cls._system_fragment(language, *flags)
+            for step in ANALYSIS_STEPS:
+                cls._step_system_fragment(step, language)
+        return len(fragment_registry)
+
     @classmethod
     def _build_system_prompt(
         cls,
@@ -344,17 +472,17 @@ class PromptBuilder:
         # 2. 자평진전 (용신/격국/십신/합충) - 다국어 지원
         if include_ziping:
             parts.append("\n\n---\n")
-            parts.append(ZipingPrompt.build(normalized_lang))
+            parts.append(data_packs.attr("classics.ziping", "ZipingPrompt").build(normalized_lang))
 
         # 3. 궁통보감 (조후론) - 다국어 지원
         if include_qiongtong:
             parts.append("\n\n---\n")
-            parts.append(QiongtongPrompt.build(normalized_lang))
+            parts.append(data_packs.attr("classics.qiongtong", "QiongtongPrompt").build(normalized_lang))
 
         # 4. 서구권 프레임워크 (모든 언어에 적용)
         if include_western:
             parts.append("\n\n---\n")
-            parts.append(DestinyCodePrompt.build(language))
+            parts.append(data_packs.attr("western.destiny_code", "DestinyCodePrompt").build(language))
 
         # 5. 로케일별 스타일 가이드
         locale = get_locale(language)
@@ -447,8 +575,8 @@ class PromptBuilder:
         year = request.year
         options = request.options
 
-        # 시스템 프롬프트 빌드
-        system_prompt = cls._build_yearly_system_prompt(
+        # 시스템 프롬프트 (v2.10: 조각 레지스트리에서 참조)
+        system_fragment = cls._yearly_system_fragment(
             language=language,
             year=year,
             include_ziping=options.include_ziping,
@@ -476,7 +604,7 @@ class PromptBuilder:
             included_modules.append("western")
 
         return PromptBuildResponse(
-            system_prompt=system_prompt,
+            system_prompt=system_fragment.text,
             user_prompt=user_prompt,
             output_schema=YEARLY_OUTPUT_JSON_SCHEMA,
             metadata={
@@ -485,6 +613,7 @@ class PromptBuilder:
                 "year": year,
                 "language": language,
                 "included_modules": included_modules,
+                "system_prompt_hash": system_fragment.hash,
                 "generated_at": datetime.utcnow().isoformat() + "Z"
             }
         )
@@ -510,17 +639,17 @@ class PromptBuilder:
         # 2. 자평진전 (용신/격국/십신/합충)
         if include_ziping:
             parts.append("\n\n---\n")
-            parts.append(ZipingPrompt.build(normalized_lang))
+            parts.append(data_packs.attr("classics.ziping", "ZipingPrompt").build(normalized_lang))
 
         # 3. 궁통보감 (조후론)
         if include_qiongtong:
             parts.append("\n\n---\n")
-            parts.append(QiongtongPrompt.build(normalized_lang))
+            parts.append(data_packs.attr("classics.qiongtong", "QiongtongPrompt").build(normalized_lang))
 
         # 4. 서구권 프레임워크
         if include_western:
             parts.append("\n\n---\n")
-            parts.append(DestinyCodePrompt.build(language))
+            parts.append(data_packs.attr("western.destiny_code", "DestinyCodePrompt").build(language))
 
         # 5. 신년 분석 전용 프롬프트
         parts.append("\n\n---\n")
@@ -596,6 +725,8 @@ class PromptBuilder:
         sinsals: Optional[List[Dict[str, Any]]] = None,
         formation: Optional[Dict[str, Any]] = None,
         current_age: Optional[int] = None,
+        # v2.10: 작업 단위 분석 컨텍스트 (사전 렌더링 블록 재사용)
+        analysis_context: Optional[AnalysisContext] = None,
     ) -> PromptBuildResponse:
         """
         멀티스텝 파이프라인용 단계별 프롬프트 빌드
@@ -612,15 +743,16 @@ class PromptBuilder:
             sinsals: v3.0 신살 (analyze_sinsal 결과)
             formation: v3.0 격국 (determine_formation 결과 → dict)
             current_age: v3.0 현재 나이 (대운 하이라이트용)
+            analysis_context: v2.10 작업 단위 분석 컨텍스트 (개별 인자가 없으면 렌더링 블록 사용)
 
         Returns:
             PromptBuildResponse: 단계별 프롬프트
         """
-        # 시스템 프롬프트 빌드
-        system_prompt = cls._build_step_system_prompt(step, language)
+        # 시스템 프롬프트 (v2.10: 조각 레지스트리에서 참조)
+        system_fragment = cls._step_system_fragment(step, language)
 
-        # 사용자 프롬프트 빌드
-        user_prompt = cls._build_step_user_prompt(
+        # 사용자 프롬프트 빌드 (v2.10: 단계별 토큰 예산 내 조립)
+        assembled = cls._assemble_step_user_prompt(
             step=step,
             pillars=pillars,
             daewun=daewun,
@@ -633,13 +765,15 @@ class PromptBuilder:
             sinsals=sinsals,
             formation=formation,
             current_age=current_age,
+            analysis_context=analysis_context,
         )
+        user_prompt = assembled.text()
 
         # 단계별 출력 스키마
         output_schema = cls._get_step_output_schema(step)
 
         return PromptBuildResponse(
-            system_prompt=system_prompt,
+            system_prompt=system_fragment.text,
             user_prompt=user_prompt,
             output_schema=output_schema,
             metadata={
@@ -647,10 +781,62 @@ class PromptBuilder:
                 "type": "step",
                 "step": step,
                 "language": language,
+                "system_prompt_hash": system_fragment.hash,
+                "token_budget": {
+                    **assembled.report(),
+                    "system_tokens": estimate_tokens(system_fragment.text),
+                },
                 "generated_at": datetime.utcnow().isoformat() + "Z"
             }
         )
 
+    @classmethod
+    def build_step_bundle(
+        cls,
+        pillars: Dict[str, Any],
+        language: LocaleType = 'ko',
+        steps: tuple = ANALYSIS_STEPS,
+        daewun: Optional[List[Dict[str, Any]]] = None,
+        jijanggan: Optional[Dict[str, List[str]]] = None,
+        ten_god_counts: Optional[Dict[str, float]] = None,
+        interactions: Optional[List[Dict[str, Any]]] = None,
+        sinsals: Optional[List[Dict[str, Any]]] = None,
+        formation: Optional[Dict[str, Any]] = None,
+        current_age: Optional[int] = None,
+        analysis_context: Optional[AnalysisContext] = None,
+    ) -> Dict[str, PromptBuildResponse]:
+        """
+        멀티스텝 전체 단계 프롬프트 일괄 빌드 (v2.10)
+
+        사주를 한 번만 받아 분석 컨텍스트(십신/상호작용/신살/격국 + 렌더링 블록)를 1회 계산하고
+        단계별로 build_step()을 호출합니다. basic 이후 단계의 이전 단계 결과는 아직 없으므로
+        자리표시자({{basicAnalysis.dayMaster.stem}} 등)로 채우고, 호출자가 fill_previous_results()로 치환합니다.
+
+        Returns:
+            단계 → PromptBuildResponse (steps 순서)
+        """
+        if analysis_context is None or analysis_context.language != language:
+            analysis_context = AnalysisContext.build(pillars, language, jijanggan)
+        placeholders = _previous_results_placeholders()
+
+        return {
+            step: cls.build_step(
+                step=step,
+                pillars=pillars,
+                language=language,
+                daewun=daewun,
+                jijanggan=jijanggan,
+                previous_results=None if step == 'basic' else placeholders,
+                ten_god_counts=ten_god_counts,
+                interactions=interactions,
+                sinsals=sinsals,
+                formation=formation,
+                current_age=current_age,
+                analysis_context=analysis_context,
+            )
+            for step in steps
+        }
+
     @classmethod
     def _build_step_system_prompt(
         cls,
@@ -2022,54 +2208,104 @@ Please respond according to the JSON schema.""",
         v3.0 업데이트:
         - personality/aptitude/fortune 단계에서 십신/상호작용/신살/격국 컨텍스트 삽입
         - 대운에 십신 관계 표시 + 현재/다음 대운 하이라이트
+
+        v2.10: 단계별 토큰 예산 내 조립 (_assemble_step_user_prompt)
         """
-        parts = []
+        return cls._assemble_step_user_prompt(
+            step, pillars, daewun, jijanggan, previous_results, language,
+            ten_god_counts=ten_god_counts,
+            interactions=interactions,
+            sinsals=sinsals,
+            formation=formation,
+            current_age=current_age,
+        ).text()
 
-        # 사주 정보
-        parts.append(cls._format_pillars(pillars, language))
+    @classmethod
+    def _assemble_step_user_prompt(
+        cls,
+        step: Literal['basic', 'personality', 'aptitude', 'fortune'],
+        pillars: Dict[str, Any],
+        daewun: Optional[List[Dict[str, Any]]],
+        jijanggan: Optional[Dict[str, List[str]]],
+        previous_results: Optional[Dict[str, Any]],
+        language: LocaleType,
+        ten_god_counts: Optional[Dict[str, float]] = None,
+        interactions: Optional[List[Dict[str, Any]]] = None,
+        sinsals: Optional[List[Dict[str, Any]]] = None,
+        formation: Optional[Dict[str, Any]] = None,
+        current_age: Optional[int] = None,
+        analysis_context: Optional[AnalysisContext] = None,
+        budget: Optional[int] = None,
+    ) -> AssembledPrompt:
+        """
+        단계별 사용자 프롬프트 섹션 조립 (v2.10)
+
+        섹션 우선순위 (높을수록 유지): 사주/분석 요청 (필수) > 격국 > 십신 분포 >
+        대운 (초과 시 십신 관계 없는 목록으로 요약) > 지지 상호작용 > 이전 단계 결과 > 지장간 > 신살
+
+        Args:
+            analysis_context: 작업 단위 분석 컨텍스트 (같은 언어면 렌더링 블록 재사용)
+            budget: 토큰 예산 (없으면 단계별 기본값)
+        """
+        shared = analysis_context if analysis_context and analysis_context.language == language else None
+
+        def context_block(name: str, value: Any, formatter) -> str:
+            # 개별 인자 우선, 없으면 작업 컨텍스트의 사전 렌더링 블록
+            if value:
+                return formatter(value, language)
+            return shared.block(name) if shared else ""
+
+        pillars_block = shared.block("pillars") if shared else cls._format_pillars(pillars, language)
+        sections = [PromptSection("pillars", pillars_block, required=True)]
+        context_step = step in ('personality', 'aptitude', 'fortune')
 
         # v3.0: 대운 정보 (십신 관계 포함, 성격/적성/재물 단계에서)
         if daewun:
-            if step in ('personality', 'aptitude', 'fortune') and current_age is not None:
+            plain_daewun = cls._format_daewun(daewun, language)
+            if context_step and current_age is not None:
                 day_master = pillars.get('day', {}).get('stem', '?')
-                parts.append(format_daewun_with_relation(
-                    daewun, day_master, current_age, language
+                sections.append(PromptSection(
+                    "daewun",
+                    format_daewun_with_relation(daewun, day_master, current_age, language),
+                    priority=60,
+                    summary=plain_daewun,
                 ))
             else:
-                parts.append(cls._format_daewun(daewun, language))
+                sections.append(PromptSection("daewun", plain_daewun, priority=60))
 
         # 지장간 정보 (있으면)
         if jijanggan:
-            parts.append(cls._format_jijanggan(jijanggan, language))
+            sections.append(PromptSection("jijanggan", cls._format_jijanggan(jijanggan, language), priority=40))
 
         # v3.0: 분석 컨텍스트 삽입 (성격/적성/재물 단계)
-        if step in ('personality', 'aptitude', 'fortune'):
-            # 격국 정보
-            if formation:
-                parts.append(format_formation_context(formation, language))
-
-            # 십신 분포
-            if ten_god_counts:
-                parts.append(format_ten_gods_context(ten_god_counts, language))
-
-            # 지지 상호작용
-            if interactions:
-                parts.append(format_interactions_context(interactions, language))
-
-            # 신살
-            if sinsals:
-                parts.append(format_sinsal_context(sinsals, language))
+        if context_step:
+            sections.extend([
+                PromptSection("formation", context_block("formation", formation, format_formation_context), priority=80),
+                PromptSection("ten_gods", context_block("ten_gods", ten_god_counts, format_ten_gods_context), priority=70),
+                PromptSection("interactions", context_block("interactions", interactions, format_interactions_context), priority=50),
+                PromptSection("sinsal", context_block("sinsal", sinsals, format_sinsal_context), priority=30),
+            ])
 
         # 이전 단계 결과 (컨텍스트)
         if previous_results:
-            parts.append(cls._format_previous_results(previous_results, step, language))
+            sections.append(PromptSection(
+                "previous_results",
+                cls._format_previous_results(previous_results, step, language),
+                priority=45,
+            ))
 
         # 분석 요청 (locale_strings 사용)
         label = get_step_label(step, language)
-        parts.append(get_locale_string('step_request_header', language, label=label))
-        parts.append(get_locale_string('step_request_instruction', language, label=label))
+        sections.append(PromptSection(
+            "request",
+            "\n".join([
+                get_locale_string('step_request_header', language, label=label),
+                get_locale_string('step_request_instruction', language, label=label),
+            ]),
+            required=True,
+        ))
 
-        return "\n".join(parts)
+        return assemble_sections(sections, budget if budget is not None else get_token_budget(step))
 
     @classmethod
     def _format_jijanggan(cls, jijanggan: Dict[str, List[str]], language: LocaleType) -> str:
@@ -2225,7 +2461,7 @@ STEP_CLASSIC_MAP: Dict[str, List[str]] = {
 
 # 2.1.3: 일간별 조후 필터링 함수
 def build_filtered_johu_prompt(
-    johu_entry: JohuEntry,
+    johu_entry: "JohuEntry",
     language: str
 ) -> str:
     """
@@ -2239,7 +2475,7 @@ def build_filtered_johu_prompt(
     Returns:
         필터링된 조후 프롬프트 문자열
     """
-    return build_johu_prompt(johu_entry, language)
+    return data_packs.attr("classics.qiongtong_matrix", "build_johu_prompt")(johu_entry, language)
 
 
 # 2.1.2: 동적 시스템 프롬프트 빌드 함수
@@ -2278,7 +2514,7 @@ def build_system_prompt_v3(
             parts.append(get_ziping_summary(normalized_lang))
         elif classic == 'qiongtong_johu':
             # 일간별 조후 필터링 (해당 월령만)
-            johu_entry = get_johu_entry(day_master, month_branch)
+            johu_entry = data_packs.attr("classics.qiongtong_matrix", "get_johu_entry")(day_master, month_branch)
             if johu_entry:
                 parts.append("\n\n---\n")
                 parts.append(build_filtered_johu_prompt(johu_entry, normalized_lang))
@@ -2538,7 +2774,7 @@ def analyze_johu_feasibility(
         JohuFeasibility 객체
     """
     # 1. 궁통보감에서 조후 필요 오행 조회
-    johu_entry = get_johu_entry(day_master, month_branch)
+    johu_entry = data_packs.attr("classics.qiongtong_matrix", "get_johu_entry")(day_master, month_branch)
 
     if not johu_entry:
         # 조후 정보가 없는 경우 기본값 반환
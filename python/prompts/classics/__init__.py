@@ -1,40 +1,38 @@
 """
 명리학 고전 프롬프트 모듈
 자평진전(子平真詮), 궁통보감(窮通寶鑑) 핵심 원리
+
+v2.10: 고전 데이터 팩은 심볼 최초 접근 시 해당 모듈만 지연 로딩 (prompts.data_packs)
 """
-from .ziping import ZipingPrompt
-from .qiongtong import QiongtongPrompt
-from .qiongtong_matrix import (
-    JOHU_MATRIX,
-    JohuEntry,
-    get_johu_entry,
-    build_johu_prompt,
-)
-from .ziping_yongsin import (
-    YONGSIN_MATRIX,
-    YONGSIN_PRINCIPLES,
-    YongsinEntry,
-    get_yongsin_entry,
-    build_yongsin_prompt,
-    get_all_formations,
-    get_yongsin_summary,
-)
+from ..data_packs import data_packs
 
-__all__ = [
+# 심볼 → 데이터 팩 모듈
+_LAZY_EXPORTS = {
     # 자평진전
-    "ZipingPrompt",
+    "ZipingPrompt": "classics.ziping",
     # 궁통보감 조후
-    "QiongtongPrompt",
-    "JOHU_MATRIX",
-    "JohuEntry",
-    "get_johu_entry",
-    "build_johu_prompt",
+    "QiongtongPrompt": "classics.qiongtong",
+    "JOHU_MATRIX": "classics.qiongtong_matrix",
+    "JohuEntry": "classics.qiongtong_matrix",
+    "get_johu_entry": "classics.qiongtong_matrix",
+    "build_johu_prompt": "classics.qiongtong_matrix",
     # 자평진전 용신 5원칙
-    "YONGSIN_MATRIX",
-    "YONGSIN_PRINCIPLES",
-    "YongsinEntry",
-    "get_yongsin_entry",
-    "build_yongsin_prompt",
-    "get_all_formations",
-    "get_yongsin_summary",
-]
+    "YONGSIN_MATRIX": "classics.ziping_yongsin",
+    "YONGSIN_PRINCIPLES": "classics.ziping_yongsin",
+    "YongsinEntry": "classics.ziping_yongsin",
+    "get_yongsin_entry": "classics.ziping_yongsin",
+    "build_yongsin_prompt": "classics.ziping_yongsin",
+    "get_all_formations": "classics.ziping_yongsin",
+    "get_yongsin_summary": "classics.ziping_yongsin",
+}
+
+
+def __getattr__(name: str):
+    """고전 심볼 지연 import (기존 import 경로 호환)"""
+    pack = _LAZY_EXPORTS.get(name)
+    if pack is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return data_packs.attr(pack, name)
+
+
+__all__ = list(_LAZY_EXPORTS)
@@ -0,0 +1,234 @@
+"""
+궁합 분석용 십신별 물상론(物象論) 원본 데이터
+
+v2.10: compatibility_prompts에서 분리. 런타임에는 빌드된 바이너리 번들(prompts.data_bundles)을 우선 사용하고
+번들이 없거나 원본이 바뀌었을 때만 이 모듈을 import합니다.
+"""
+
+# ============================================================
+# 십신별 물상론 (MUSANG_DATABASE)
+# ============================================================
+# 각 십신이 길할 때/흉할 때 나타나는 구체적 사건/상황
+
+MUSANG_DATABASE = {
+    '비견': {
+        '길': {
+            'events': [
+                '친구와 동업하여 성공',
+                '형제/자매와 협력하여 문제 해결',
+                '동료와 함께 프로젝트 완수',
+                '같은 뜻을 가진 사람을 만나 동지가 됨',
+            ],
+            'relationship': '서로 대등한 관계에서 시너지가 발생함',
+            'advice': '함께 할 때 더 강해지는 관계',
+        },
+        '흉': {
+            'events': [
+                '재산을 두고 형제간 다툼',
+                '친구에게 배신당함',
+                '동업자와 이익 분배로 갈등',
+                '경쟁자로 인해 기회를 잃음',
+            ],
+            'relationship': '서로 경쟁하며 소모적 관계가 됨',
+            'advice': '역할 분담과 경계를 명확히 해야 함',
+        },
+    },
+    '겁재': {
+        '길': {
+            'events': [
+                '강력한 추진력으로 목표 달성',
+                '위기 상황에서 과감한 결단',
+                '투자에서 대박',
+                '새로운 도전에서 승리',
+            ],
+            'relationship': '서로의 야망을 자극하며 성장',
+            'advice': '열정을 공유할 때 폭발적 에너지',
+        },
+        '흉': {
+            'events': [
+                '충동적 결정으로 손해',
+                '투기성 투자 실패',
+                '다툼으로 인한 관계 파탄',
+                '강압적 태도로 주변 이탈',
+            ],
+            'relationship': '서로 상처 주는 관계가 될 수 있음',
+            'advice': '감정 조절과 인내심이 필요',
+        },
+    },
+    '식신': {
+        '길': {
+            'events': [
+                '취미 생활로 스트레스 해소',
+                '맛집 탐방, 여행으로 행복',
+                '창작 활동에서 인정받음',
+                '아이디어로 문제 해결',
+            ],
+            'relationship': '함께 있으면 즐겁고 편안함',
+            'advice': '서로의 취향을 공유하며 행복 증가',
+        },
+        '흉': {
+            'events': [
+                '과식, 과음으로 건강 문제',
+                '낭비벽으로 경제적 어려움',
+                '쾌락 추구로 책임 회피',
+                '게으름으로 기회 상실',
+            ],
+            'relationship': '서로 타락시키는 관계가 될 수 있음',
+            'advice': '절제와 균형이 필요',
+        },
+    },
+    '상관': {
+        '길': {
+            'events': [
+                '창의적 아이디어로 주목받음',
+                '솔직한 표현으로 오해 해소',
+                '전문 기술로 인정받음',
+                '혁신적 방법으로 문제 해결',
+            ],
+            'relationship': '서로에게 영감을 주는 관계',
+            'advice': '창의성을 응원해주면 시너지 발생',
+        },
+        '흉': {
+            'events': [
+                '직설적 발언으로 관계 악화',
+                '상사/윗사람과 충돌',
+                '규칙 무시로 불이익',
+                '지나친 자기 표현으로 따돌림',
+            ],
+            'relationship': '서로 비판하며 갈등 증폭',
+            'advice': '말하기 전에 한 번 더 생각',
+        },
+    },
+    '편재': {
+        '길': {
+            'events': [
+                '사업에서 큰 수익',
+                '부동산 투자 성공',
+                '새로운 재테크 발견',
+                '폭넓은 인맥으로 기회 획득',
+            ],
+            'relationship': '함께 부를 쌓아가는 동반자',
+            'advice': '재물에 대한 가치관 공유 중요',
+        },
+        '흉': {
+            'events': [
+                '투기 실패로 큰 손실',
+                '보증으로 인한 피해',
+                '사기를 당함',
+                '돈 문제로 관계 파탄',
+            ],
+            'relationship': '재물로 인한 갈등 가능성',
+            'advice': '투자는 신중하게, 보증은 피해야',
+        },
+    },
+    '정재': {
+        '길': {
+            'events': [
+                '안정적 수입 확보',
+                '저축으로 목돈 마련',
+                '꾸준한 노력으로 승진',
+                '신뢰받는 직원으로 인정',
+            ],
+            'relationship': '안정적이고 신뢰할 수 있는 관계',
+            'advice': '함께 미래를 계획하기 좋은 파트너',
+        },
+        '흉': {
+            'events': [
+                '고정관념에 갇혀 기회 놓침',
+                '지나친 절약으로 삶의 질 저하',
+                '융통성 부족으로 갈등',
+                '변화 거부로 도태',
+            ],
+            'relationship': '너무 보수적이면 답답해질 수 있음',
+            'advice': '때로는 모험도 필요',
+        },
+    },
+    '편관': {
+        '길': {
+            'events': [
+                '강력한 리더십으로 조직 이끔',
+                '위기 상황에서 냉철한 판단',
+                '규율로 질서 확립',
+                '책임감으로 신뢰 획득',
+            ],
+            'relationship': '서로에게 든든한 버팀목',
+            'advice': '명확한 역할 분담이 관계에 도움',
+        },
+        '흉': {
+            'events': [
+                '권위적 태도로 반발',
+                '강압으로 관계 악화',
+                '스트레스로 건강 문제',
+                '완벽주의로 번아웃',
+            ],
+            'relationship': '지배-피지배 관계가 될 위험',
+            'advice': '통제보다 존중이 필요',
+        },
+    },
+    '정관': {
+        '길': {
+            'events': [
+                '공무원/대기업 취업 성공',
+                '법적 분쟁에서 승리',
+                '사회적 명예 획득',
+                '원칙을 지켜 존경받음',
+            ],
+            'relationship': '서로 존중하는 성숙한 관계',
+            'advice': '정정당당함이 신뢰의 기반',
+        },
+        '흉': {
+            'events': [
+                '법적 문제에 휘말림',
+                '융통성 없어 기회 놓침',
+                '지나친 규칙으로 갈등',
+                '권위에 눌려 위축',
+            ],
+            'relationship': '격식에 얽매여 진정한 소통 어려움',
+            'advice': '규칙보다 마음이 먼저',
+        },
+    },
+    '편인': {
+        '길': {
+            'events': [
+                '독창적 아이디어로 성공',
+                '특이한 분야에서 전문가',
+                '영적/철학적 깨달음',
+                '비주류 취미로 행복',
+            ],
+            'relationship': '서로의 독특함을 인정하는 관계',
+            'advice': '평범하지 않아도 괜찮아',
+        },
+        '흉': {
+            'events': [
+                '현실과 동떨어진 생각',
+                '고립되어 외로움',
+                '의심으로 관계 악화',
+                '불안정한 정신 상태',
+            ],
+            'relationship': '서로를 이해하기 어려울 수 있음',
+            'advice': '현실 감각을 잃지 말아야',
+        },
+    },
+    '정인': {
+        '길': {
+            'events': [
+                '학업에서 좋은 성적',
+                '자격증 취득 성공',
+                '어머니/스승의 도움',
+                '문서운/계약운 상승',
+            ],
+            'relationship': '서로 성장시키는 관계',
+            'advice': '함께 배우고 발전하면 좋음',
+        },
+        '흉': {
+            'events': [
+                '과보호로 자립 어려움',
+                '이론만 앞서고 실행 부족',
+                '문서/계약 문제',
+                '생각이 많아 우유부단',
+            ],
+            'relationship': '한쪽이 너무 의존할 수 있음',
+            'advice': '독립심과 실행력을 키워야',
+        },
+    },
+}
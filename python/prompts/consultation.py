@@ -4,6 +4,8 @@ v2.1: LoA 용어 제거, 자연스러운 긍정적 조언으로 개선
 """
 from typing import List, Dict, Optional
 
+from .token_budget import PromptSection, assemble_sections, get_token_budget
+
 
 def build_assessment_prompt(
     question: str,
@@ -394,6 +396,13 @@ JSONのみで応答してください。""",
     return prompts.get(language, prompts["ko"])
 
 
+def _truncate(text: Optional[str], limit: int) -> Optional[str]:
+    """요약용 앞부분 자르기 (limit 이하면 None → 요약 불필요)"""
+    if not text or len(text) <= limit:
+        return None
+    return text[:limit] + "..."
+
+
 def build_answer_prompt(
     question: str,
     pillars: dict,
@@ -448,6 +457,7 @@ def build_answer_prompt(
             '壬': '(바다/큰물의 기운)', '癸': '(이슬/샘물의 기운)'
         }
         daewun_items = []
+        current_index = None
         for d in daewun[:8]:
             age = d.get("age", "")
             end_age = d.get("endAge", d.get("end_age", ""))
@@ -457,13 +467,22 @@ def build_answer_prompt(
             desc = d.get("description", "")[:30] if d.get("description") else ""
             is_current = d.get("isCurrent", d.get("is_current", False))
             current_marker = " ← 현재 대운" if is_current else ""
+            if is_current:
+                current_index = len(daewun_items)
             daewun_items.append(f"- {age}~{end_age}세: {stem}{branch} {metaphor} - {desc}...{current_marker}")
         daewun_formatted = "\n".join(daewun_items)
+        # 예산 초과 시 현재 대운 전후만 유지
+        if current_index is not None:
+            daewun_summary = "\n".join(daewun_items[max(0, current_index - 1):current_index + 2])
+        else:
+            daewun_summary = "\n".join(daewun_items[:3])
     else:
         daewun_formatted = "(대운 정보 없음)"
+        daewun_summary = None
 
     # 명확화 응답 포맷
     clarification_formatted = ""
+    clarification_summary = None
     if clarification_responses:
         clarification_items = []
         for c in clarification_responses:
@@ -473,11 +492,13 @@ def build_answer_prompt(
                 f"사용자: {c.get('user_answer', '')}"
             )
         clarification_formatted = "\n\n".join(clarification_items)
+        clarification_summary = "\n\n".join(clarification_items[-2:])
     else:
         clarification_formatted = "(없음)"
 
     # 최근 상담 포맷
     recent_formatted = ""
+    recent_summary = None
     if recent_consultations:
         recent_items = []
         for c in recent_consultations:
@@ -486,6 +507,7 @@ def build_answer_prompt(
                 f"- 요약: {c.get('summary', '')}"
             )
         recent_formatted = "\n\n".join(recent_items)
+        recent_summary = "\n\n".join(recent_items[:2])
     else:
         recent_formatted = "(없음)"
 
@@ -496,6 +518,21 @@ def build_answer_prompt(
         target_year = yearly_summary.get('year', '')
         yearly_info = yearly_summary.get('summary', '')
 
+    # v2.10: 컨텍스트 블록 토큰 예산 조립 (우선순위 낮은 블록부터 요약/제외)
+    # 명확화 응답 > 기본 분석 요약 > 대운 > 신년 운세 > 최근 상담
+    assembled = assemble_sections([
+        PromptSection("clarifications", clarification_formatted, priority=90, summary=clarification_summary),
+        PromptSection("analysis_summary", analysis_summary or "", priority=70, summary=_truncate(analysis_summary, 300)),
+        PromptSection("daewun", daewun_formatted, priority=60, summary=daewun_summary),
+        PromptSection("yearly", yearly_info, priority=50, summary=_truncate(yearly_info, 300)),
+        PromptSection("recent_consultations", recent_formatted, priority=30, summary=recent_summary),
+    ], get_token_budget('consultation_answer'))
+    clarification_formatted = assembled.get("clarifications", "(없음)")
+    analysis_summary = assembled.get("analysis_summary") or None
+    daewun_formatted = assembled.get("daewun", "(대운 정보 없음)")
+    yearly_info = assembled.get("yearly")
+    recent_formatted = assembled.get("recent_consultations", "(없음)")
+
     prompts = {
         "ko": f"""# Role
 
@@ -4,6 +4,8 @@ Gemini AI용 프롬프트 생성
 """
 from typing import Dict, Any, List, Optional
 
+from .token_budget import PromptSection, assemble_sections, get_token_budget
+
 # 다국어 페르소나 (v2.0: 운명의 조율사 + 서사적 문체 가이드)
 PERSONA = {
     'ko': """# 운명의 조율사
@@ -315,7 +317,7 @@ class DailyFortunePrompts:
         analysis_guide = cls._get_analysis_guide(language)
 
         # 고전 명리학 분석 섹션 (Task 7-15)
-        classical_section = cls._build_classical_section(
+        classical_sections = cls._build_classical_sections(
             language=language,
             pillars=pillars,
             day_stem=day_stem,
@@ -332,8 +334,26 @@ class DailyFortunePrompts:
             mulsangron_info=mulsangron_info,
         )
 
-        # v3.0: 상담 기록 컨텍스트
-        consultation_context = cls._build_consultation_context(recent_consultations, language)
+        # v3.0: 상담 기록 컨텍스트 (v2.10: 예산 초과 시 최근 3건으로 요약)
+        consultation_section = PromptSection(
+            "consultations",
+            cls._build_consultation_context(recent_consultations, language),
+            priority=20,
+            summary=cls._build_consultation_context(recent_consultations, language, limit=3),
+        )
+
+        # v2.10: 토큰 예산 내 조립 (우선순위 낮은 섹션부터 요약/제외)
+        assembled = assemble_sections(
+            [*classical_sections, consultation_section],
+            get_token_budget('daily_fortune'),
+        )
+        classical_parts = [
+            section.text for section in assembled.sections if section.name != "consultations"
+        ]
+        classical_section = (
+            '\n'.join([cls._classical_header(language), *classical_parts]) if classical_parts else ''
+        )
+        consultation_context = assembled.get("consultations")
 
         # v3.0: LoA 가이드
         loa_guide = cls._get_loa_wisdom_guide(language)
@@ -406,7 +426,7 @@ class DailyFortunePrompts:
         return prompt
 
     @classmethod
-    def _build_classical_section(
+    def _build_classical_sections(
         cls,
         language: str,
         pillars: Dict[str, Any],
@@ -422,19 +442,14 @@ class DailyFortunePrompts:
         shinssal_info: Dict[str, Any] = None,
         johu_tuning_info: Dict[str, Any] = None,
         mulsangron_info: Dict[str, Any] = None,
-    ) -> str:
-        """고전 명리학 분석 섹션 빌드 (Task 7-15)"""
-        sections = []
+    ) -> List[PromptSection]:
+        """
+        고전 명리학 분석 섹션 빌드 (Task 7-15)
 
-        # 섹션 헤더 (다국어)
-        headers = {
-            'ko': '## 고전 명리학 분석 (자동 계산됨 - 분석에 반영하세요)',
-            'en': '## Classical BaZi Analysis (Auto-calculated - Reflect in analysis)',
-            'ja': '## 古典命理学分析 (自動計算済み - 分析に反映してください)',
-            'zh-CN': '## 古典命理学分析 (自动计算 - 请反映在分析中)',
-            'zh-TW': '## 古典命理學分析 (自動計算 - 請反映在分析中)',
-        }
-        sections.append(headers.get(language, headers['ko']))
+        v2.10: 토큰 예산 조립용 섹션 목록 반환 (헤더 제외)
+        우선순위: 용신 > 복음/반음 > 12운성 > 조후 > 삼합/방합 > 형/파/해 > 12신살 > 조후 튜닝 > 물상론
+        """
+        sections: List[PromptSection] = []
 
         # Task 7: 12운성
         if wunseong_info and wunseong_info.get('wunseong'):
@@ -450,12 +465,12 @@ class DailyFortunePrompts:
                 'zh-CN': '### 十二运星分析',
                 'zh-TW': '### 十二運星分析',
             }
-            sections.append(f"""
+            sections.append(PromptSection("wunseong", f"""
 {wunseong_titles.get(language, wunseong_titles['ko'])}
 - 일간({natal_day_stem})이 당일 지지({day_branch})에서: **{wunseong}**
 - 에너지 상태: {description}
 - 기본 점수 보정: {score_bonus:+d}점
-""")
+""", priority=80))
 
         # Task 8: 복음/반음
         if timing_info and (timing_info.get('fuyin') or timing_info.get('fanyin')):
@@ -469,12 +484,12 @@ class DailyFortunePrompts:
                 'zh-CN': '### 伏吟/反吟检测 (特别注意)',
                 'zh-TW': '### 伏吟/反吟檢測 (特別注意)',
             }
-            sections.append(f"""
+            sections.append(PromptSection("timing", f"""
 {timing_titles.get(language, timing_titles['ko'])}
 {timing_msg}
 - 점수 변동 배수: ×{modifier}
 - 이 정보를 분석에 반영하여 특별한 주의사항을 강조하세요.
-""")
+""", priority=85))
 
         # Task 9: 조후용신
         if johu_info and johu_info.get('month_branch'):
@@ -491,13 +506,13 @@ class DailyFortunePrompts:
                 'zh-CN': '### 调候分析 - 穷通宝鉴',
                 'zh-TW': '### 調候分析 - 窮通寶鑑',
             }
-            sections.append(f"""
+            sections.append(PromptSection("johu", f"""
 {johu_titles.get(language, johu_titles['ko'])}
 - 월령({month_branch}): {season_feature}
 - 필요한 천간: {needed_stems}
 - 당일 천간({day_stem}): {match_status}
 {f'- {advice}' if advice else ''}
-""")
+""", priority=70))
 
         # Task 10: 삼합/방합
         if combination_info and (combination_info.get('samhap_formed') or
@@ -521,13 +536,13 @@ class DailyFortunePrompts:
             }
             affected_area = element_area_map.get('ko', {}).get(affected, affected)
 
-            sections.append(f"""
+            sections.append(PromptSection("combination", f"""
 {combo_titles.get(language, combo_titles['ko'])}
 {combo_msg}
 - 영향 오행: {affected}
 - 점수 보너스: +{score_bonus}점
 - **{affected_area}** 영역의 점수를 높게 평가하세요.
-""")
+""", priority=65))
 
         # Task 11: 용신
         if useful_god:
@@ -540,12 +555,12 @@ class DailyFortunePrompts:
                 'zh-CN': '### 个人用神信息',
                 'zh-TW': '### 個人用神信息',
             }
-            sections.append(f"""
+            sections.append(PromptSection("useful_god", f"""
 {god_titles.get(language, god_titles['ko'])}
 - 용신 오행: {useful_god}
 - 당일 천간({day_stem}) 오행: {STEM_ELEMENT.get(day_stem, '')} {match_msg}
 - 행운 정보(색상/방향/숫자)를 용신 기반으로 개인화하여 제시하세요.
-""")
+""", priority=90))
 
         # Task 12: 형/파/해/원진
         if negative_interactions_info:
@@ -575,13 +590,13 @@ class DailyFortunePrompts:
                 if wonjin_list:
                     neg_details.append(f"원진(元辰) {len(wonjin_list)}건")
 
-                sections.append(f"""
+                sections.append(PromptSection("negative_interactions", f"""
 {neg_titles.get(language, neg_titles['ko'])}
 - 감지된 상호작용: {', '.join(neg_details)}
 - 점수 감점: {total_penalty}점
 - {neg_msg}
 - 이 부정적 상호작용을 분석에 반영하여 주의사항을 강조하세요.
-""")
+""", priority=60))
 
         # Task 13: 12신살
         if shinssal_info and shinssal_info.get('detected'):
@@ -604,13 +619,13 @@ class DailyFortunePrompts:
                 score = d.get('score', 0)
                 shinssal_details.append(f"{name}({is_fav}, {score:+d}점)")
 
-            sections.append(f"""
+            sections.append(PromptSection("shinssal", f"""
 {shinssal_titles.get(language, shinssal_titles['ko'])}
 - 감지된 신살: {', '.join(shinssal_details)}
 - 총 점수 보정: {total_bonus:+d}점
 - {shinssal_msg}
 - 이 신살의 특성을 분석에 반영하세요.
-""")
+""", priority=50))
 
         # Task 15: 조후 튜닝 워드
         if johu_tuning_info and johu_tuning_info.get('climate'):
@@ -631,13 +646,13 @@ class DailyFortunePrompts:
             climate_name = climate_names.get(climate, climate)
             solved_str = "해결됨 (+12점)" if is_solved else "미해결"
 
-            sections.append(f"""
+            sections.append(PromptSection("johu_tuning", f"""
 {tuning_titles.get(language, tuning_titles['ko'])}
 - 현재 기후: {climate}({climate_name})
 - 당일 천간으로 조후 {solved_str}
 - {tuning_msg}
 - 이 기후 특성을 분석 톤에 반영하세요.
-""")
+""", priority=40))
 
         # Task 14: 물상론
         if mulsangron_info and mulsangron_info.get('ten_god'):
@@ -660,7 +675,7 @@ class DailyFortunePrompts:
             unfav_str = ', '.join(unfavorable[:5]) if unfavorable else '없음'
             people_str = ', '.join(people[:3]) if people else '없음'
 
-            sections.append(f"""
+            sections.append(PromptSection("mulsangron", f"""
 {mul_titles.get(language, mul_titles['ko'])}
 - 당일 십신: **{ten_god}** ({ten_god_hanja})
 - 십신 관계: {relationship}
@@ -668,9 +683,21 @@ class DailyFortunePrompts:
 - 흉 사건 키워드: {unfav_str}
 - 관련 인물: {people_str}
 - 이 물상론 키워드를 분석에 자연스럽게 녹여내세요.
-""")
+""", priority=35))
+
+        return sections
 
-        return '\n'.join(sections) if len(sections) > 1 else ''
+    @classmethod
+    def _classical_header(cls, language: str) -> str:
+        """고전 명리학 분석 섹션 헤더 (다국어)"""
+        headers = {
+            'ko': '## 고전 명리학 분석 (자동 계산됨 - 분석에 반영하세요)',
+            'en': '## Classical BaZi Analysis (Auto-calculated - Reflect in analysis)',
+            'ja': '## 古典命理学分析 (自動計算済み - 分析に反映してください)',
+            'zh-CN': '## 古典命理学分析 (自动计算 - 请反映在分析中)',
+            'zh-TW': '## 古典命理學分析 (自動計算 - 請反映在分析中)',
+        }
+        return headers.get(language, headers['ko'])
 
     @classmethod
     def _format_pillars(cls, pillars: Dict[str, Any], language: str) -> str:
@@ -773,9 +800,10 @@ class DailyFortunePrompts:
     def _build_consultation_context(
         cls,
         recent_consultations: List[Dict[str, str]],
-        language: str
+        language: str,
+        limit: int = 10
     ) -> str:
-        """최근 상담 기록을 프롬프트 컨텍스트로 변환 (v3.0)"""
+        """최근 상담 기록을 프롬프트 컨텍스트로 변환 (v3.0, limit: 최대 상담 수)"""
         if not recent_consultations:
             return ""
 
@@ -805,9 +833,9 @@ class DailyFortunePrompts:
 - loaWisdom: 針對諮詢中暴露的煩惱提供積極心態和精神智慧""",
         }
 
-        # 상담 기록 포맷 (최대 10개)
+        # 상담 기록 포맷 (최대 limit개)
         formatted_consultations = []
-        for c in recent_consultations[:10]:
+        for c in recent_consultations[:limit]:
             date = c.get('date', '')
             question = c.get('question', '(제목 없음)')
             summary = c.get('summary', '')[:150]
@@ -0,0 +1,288 @@
+"""
+프롬프트 데이터 바이너리 번들 (v2.10)
+
+조후 매트릭스, 용신 매트릭스, Destiny Code 조언, 물상 데이터베이스, 로케일 문자열은
+파이썬 리터럴이라 import 시 파싱/컴파일 후 워커마다 dict/dataclass 수천 개를 새로 만듭니다.
+빌드 단계에서 항목별 JSON을 색인된 바이너리 번들로 직렬화하고,
+런타임에는 파일을 mmap으로 열어 접근한 항목만 디코딩합니다 (fork된 워커는 페이지 공유).
+
+- 빌드: python build_prompt_bundles.py [--output DIR]  (Dockerfile에서 실행)
+- 번들 형식: MAGIC(8) + 헤더 길이(u32 LE) + 헤더 JSON(메타 + 색인) + 항목 JSON 연속 영역
+- 원본 데이터 모듈 해시가 헤더와 다르면(번들 재빌드 누락) 원본 모듈로 폴백
+- bundled_table(name, decode): 번들(중첩 Mapping 뷰) 또는 원본 테이블 반환
+"""
+import dataclasses
+import hashlib
+import importlib.util
+import json
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .data_packs import PACKAGE, data_packs
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_MAGIC = b"FTPBNDL1"
+BUNDLE_HEADER = struct.Struct("<8sI")
+BUNDLE_FORMAT_VERSION = 1
+# 중첩 키 구분자 (데이터 키에 쓰이지 않는 제어 문자)
+KEY_SEPARATOR = "\x1f"
+
+PROMPT_DATA_BUNDLES_ENABLED = os.getenv("PROMPT_DATA_BUNDLES", "true").lower() in ("1", "true", "yes")
+PROMPT_BUNDLE_DIR = Path(os.getenv("PROMPT_BUNDLE_DIR", str(Path(__file__).parent / "bundles")))
+
+
+@dataclass(frozen=True)
+class BundleSource:
+    """번들 원본 (prompts 기준 데이터 모듈 + 테이블 이름 + 중첩 깊이)"""
+    module: str
+    attribute: str
+    depth: int
+
+
+BUNDLE_SOURCES: Dict[str, BundleSource] = {
+    "johu_matrix": BundleSource("classics.qiongtong_matrix_data", "JOHU_MATRIX", 2),
+    "yongsin_matrix": BundleSource("classics.ziping_yongsin_data", "YONGSIN_MATRIX", 2),
+    "destiny_advice": BundleSource("western.destiny_code_data", "DESTINY_ADVICE_DB", 2),
+    "musang_database": BundleSource("compatibility_data", "MUSANG_DATABASE", 1),
+    "locale_strings": BundleSource("locale_strings_data", "LOCALE_STRINGS", 1),
+}
+
+
+def source_hash(source: BundleSource) -> str:
+    """원본 데이터 모듈 파일 해시 (번들 신선도 확인용, import 없이 계산)"""
+    spec = importlib.util.find_spec(f"{PACKAGE}.{source.module}")
+    return hashlib.sha256(Path(spec.origin).read_bytes()).hexdigest()
+
+
+def _encode(value: Any) -> Any:
+    """dataclass → dict (나머지는 그대로)"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return value
+
+
+def _flatten(table: Dict[str, Any], depth: int, prefix: str = "") -> Iterator[tuple]:
+    """중첩 테이블 → (구분자 결합 키, 항목)"""
+    for key, value in table.items():
+        if depth == 1:
+            yield prefix + key, value
+        else:
+            yield from _flatten(value, depth - 1, prefix + key + KEY_SEPARATOR)
+
+
+def write_bundle(path: Path, name: str, table: Dict[str, Any], depth: int, digest: str) -> int:
+    """
+    테이블을 바이너리 번들로 직렬화
+
+    Returns:
+        번들 크기 (바이트)
+    """
+    index: Dict[str, List[int]] = {}
+    chunks: List[bytes] = []
+    offset = 0
+    for key, value in _flatten(table, depth):
+        payload = json.dumps(_encode(value), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        index[key] = [offset, len(payload)]
+        chunks.append(payload)
+        offset += len(payload)
+
+    header = json.dumps({
+        "name": name,
+        "version": BUNDLE_FORMAT_VERSION,
+        "source_hash": digest,
+        "depth": depth,
+        "index": index,
+    }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, len(header)))
+        f.write(header)
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+    return BUNDLE_HEADER.size + len(header) + offset
+
+
+class PromptDataBundle:
+    """mmap 기반 번들 리더 (색인만 파싱, 항목은 접근 시 디코딩)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, header_length = BUNDLE_HEADER.unpack_from(self._mmap, 0)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"번들 형식 아님: {path}")
+        header = json.loads(self._mmap[BUNDLE_HEADER.size:BUNDLE_HEADER.size + header_length])
+        if header.get("version") != BUNDLE_FORMAT_VERSION:
+            raise ValueError(f"번들 버전 불일치: {header.get('version')}")
+
+        self.name: str = header["name"]
+        self.source_hash: str = header["source_hash"]
+        self.depth: int = header["depth"]
+        self._index: Dict[str, List[int]] = header["index"]
+        self._data_start = BUNDLE_HEADER.size + header_length
+        self.decoded = 0
+
+    def keys(self) -> List[str]:
+        return list(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def read(self, key: str) -> Any:
+        """항목 디코딩 (없으면 KeyError)"""
+        offset, length = self._index[key]
+        start = self._data_start + offset
+        self.decoded += 1
+        return json.loads(self._mmap[start:start + length])
+
+    @property
+    def size(self) -> int:
+        return len(self._mmap)
+
+
+class BundleMapping(Mapping):
+    """
+    번들의 읽기 전용 중첩 Mapping 뷰
+
+    원본 테이블과 같은 방식(table[a][b], .get(), .keys())으로 조회하며,
+    마지막 단계 항목은 접근할 때마다 디코딩 후 decode()로 변환합니다.
+    """
+
+    def __init__(
+        self,
+        bundle: PromptDataBundle,
+        decode: Optional[Callable[[Any], Any]] = None,
+        prefix: str = "",
+        depth: Optional[int] = None,
+    ):
+        self._bundle = bundle
+        self._decode = decode
+        self._prefix = prefix
+        self._depth = bundle.depth if depth is None else depth
+        self._children: Optional[List[str]] = None
+        self._views: Dict[str, "BundleMapping"] = {}
+
+    def _child_keys(self) -> List[str]:
+        if self._children is None:
+            seen: Dict[str, None] = {}
+            for key in self._bundle.keys():
+                if key.startswith(self._prefix):
+                    seen.setdefault(key[len(self._prefix):].split(KEY_SEPARATOR, 1)[0], None)
+            self._children = list(seen)
+        return self._children
+
+    def __getitem__(self, key: str) -> Any:
+        if self._depth == 1:
+            value = self._bundle.read(self._prefix + key)
+            return self._decode(value) if self._decode else value
+
+        view = self._views.get(key)
+        if view is None:
+            if key not in self._child_keys():
+                raise KeyError(key)
+            view = BundleMapping(self._bundle, self._decode, self._prefix + key + KEY_SEPARATOR, self._depth - 1)
+            self._views[key] = view
+        return view
+
+    def __contains__(self, key: object) -> bool:
+        if self._depth == 1:
+            return isinstance(key, str) and (self._prefix + key) in self._bundle
+        return key in self._child_keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._child_keys())
+
+    def __len__(self) -> int:
+        return len(self._child_keys())
+
+
+def open_bundle(name: str, bundle_dir: Optional[Path] = None) -> Optional[PromptDataBundle]:
+    """
+    번들 열기
+
+    Returns:
+        PromptDataBundle (비활성화 / 파일 없음 / 형식 오류 / 원본 변경 시 None)
+    """
+    if not PROMPT_DATA_BUNDLES_ENABLED:
+        return None
+    path = (bundle_dir or PROMPT_BUNDLE_DIR) / f"{name}.bin"
+    if not path.exists():
+        return None
+    try:
+        bundle = PromptDataBundle(path)
+    except (OSError, ValueError, struct.error) as e:
+        logger.warning(f"[DataBundle] {name} 번들 열기 실패, 원본 모듈 사용: {e}")
+        return None
+    if bundle.source_hash != source_hash(BUNDLE_SOURCES[name]):
+        logger.warning(f"[DataBundle] {name} 번들이 원본과 다름 (재빌드 필요), 원본 모듈 사용")
+        return None
+    return bundle
+
+
+# name → BundleMapping 또는 원본 테이블 (프로세스 전역)
+_tables: Dict[str, Mapping] = {}
+_bundles: Dict[str, PromptDataBundle] = {}
+
+
+def bundled_table(name: str, decode: Optional[Callable[[Any], Any]] = None) -> Mapping:
+    """
+    데이터 테이블 반환 (최초 호출 시 번들 mmap, 없으면 원본 데이터 모듈 import)
+
+    Args:
+        name: BUNDLE_SOURCES 키
+        decode: 번들 항목(dict) → 원본 타입 변환 (예: JohuEntry(**data))
+    """
+    table = _tables.get(name)
+    if table is None:
+        bundle = open_bundle(name)
+        if bundle is not None:
+            _bundles[name] = bundle
+            table = BundleMapping(bundle, decode)
+            logger.info(f"[DataBundle] {name} 번들 mmap ({bundle.size}B, 항목 {len(bundle.keys())}개)")
+        else:
+            source = BUNDLE_SOURCES[name]
+            table = data_packs.attr(source.module, source.attribute)
+        _tables[name] = table
+    return table
+
+
+def get_stats() -> Dict[str, Any]:
+    """번들별 로딩 방식 / 크기 / 디코딩 횟수"""
+    stats = {}
+    for name in BUNDLE_SOURCES:
+        bundle = _bundles.get(name)
+        if bundle is not None:
+            stats[name] = {"mode": "mmap", "size_bytes": bundle.size, "entries": len(bundle.keys()), "decoded": bundle.decoded}
+        elif name in _tables:
+            stats[name] = {"mode": "module"}
+        else:
+            stats[name] = {"mode": "unloaded"}
+    return stats
+
+
+def build_bundles(output_dir: Optional[Path] = None) -> Dict[str, int]:
+    """
+    모든 번들 빌드 (원본 데이터 모듈 import → 직렬화)
+
+    Returns:
+        번들 이름 → 크기 (바이트)
+    """
+    output_dir = output_dir or PROMPT_BUNDLE_DIR
+    sizes = {}
+    for name, source in BUNDLE_SOURCES.items():
+        table = data_packs.attr(source.module, source.attribute)
+        sizes[name] = write_bundle(output_dir / f"{name}.bin", name, table, source.depth, source_hash(source))
+    return sizes
+
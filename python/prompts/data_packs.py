@@ -0,0 +1,118 @@
+"""
+프롬프트 데이터 팩 지연 로딩 (v2.10)
+
+고전 원문/매트릭스(궁통보감 조후 120조합, 자평진전 용신 등)와 언어별 로케일 모듈은
+크기가 커서 서버 시작 시 모두 import하면 콜드 스타트와 워커당 메모리가 늘어납니다.
+실제로 필요한 시점에 모듈 단위로 한 번만 import하고, import 시간과 RSS 증가량을 기록합니다.
+
+- data_packs.load("classics.qiongtong_matrix"): prompts 패키지 기준 상대 모듈 로딩
+- data_packs.attr(pack, name): 팩 내부 심볼 조회
+- get_stats(): 로딩된 팩별 import 시간(ms) / RSS 증가량(KB) + 현재 RSS
+"""
+import importlib
+import logging
+import resource
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+PACKAGE = __name__.rsplit(".", 1)[0]
+
+# 언어별 로케일 팩 (language → (모듈, 클래스))
+LOCALE_PACKS: Dict[str, tuple] = {
+    'ko': ("locales.ko", "KoreanLocale"),
+    'en': ("locales.en", "EnglishLocale"),
+    'ja': ("locales.ja", "JapaneseLocale"),
+    'zh-CN': ("locales.zh_cn", "ChineseSimplifiedLocale"),
+    'zh-TW': ("locales.zh_tw", "ChineseTraditionalLocale"),
+}
+
+
+def current_rss_kb() -> int:
+    """현재 프로세스 RSS (KB, /proc 미지원 시 최대 RSS로 대체)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() // 1024
+    except (OSError, ValueError, IndexError):
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 바이트 단위
+        return max_rss // 1024 if sys.platform == "darwin" else max_rss
+
+
+class DataPackLoader:
+    """프롬프트 데이터 팩 로더 (프로세스 전역, 팩당 1회 import)"""
+
+    def __init__(self, package: str = PACKAGE):
+        self.package = package
+        self._modules: Dict[str, ModuleType] = {}
+        # pack → {"import_ms", "rss_delta_kb"}
+        self._metrics: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.RLock()
+
+    def load(self, pack: str) -> ModuleType:
+        """
+        데이터 팩 모듈 반환 (최초 호출 시 import + 계측)
+
+        Args:
+            pack: prompts 패키지 기준 모듈 경로 (예: classics.qiongtong_matrix)
+        """
+        module = self._modules.get(pack)
+        if module is not None:
+            return module
+
+        with self._lock:
+            module = self._modules.get(pack)
+            if module is not None:
+                return module
+
+            full_name = f"{self.package}.{pack}"
+            already_imported = full_name in sys.modules
+            rss_before = current_rss_kb()
+            started = time.perf_counter()
+            module = importlib.import_module(full_name)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            # 다른 경로로 이미 import된 모듈은 비용 0으로 기록
+            self._metrics[pack] = {
+                "import_ms": 0.0 if already_imported else round(elapsed_ms, 2),
+                "rss_delta_kb": 0 if already_imported else max(current_rss_kb() - rss_before, 0),
+            }
+            self._modules[pack] = module
+            if not already_imported:
+                logger.info(
+                    f"[DataPack] {pack} 로딩 ({elapsed_ms:.1f}ms, "
+                    f"+{self._metrics[pack]['rss_delta_kb']}KB)"
+                )
+        return module
+
+    def attr(self, pack: str, name: str) -> Any:
+        """팩 내부 심볼 조회"""
+        return getattr(self.load(pack), name)
+
+    def locale(self, language: str) -> Any:
+        """언어별 로케일 클래스 (해당 언어 팩만 로딩, 미지원 언어는 한국어)"""
+        if language == 'zh':
+            language = 'zh-CN'
+        pack, class_name = LOCALE_PACKS.get(language, LOCALE_PACKS['ko'])
+        return self.attr(pack, class_name)
+
+    def is_loaded(self, pack: str) -> bool:
+        return pack in self._modules
+
+    def get_stats(self) -> Dict[str, Any]:
+        """로딩된 팩 / import 시간 / RSS 증가량"""
+        return {
+            "loaded": sorted(self._modules),
+            "packs": {pack: dict(metrics) for pack, metrics in self._metrics.items()},
+            "total_import_ms": round(sum(m["import_ms"] for m in self._metrics.values()), 2),
+            "rss_kb": current_rss_kb(),
+        }
+
+
+# 프로세스 전역 로더 (싱글톤)
+data_packs = DataPackLoader()
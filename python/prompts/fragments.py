@@ -0,0 +1,95 @@
+"""
+프롬프트 조각(fragment) 레지스트리
+
+시스템 프롬프트(마스터 + 고전 + 스타일 가이드 + 스키마 설명)는
+(언어 × 모듈 옵션 × 단계) 조합별로 항상 같은 문자열이므로
+한 번만 렌더링하고 이후 요청에서는 같은 객체를 참조로 재사용합니다.
+
+- PromptFragment: 렌더링된 불변 조각 (텍스트 + 내용 해시)
+- FragmentRegistry: 키 → 조각 (최초 사용 시 렌더링, 이후 재사용)
+- 내용 해시는 응답 metadata에 포함되어 클라이언트/캐시가 조각을 식별할 수 있음
+- 참조 응답 모드에서는 본문 대신 (ID, 해시)만 반환 → /api/prompts/fragments/{hash}로 1회 조회
+"""
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 메타데이터용 해시 길이 (sha256 hex 앞부분)
+FRAGMENT_HASH_LENGTH = 16
+
+
+def content_hash(text: str) -> str:
+    """조각 내용 해시 (sha256 hex 앞 16자)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:FRAGMENT_HASH_LENGTH]
+
+
+@dataclass(frozen=True)
+class PromptFragment:
+    """렌더링된 프롬프트 조각 (불변)"""
+    key: Tuple[Hashable, ...]   # (종류, 언어, 옵션...)
+    text: str                   # 렌더링 결과
+    hash: str                   # 내용 해시
+
+    @property
+    def id(self) -> str:
+        """사람이 읽을 수 있는 조각 ID (예: step:ko:basic, system:en:1:1:0)"""
+        return ":".join(str(int(part)) if isinstance(part, bool) else str(part) for part in self.key)
+
+
+class FragmentRegistry:
+    """프롬프트 조각 레지스트리 (프로세스 전역, 추가만 가능)"""
+
+    def __init__(self):
+        self._by_key: Dict[Tuple[Hashable, ...], PromptFragment] = {}
+        self._by_hash: Dict[str, PromptFragment] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.renders = 0
+
+    def get_or_render(self, key: Tuple[Hashable, ...], render: Callable[[], str]) -> PromptFragment:
+        """
+        등록된 조각 반환 (없으면 render()로 한 번 렌더링 후 등록)
+
+        Args:
+            key: 조각 키 (종류 + 언어 + 옵션)
+            render: 조각 텍스트 생성 함수
+        """
+        fragment = self._by_key.get(key)
+        if fragment is not None:
+            self.hits += 1
+            return fragment
+
+        # 렌더링은 락 밖에서 (동시 렌더링 시 먼저 등록된 쪽 사용)
+        text = render()
+        with self._lock:
+            fragment = self._by_key.get(key)
+            if fragment is None:
+                fragment = PromptFragment(key=key, text=text, hash=content_hash(text))
+                self._by_key[key] = fragment
+                self._by_hash.setdefault(fragment.hash, fragment)
+                self.renders += 1
+        return fragment
+
+    def get_by_hash(self, fragment_hash: str) -> Optional[PromptFragment]:
+        """내용 해시로 조각 조회"""
+        return self._by_hash.get(fragment_hash)
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """등록 조각 수 / 총 크기 / 재사용 횟수"""
+        return {
+            "fragments": len(self._by_key),
+            "total_chars": sum(len(f.text) for f in self._by_key.values()),
+            "renders": self.renders,
+            "hits": self.hits,
+        }
+
+
+# 프로세스 전역 레지스트리 (싱글톤)
+fragment_registry = FragmentRegistry()
@@ -1,25 +1,17 @@
 """
 언어별 프롬프트 로케일
 ko: 한국어, en: 영어, ja: 일본어, zh-CN: 간체중국어, zh-TW: 번체중국어
+
+v2.10: 언어별 모듈은 get_locale() 최초 호출 시 해당 언어만 지연 로딩 (prompts.data_packs)
 """
 from typing import Literal
 
-from .ko import KoreanLocale
-from .en import EnglishLocale
-from .ja import JapaneseLocale
-from .zh_cn import ChineseSimplifiedLocale
-from .zh_tw import ChineseTraditionalLocale
+from ..data_packs import LOCALE_PACKS, data_packs
 
 LocaleType = Literal['ko', 'en', 'ja', 'zh-CN', 'zh-TW']
 
-LOCALES = {
-    'ko': KoreanLocale,
-    'en': EnglishLocale,
-    'ja': JapaneseLocale,
-    'zh-CN': ChineseSimplifiedLocale,
-    'zh-TW': ChineseTraditionalLocale,
-    'zh': ChineseSimplifiedLocale,  # 레거시 호환: zh → zh-CN
-}
+# 클래스 이름 → 언어 코드 (지연 import용)
+_LOCALE_CLASSES = {class_name: language for language, (_, class_name) in LOCALE_PACKS.items()}
 
 
 def get_locale(language: str):
@@ -31,10 +23,18 @@ def get_locale(language: str):
     Returns:
         해당 로케일 클래스. 찾지 못하면 KoreanLocale 반환.
     """
-    # 레거시 호환: zh → zh-CN
-    if language == 'zh':
-        language = 'zh-CN'
-    return LOCALES.get(language, KoreanLocale)
+    return data_packs.locale(language)
+
+
+def __getattr__(name: str):
+    """로케일 클래스 / LOCALES 지연 import (기존 import 경로 호환)"""
+    if name in _LOCALE_CLASSES:
+        return data_packs.locale(_LOCALE_CLASSES[name])
+    if name == "LOCALES":
+        locales = {language: data_packs.locale(language) for language in LOCALE_PACKS}
+        locales['zh'] = locales['zh-CN']  # 레거시 호환: zh → zh-CN
+        return locales
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
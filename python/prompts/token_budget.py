@@ -0,0 +1,148 @@
+"""
+토큰 예산 기반 프롬프트 조립
+
+컨텍스트 블록(대운, 신살, 상호작용, 상담 기록 등)을 섹션 단위로 선언하고
+단계별 토큰 예산을 넘으면 우선순위가 낮은 섹션부터 요약본으로 교체하거나 제외합니다.
+
+- estimate_tokens(): 로컬 토큰 추정 (ASCII 4자 ≈ 1토큰, 한글/한자 1.5자 ≈ 1토큰)
+- PromptSection: 섹션 이름 + 본문 + 우선순위 (+ 요약본 / 필수 여부)
+- assemble_sections(): 예산 내 조립 → 원래 순서 유지, 제외/요약 섹션 보고
+"""
+import logging
+import math
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 단계별 동적 컨텍스트 토큰 예산 (정적 시스템 프롬프트 제외)
+# 환경변수 PROMPT_TOKEN_BUDGET_<STEP> 로 단계별 조정 (예: PROMPT_TOKEN_BUDGET_DAILY_FORTUNE=3000)
+DEFAULT_TOKEN_BUDGETS: Dict[str, int] = {
+    'basic': 2000,
+    'personality': 3000,
+    'aptitude': 3000,
+    'fortune': 3000,
+    'daily_fortune': 4000,
+    'consultation_answer': 6000,
+}
+FALLBACK_TOKEN_BUDGET = 4000
+
+
+def get_token_budget(step: str) -> int:
+    """단계별 토큰 예산"""
+    env_key = f"PROMPT_TOKEN_BUDGET_{step.upper().replace('-', '_')}"
+    return int(os.getenv(env_key, DEFAULT_TOKEN_BUDGETS.get(step, FALLBACK_TOKEN_BUDGET)))
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    로컬 토큰 수 추정 (API 호출 없음)
+
+    Gemini 토크나이저 기준 대략치: 영문/숫자/기호 약 4자당 1토큰,
+    한글/한자/가나는 약 1.5자당 1토큰 (보수적으로 올림)
+    """
+    if not text:
+        return 0
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    other_chars = len(text) - ascii_chars
+    return math.ceil(ascii_chars / 4 + other_chars / 1.5)
+
+
+@dataclass
+class PromptSection:
+    """프롬프트 섹션"""
+    name: str                        # 보고용 이름 (예: sinsal, daewun)
+    text: str                        # 본문
+    priority: int = 50               # 높을수록 끝까지 유지
+    required: bool = False           # True면 예산과 무관하게 유지
+    summary: Optional[str] = None    # 예산 초과 시 대체할 요약본 (없으면 제외)
+
+
+@dataclass
+class AssembledPrompt:
+    """조립 결과"""
+    sections: List[PromptSection]            # 최종 포함 섹션 (원래 순서, 요약 반영)
+    budget: int
+    estimated_tokens: int
+    dropped: List[str] = field(default_factory=list)
+    summarized: List[str] = field(default_factory=list)
+
+    def text(self, separator: str = "\n") -> str:
+        """섹션 본문 연결"""
+        return separator.join(section.text for section in self.sections)
+
+    def get(self, name: str, default: str = "") -> str:
+        """이름으로 최종 섹션 본문 조회 (제외되었으면 default)"""
+        for section in self.sections:
+            if section.name == name:
+                return section.text
+        return default
+
+    def report(self) -> Dict[str, Any]:
+        """메타데이터용 보고"""
+        return {
+            "budget": self.budget,
+            "estimated_tokens": self.estimated_tokens,
+            "dropped": list(self.dropped),
+            "summarized": list(self.summarized),
+        }
+
+
+def assemble_sections(sections: List[PromptSection], budget: int) -> AssembledPrompt:
+    """
+    예산 내 섹션 조립
+
+    빈 섹션은 건너뛰고, 예산을 넘으면 우선순위가 가장 낮은 섹션부터
+    요약본이 있으면 요약본으로 교체, 없거나 이미 요약했으면 제외합니다.
+    필수 섹션만 남아도 초과하면 그대로 반환합니다 (estimated_tokens > budget).
+
+    Args:
+        sections: 섹션 목록 (출력 순서)
+        budget: 토큰 예산
+    """
+    included = [
+        PromptSection(s.name, s.text, s.priority, s.required, s.summary)
+        for s in sections
+        if s.text
+    ]
+    tokens = {id(s): estimate_tokens(s.text) for s in included}
+    total = sum(tokens.values())
+    dropped: List[str] = []
+    summarized: List[str] = []
+
+    # 낮은 우선순위부터 (같으면 뒤쪽 섹션부터)
+    candidates = sorted(
+        (s for s in included if not s.required),
+        key=lambda s: (s.priority, -included.index(s))
+    )
+    for section in candidates:
+        if total <= budget:
+            break
+        if section.summary and estimate_tokens(section.summary) < tokens[id(section)]:
+            saved = tokens[id(section)] - estimate_tokens(section.summary)
+            section.text = section.summary
+            tokens[id(section)] -= saved
+            total -= saved
+            summarized.append(section.name)
+            if total <= budget:
+                break
+        total -= tokens[id(section)]
+        included.remove(section)
+        dropped.append(section.name)
+        if section.name in summarized:
+            summarized.remove(section.name)
+
+    result = AssembledPrompt(
+        sections=included,
+        budget=budget,
+        estimated_tokens=total,
+        dropped=dropped,
+        summarized=summarized,
+    )
+    if dropped or summarized:
+        logger.info(
+            f"[PromptBudget] 예산 {budget} 토큰 → {total} 토큰 "
+            f"(제외: {dropped or '-'}, 요약: {summarized or '-'})"
+        )
+    return result
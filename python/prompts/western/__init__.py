@@ -3,31 +3,10 @@
 The Destiny Code 기반 현대적 해석
 
 지원 언어: ko, en, ja, zh-CN, zh-TW
+
+v2.10: 하위 모듈은 심볼 최초 접근 시 지연 로딩 (prompts.data_packs)
 """
-from .destiny_code import (
-    # 타입
-    LanguageType,
-    # 데이터클래스
-    TermMapping,
-    ElementEnergy,
-    DestinyAdvice,
-    LuckCycleEntry,
-    # 클래스
-    DestinyCodePrompt,
-    # 매핑 데이터
-    TEN_GODS_MAPPING,
-    FIVE_FACTORS_MAPPING,
-    DESTINY_ADVICE_DB,
-    LUCK_INTERACTIONS,
-    LUCK_CYCLE_THEMES,
-    # 헬퍼 함수
-    get_ten_god_name,
-    get_destiny_advice,
-    get_all_destiny_advice,
-    get_luck_interaction,
-    build_luck_cycle_prompt,
-    build_destiny_code_analysis_prompt,
-)
+from ..data_packs import data_packs
 
 __all__ = [
     # 타입
@@ -53,3 +32,10 @@ __all__ = [
     "build_luck_cycle_prompt",
     "build_destiny_code_analysis_prompt",
 ]
+
+
+def __getattr__(name: str):
+    """destiny_code 심볼 지연 import (기존 import 경로 호환)"""
+    if name in __all__:
+        return data_packs.attr("western.destiny_code", name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,9 @@ Joey Yap의 "BaZi - The Destiny Code" 기반
 지원 언어: ko, en, ja, zh-CN, zh-TW
 """
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Literal
+from typing import List, Dict, Mapping, Optional, Literal
+
+from ..data_bundles import bundled_table
 
 LanguageType = Literal['ko', 'en', 'ja', 'zh-CN', 'zh-TW']
 
@@ -143,488 +145,17 @@ class DestinyAdvice:
 
 
 # 십신별 조언 데이터베이스
-DESTINY_ADVICE_DB: Dict[str, Dict[str, DestinyAdvice]] = {
-    # 정관 (Direct Officer)
-    "정관": {
-        "strong": DestinyAdvice(
-            ten_god="정관",
-            strength="strong",
-            career_advice={
-                "ko": "체계적인 조직에서 승진 경로가 명확한 직장이 적합합니다. 공무원, 대기업 관리직, 법조인 등이 좋습니다.",
-                "en": "Structured organizations with clear advancement paths suit you best. Consider government, corporate management, or legal professions.",
-                "ja": "体系的な組織で昇進経路が明確な職場が適しています。公務員、大企業管理職、法曹界などが良いでしょう。",
-                "zh-CN": "适合在体系完善的组织中工作，晋升路径清晰。适合公务员、大企业管理岗、法律界等。",
-                "zh-TW": "適合在體系完善的組織中工作，晉升路徑清晰。適合公務員、大企業管理崗、法律界等。",
-            },
-            relationship_advice={
-                "ko": "책임감이 강해 신뢰할 수 있는 파트너입니다. 다만 지나친 원칙주의로 융통성이 부족할 수 있습니다.",
-                "en": "Your strong sense of responsibility makes you a trustworthy partner. However, excessive rigidity may limit flexibility.",
-                "ja": "責任感が強く信頼できるパートナーです。ただし、過度の原則主義で柔軟性に欠ける場合があります。",
-                "zh-CN": "责任感强，是值得信赖的伴侣。但过于讲原则可能缺乏灵活性。",
-                "zh-TW": "責任感強，是值得信賴的伴侶。但過於講原則可能缺乏靈活性。",
-            },
-            action_items={
-                "ko": ["리더십 개발 프로그램 참여", "자격증/인증 획득", "멘토링 역할 수행", "장기 경력 계획 수립"],
-                "en": ["Join leadership development programs", "Obtain certifications", "Take on mentoring roles", "Create a long-term career plan"],
-                "ja": ["リーダーシップ開発プログラムへの参加", "資格・認証の取得", "メンタリング役割の遂行", "長期キャリア計画の策定"],
-                "zh-CN": ["参加领导力发展项目", "获取资格认证", "担任导师角色", "制定长期职业规划"],
-                "zh-TW": ["參加領導力發展項目", "獲取資格認證", "擔任導師角色", "制定長期職業規劃"],
-            },
-            avoid_items={
-                "ko": ["불확실성 높은 스타트업", "프리랜서 등 비정형 직업", "규칙 없는 환경", "과도한 위험 감수"],
-                "en": ["High-uncertainty startups", "Freelance or unstructured jobs", "Rule-free environments", "Excessive risk-taking"],
-                "ja": ["不確実性の高いスタートアップ", "フリーランス等の非定型職", "規則のない環境", "過度なリスクテイキング"],
-                "zh-CN": ["高不确定性的创业", "自由职业等非正式工作", "无规则的环境", "过度冒险"],
-                "zh-TW": ["高不確定性的創業", "自由職業等非正式工作", "無規則的環境", "過度冒險"],
-            },
-            insight={
-                "ko": "정관이 강하면 사회적 지위와 명예를 중시합니다. 자신의 능력을 공식적으로 인정받을 수 있는 환경에서 빛납니다.",
-                "en": "Strong Direct Officer values social status and reputation. You shine in environments where abilities are formally recognized.",
-                "ja": "正官が強いと社会的地位と名誉を重視します。能力が公式に認められる環境で輝きます。",
-                "zh-CN": "正官强旺时重视社会地位和声誉。在能力被正式认可的环境中表现出色。",
-                "zh-TW": "正官強旺時重視社會地位和聲譽。在能力被正式認可的環境中表現出色。",
-            },
-        ),
-        "weak": DestinyAdvice(
-            ten_god="정관",
-            strength="weak",
-            career_advice={
-                "ko": "지나친 권위나 압박 없는 환경이 필요합니다. 창의적 직종이나 자율성 높은 직장을 고려하세요.",
-                "en": "You need environments without excessive authority or pressure. Consider creative fields or autonomous workplaces.",
-                "ja": "過度な権威や圧力のない環境が必要です。創造的な職種や自律性の高い職場を検討してください。",
-                "zh-CN": "需要没有过度权威或压力的环境。考虑创意领域或自主性高的工作。",
-                "zh-TW": "需要沒有過度權威或壓力的環境。考慮創意領域或自主性高的工作。",
-            },
-            relationship_advice={
-                "ko": "권위적인 파트너보다 동등한 관계를 선호합니다. 지지해주는 관계에서 성장합니다.",
-                "en": "Prefer equal partnerships over authoritative ones. You grow in supportive relationships.",
-                "ja": "権威的なパートナーより対等な関係を好みます。支持的な関係で成長します。",
-                "zh-CN": "喜欢平等关系而非权威式伴侣。在支持性关系中成长。",
-                "zh-TW": "喜歡平等關係而非權威式伴侶。在支持性關係中成長。",
-            },
-            action_items={
-                "ko": ["자기주장 훈련", "소규모 리더십 경험 축적", "신뢰할 수 있는 멘토 찾기", "점진적 책임 확대"],
-                "en": ["Practice assertiveness", "Gain small leadership experiences", "Find a trusted mentor", "Gradually expand responsibilities"],
-                "ja": ["自己主張の訓練", "小規模なリーダーシップ経験の蓄積", "信頼できるメンターを探す", "段階的な責任拡大"],
-                "zh-CN": ["练习自我主张", "积累小型领导经验", "寻找可信赖的导师", "逐步扩大责任"],
-                "zh-TW": ["練習自我主張", "積累小型領導經驗", "尋找可信賴的導師", "逐步擴大責任"],
-            },
-            avoid_items={
-                "ko": ["과도한 경쟁 환경", "엄격한 위계질서", "과도한 책임 부담", "권위주의적 상사"],
-                "en": ["Overly competitive environments", "Strict hierarchies", "Excessive responsibility burdens", "Authoritarian bosses"],
-                "ja": ["過度な競争環境", "厳格な階層構造", "過度な責任負担", "権威主義的な上司"],
-                "zh-CN": ["过度竞争的环境", "严格的等级制度", "过度的责任负担", "专制型上司"],
-                "zh-TW": ["過度競爭的環境", "嚴格的等級制度", "過度的責任負擔", "專制型上司"],
-            },
-            insight={
-                "ko": "정관이 약하면 자유로운 환경에서 더 빛납니다. 억압받지 않을 때 창의성이 발휘됩니다.",
-                "en": "Weak Direct Officer thrives in free environments. Creativity flourishes without suppression.",
-                "ja": "正官が弱いと自由な環境でより輝きます。抑圧されない時に創造性が発揮されます。",
-                "zh-CN": "正官弱时在自由环境中更出色。不受压抑时创造力得以发挥。",
-                "zh-TW": "正官弱時在自由環境中更出色。不受壓抑時創造力得以發揮。",
-            },
-        ),
-        "balanced": DestinyAdvice(
-            ten_god="정관",
-            strength="balanced",
-            career_advice={
-                "ko": "유연하게 다양한 환경에 적응 가능합니다. 균형 잡힌 조직문화의 회사가 이상적입니다.",
-                "en": "Adaptable to various environments. Companies with balanced organizational culture are ideal.",
-                "ja": "柔軟に様々な環境に適応可能です。バランスの取れた組織文化の会社が理想的です。",
-                "zh-CN": "能灵活适应各种环境。组织文化平衡的公司最为理想。",
-                "zh-TW": "能靈活適應各種環境。組織文化平衡的公司最為理想。",
-            },
-            relationship_advice={
-                "ko": "균형 잡힌 관계를 형성합니다. 주고받는 것이 자연스럽습니다.",
-                "en": "Form balanced relationships. Give and take comes naturally.",
-                "ja": "バランスの取れた関係を形成します。与えることと受け取ることが自然です。",
-                "zh-CN": "形成平衡的关系。给予和接受都很自然。",
-                "zh-TW": "形成平衡的關係。給予和接受都很自然。",
-            },
-            action_items={
-                "ko": ["강점과 약점 분석", "다양한 역할 경험", "네트워크 확장", "지속적 자기계발"],
-                "en": ["Analyze strengths and weaknesses", "Experience various roles", "Expand network", "Continuous self-development"],
-                "ja": ["強みと弱みの分析", "様々な役割の経験", "ネットワークの拡大", "継続的な自己啓発"],
-                "zh-CN": ["分析优势和劣势", "体验各种角色", "拓展人脉", "持续自我发展"],
-                "zh-TW": ["分析優勢和劣勢", "體驗各種角色", "拓展人脈", "持續自我發展"],
-            },
-            avoid_items={
-                "ko": ["극단적 환경", "과도한 스트레스", "불균형한 관계", "한쪽으로 치우친 선택"],
-                "en": ["Extreme environments", "Excessive stress", "Unbalanced relationships", "One-sided choices"],
-                "ja": ["極端な環境", "過度なストレス", "不均衡な関係", "偏った選択"],
-                "zh-CN": ["极端环境", "过度压力", "不平衡的关系", "偏向一方的选择"],
-                "zh-TW": ["極端環境", "過度壓力", "不平衡的關係", "偏向一方的選擇"],
-            },
-            insight={
-                "ko": "정관이 균형잡히면 안정과 변화 사이에서 지혜롭게 선택할 수 있습니다.",
-                "en": "Balanced Direct Officer allows wise choices between stability and change.",
-                "ja": "正官がバランスを取れていると、安定と変化の間で賢明な選択ができます。",
-                "zh-CN": "正官平衡时能在稳定与变化之间做出明智选择。",
-                "zh-TW": "正官平衡時能在穩定與變化之間做出明智選擇。",
-            },
-        ),
-    },
-    # 편관/칠살 (Seven Killings)
-    "편관": {
-        "strong": DestinyAdvice(
-            ten_god="편관",
-            strength="strong",
-            career_advice={
-                "ko": "도전적이고 압박감 있는 환경에서 역량을 발휘합니다. 경찰, 군인, 위기관리, 고위 경영진 등이 적합합니다.",
-                "en": "Thrive under pressure and challenges. Police, military, crisis management, or executive roles suit you.",
-                "ja": "挑戦的でプレッシャーのある環境で能力を発揮します。警察、軍人、危機管理、上級管理職などが適しています。",
-                "zh-CN": "在压力和挑战性环境中表现出色。适合警察、军人、危机管理或高管职位。",
-                "zh-TW": "在壓力和挑戰性環境中表現出色。適合警察、軍人、危機管理或高管職位。",
-            },
-            relationship_advice={
-                "ko": "강한 성격으로 상대를 압도할 수 있습니다. 파트너의 자율성을 존중하는 연습이 필요합니다.",
-                "en": "Your strong personality may overwhelm partners. Practice respecting partner's autonomy.",
-                "ja": "強い性格で相手を圧倒することがあります。パートナーの自律性を尊重する練習が必要です。",
-                "zh-CN": "强势性格可能压倒伴侣。需要练习尊重伴侣的自主性。",
-                "zh-TW": "強勢性格可能壓倒伴侶。需要練習尊重伴侶的自主性。",
-            },
-            action_items={
-                "ko": ["스트레스 관리 기술 습득", "협상/갈등해결 기술 개발", "고강도 운동 루틴", "분노 조절 연습"],
-                "en": ["Learn stress management", "Develop negotiation skills", "High-intensity exercise routine", "Practice anger management"],
-                "ja": ["ストレス管理技術の習得", "交渉・紛争解決スキルの開発", "高強度運動ルーティン", "怒りのコントロール練習"],
-                "zh-CN": ["学习压力管理技巧", "培养谈判技能", "高强度运动习惯", "练习愤怒管理"],
-                "zh-TW": ["學習壓力管理技巧", "培養談判技能", "高強度運動習慣", "練習憤怒管理"],
-            },
-            avoid_items={
-                "ko": ["과도한 통제욕", "공격적 의사소통", "권력 남용", "타인 무시"],
-                "en": ["Excessive control", "Aggressive communication", "Power abuse", "Ignoring others"],
-                "ja": ["過度なコントロール欲", "攻撃的なコミュニケーション", "権力の乱用", "他人の無視"],
-                "zh-CN": ["过度控制欲", "攻击性沟通", "滥用权力", "忽视他人"],
-                "zh-TW": ["過度控制欲", "攻擊性溝通", "濫用權力", "忽視他人"],
-            },
-            insight={
-                "ko": "칠살이 강하면 강한 추진력과 권력욕이 있습니다. 이 에너지를 건설적으로 활용하면 큰 성취가 가능합니다.",
-                "en": "Strong Seven Killings brings powerful drive and ambition. Channel this energy constructively for great achievements.",
-                "ja": "七殺が強いと強い推進力と権力欲があります。このエネルギーを建設的に活用すれば大きな成果が可能です。",
-                "zh-CN": "七杀强旺时有强大的推动力和权力欲。建设性地运用这种能量可实现大成就。",
-                "zh-TW": "七殺強旺時有強大的推動力和權力欲。建設性地運用這種能量可實現大成就。",
-            },
-        ),
-        "weak": DestinyAdvice(
-            ten_god="편관",
-            strength="weak",
-            career_advice={
-                "ko": "갈등이 적고 협력적인 환경이 적합합니다. 지원 역할이나 팀 중심 직무를 고려하세요.",
-                "en": "Low-conflict, collaborative environments suit you. Consider support roles or team-oriented positions.",
-                "ja": "対立の少ない協力的な環境が適しています。サポート役やチーム中心の職務を検討してください。",
-                "zh-CN": "适合冲突少、协作性强的环境。考虑支持性角色或团队导向的职位。",
-                "zh-TW": "適合衝突少、協作性強的環境。考慮支持性角色或團隊導向的職位。",
-            },
-            relationship_advice={
-                "ko": "조화로운 관계를 추구하지만 자기주장이 부족할 수 있습니다. 필요시 경계 설정을 연습하세요.",
-                "en": "Seek harmonious relationships but may lack assertiveness. Practice setting boundaries when needed.",
-                "ja": "調和のある関係を求めますが、自己主張が不足することがあります。必要時に境界設定を練習してください。",
-                "zh-CN": "追求和谐关系但可能缺乏自我主张。需要时练习设定界限。",
-                "zh-TW": "追求和諧關係但可能缺乏自我主張。需要時練習設定界限。",
-            },
-            action_items={
-                "ko": ["자신감 구축", "적당한 경쟁 경험", "자기방어 기술 학습", "건강한 경계 설정"],
-                "en": ["Build confidence", "Experience healthy competition", "Learn self-defense skills", "Set healthy boundaries"],
-                "ja": ["自信の構築", "適度な競争経験", "自己防衛スキルの学習", "健全な境界設定"],
-                "zh-CN": ["建立自信", "体验适度竞争", "学习自我保护技能", "设定健康界限"],
-                "zh-TW": ["建立自信", "體驗適度競爭", "學習自我保護技能", "設定健康界限"],
-            },
-            avoid_items={
-                "ko": ["위험한 상황", "공격적인 사람들", "과도한 압박", "갈등 상황"],
-                "en": ["Dangerous situations", "Aggressive people", "Excessive pressure", "Conflict situations"],
-                "ja": ["危険な状況", "攻撃的な人々", "過度なプレッシャー", "対立状況"],
-                "zh-CN": ["危险情况", "攻击性强的人", "过度压力", "冲突场合"],
-                "zh-TW": ["危險情況", "攻擊性強的人", "過度壓力", "衝突場合"],
-            },
-            insight={
-                "ko": "칠살이 약하면 평화로운 환경에서 더 잘 기능합니다. 자신만의 페이스를 존중하세요.",
-                "en": "Weak Seven Killings functions better in peaceful environments. Respect your own pace.",
-                "ja": "七殺が弱いと平和な環境でより良く機能します。自分のペースを尊重してください。",
-                "zh-CN": "七杀弱时在平和环境中表现更好。尊重自己的节奏。",
-                "zh-TW": "七殺弱時在平和環境中表現更好。尊重自己的節奏。",
-            },
-        ),
-        "balanced": DestinyAdvice(
-            ten_god="편관",
-            strength="balanced",
-            career_advice={
-                "ko": "적절한 도전과 안정의 균형이 있는 직장이 이상적입니다.",
-                "en": "Workplaces with balanced challenge and stability are ideal.",
-                "ja": "適切な挑戦と安定のバランスがある職場が理想的です。",
-                "zh-CN": "挑战与稳定平衡的工作环境最为理想。",
-                "zh-TW": "挑戰與穩定平衡的工作環境最為理想。",
-            },
-            relationship_advice={
-                "ko": "상호 존중하는 균형 잡힌 관계를 형성할 수 있습니다.",
-                "en": "Can form balanced, mutually respectful relationships.",
-                "ja": "相互尊重のバランスの取れた関係を形成できます。",
-                "zh-CN": "能形成相互尊重的平衡关系。",
-                "zh-TW": "能形成相互尊重的平衡關係。",
-            },
-            action_items={
-                "ko": ["상황에 맞는 대응력 개발", "리더십과 팔로워십 균형", "건강한 경쟁심 유지"],
-                "en": ["Develop situational responsiveness", "Balance leadership and followership", "Maintain healthy competitiveness"],
-                "ja": ["状況に応じた対応力の開発", "リーダーシップとフォロワーシップのバランス", "健全な競争心の維持"],
-                "zh-CN": ["培养情境应对能力", "平衡领导力和追随力", "保持健康的竞争心"],
-                "zh-TW": ["培養情境應對能力", "平衡領導力和追隨力", "保持健康的競爭心"],
-            },
-            avoid_items={
-                "ko": ["극단적 선택", "불필요한 갈등", "수동적 태도"],
-                "en": ["Extreme choices", "Unnecessary conflicts", "Passive attitudes"],
-                "ja": ["極端な選択", "不必要な対立", "受動的な態度"],
-                "zh-CN": ["极端选择", "不必要的冲突", "被动态度"],
-                "zh-TW": ["極端選擇", "不必要的衝突", "被動態度"],
-            },
-            insight={
-                "ko": "칠살이 균형잡히면 필요할 때 강하게, 평소엔 부드럽게 행동할 수 있습니다.",
-                "en": "Balanced Seven Killings allows strength when needed, softness otherwise.",
-                "ja": "七殺がバランスを取れていると、必要な時は強く、普段は柔らかく行動できます。",
-                "zh-CN": "七杀平衡时，该强则强，平时温和。",
-                "zh-TW": "七殺平衡時，該強則強，平時溫和。",
-            },
-        ),
-    },
-    # 정재 (Direct Wealth)
-    "정재": {
-        "strong": DestinyAdvice(
-            ten_god="정재",
-            strength="strong",
-            career_advice={
-                "ko": "재무, 회계, 은행, 부동산 등 안정적 재산 관리 분야에서 빛납니다. 투자보다 저축형입니다.",
-                "en": "Excel in stable wealth management: finance, accounting, banking, real estate. Saver rather than investor.",
-                "ja": "財務、会計、銀行、不動産など安定的な資産管理分野で輝きます。投資より貯蓄型です。",
-                "zh-CN": "在财务、会计、银行、房地产等稳定理财领域表现出色。储蓄型而非投资型。",
-                "zh-TW": "在財務、會計、銀行、房地產等穩定理財領域表現出色。儲蓄型而非投資型。",
-            },
-            relationship_advice={
-                "ko": "물질적 안정을 제공하는 데 능숙합니다. 감정적 연결도 중요히 여기세요.",
-                "en": "Good at providing material stability. Remember emotional connection matters too.",
-                "ja": "物質的な安定を提供することに長けています。感情的なつながりも大切にしてください。",
-                "zh-CN": "善于提供物质稳定。也要重视情感连接。",
-                "zh-TW": "善於提供物質穩定。也要重視情感連接。",
-            },
-            action_items={
-                "ko": ["장기 재무 계획 수립", "정기적 저축 습관", "부동산 투자 검토", "자산 다각화"],
-                "en": ["Create long-term financial plans", "Regular savings habits", "Consider real estate", "Diversify assets"],
-                "ja": ["長期財務計画の策定", "定期的な貯蓄習慣", "不動産投資の検討", "資産の多様化"],
-                "zh-CN": ["制定长期财务计划", "养成定期储蓄习惯", "考虑房地产投资", "资产多元化"],
-                "zh-TW": ["制定長期財務計劃", "養成定期儲蓄習慣", "考慮房地產投資", "資產多元化"],
-            },
-            avoid_items={
-                "ko": ["고위험 투기", "충동 소비", "보증", "과도한 인색함"],
-                "en": ["High-risk speculation", "Impulse spending", "Guaranteeing others' debts", "Excessive stinginess"],
-                "ja": ["高リスク投機", "衝動消費", "保証人になること", "過度なけち"],
-                "zh-CN": ["高风险投机", "冲动消费", "替人担保", "过度吝啬"],
-                "zh-TW": ["高風險投機", "衝動消費", "替人擔保", "過度吝嗇"],
-            },
-            insight={
-                "ko": "정재가 강하면 꾸준한 수입과 저축 능력이 뛰어납니다. 안정적인 재산 축적이 가능합니다.",
-                "en": "Strong Direct Wealth brings steady income and saving ability. Stable wealth accumulation is possible.",
-                "ja": "正財が強いと安定した収入と貯蓄能力に優れています。安定的な資産蓄積が可能です。",
-                "zh-CN": "正财强旺时收入稳定、储蓄能力强。能稳定积累财富。",
-                "zh-TW": "正財強旺時收入穩定、儲蓄能力強。能穩定積累財富。",
-            },
-        ),
-        "weak": DestinyAdvice(
-            ten_god="정재",
-            strength="weak",
-            career_advice={
-                "ko": "재무 관리에 도움이 필요합니다. 전문가 조언을 구하고, 안정적 수입원을 확보하세요.",
-                "en": "Need help with financial management. Seek expert advice and secure stable income sources.",
-                "ja": "財務管理に助けが必要です。専門家のアドバイスを求め、安定した収入源を確保してください。",
-                "zh-CN": "财务管理需要帮助。寻求专家建议，确保稳定收入来源。",
-                "zh-TW": "財務管理需要幫助。尋求專家建議，確保穩定收入來源。",
-            },
-            relationship_advice={
-                "ko": "물질적 부분보다 정서적 유대에 집중하세요. 재정은 파트너와 협력하여 관리하면 좋습니다.",
-                "en": "Focus on emotional bonds over material aspects. Manage finances cooperatively with partner.",
-                "ja": "物質的な部分より情緒的な絆に集中してください。財務はパートナーと協力して管理すると良いです。",
-                "zh-CN": "注重情感纽带而非物质方面。与伴侣合作管理财务。",
-                "zh-TW": "注重情感紐帶而非物質方面。與伴侶合作管理財務。",
-            },
-            action_items={
-                "ko": ["재무 교육 받기", "자동 저축 설정", "지출 추적", "재정 파트너/전문가 활용"],
-                "en": ["Get financial education", "Set up automatic savings", "Track expenses", "Use financial partners/experts"],
-                "ja": ["財務教育を受ける", "自動貯蓄の設定", "支出追跡", "財務パートナー/専門家の活用"],
-                "zh-CN": ["接受财务教育", "设置自动储蓄", "追踪支出", "借助财务伙伴/专家"],
-                "zh-TW": ["接受財務教育", "設置自動儲蓄", "追蹤支出", "借助財務夥伴/專家"],
-            },
-            avoid_items={
-                "ko": ["재정 무관심", "빚", "단독 대규모 투자", "충동 구매"],
-                "en": ["Financial neglect", "Debt", "Solo large investments", "Impulse purchases"],
-                "ja": ["財務への無関心", "借金", "単独の大規模投資", "衝動買い"],
-                "zh-CN": ["忽视财务", "负债", "独自大额投资", "冲动购物"],
-                "zh-TW": ["忽視財務", "負債", "獨自大額投資", "衝動購物"],
-            },
-            insight={
-                "ko": "정재가 약하면 돈 관리에 더 의식적인 노력이 필요합니다. 시스템과 전문가를 활용하세요.",
-                "en": "Weak Direct Wealth requires more conscious effort in money management. Use systems and experts.",
-                "ja": "正財が弱いとお金の管理により意識的な努力が必要です。システムと専門家を活用してください。",
-                "zh-CN": "正财弱时需要更有意识地管理金钱。善用系统和专家。",
-                "zh-TW": "正財弱時需要更有意識地管理金錢。善用系統和專家。",
-            },
-        ),
-        "balanced": DestinyAdvice(
-            ten_god="정재",
-            strength="balanced",
-            career_advice={
-                "ko": "재정과 다른 분야의 균형이 좋습니다. 다양한 수입원을 개발할 수 있습니다.",
-                "en": "Good balance between finances and other areas. Can develop diverse income sources.",
-                "ja": "財務と他の分野のバランスが良いです。様々な収入源を開発できます。",
-                "zh-CN": "财务与其他领域平衡良好。可以开发多种收入来源。",
-                "zh-TW": "財務與其他領域平衡良好。可以開發多種收入來源。",
-            },
-            relationship_advice={
-                "ko": "물질과 감정의 균형을 자연스럽게 유지합니다.",
-                "en": "Naturally maintain balance between material and emotional aspects.",
-                "ja": "物質と感情のバランスを自然に維持します。",
-                "zh-CN": "自然地保持物质与情感的平衡。",
-                "zh-TW": "自然地保持物質與情感的平衡。",
-            },
-            action_items={
-                "ko": ["균형 잡힌 포트폴리오", "수입-지출 균형", "적정 위험 투자"],
-                "en": ["Balanced portfolio", "Income-expense balance", "Moderate risk investments"],
-                "ja": ["バランスの取れたポートフォリオ", "収支バランス", "適度なリスク投資"],
-                "zh-CN": ["平衡的投资组合", "收支平衡", "适度风险投资"],
-                "zh-TW": ["平衡的投資組合", "收支平衡", "適度風險投資"],
-            },
-            avoid_items={
-                "ko": ["극단적 인색 또는 낭비", "재정 무관심"],
-                "en": ["Extreme stinginess or waste", "Financial neglect"],
-                "ja": ["極端なけちまたは浪費", "財務への無関心"],
-                "zh-CN": ["极端吝啬或浪费", "忽视财务"],
-                "zh-TW": ["極端吝嗇或浪費", "忽視財務"],
-            },
-            insight={
-                "ko": "정재가 균형잡히면 필요한 곳에 쓰고 저축도 할 수 있는 재무 지혜가 있습니다.",
-                "en": "Balanced Direct Wealth brings financial wisdom to spend wisely and save appropriately.",
-                "ja": "正財がバランスを取れていると、必要な所に使い貯蓄もできる財務の知恵があります。",
-                "zh-CN": "正财平衡时有财务智慧，该花则花，该省则省。",
-                "zh-TW": "正財平衡時有財務智慧，該花則花，該省則省。",
-            },
-        ),
-    },
-    # 식신 (Eating God)
-    "식신": {
-        "strong": DestinyAdvice(
-            ten_god="식신",
-            strength="strong",
-            career_advice={
-                "ko": "창의적 표현이 중요한 분야가 적합합니다. 요리, 예술, 글쓰기, 교육, 콘텐츠 제작 등이 좋습니다.",
-                "en": "Fields requiring creative expression suit you. Cooking, arts, writing, education, content creation excel.",
-                "ja": "創造的な表現が重要な分野が適しています。料理、芸術、執筆、教育、コンテンツ制作などが良いです。",
-                "zh-CN": "适合需要创意表达的领域。烹饪、艺术、写作、教育、内容创作等都很出色。",
-                "zh-TW": "適合需要創意表達的領域。烹飪、藝術、寫作、教育、內容創作等都很出色。",
-            },
-            relationship_advice={
-                "ko": "따뜻하고 배려심 깊은 파트너입니다. 자녀 양육에 특히 재능이 있습니다.",
-                "en": "Warm, nurturing partner. Especially talented in raising children.",
-                "ja": "温かく思いやりのあるパートナーです。子育てに特に才能があります。",
-                "zh-CN": "温暖体贴的伴侣。尤其擅长养育孩子。",
-                "zh-TW": "溫暖體貼的伴侶。尤其擅長養育孩子。",
-            },
-            action_items={
-                "ko": ["창작 활동 정기화", "요리/예술 클래스", "블로그/유튜브 시작", "지식 공유 활동"],
-                "en": ["Regular creative activities", "Cooking/art classes", "Start blog/YouTube", "Knowledge sharing"],
-                "ja": ["創作活動の定期化", "料理/アートクラス", "ブログ/YouTube開始", "知識共有活動"],
-                "zh-CN": ["定期创作活动", "烹饪/艺术课程", "开始写博客/做视频", "知识分享活动"],
-                "zh-TW": ["定期創作活動", "烹飪/藝術課程", "開始寫部落格/做影片", "知識分享活動"],
-            },
-            avoid_items={
-                "ko": ["창의성 억압 환경", "반복적 단순 업무", "표현 기회 없는 직장", "과식/탐닉"],
-                "en": ["Creativity-suppressing environments", "Repetitive simple tasks", "Jobs without expression", "Overeating/indulgence"],
-                "ja": ["創造性を抑圧する環境", "反復的な単純作業", "表現機会のない職場", "過食/耽溺"],
-                "zh-CN": ["压制创造力的环境", "重复性简单工作", "无表达机会的工作", "暴饮暴食/沉迷"],
-                "zh-TW": ["壓制創造力的環境", "重複性簡單工作", "無表達機會的工作", "暴飲暴食/沉迷"],
-            },
-            insight={
-                "ko": "식신이 강하면 타고난 창의력과 표현력이 있습니다. 이를 발휘할 출구가 필요합니다.",
-                "en": "Strong Eating God brings natural creativity and expression. Needs outlets to express.",
-                "ja": "食神が強いと生まれながらの創造力と表現力があります。これを発揮する出口が必要です。",
-                "zh-CN": "食神强旺时有天生的创造力和表达力。需要发挥的出口。",
-                "zh-TW": "食神強旺時有天生的創造力和表達力。需要發揮的出口。",
-            },
-        ),
-        "weak": DestinyAdvice(
-            ten_god="식신",
-            strength="weak",
-            career_advice={
-                "ko": "구조화된 환경에서 일하면서 창의성을 점진적으로 개발하세요.",
-                "en": "Work in structured environments while gradually developing creativity.",
-                "ja": "構造化された環境で働きながら創造性を徐々に開発してください。",
-                "zh-CN": "在结构化环境中工作，同时逐步培养创造力。",
-                "zh-TW": "在結構化環境中工作，同時逐步培養創造力。",
-            },
-            relationship_advice={
-                "ko": "감정 표현을 의식적으로 연습하세요. 파트너에게 생각을 말로 전달하는 것이 중요합니다.",
-                "en": "Consciously practice emotional expression. Verbal communication with partner matters.",
-                "ja": "感情表現を意識的に練習してください。パートナーに考えを言葉で伝えることが重要です。",
-                "zh-CN": "有意识地练习情感表达。与伴侣的言语沟通很重要。",
-                "zh-TW": "有意識地練習情感表達。與伴侶的言語溝通很重要。",
-            },
-            action_items={
-                "ko": ["작은 창작부터 시작", "표현력 워크숍", "일기 쓰기", "취미 활동 탐색"],
-                "en": ["Start with small creations", "Expression workshops", "Journal writing", "Explore hobbies"],
-                "ja": ["小さな創作から始める", "表現力ワークショップ", "日記を書く", "趣味活動の探索"],
-                "zh-CN": ["从小创作开始", "表达力工作坊", "写日记", "探索兴趣爱好"],
-                "zh-TW": ["從小創作開始", "表達力工作坊", "寫日記", "探索興趣愛好"],
-            },
-            avoid_items={
-                "ko": ["표현 기회 완전 포기", "감정 억압", "타인 아이디어만 따르기"],
-                "en": ["Completely giving up expression", "Suppressing emotions", "Only following others' ideas"],
-                "ja": ["表現機会の完全放棄", "感情の抑圧", "他人のアイデアだけに従う"],
-                "zh-CN": ["完全放弃表达机会", "压抑情感", "只跟随他人想法"],
-                "zh-TW": ["完全放棄表達機會", "壓抑情感", "只跟隨他人想法"],
-            },
-            insight={
-                "ko": "식신이 약하면 창의적 표현에 더 의식적 노력이 필요합니다. 꾸준한 연습으로 개발 가능합니다.",
-                "en": "Weak Eating God requires more conscious effort in creative expression. Develops with consistent practice.",
-                "ja": "食神が弱いと創造的な表現により意識的な努力が必要です。継続的な練習で開発可能です。",
-                "zh-CN": "食神弱时创意表达需要更多有意识的努力。持续练习可以培养。",
-                "zh-TW": "食神弱時創意表達需要更多有意識的努力。持續練習可以培養。",
-            },
-        ),
-        "balanced": DestinyAdvice(
-            ten_god="식신",
-            strength="balanced",
-            career_advice={
-                "ko": "창의성과 실용성의 균형이 좋습니다. 다양한 분야에서 적응 가능합니다.",
-                "en": "Good balance of creativity and practicality. Adaptable across various fields.",
-                "ja": "創造性と実用性のバランスが良いです。様々な分野で適応可能です。",
-                "zh-CN": "创造力与实用性平衡良好。可适应各种领域。",
-                "zh-TW": "創造力與實用性平衡良好。可適應各種領域。",
-            },
-            relationship_advice={
-                "ko": "적절히 표현하고 적절히 경청하는 균형 있는 소통이 가능합니다.",
-                "en": "Balanced communication - expressing and listening appropriately.",
-                "ja": "適切に表現し適切に傾聴するバランスの取れたコミュニケーションが可能です。",
-                "zh-CN": "平衡的沟通——适当表达、适当倾听。",
-                "zh-TW": "平衡的溝通——適當表達、適當傾聽。",
-            },
-            action_items={
-                "ko": ["창의적 취미 유지", "업무에 창의성 접목", "지속적 아이디어 기록"],
-                "en": ["Maintain creative hobbies", "Apply creativity at work", "Continuously record ideas"],
-                "ja": ["創造的な趣味の維持", "仕事に創造性を接合", "継続的なアイデア記録"],
-                "zh-CN": ["保持创意爱好", "将创造力应用于工作", "持续记录想法"],
-                "zh-TW": ["保持創意愛好", "將創造力應用於工作", "持續記錄想法"],
-            },
-            avoid_items={
-                "ko": ["창의성 완전 포기", "과도한 자기표현"],
-                "en": ["Completely abandoning creativity", "Excessive self-expression"],
-                "ja": ["創造性の完全放棄", "過度な自己表現"],
-                "zh-CN": ["完全放弃创造力", "过度自我表达"],
-                "zh-TW": ["完全放棄創造力", "過度自我表達"],
-            },
-            insight={
-                "ko": "식신이 균형잡히면 적절한 때에 창의성을 발휘하고 필요시 실용적으로 행동합니다.",
-                "en": "Balanced Eating God expresses creativity at the right time and acts practically when needed.",
-                "ja": "食神がバランスを取れていると適切な時に創造性を発揮し、必要時は実用的に行動します。",
-                "zh-CN": "食神平衡时在适当时机发挥创造力，需要时务实行动。",
-                "zh-TW": "食神平衡時在適當時機發揮創造力，需要時務實行動。",
-            },
-        ),
-    },
-}
+# v2.10: 원본 데이터는 destiny_code_data, 런타임은 바이너리 번들 우선
+def _destiny_advice_db() -> Mapping[str, Mapping[str, DestinyAdvice]]:
+    """십신별 조언 데이터베이스 (번들 또는 원본 데이터 모듈)"""
+    return bundled_table("destiny_advice", lambda data: DestinyAdvice(**data))
+
+
+def __getattr__(name: str):
+    """DESTINY_ADVICE_DB 지연 로딩 (기존 import 경로 호환)"""
+    if name == "DESTINY_ADVICE_DB":
+        return _destiny_advice_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================================================
@@ -1139,13 +670,14 @@ def get_destiny_advice(
         >>> print(advice['career_advice'])
         "체계적인 조직에서 승진 경로가 명확한 직장이 적합합니다..."
     """
-    if ten_god not in DESTINY_ADVICE_DB:
+    advice_db = _destiny_advice_db()
+    if ten_god not in advice_db:
         return None
 
-    if strength not in DESTINY_ADVICE_DB[ten_god]:
+    if strength not in advice_db[ten_god]:
         return None
 
-    advice: DestinyAdvice = DESTINY_ADVICE_DB[ten_god][strength]
+    advice: DestinyAdvice = advice_db[ten_god][strength]
 
     return {
         "ten_god": get_ten_god_name(ten_god, language),
@@ -1170,9 +702,10 @@ def get_all_destiny_advice(language: LanguageType = 'ko') -> Dict[str, Dict[str,
         중첩 딕셔너리 {십신: {강약: 조언}}
     """
     result = {}
-    for ten_god in DESTINY_ADVICE_DB:
+    advice_db = _destiny_advice_db()
+    for ten_god in advice_db:
         result[ten_god] = {}
-        for strength in DESTINY_ADVICE_DB[ten_god]:
+        for strength in advice_db[ten_god]:
             advice = get_destiny_advice(ten_god, strength, language)
             if advice:
                 result[ten_god][strength] = advice
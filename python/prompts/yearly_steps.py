@@ -9,7 +9,9 @@ Steps:
 7. classical_refs - 고전 인용
 """
 import json
-from typing import Dict, Any, List, Literal
+from typing import Dict, Any, List, Literal, Optional
+
+from .analysis_context import AnalysisContext, format_pillars_brief
 
 LocaleType = Literal['ko', 'en', 'ja', 'zh-CN', 'zh-TW']
 
@@ -38,13 +40,14 @@ You've internalized Ziping Zhengquan, Qiongtong Baojian, and Ditian Sui.""",
         language: LocaleType,
         year: int,
         pillars: Dict[str, Any],
-        daewun: List[Dict[str, Any]] = None
+        daewun: List[Dict[str, Any]] = None,
+        analysis_context: Optional[AnalysisContext] = None
     ) -> str:
         """
         Step 1: 연간 기본 정보 프롬프트
         출력: year, summary, yearlyTheme, overallScore
         """
-        pillars_str = cls._format_pillars(pillars, language)
+        pillars_str = cls._pillars_text(pillars, language, analysis_context)
         persona = cls.PERSONA.get(language, cls.PERSONA['ko'])
 
         if language == 'ko':
@@ -141,13 +144,14 @@ Example: 50 + (+25) + (-30) = 45
         months: List[int],
         pillars: Dict[str, Any],
         daewun: List[Dict[str, Any]] = None,
-        overview_result: Dict[str, Any] = None
+        overview_result: Dict[str, Any] = None,
+        analysis_context: Optional[AnalysisContext] = None
     ) -> str:
         """
         Steps 2-5: 월별 운세 프롬프트 (3개월씩)
         출력: monthlyFortunes (3개월분)
         """
-        pillars_str = cls._format_pillars(pillars, language)
+        pillars_str = cls._pillars_text(pillars, language, analysis_context)
         persona = cls.PERSONA.get(language, cls.PERSONA['ko'])
         month_range = f"{months[0]}-{months[-1]}"
 
@@ -277,13 +281,14 @@ Clamp final score to 0-100 range.
         year: int,
         pillars: Dict[str, Any],
         daewun: List[Dict[str, Any]] = None,
-        overview_result: Dict[str, Any] = None
+        overview_result: Dict[str, Any] = None,
+        analysis_context: Optional[AnalysisContext] = None
     ) -> str:
         """
         Step 6: 연간 조언 6섹션 프롬프트
         출력: yearlyAdvice (6섹션 × 상/하반기)
         """
-        pillars_str = cls._format_pillars(pillars, language)
+        pillars_str = cls._pillars_text(pillars, language, analysis_context)
         persona = cls.PERSONA.get(language, cls.PERSONA['ko'])
 
         theme = overview_result.get('yearlyTheme', '') if overview_result else ''
@@ -394,13 +399,14 @@ Yearly theme: {theme}
         language: LocaleType,
         year: int,
         pillars: Dict[str, Any],
-        overview_result: Dict[str, Any] = None
+        overview_result: Dict[str, Any] = None,
+        analysis_context: Optional[AnalysisContext] = None
     ) -> str:
         """
         Step 7: 고전 인용 프롬프트
         출력: classicalReferences (2-3개)
         """
-        pillars_str = cls._format_pillars(pillars, language)
+        pillars_str = cls._pillars_text(pillars, language, analysis_context)
         persona = cls.PERSONA.get(language, cls.PERSONA['ko'])
 
         theme = overview_result.get('yearlyTheme', '') if overview_result else ''
@@ -469,27 +475,19 @@ Yearly theme: {theme}
         else:
             return cls.build_classical_refs('ko', year, pillars, overview_result)
 
+    @classmethod
+    def _pillars_text(
+        cls,
+        pillars: Dict[str, Any],
+        language: LocaleType,
+        analysis_context: Optional[AnalysisContext] = None
+    ) -> str:
+        """사주 정보 블록 (v2.10: 같은 언어의 작업 컨텍스트가 있으면 사전 렌더링 블록 재사용)"""
+        if analysis_context is not None and analysis_context.language == language:
+            return analysis_context.block("pillars_brief")
+        return cls._format_pillars(pillars, language)
+
     @classmethod
     def _format_pillars(cls, pillars: Dict[str, Any], language: LocaleType) -> str:
         """사주 정보를 문자열로 포맷"""
-        if not pillars:
-            return "사주 정보 없음"
-
-        lines = []
-        pillar_names = {
-            'ko': {'year': '연주', 'month': '월주', 'day': '일주', 'hour': '시주'},
-            'en': {'year': 'Year', 'month': 'Month', 'day': 'Day', 'hour': 'Hour'},
-            'ja': {'year': '年柱', 'month': '月柱', 'day': '日柱', 'hour': '時柱'},
-            'zh-CN': {'year': '年柱', 'month': '月柱', 'day': '日柱', 'hour': '时柱'},
-            'zh-TW': {'year': '年柱', 'month': '月柱', 'day': '日柱', 'hour': '時柱'},
-        }
-
-        names = pillar_names.get(language, pillar_names['ko'])
-
-        for key in ['year', 'month', 'day', 'hour']:
-            pillar = pillars.get(key, {})
-            stem = pillar.get('stem', '?')
-            branch = pillar.get('branch', '?')
-            lines.append(f"- {names[key]}: {stem}{branch}")
-
-        return "\n".join(lines)
+        return format_pillars_brief(pillars, language)
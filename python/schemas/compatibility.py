@@ -63,6 +63,7 @@ class CompatibilityAnalysisStartResponse(BaseModel):
     analysis_id: Optional[str] = Field(None, description="DB 분석 레코드 ID")
     status: CompatibilityJobStatus = Field(..., description="작업 상태")
     message: str = Field(..., description="메시지")
+    estimated_start_seconds: Optional[int] = Field(None, description="예상 시작까지 남은 시간 (초)")
 
 
 # ============================================
@@ -0,0 +1,24 @@
+"""
+작업 저장소 조회 API 스키마 (v2.10)
+"""
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+
+
+class ActiveJob(BaseModel):
+    """진행 중 작업 요약"""
+    job_id: str = Field(..., description="작업 ID")
+    job_type: Literal['report', 'yearly', 'compatibility'] = Field(..., description="작업 종류")
+    status: str = Field(..., description="작업 상태")
+    progress_percent: int = Field(0, ge=0, le=100, description="진행률")
+    current_step: Optional[str] = Field(None, description="현재 단계")
+    report_id: Optional[str] = Field(None, description="리포트 ID (리포트 작업)")
+    analysis_id: Optional[str] = Field(None, description="분석 ID (신년/궁합 작업)")
+    created_at: str = Field(..., description="생성 시각")
+    updated_at: str = Field(..., description="수정 시각")
+
+
+class ActiveJobsResponse(BaseModel):
+    """사용자 진행 중 작업 목록 응답"""
+    user_id: str = Field(..., description="사용자 ID")
+    jobs: List[ActiveJob] = Field(default_factory=list, description="진행 중 작업 (생성 순)")
@@ -6,6 +6,10 @@ from pydantic import BaseModel, Field
 from typing import Literal, Optional, Dict, List, Any
 
 
+# v2.10: 시스템 프롬프트 응답 모드
+PromptResponseMode = Literal['full', 'reference']
+
+
 class PillarInfo(BaseModel):
     """기둥 정보"""
     stem: str = Field(..., description="천간")
@@ -48,6 +52,9 @@ class PromptBuildRequest(BaseModel):
     )
     question: Optional[str] = Field(None, max_length=500, description="사용자 질문")
     options: PromptBuildOptions = Field(default_factory=PromptBuildOptions, description="빌드 옵션")
+    responseMode: PromptResponseMode = Field(
+        'full', description="full: 시스템 프롬프트 본문 포함, reference: 조각 참조만 반환 (v2.10)"
+    )
 
     class Config:
         json_schema_extra = {
@@ -78,12 +85,23 @@ class PromptMetadata(BaseModel):
     version: str = Field(..., description="프롬프트 버전")
     language: str = Field(..., description="언어")
     includedModules: List[str] = Field(..., description="포함된 모듈")
+    systemPromptHash: Optional[str] = Field(None, description="시스템 프롬프트 조각 내용 해시 (v2.10)")
     generatedAt: str = Field(..., description="생성 시각 (ISO 8601)")
 
 
+class PromptFragmentRef(BaseModel):
+    """시스템 프롬프트 조각 참조 (v2.10, responseMode=reference)"""
+    id: str = Field(..., description="조각 ID (예: step:ko:basic)")
+    hash: str = Field(..., description="내용 해시 (GET /api/prompts/fragments/{hash})")
+    size: int = Field(..., description="본문 길이 (문자 수)")
+
+
 class PromptBuildResponse(BaseModel):
     """프롬프트 빌드 응답"""
-    systemPrompt: str = Field(..., description="시스템 프롬프트")
+    systemPrompt: Optional[str] = Field(None, description="시스템 프롬프트 (reference 모드에서는 생략)")
+    systemPromptRef: Optional[PromptFragmentRef] = Field(
+        None, description="시스템 프롬프트 조각 참조 (reference 모드)"
+    )
     userPrompt: str = Field(..., description="사용자 프롬프트")
     outputSchema: Dict[str, Any] = Field(..., description="출력 JSON 스키마")
     metadata: PromptMetadata = Field(..., description="메타데이터")
@@ -119,6 +137,9 @@ class StepPromptRequest(BaseModel):
     currentAge: Optional[int] = Field(
         None, description="현재 나이 (대운 하이라이트용)"
     )
+    responseMode: PromptResponseMode = Field(
+        'full', description="full: 시스템 프롬프트 본문 포함, reference: 조각 참조만 반환 (v2.10)"
+    )
 
     class Config:
         json_schema_extra = {
@@ -144,6 +165,66 @@ class StepPromptRequest(BaseModel):
         }
 
 
+class StepBundleRequest(BaseModel):
+    """멀티스텝 전체 단계 프롬프트 일괄 요청 (v2.10)"""
+    language: Literal['ko', 'en', 'ja', 'zh-CN', 'zh-TW'] = Field(
+        'ko', description="언어"
+    )
+    steps: List[Literal['basic', 'personality', 'aptitude', 'fortune']] = Field(
+        default=['basic', 'personality', 'aptitude', 'fortune'], min_length=1, description="빌드할 단계"
+    )
+    pillars: Dict[str, Any] = Field(..., description="사주 팔자")
+    daewun: Optional[List[Dict[str, Any]]] = Field(default=[], description="대운 목록")
+    jijanggan: Optional[Dict[str, List[str]]] = Field(None, description="지장간 데이터")
+    tenGodCounts: Optional[Dict[str, float]] = Field(
+        None, description="십신 분포 (없으면 서버에서 1회 계산)"
+    )
+    interactions: Optional[List[Dict[str, Any]]] = Field(
+        None, description="지지 상호작용 (없으면 서버에서 1회 계산)"
+    )
+    sinsals: Optional[List[Dict[str, Any]]] = Field(
+        None, description="신살 목록 (없으면 서버에서 1회 계산)"
+    )
+    formation: Optional[Dict[str, Any]] = Field(
+        None, description="격국 분석 결과 (없으면 서버에서 1회 계산)"
+    )
+    currentAge: Optional[int] = Field(
+        None, description="현재 나이 (대운 하이라이트용)"
+    )
+    responseMode: PromptResponseMode = Field(
+        'reference', description="reference: 조각 참조만 반환 (기본), full: 시스템 프롬프트 본문 포함"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "language": "ko",
+                "pillars": {
+                    "year": {"stem": "庚", "branch": "午", "element": "金"},
+                    "month": {"stem": "辛", "branch": "巳", "element": "金"},
+                    "day": {"stem": "甲", "branch": "子", "element": "木"},
+                    "hour": {"stem": "辛", "branch": "未", "element": "金"}
+                },
+                "daewun": [
+                    {"age": 1, "stem": "壬", "branch": "午", "startYear": 1991}
+                ],
+                "currentAge": 35
+            }
+        }
+
+
+class StepBundleResponse(BaseModel):
+    """멀티스텝 전체 단계 프롬프트 일괄 응답 (v2.10)"""
+    steps: Dict[str, PromptBuildResponse] = Field(..., description="단계별 프롬프트 (요청 순서)")
+    placeholders: List[str] = Field(
+        ...,
+        description="userPrompt의 이전 단계 결과 자리표시자 (예: {{basicAnalysis.dayMaster.stem}}) "
+                    "→ basic 결과의 같은 경로 값으로 치환"
+    )
+    language: str = Field(..., description="언어")
+    generatedAt: str = Field(..., description="생성 시각")
+
+
 class YearlyPromptBuildRequest(BaseModel):
     """신년 사주 분석 프롬프트 빌드 요청"""
     language: Literal['ko', 'en', 'ja', 'zh-CN', 'zh-TW'] = Field('ko', description="언어")
@@ -154,6 +235,9 @@ class YearlyPromptBuildRequest(BaseModel):
     currentDaewun: Optional[Dict[str, Any]] = Field(None, description="현재 대운")
     gender: Literal['male', 'female'] = Field(..., description="성별")
     options: PromptBuildOptions = Field(default_factory=PromptBuildOptions, description="빌드 옵션")
+    responseMode: PromptResponseMode = Field(
+        'full', description="full: 시스템 프롬프트 본문 포함, reference: 조각 참조만 반환 (v2.10)"
+    )
 
     class Config:
         json_schema_extra = {
@@ -57,6 +57,7 @@ class ReportAnalysisStartResponse(BaseModel):
     report_id: str = Field(..., description="리포트 ID")
     status: JobStatus = Field(..., description="작업 상태")
     message: str = Field(..., description="메시지")
+    estimated_start_seconds: Optional[int] = Field(None, description="예상 시작까지 남은 시간 (초)")
 
 
 class ReportAnalysisStatusResponse(BaseModel):
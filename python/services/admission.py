@@ -0,0 +1,236 @@
+"""
+작업 수용 제어 / 역압 (v2.10)
+
+작업 시작 엔드포인트(/api/analysis/{report,yearly,compatibility}, /api/consultation/generate,
+/api/daily-fortune)는 요청을 무제한으로 받아 트래픽이 몰리면 큐 대기 시간이 끝없이 늘어납니다.
+작업 종류별 대기 + 실행 중 작업 수를 기준으로 요청을 수용하거나 429로 거절합니다.
+
+- 큐 작업: 작업 큐(job_queue)의 대기/실행 중 행 수 (큐 파일을 공유하는 모든 프로세스 합계)
+  - 한도 확인과 등록은 작업 큐의 한 트랜잭션 (try_enqueue) → 동시 요청이 함께 한도를 통과하지 않음
+  - 종류별 상한 ADMISSION_MAX_PENDING_<KIND> (기본: 워커 수 × ADMISSION_QUEUE_FACTOR)
+  - 사용자별 상한 ADMISSION_MAX_PER_USER (종류별 대기 + 실행 중, 0이면 제한 없음)
+  - 수용 시 예상 시작 시간(초) 반환, 거절 시 Retry-After 계산 (평균 처리 시간 기준)
+- 동기 작업 (오늘의 운세): 프로세스 내 동시 실행 수 (ADMISSION_MAX_INFLIGHT_<KIND>)
+  - 같은 dedup_key의 동시 요청은 하나의 생성으로 병합되므로 1건으로 집계
+- 중복 요청 (dedup_key의 작업이 이미 대기/실행 중)은 기존 작업에 합류하므로 항상 수용
+"""
+import math
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from services.job_queue import JobQueue, QueueFull, get_worker_count, job_queue
+
+# 종류별 대기 상한 기본값 = 워커 수 × 배수
+ADMISSION_QUEUE_FACTOR = int(os.getenv("ADMISSION_QUEUE_FACTOR", "10"))
+ADMISSION_MAX_PER_USER = int(os.getenv("ADMISSION_MAX_PER_USER", "3"))
+ADMISSION_MIN_RETRY_SECONDS = int(os.getenv("ADMISSION_MIN_RETRY_SECONDS", "1"))
+
+# 동기 작업 기본 동시 실행 상한 / 1건 처리 시간 추정치 (초)
+DEFAULT_MAX_INFLIGHT: Dict[str, int] = {
+    "daily": 16,
+}
+DEFAULT_INFLIGHT_SECONDS: Dict[str, float] = {
+    "daily": 20.0,
+}
+FALLBACK_MAX_INFLIGHT = 8
+FALLBACK_INFLIGHT_SECONDS = 20.0
+
+
+class AdmissionRejected(Exception):
+    """수용 한도 초과 (HTTP 429 + Retry-After)"""
+
+    def __init__(self, kind: str, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.kind = kind
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass
+class Admission:
+    """수용 결과"""
+    kind: str
+    job_id: str                      # 실행될 job_id (중복이면 기존 작업의 job_id)
+    queued: int                      # 앞에 대기 중인 작업 수
+    running: int                     # 실행 중인 작업 수
+    estimated_start_seconds: int     # 예상 시작까지 남은 시간 (0이면 바로 시작)
+    joined: bool = False             # 대기/실행 중인 기존 작업에 합류 (한도 미적용)
+
+
+def get_max_pending(kind: str) -> int:
+    """작업 종류별 대기 + 실행 중 상한"""
+    env_key = f"ADMISSION_MAX_PENDING_{kind.upper()}"
+    return int(os.getenv(env_key, get_worker_count(kind) * ADMISSION_QUEUE_FACTOR))
+
+
+def get_max_inflight(kind: str) -> int:
+    """동기 작업 종류별 프로세스 내 동시 실행 상한"""
+    env_key = f"ADMISSION_MAX_INFLIGHT_{kind.upper()}"
+    return int(os.getenv(env_key, DEFAULT_MAX_INFLIGHT.get(kind, FALLBACK_MAX_INFLIGHT)))
+
+
+def estimate_wait(ahead: int, workers: int, average_seconds: float) -> int:
+    """
+    ahead개 작업 뒤에 들어간 작업의 예상 대기 시간 (초)
+
+    워커가 workers개이므로 앞선 작업이 workers개 미만이면 바로 시작,
+    이후 workers개마다 평균 처리 시간만큼 밀림
+    """
+    workers = max(workers, 1)
+    if ahead < workers:
+        return 0
+    return math.ceil((ahead - workers + 1) / workers * average_seconds)
+
+
+class AdmissionController:
+    """작업 종류별 수용 제어"""
+
+    def __init__(self, queue: JobQueue = job_queue, max_per_user: int = ADMISSION_MAX_PER_USER):
+        self.queue = queue
+        self.max_per_user = max_per_user
+        # 동기 작업 프로세스 내 실행 중 수 (전체 / 사용자별)
+        self._inflight: Dict[str, int] = {}
+        self._inflight_users: Dict[str, Dict[str, int]] = {}
+        # 동기 작업 dedup_key별 [참여 요청 수, 집계된 user_id]
+        self._inflight_keys: Dict[str, Dict[str, List[Any]]] = {}
+
+        # 통계 (프로세스 단위)
+        self.admitted: Dict[str, int] = {}
+        self.rejected: Dict[str, int] = {}
+
+    async def enqueue(
+        self,
+        kind: str,
+        job_id: str,
+        payload: Dict[str, Any],
+        dedup_key: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> Admission:
+        """
+        큐 작업 수용 판단 + 등록 (한도 확인과 등록은 작업 큐의 한 트랜잭션)
+
+        Args:
+            kind: 작업 종류 (작업 큐 키)
+            job_id: 서비스 작업 ID
+            payload: 작업 큐 요청 데이터
+            dedup_key: 중복 방지 키 (이미 대기/실행 중이면 한도와 무관하게 기존 작업에 합류)
+            user_id: 요청 사용자 (사용자별 상한)
+
+        Raises:
+            AdmissionRejected: 종류별 / 사용자별 한도 초과
+        """
+        workers = get_worker_count(kind)
+        average = self.queue.average_duration(kind)
+        try:
+            result = await self.queue.try_enqueue(
+                kind, job_id, payload, dedup_key, user_id,
+                max_pending=get_max_pending(kind), max_per_user=self.max_per_user,
+            )
+        except QueueFull as full:
+            if full.scope == "user":
+                # 사용자 작업 1건이 끝날 때까지
+                self._reject(kind, f"사용자별 동시 작업 한도({full.limit}) 초과", average)
+            # 대기 + 실행 중 작업이 상한 아래로 내려갈 때까지
+            excess = full.pending - full.limit + 1
+            self._reject(
+                kind,
+                f"대기 중인 작업이 너무 많습니다 ({full.pending}/{full.limit})",
+                excess / max(workers, 1) * average,
+            )
+
+        if result.joined:
+            return Admission(kind, result.job_id, result.queued, result.running, 0, joined=True)
+        self.admitted[kind] = self.admitted.get(kind, 0) + 1
+        ahead = result.queued + result.running
+        return Admission(
+            kind, result.job_id, result.queued, result.running, estimate_wait(ahead, workers, average)
+        )
+
+    @contextmanager
+    def track(
+        self,
+        kind: str,
+        user_id: Optional[str] = None,
+        dedup_key: Optional[str] = None,
+    ) -> Iterator[None]:
+        """
+        동기 작업 수용 + 실행 중 집계 (with 블록 동안)
+
+        Args:
+            kind: 작업 종류
+            user_id: 요청 사용자 (사용자별 상한)
+            dedup_key: 병합 키 (같은 키로 진행 중인 요청이 있으면 한도와 무관하게 합류,
+                       마지막 요청이 끝날 때까지 1건으로 집계)
+
+        Raises:
+            AdmissionRejected: 프로세스 내 동시 실행 / 사용자별 한도 초과
+        """
+        keys = self._inflight_keys.setdefault(kind, {})
+        entry = keys.get(dedup_key) if dedup_key is not None else None
+        if entry is not None:
+            entry[0] += 1
+            try:
+                yield
+            finally:
+                self._leave_key(kind, dedup_key)
+            return
+
+        average = DEFAULT_INFLIGHT_SECONDS.get(kind, FALLBACK_INFLIGHT_SECONDS)
+        users = self._inflight_users.setdefault(kind, {})
+        if user_id and self.max_per_user > 0 and users.get(user_id, 0) >= self.max_per_user:
+            self._reject(kind, f"사용자별 동시 작업 한도({self.max_per_user}) 초과", average)
+        max_inflight = get_max_inflight(kind)
+        if self._inflight.get(kind, 0) >= max_inflight:
+            self._reject(kind, f"처리 중인 요청이 너무 많습니다 ({max_inflight})", average)
+
+        self.admitted[kind] = self.admitted.get(kind, 0) + 1
+        self._inflight[kind] = self._inflight.get(kind, 0) + 1
+        if user_id:
+            users[user_id] = users.get(user_id, 0) + 1
+        if dedup_key is None:
+            try:
+                yield
+            finally:
+                self._release(kind, user_id)
+            return
+
+        keys[dedup_key] = [1, user_id]
+        try:
+            yield
+        finally:
+            self._leave_key(kind, dedup_key)
+
+    def _leave_key(self, kind: str, dedup_key: str) -> None:
+        """병합 키 참여 종료 (마지막 요청이면 집계 해제)"""
+        keys = self._inflight_keys[kind]
+        entry = keys[dedup_key]
+        entry[0] -= 1
+        if entry[0] <= 0:
+            del keys[dedup_key]
+            self._release(kind, entry[1])
+
+    def _release(self, kind: str, user_id: Optional[str]) -> None:
+        self._inflight[kind] -= 1
+        if user_id:
+            users = self._inflight_users[kind]
+            users[user_id] -= 1
+            if users[user_id] <= 0:
+                del users[user_id]
+
+    def _reject(self, kind: str, reason: str, retry_seconds: float) -> None:
+        self.rejected[kind] = self.rejected.get(kind, 0) + 1
+        raise AdmissionRejected(kind, reason, max(ADMISSION_MIN_RETRY_SECONDS, math.ceil(retry_seconds)))
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            "max_per_user": self.max_per_user,
+            "inflight": dict(self._inflight),
+            "admitted": dict(self.admitted),
+            "rejected": dict(self.rejected),
+        }
+
+
+# 전역 수용 제어
+admission_controller = AdmissionController()
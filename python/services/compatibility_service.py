@@ -1,18 +1,15 @@
 """
 궁합 분석 서비스
-비동기 백그라운드 작업 처리 (10단계 파이프라인)
+비동기 백그라운드 작업 처리 (10단계 DAG 파이프라인)
 
 파이프라인 단계:
-1-2. manseryeok_a, manseryeok_b - 만세력 계산
+1-2. manseryeok_a, manseryeok_b - 만세력 계산 (병렬)
 3-4. compatibility_score, trait_scores - Python 점수 계산
-5-9. relationship_type ~ mutual_influence - Gemini 분석
+5-9. relationship_type ~ mutual_influence - Gemini 분석 (병렬)
 10. saving - DB 저장
 """
-import asyncio
 import uuid
 import logging
-import os
-import httpx
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
@@ -24,6 +21,12 @@ from schemas.compatibility import (
 from schemas.gemini_schemas import get_gemini_schema
 from .gemini import get_gemini_service
 from .normalizers import normalize_all_keys
+from .step_executor import StepExecutor, StepSpec, StepContext
+from .job_store import BoundedJobStore
+from .admission import Admission, AdmissionRejected, admission_controller
+from .job_queue import job_queue
+from .progress_writer import ProgressWriter
+from .supabase_rest import supabase_rest
 
 logger = logging.getLogger(__name__)
 
@@ -224,16 +227,12 @@ def analyze_johu_compatibility(pillars_a: Dict, pillars_b: Dict) -> Dict[str, An
         'score_modifier': compatibility['score_modifier'],
     }
 
-# Supabase 설정
-SUPABASE_URL = os.getenv("SUPABASE_URL", "")
-SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
 
-
-class CompatibilityJobStore:
-    """인메모리 작업 저장소"""
+class CompatibilityJobStore(BoundedJobStore):
+    """궁합 작업 저장소 (v2.10: 공용 상한/TTL 저장소 기반)"""
 
     def __init__(self):
-        self._jobs: Dict[str, Dict[str, Any]] = {}
+        super().__init__("compatibility")
 
     def create(self, job_id: str, analysis_id: str, user_id: str) -> Dict[str, Any]:
         """작업 생성"""
@@ -264,70 +263,67 @@ class CompatibilityJobStore:
             "created_at": now,
             "updated_at": now,
         }
-        self._jobs[job_id] = job
-        return job
-
-    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """작업 조회"""
-        return self._jobs.get(job_id)
-
-    def update(self, job_id: str, **kwargs) -> Optional[Dict[str, Any]]:
-        """작업 업데이트"""
-        job = self._jobs.get(job_id)
-        if not job:
-            return None
-
-        job.update(kwargs)
-        job["updated_at"] = datetime.utcnow().isoformat()
-        return job
-
-    def update_step_status(self, job_id: str, step: str, status: str) -> None:
-        """단계 상태 업데이트"""
-        job = self._jobs.get(job_id)
-        if job and "step_statuses" in job:
-            job["step_statuses"][step] = status
-            job["updated_at"] = datetime.utcnow().isoformat()
+        return self._insert(job_id, job)
 
     def add_failed_step(self, job_id: str, step: str) -> None:
         """실패한 단계 추가"""
         job = self._jobs.get(job_id)
         if job and step not in job.get("failed_steps", []):
             job["failed_steps"].append(step)
-
-    def delete(self, job_id: str) -> bool:
-        """작업 삭제"""
-        if job_id in self._jobs:
-            del self._jobs[job_id]
-            return True
-        return False
+            self._publish(job_id)
 
 
 # 글로벌 작업 저장소
 compatibility_job_store = CompatibilityJobStore()
 
 
-# 단계별 진행률
-STEP_PROGRESS = {
+# 단계별 진행률 가중치 (StepExecutor가 progress_percent 자동 계산)
+STEP_WEIGHTS = {
     "manseryeok_a": 5,
-    "manseryeok_b": 10,
-    "compatibility_score": 25,
-    "trait_scores": 35,
-    "relationship_type": 45,
-    "trait_interpretation": 55,
-    "conflict_analysis": 65,
-    "marriage_fit": 75,
-    "mutual_influence": 82,
-    "interaction_interpretation": 90,
-    "saving": 97,
-    "complete": 100,
+    "manseryeok_b": 5,
+    "compatibility_score": 15,
+    "trait_scores": 10,
+    "relationship_type": 10,
+    "trait_interpretation": 10,
+    "conflict_analysis": 10,
+    "marriage_fit": 10,
+    "mutual_influence": 7,
+    "interaction_interpretation": 8,
+    "saving": 7,
 }
 
+# Gemini 분석 단계 (점수 계산 결과만 참조 → 서로 독립적으로 병렬 실행)
+GEMINI_STEPS = [
+    "relationship_type",          # 인연의 성격
+    "trait_interpretation",       # 연애 스타일 해석
+    "conflict_analysis",          # 갈등 포인트
+    "marriage_fit",               # 결혼 적합도
+    "mutual_influence",           # 상호 영향
+    "interaction_interpretation", # 간지 상호작용 해석
+]
+
+# v2.10: DB 컬럼으로 중간 저장되는 Gemini 단계 (체크포인트 복원 대상)
+# 만세력 / 점수 계산은 Python 엔진이라 재실행 비용이 작으므로 항상 다시 계산
+CHECKPOINT_STEPS = [step for step in GEMINI_STEPS if step != "interaction_interpretation"]
+
+
+def compatibility_checkpoint_results(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    compatibility_analyses 중간 저장 결과 → 복원 가능한 Gemini 단계 결과
+
+    Returns:
+        단계명 → 정규화된 Gemini 응답 (컬럼 값이 있는 단계만)
+    """
+    return {step: row[step] for step in CHECKPOINT_STEPS if row.get(step)}
+
 
 class CompatibilityAnalysisService:
-    """궁합 분석 서비스 (10단계 파이프라인)"""
+    """궁합 분석 서비스 (10단계 DAG 파이프라인)"""
 
     def __init__(self):
         self.gemini = None
+        # v2.10: processing 중간 저장 쓰기 병합 (병렬 Gemini 단계 완료가 몰리면 1회로)
+        self.progress = ProgressWriter("compatibility", self._write_db_status)
 
     def _get_gemini(self):
         """Gemini 서비스 지연 로딩"""
@@ -335,7 +331,7 @@ class CompatibilityAnalysisService:
             self.gemini = get_gemini_service()
         return self.gemini
 
-    async def start_analysis(self, request: Dict[str, Any]) -> str:
+    async def start_analysis(self, request: Dict[str, Any]) -> Admission:
         """
         분석 작업 시작 (백그라운드)
 
@@ -343,134 +339,155 @@ class CompatibilityAnalysisService:
             request: 분석 요청 dict
 
         Returns:
-            job_id
+            수용 결과 (job_id: 같은 분석이 진행 중이면 기존 job_id)
+
+        Raises:
+            AdmissionRejected: 작업 큐 수용 한도 초과
         """
-        job_id = str(uuid.uuid4())
         analysis_id = request.get("analysis_id")
         user_id = request.get("user_id")
 
+        job_id = str(uuid.uuid4())
+
         # 작업 생성
         compatibility_job_store.create(job_id, analysis_id, user_id)
 
-        # 백그라운드 실행
-        asyncio.create_task(self._run_pipeline(job_id, request))
+        # v2.10: 영속 작업 큐에 수용 한도 조건부 등록 (워커가 실행, 재시작 후 재개)
+        # 중복 요청 (더블 클릭 / 재시도) → 대기/진행 중인 작업에 합류
+        try:
+            admission = await admission_controller.enqueue(
+                "compatibility", job_id, request, dedup_key=analysis_id, user_id=user_id
+            )
+        except AdmissionRejected:
+            compatibility_job_store.delete(job_id)
+            raise
+        queued_job_id = admission.job_id
+        if queued_job_id != job_id:
+            compatibility_job_store.delete(job_id)
+            logger.info(f"[Compatibility] 진행 중인 작업 재사용: {analysis_id} → {queued_job_id}")
+        else:
+            # 공유 상태 백엔드 사용 시 실행은 작업을 가져간 워커 프로세스가 담당
+            compatibility_job_store.handoff(job_id)
+        return admission
+
+    async def run_queued(self, job_id: str, request: Dict[str, Any], final_attempt: bool = True):
+        """작업 큐 워커 진입점 (재시작 후 재개 시 작업 상태 재생성)"""
+        if job_id not in compatibility_job_store:
+            compatibility_job_store.create(job_id, request.get("analysis_id"), request.get("user_id"))
+        await self._run_pipeline(job_id, request, final_attempt)
+
+    async def on_interrupted(self, job_id: str, request: Dict[str, Any]):
+        """
+        작업 큐 중단 훅 (종료 대기 시간 초과)
 
-        return job_id
+        완료된 Gemini 단계는 컬럼에 중간 저장되어 있으므로 행을 pending으로 되돌려
+        재개한 워커가 체크포인트부터 이어서 실행
+        """
+        job = compatibility_job_store.mark_interrupted(job_id)
+        analysis_id = request.get("analysis_id")
+        if job is None or not analysis_id:
+            return
+        await self._update_db_status(
+            analysis_id,
+            status="pending",
+            step_statuses=job["step_statuses"],
+            progress_percent=job.get("progress_percent"),
+            current_step=job.get("current_step")
+        )
 
-    def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """작업 상태 조회"""
-        return compatibility_job_store.get(job_id)
+    async def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 조회 (다른 워커의 작업은 공유 상태 백엔드에서)"""
+        return await compatibility_job_store.fetch(job_id)
 
-    async def _run_pipeline(self, job_id: str, request: Dict[str, Any]):
+    def _build_pipeline(self, request: Dict[str, Any]) -> List[StepSpec]:
         """
-        전체 파이프라인 실행
+        궁합 파이프라인 DAG 정의
 
-        1-2. 만세력 계산 (A, B)
+        (manseryeok_a | manseryeok_b) → compatibility_score → trait_scores
+        → (Gemini 6단계 병렬) → saving
+        """
+        analysis_id = request.get("analysis_id")
+
+        steps = [
+            StepSpec(
+                name="manseryeok_a",
+                run=lambda ctx: self._step_manseryeok(ctx, request.get("profile_a"), analysis_id),
+                weight=STEP_WEIGHTS["manseryeok_a"],
+            ),
+            StepSpec(
+                name="manseryeok_b",
+                run=lambda ctx: self._step_manseryeok(ctx, request.get("profile_b"), analysis_id),
+                weight=STEP_WEIGHTS["manseryeok_b"],
+            ),
+            StepSpec(
+                name="compatibility_score",
+                run=lambda ctx: self._step_compatibility_score(ctx, analysis_id),
+                depends_on=("manseryeok_a", "manseryeok_b"),
+                weight=STEP_WEIGHTS["compatibility_score"],
+            ),
+            StepSpec(
+                name="trait_scores",
+                run=lambda ctx: self._step_trait_scores(ctx, request),
+                depends_on=("compatibility_score",),
+                weight=STEP_WEIGHTS["trait_scores"],
+            ),
+        ]
+
+        # 5-10. Gemini 분석 (실패해도 계속 진행)
+        for step_name in GEMINI_STEPS:
+            steps.append(StepSpec(
+                name=step_name,
+                run=lambda ctx: self._step_gemini_analysis(ctx, analysis_id),
+                depends_on=("trait_scores",),
+                max_attempts=3,
+                weight=STEP_WEIGHTS[step_name],
+                critical=False,
+                retry_delay=1.0,
+            ))
+
+        steps.append(StepSpec(
+            name="saving",
+            run=lambda ctx: self._step_saving(ctx, analysis_id),
+            depends_on=tuple(GEMINI_STEPS),
+            weight=STEP_WEIGHTS["saving"],
+        ))
+        return steps
+
+    async def _run_pipeline(self, job_id: str, request: Dict[str, Any], final_attempt: bool = True):
+        """
+        전체 파이프라인 실행 (DAG 실행기)
+
+        1-2. 만세력 계산 (A, B) - 병렬
         3-4. Python 점수 계산
-        5-9. Gemini 분석
-        10. DB 저장
+        5-10. Gemini 분석 - 병렬
+        11. DB 저장
 
         각 단계 완료 시 DB 중간 저장 (Report 패턴)
+        파이프라인 실패 시 상태 / DB 기록 후 예외를 다시 던짐 → 작업 큐가 max_attempts까지 재시도
+        (마지막 시도가 아니면 failed 대신 재시도 대기(pending)로 기록)
         """
         analysis_id = request.get("analysis_id")
-        language = request.get("language", "ko")
 
         try:
-            # 상태 업데이트
+            # 상태 업데이트 (재시도 시 이전 실패 정보 초기화)
             compatibility_job_store.update(
                 job_id,
-                status=CompatibilityJobStatus.PROCESSING
-            )
-
-            # 1. A 만세력 계산
-            pillars_a, daewun_a, jijanggan_a = await self._step_manseryeok(
-                job_id, "manseryeok_a", request.get("profile_a"), analysis_id
-            )
-
-            # 2. B 만세력 계산
-            pillars_b, daewun_b, jijanggan_b = await self._step_manseryeok(
-                job_id, "manseryeok_b", request.get("profile_b"), analysis_id
-            )
-
-            # 3. 궁합 점수 계산 (Python 엔진)
-            scores_result = await self._step_compatibility_score(
-                job_id, pillars_a, pillars_b, jijanggan_a, jijanggan_b, analysis_id
-            )
-
-            # 4. 연애 스타일 점수 (이미 scores_result에 포함)
-            self._update_step(job_id, "trait_scores", "completed", 35)
-
-            # trait_scores 중간 저장
-            if analysis_id:
-                job = compatibility_job_store.get(job_id)
-                await self._update_db_status(
-                    analysis_id,
-                    status="processing",
-                    step_statuses=job.get("step_statuses") if job else None,
-                    progress_percent=35,
-                    current_step="trait_scores"
-                )
-
-            # 조후(調候) 분석 추가
-            johu_analysis = analyze_johu_compatibility(pillars_a, pillars_b)
-
-            # Gemini 분석을 위한 컨텍스트 준비
-            analysis_context = {
-                "name_a": request.get("profile_a", {}).get("name", "A"),
-                "name_b": request.get("profile_b", {}).get("name", "B"),
-                "pillars_a": pillars_a,
-                "pillars_b": pillars_b,
-                "scores": scores_result.get("scores", {}),
-                "trait_scores_a": scores_result.get("traitScoresA", {}),
-                "trait_scores_b": scores_result.get("traitScoresB", {}),
-                "interactions": scores_result.get("interactions", {}),
-                "total_score": scores_result.get("totalScore", 50),
-                "johu_analysis": johu_analysis,  # 조후 분석 추가
-                "language": language,
-            }
-
-            # 5-9. Gemini 분석 (실패해도 계속 진행)
-            gemini_results = {}
-
-            # 5. 인연의 성격
-            gemini_results["relationship_type"] = await self._step_gemini_analysis(
-                job_id, "relationship_type", analysis_context, analysis_id
-            )
-
-            # 6. 연애 스타일 해석
-            gemini_results["trait_interpretation"] = await self._step_gemini_analysis(
-                job_id, "trait_interpretation", analysis_context, analysis_id
-            )
-
-            # 7. 갈등 포인트
-            gemini_results["conflict_analysis"] = await self._step_gemini_analysis(
-                job_id, "conflict_analysis", analysis_context, analysis_id
+                status=CompatibilityJobStatus.PROCESSING,
+                error=None,
+                retrying=False
             )
 
-            # 8. 결혼 적합도
-            gemini_results["marriage_fit"] = await self._step_gemini_analysis(
-                job_id, "marriage_fit", analysis_context, analysis_id
-            )
-
-            # 9. 상호 영향
-            gemini_results["mutual_influence"] = await self._step_gemini_analysis(
-                job_id, "mutual_influence", analysis_context, analysis_id
-            )
-
-            # 10. 간지 상호작용 해석
-            gemini_results["interaction_interpretation"] = await self._step_gemini_analysis(
-                job_id, "interaction_interpretation", analysis_context, analysis_id
-            )
-
-            # 11. DB 저장 (최종)
-            await self._step_saving(
+            # v2.10: 재시도 / 재시작 시 완료된 Gemini 단계는 DB 중간 저장 결과로 복원
+            restored = await self._load_checkpoint(analysis_id)
+            executor = StepExecutor(
+                self._build_pipeline(request),
+                compatibility_job_store,
                 job_id,
-                analysis_id,
-                pillars_a, pillars_b,
-                daewun_a, daewun_b,
-                scores_result,
-                gemini_results
+                on_failure=lambda ctx, error: self._on_step_failed(ctx, error, analysis_id),
+                log_prefix="Compatibility",
+                restored=restored,
             )
+            await executor.run()
 
             # 완료
             job = compatibility_job_store.get(job_id)
@@ -488,6 +505,21 @@ class CompatibilityAnalysisService:
 
         except Exception as e:
             logger.error(f"[Compatibility] 파이프라인 실패: {str(e)}")
+            if not final_attempt:
+                # 작업 큐가 다시 실행 → 최종 실패로 표시하지 않음 (완료 단계는 체크포인트에서 복원)
+                job = compatibility_job_store.get(job_id)
+                current_step = job.get("current_step") if job else None
+                job = compatibility_job_store.mark_retrying(job_id, str(e), current_step)
+                if job is not None and analysis_id:
+                    await self._update_db_status(
+                        analysis_id,
+                        status="pending",
+                        step_statuses=job["step_statuses"],
+                        progress_percent=job.get("progress_percent"),
+                        current_step=current_step
+                    )
+                raise
+
             compatibility_job_store.update(
                 job_id,
                 status=CompatibilityJobStatus.FAILED,
@@ -504,206 +536,203 @@ class CompatibilityAnalysisService:
                     error=str(e),
                     current_step=job.get("current_step") if job else None
                 )
+            raise
 
-    async def _step_manseryeok(
-        self,
-        job_id: str,
-        step_name: str,
-        profile: Dict[str, Any],
-        analysis_id: str = None
-    ) -> tuple:
-        """만세력 계산 단계"""
-        self._update_step(job_id, step_name, "in_progress", STEP_PROGRESS[step_name])
+    async def _load_checkpoint(self, analysis_id: Optional[str]) -> Dict[str, Any]:
+        """
+        DB 중간 저장 결과 조회 → 복원 단계 결과
+
+        Returns:
+            단계명 → 결과 (조회 실패 시 빈 딕셔너리 = 처음부터 실행)
+        """
+        if not analysis_id or not supabase_rest.configured:
+            return {}
 
         try:
-            from manseryeok.engine import ManseryeokEngine
-            from schemas.saju import CalculateRequest
+            response = await supabase_rest.get(
+                "compatibility_analyses",
+                params={"select": ",".join(CHECKPOINT_STEPS), "id": f"eq.{analysis_id}"},
+                timeout=10.0
+            )
+            response.raise_for_status()
+            rows = response.json()
+        except Exception as e:
+            logger.warning(f"[Compatibility] 체크포인트 조회 실패 (처음부터 실행): {analysis_id}, {e}")
+            return {}
+
+        return compatibility_checkpoint_results(rows[0]) if rows else {}
 
-            engine = ManseryeokEngine()
+    async def _on_step_failed(self, ctx: StepContext, error: Exception, analysis_id: str = None):
+        """단계 최종 실패 시 failed_steps 기록 + DB 반영"""
+        compatibility_job_store.add_failed_step(ctx.job_id, ctx.step)
 
-            # birth_date와 birth_time을 합쳐서 ISO 8601 datetime 형식으로 변환
-            birth_date = profile.get("birth_date", "1990-01-01")
-            birth_time = profile.get("birth_time", "12:00")
-            birth_datetime_str = f"{birth_date}T{birth_time}:00"
+        if not analysis_id:
+            return
 
-            request = CalculateRequest(
-                birthDatetime=birth_datetime_str,
-                timezone="GMT+9",
-                isLunar=profile.get("calendar_type") == "lunar",
-                gender=profile.get("gender", "male")
+        job = compatibility_job_store.get(ctx.job_id)
+        if ctx.step in GEMINI_STEPS:
+            # Gemini 실패해도 파이프라인 계속
+            await self._update_db_status(
+                analysis_id,
+                status="processing",
+                step_statuses=job.get("step_statuses") if job else None,
+                failed_steps=job.get("failed_steps") if job else [],
+                progress_percent=job.get("progress_percent") if job else None,
+                current_step=ctx.step
+            )
+        else:
+            await self._update_db_status(
+                analysis_id,
+                status="failed",
+                step_statuses=job.get("step_statuses") if job else None,
+                failed_steps=job.get("failed_steps") if job else [ctx.step],
+                error=str(error),
+                current_step=ctx.step
             )
 
-            result = engine.calculate(request)
+    async def _save_step_progress(self, ctx: StepContext, analysis_id: str = None, **kwargs):
+        """단계 완료 DB 중간 저장 (Report 패턴)"""
+        if not analysis_id:
+            return
 
-            pillars = result.pillars.model_dump() if hasattr(result.pillars, 'model_dump') else result.pillars
-            daewun = [d.model_dump() if hasattr(d, 'model_dump') else d for d in result.daewun]
-            jijanggan = result.jijanggan.model_dump() if hasattr(result.jijanggan, 'model_dump') else result.jijanggan
+        job = compatibility_job_store.get(ctx.job_id)
+        step_statuses = dict(job.get("step_statuses") or {}) if job else {}
+        step_statuses[ctx.step] = "completed"
+
+        await self._update_db_status(
+            analysis_id,
+            status="processing",
+            **kwargs,
+            step_statuses=step_statuses,
+            progress_percent=job.get("progress_percent") if job else None,
+            current_step=ctx.step
+        )
 
-            self._update_step(job_id, step_name, "completed", STEP_PROGRESS[step_name])
+    async def _step_manseryeok(
+        self,
+        ctx: StepContext,
+        profile: Dict[str, Any],
+        analysis_id: str = None
+    ) -> tuple:
+        """만세력 계산 단계"""
+        from manseryeok.engine import ManseryeokEngine
+        from schemas.saju import CalculateRequest
+
+        step_name = ctx.step
+        engine = ManseryeokEngine()
+
+        # birth_date와 birth_time을 합쳐서 ISO 8601 datetime 형식으로 변환
+        birth_date = profile.get("birth_date", "1990-01-01")
+        birth_time = profile.get("birth_time", "12:00")
+        birth_datetime_str = f"{birth_date}T{birth_time}:00"
+
+        request = CalculateRequest(
+            birthDatetime=birth_datetime_str,
+            timezone="GMT+9",
+            isLunar=profile.get("calendar_type") == "lunar",
+            gender=profile.get("gender", "male")
+        )
 
-            # DB 중간 저장 (Report 패턴)
-            if analysis_id:
-                job = compatibility_job_store.get(job_id)
-                pillar_key = "pillars_a" if step_name == "manseryeok_a" else "pillars_b"
-                daewun_key = "daewun_a" if step_name == "manseryeok_a" else "daewun_b"
+        result = engine.calculate(request)
 
-                await self._update_db_status(
-                    analysis_id,
-                    status="processing",
-                    **{pillar_key: pillars, daewun_key: daewun},
-                    step_statuses=job.get("step_statuses") if job else None,
-                    progress_percent=STEP_PROGRESS[step_name],
-                    current_step=step_name
-                )
+        pillars = result.pillars.model_dump() if hasattr(result.pillars, 'model_dump') else result.pillars
+        daewun = [d.model_dump() if hasattr(d, 'model_dump') else d for d in result.daewun]
+        jijanggan = result.jijanggan.model_dump() if hasattr(result.jijanggan, 'model_dump') else result.jijanggan
 
-            return pillars, daewun, jijanggan
+        # DB 중간 저장 (Report 패턴)
+        pillar_key = "pillars_a" if step_name == "manseryeok_a" else "pillars_b"
+        daewun_key = "daewun_a" if step_name == "manseryeok_a" else "daewun_b"
+        await self._save_step_progress(ctx, analysis_id, **{pillar_key: pillars, daewun_key: daewun})
 
-        except Exception as e:
-            logger.error(f"[Compatibility] {step_name} 실패: {str(e)}")
-            compatibility_job_store.update_step_status(job_id, step_name, "failed")
-            compatibility_job_store.add_failed_step(job_id, step_name)
-            # 실패 시 DB에도 기록
-            if analysis_id:
-                job = compatibility_job_store.get(job_id)
-                await self._update_db_status(
-                    analysis_id,
-                    status="failed",
-                    step_statuses=job.get("step_statuses") if job else None,
-                    failed_steps=job.get("failed_steps") if job else [step_name],
-                    error=str(e),
-                    current_step=step_name
-                )
-            raise
+        return pillars, daewun, jijanggan
 
     async def _step_compatibility_score(
         self,
-        job_id: str,
-        pillars_a: Dict,
-        pillars_b: Dict,
-        jijanggan_a: Dict = None,
-        jijanggan_b: Dict = None,
+        ctx: StepContext,
         analysis_id: str = None
     ) -> Dict[str, Any]:
         """궁합 점수 계산 단계 (Python 엔진)"""
-        self._update_step(job_id, "compatibility_score", "in_progress", 25)
+        from manseryeok.compatibility_engine import calculate_all_scores
 
-        try:
-            from manseryeok.compatibility_engine import calculate_all_scores
+        pillars_a, _, jijanggan_a = ctx.results["manseryeok_a"]
+        pillars_b, _, jijanggan_b = ctx.results["manseryeok_b"]
 
-            result = calculate_all_scores(
-                pillars_a, pillars_b,
-                jijanggan_a, jijanggan_b
-            )
+        result = calculate_all_scores(
+            pillars_a, pillars_b,
+            jijanggan_a, jijanggan_b
+        )
 
-            self._update_step(job_id, "compatibility_score", "completed", 25)
+        # DB 중간 저장 (Report 패턴)
+        await self._save_step_progress(
+            ctx,
+            analysis_id,
+            total_score=result.get("totalScore"),
+            scores=result.get("scores"),
+            trait_scores_a=result.get("traitScoresA"),
+            trait_scores_b=result.get("traitScoresB"),
+            interactions=result.get("interactions"),
+        )
 
-            # DB 중간 저장 (Report 패턴)
-            if analysis_id:
-                job = compatibility_job_store.get(job_id)
-                await self._update_db_status(
-                    analysis_id,
-                    status="processing",
-                    total_score=result.get("totalScore"),
-                    scores=result.get("scores"),
-                    trait_scores_a=result.get("traitScoresA"),
-                    trait_scores_b=result.get("traitScoresB"),
-                    interactions=result.get("interactions"),
-                    step_statuses=job.get("step_statuses") if job else None,
-                    progress_percent=25,
-                    current_step="compatibility_score"
-                )
+        return result
 
-            return result
+    async def _step_trait_scores(self, ctx: StepContext, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        연애 스타일 점수 (이미 scores_result에 포함) + Gemini 분석 컨텍스트 준비
 
-        except Exception as e:
-            logger.error(f"[Compatibility] compatibility_score 실패: {str(e)}")
-            compatibility_job_store.update_step_status(job_id, "compatibility_score", "failed")
-            compatibility_job_store.add_failed_step(job_id, "compatibility_score")
-            # 실패 시 DB에도 기록
-            if analysis_id:
-                job = compatibility_job_store.get(job_id)
-                await self._update_db_status(
-                    analysis_id,
-                    status="failed",
-                    step_statuses=job.get("step_statuses") if job else None,
-                    failed_steps=job.get("failed_steps") if job else ["compatibility_score"],
-                    error=str(e),
-                    current_step="compatibility_score"
-                )
-            raise
+        Returns:
+            Gemini 단계 공용 analysis_context
+        """
+        pillars_a = ctx.results["manseryeok_a"][0]
+        pillars_b = ctx.results["manseryeok_b"][0]
+        scores_result = ctx.results["compatibility_score"]
+
+        # trait_scores 중간 저장
+        await self._save_step_progress(ctx, request.get("analysis_id"))
+
+        # 조후(調候) 분석 추가
+        johu_analysis = analyze_johu_compatibility(pillars_a, pillars_b)
+
+        # Gemini 분석을 위한 컨텍스트 준비
+        return {
+            "name_a": request.get("profile_a", {}).get("name", "A"),
+            "name_b": request.get("profile_b", {}).get("name", "B"),
+            "pillars_a": pillars_a,
+            "pillars_b": pillars_b,
+            "scores": scores_result.get("scores", {}),
+            "trait_scores_a": scores_result.get("traitScoresA", {}),
+            "trait_scores_b": scores_result.get("traitScoresB", {}),
+            "interactions": scores_result.get("interactions", {}),
+            "total_score": scores_result.get("totalScore", 50),
+            "johu_analysis": johu_analysis,  # 조후 분석 추가
+            "language": request.get("language", "ko"),
+        }
 
     async def _step_gemini_analysis(
         self,
-        job_id: str,
-        step_name: str,
-        context: Dict[str, Any],
-        analysis_id: str = None,
-        max_retries: int = 3
-    ) -> Optional[Dict[str, Any]]:
-        """Gemini 분석 단계 (재시도 + 에러 피드백)"""
-        self._update_step(job_id, step_name, "in_progress", STEP_PROGRESS.get(step_name, 50))
-
-        last_error = None
-
-        for attempt in range(1, max_retries + 1):
-            try:
-                gemini = self._get_gemini()
-
-                # 프롬프트 빌드
-                prompt = self._build_gemini_prompt(step_name, context, last_error)
-
-                # Gemini 호출
-                response_schema = get_gemini_schema(step_name)
-                result = await gemini.generate_with_schema(
-                    prompt,
-                    response_schema=response_schema
-                )
-
-                # 정규화
-                normalized = normalize_all_keys(result)
-
-                self._update_step(job_id, step_name, "completed", STEP_PROGRESS.get(step_name, 50))
-
-                # DB 중간 저장 (Report 패턴)
-                if analysis_id:
-                    job = compatibility_job_store.get(job_id)
-                    await self._update_db_status(
-                        analysis_id,
-                        status="processing",
-                        **{step_name: normalized},
-                        step_statuses=job.get("step_statuses") if job else None,
-                        progress_percent=STEP_PROGRESS.get(step_name, 50),
-                        current_step=step_name
-                    )
-
-                return normalized
-
-            except Exception as e:
-                last_error = str(e)
-                logger.warning(f"[Compatibility] {step_name} 시도 {attempt}/{max_retries} 실패: {last_error}")
-
-                if attempt == max_retries:
-                    logger.error(f"[Compatibility] {step_name} 최종 실패")
-                    compatibility_job_store.update_step_status(job_id, step_name, "failed")
-                    compatibility_job_store.add_failed_step(job_id, step_name)
-
-                    # 실패 시에도 DB에 상태 기록 (파이프라인은 계속)
-                    if analysis_id:
-                        job = compatibility_job_store.get(job_id)
-                        await self._update_db_status(
-                            analysis_id,
-                            status="processing",  # Gemini 실패해도 파이프라인 계속
-                            step_statuses=job.get("step_statuses") if job else None,
-                            failed_steps=job.get("failed_steps") if job else [],
-                            progress_percent=STEP_PROGRESS.get(step_name, 50),
-                            current_step=step_name
-                        )
-
-                    return None
+        ctx: StepContext,
+        analysis_id: str = None
+    ) -> Dict[str, Any]:
+        """Gemini 분석 단계 (재시도 + 에러 피드백은 StepExecutor가 담당)"""
+        step_name = ctx.step
+        context = ctx.results["trait_scores"]
+        gemini = self._get_gemini()
+
+        # 프롬프트 빌드
+        prompt = self._build_gemini_prompt(step_name, context, ctx.last_error)
+
+        # Gemini 호출
+        response_schema = get_gemini_schema(step_name)
+        normalized = await gemini.generate_with_schema(
+            prompt,
+            response_schema=response_schema,
+            postprocess=normalize_all_keys,
+            step=step_name
+        )
 
-                await asyncio.sleep(1)  # 잠시 대기 후 재시도
+        # DB 중간 저장 (Report 패턴)
+        await self._save_step_progress(ctx, analysis_id, **{step_name: normalized})
 
-        return None
+        return normalized
 
     def _build_gemini_prompt(
         self,
@@ -967,85 +996,62 @@ class CompatibilityAnalysisService:
 
         return "\n".join(parts)
 
-    async def _step_saving(
-        self,
-        job_id: str,
-        analysis_id: str,
-        pillars_a: Dict, pillars_b: Dict,
-        daewun_a: List, daewun_b: List,
-        scores_result: Dict,
-        gemini_results: Dict
-    ):
+    async def _step_saving(self, ctx: StepContext, analysis_id: str = None):
         """DB 저장 단계"""
-        self._update_step(job_id, "saving", "in_progress", 97)
-
-        try:
-            if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
-                logger.warning("[Compatibility] Supabase 설정 없음, DB 저장 건너뜀")
-                self._update_step(job_id, "saving", "completed", 97)
-                return
-
-            # 실패한 단계 수집
-            job = compatibility_job_store.get(job_id)
-            failed_steps = job.get("failed_steps", []) if job else []
-
-            update_data = {
-                "status": "completed",
-                "progress_percent": 100,
-                "pillars_a": pillars_a,
-                "pillars_b": pillars_b,
-                "daewun_a": daewun_a,
-                "daewun_b": daewun_b,
-                "total_score": scores_result.get("totalScore"),
-                "scores": scores_result.get("scores"),
-                "trait_scores_a": scores_result.get("traitScoresA"),
-                "trait_scores_b": scores_result.get("traitScoresB"),
-                "interactions": scores_result.get("interactions"),
-                "relationship_type": gemini_results.get("relationship_type"),
-                "trait_interpretation": gemini_results.get("trait_interpretation"),
-                "conflict_analysis": gemini_results.get("conflict_analysis"),
-                "marriage_fit": gemini_results.get("marriage_fit"),
-                "mutual_influence": gemini_results.get("mutual_influence"),
-                "failed_steps": failed_steps,
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-
-            async with httpx.AsyncClient() as client:
-                response = await client.patch(
-                    f"{SUPABASE_URL}/rest/v1/compatibility_analyses?id=eq.{analysis_id}",
-                    json=update_data,
-                    headers={
-                        "apikey": SUPABASE_SERVICE_ROLE_KEY,
-                        "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}",
-                        "Content-Type": "application/json",
-                        "Prefer": "return=minimal",
-                    }
-                )
-                response.raise_for_status()
-
-            self._update_step(job_id, "saving", "completed", 97)
+        if not supabase_rest.configured:
+            logger.warning("[Compatibility] Supabase 설정 없음, DB 저장 건너뜀")
+            return
 
-        except Exception as e:
-            logger.error(f"[Compatibility] DB 저장 실패: {str(e)}")
-            compatibility_job_store.update_step_status(job_id, "saving", "failed")
-            compatibility_job_store.add_failed_step(job_id, "saving")
-            raise
+        pillars_a, daewun_a, _ = ctx.results["manseryeok_a"]
+        pillars_b, daewun_b, _ = ctx.results["manseryeok_b"]
+        scores_result = ctx.results["compatibility_score"]
+        gemini_results = {step_name: ctx.results.get(step_name) for step_name in GEMINI_STEPS}
+
+        # 실패한 단계 수집
+        job = compatibility_job_store.get(ctx.job_id)
+        failed_steps = job.get("failed_steps", []) if job else []
+
+        # 병합 대기 중인 중간 저장을 먼저 기록 (최종 저장 뒤에 processing으로 덮어쓰지 않도록)
+        await self.progress.close(analysis_id)
+
+        update_data = {
+            "status": "completed",
+            "progress_percent": 100,
+            "pillars_a": pillars_a,
+            "pillars_b": pillars_b,
+            "daewun_a": daewun_a,
+            "daewun_b": daewun_b,
+            "total_score": scores_result.get("totalScore"),
+            "scores": scores_result.get("scores"),
+            "trait_scores_a": scores_result.get("traitScoresA"),
+            "trait_scores_b": scores_result.get("traitScoresB"),
+            "interactions": scores_result.get("interactions"),
+            "relationship_type": gemini_results.get("relationship_type"),
+            "trait_interpretation": gemini_results.get("trait_interpretation"),
+            "conflict_analysis": gemini_results.get("conflict_analysis"),
+            "marriage_fit": gemini_results.get("marriage_fit"),
+            "mutual_influence": gemini_results.get("mutual_influence"),
+            "failed_steps": failed_steps,
+            "updated_at": datetime.utcnow().isoformat(),
+        }
 
-    def _update_step(self, job_id: str, step: str, status: str, progress: int):
-        """단계 상태 및 진행률 업데이트"""
-        compatibility_job_store.update_step_status(job_id, step, status)
-        compatibility_job_store.update(
-            job_id,
-            current_step=step,
-            progress_percent=progress
+        response = await supabase_rest.patch(
+            f"compatibility_analyses?id=eq.{analysis_id}",
+            json=update_data,
+            headers={"Prefer": "return=minimal"}
         )
+        response.raise_for_status()
+        # v2.10: DB 저장 완료 (작업 종료 후 메모리 정리 우선 대상)
+        compatibility_job_store.mark_persisted(ctx.job_id)
 
     async def _update_db_status(self, analysis_id: str, **kwargs):
         """
         Supabase DB 상태 업데이트 (Report 패턴)
         각 단계 완료 시 호출하여 크래시 복구 가능하게 함
+
+        v2.10: status=processing 중간 저장은 ProgressWriter로 병합, 실패 / 중단은 즉시 기록
         """
-        if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
+        if not supabase_rest.configured:
             logger.warning("[Compatibility] Supabase 설정 없음, DB 중간 저장 건너뜀")
             return
 
@@ -1079,25 +1085,34 @@ class CompatibilityAnalysisService:
             if kwarg_key in kwargs and kwargs[kwarg_key] is not None:
                 update_data[db_key] = kwargs[kwarg_key]
 
+        status = kwargs.get("status")
+        await self.progress.update(
+            analysis_id,
+            update_data,
+            flush=status != "processing",
+            final=status in ("completed", "failed", "pending")
+        )
+
+    async def _write_db_status(self, analysis_id: str, update_data: Dict[str, Any]) -> bool:
+        """병합된 변경 기록 (compatibility_analyses PATCH)"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.patch(
-                    f"{SUPABASE_URL}/rest/v1/compatibility_analyses?id=eq.{analysis_id}",
-                    json=update_data,
-                    headers={
-                        "apikey": SUPABASE_SERVICE_ROLE_KEY,
-                        "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}",
-                        "Content-Type": "application/json",
-                        "Prefer": "return=minimal"
-                    },
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                logger.info(f"[Compatibility] DB 중간 저장: {analysis_id}, step={kwargs.get('current_step')}")
+            response = await supabase_rest.patch(
+                f"compatibility_analyses?id=eq.{analysis_id}",
+                json=update_data,
+                headers={"Prefer": "return=minimal"},
+                timeout=30.0
+            )
+            response.raise_for_status()
+            logger.info(f"[Compatibility] DB 중간 저장: {analysis_id}, step={update_data.get('current_step')}")
+            return True
         except Exception as e:
             logger.error(f"[Compatibility] DB 중간 저장 실패: {e}")
             # 중간 저장 실패해도 파이프라인은 계속 진행
+            return False
 
 
 # 싱글톤 서비스 인스턴스
 compatibility_service = CompatibilityAnalysisService()
+job_queue.register(
+    "compatibility", compatibility_service.run_queued, on_interrupt=compatibility_service.on_interrupted
+)
@@ -1,31 +1,23 @@
 """
 상담 메시지 AI 응답 생성 서비스
 v2.0: 다회 명확화 + 최근 상담 연동 + 가정의 법칙
+v2.10: 비동기 DB 접근 (공유 PostgREST 클라이언트) + 상담 맥락 동시 조회
 """
 import asyncio
-import os
 import logging
 import json
 from typing import Dict, Any, Tuple, List, Optional
 from datetime import datetime
 
-from supabase import create_client, Client
-
 from .gemini import get_gemini_service
+from .admission import Admission, admission_controller
+from .job_queue import job_queue
+from .supabase_rest import supabase_rest
 from prompts.consultation import build_assessment_prompt, build_answer_prompt
 
 logger = logging.getLogger(__name__)
 
 
-def get_supabase_client() -> Client:
-    """Supabase 클라이언트 생성"""
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-    if not url or not key:
-        raise ValueError("SUPABASE_URL 또는 SUPABASE_SERVICE_ROLE_KEY 환경변수가 설정되지 않았습니다")
-    return create_client(url, key)
-
-
 # 일간 비유 매핑
 STEM_METAPHORS = {
     '甲': '甲木(큰 나무)', '乙': '乙木(풀/덩굴)',
@@ -36,13 +28,18 @@ STEM_METAPHORS = {
 }
 
 
+def consultation_user_key(request: Dict[str, Any]) -> Optional[str]:
+    """공정 임대 / 수용 한도 기준 사용자 (user_id 미전달 시 프로필 → 세션, v2.10)"""
+    return request.get("user_id") or request.get("profile_id") or request.get("session_id")
+
+
 class ConsultationService:
     """상담 AI 응답 생성 서비스 v2.0"""
 
     MAX_RETRIES = 3
     MAX_CLARIFICATIONS = 3
 
-    async def start_generate(self, request: dict):
+    async def start_generate(self, request: dict) -> Admission:
         """
         백그라운드에서 AI 응답 생성 시작
 
@@ -57,22 +54,44 @@ class ConsultationService:
               - skip_clarification: bool
               - question_round: int
               - language: 언어 코드 (ko, en, ja, zh-CN, zh-TW)
+
+        Returns:
+            수용 결과
+
+        Raises:
+            AdmissionRejected: 작업 큐 수용 한도 초과
         """
-        asyncio.create_task(self._generate_response(request))
+        message_id = request['message_id']
+
+        # v2.10: 영속 작업 큐에 수용 한도 조건부 등록 (워커가 실행, 재시작 후 재개)
+        # 같은 메시지 생성이 대기/진행 중이면 등록하지 않고 기존 작업에 합류
+        admission = await admission_controller.enqueue(
+            "consultation", message_id, request,
+            dedup_key=message_id, user_id=consultation_user_key(request),
+        )
+        if admission.joined:
+            logger.warning(f"[Consultation:{message_id}] 이미 생성 중 - 중복 요청 무시")
+        return admission
+
+    async def run_queued(self, message_id: str, request: dict, final_attempt: bool = True):
+        """작업 큐 워커 진입점 (재시도는 _generate_response 내부에서 처리)"""
+        await self._generate_response(request)
 
     async def _generate_response(self, request: dict):
         """
         AI 응답 생성 (3회 재시도, 중복 요청 방지)
+
+        v2.10: DB 조회/저장은 공유 비동기 PostgREST 클라이언트 사용 (이벤트 루프 블로킹 없음)
         """
-        supabase = get_supabase_client()
         message_id = request['message_id']
 
         # 처리 시작 전 상태 확인 (중복 요청 방지)
-        status_check = supabase.table('consultation_messages').select(
-            'status'
-        ).eq('id', message_id).single().execute()
+        status_rows = await self._select('consultation_messages', {
+            'select': 'status',
+            'id': f'eq.{message_id}',
+        })
 
-        if not status_check.data or status_check.data.get('status') != 'generating':
+        if not status_rows or status_rows[0].get('status') != 'generating':
             logger.warning(f"[Consultation:{message_id}] 이미 처리 중이거나 완료됨 - 스킵")
             return
 
@@ -83,15 +102,8 @@ class ConsultationService:
             try:
                 logger.info(f"[Consultation:{message_id}] 시도 {attempt}/{self.MAX_RETRIES}")
 
-                # 1. 리포트 데이터 조회
-                report = self._get_report_data(supabase, request['profile_report_id'])
-
-                # 2. 최근 상담 기록 조회 (최대 5개)
-                profile_id = request.get('profile_id') or report.get('profile_id')
-                recent_consultations = self._get_recent_consultations(supabase, profile_id)
-
-                # 3. 현재 세션 히스토리 조회
-                history = self._get_session_history(supabase, request['session_id'], message_id)
+                # 1~3. 리포트 / 최근 상담 기록 (최대 5개) / 현재 세션 히스토리 동시 조회
+                report, recent_consultations, history = await self._load_context(request)
 
                 # 4. AI 응답 생성
                 ai_content, final_type, clarification_round = await self._call_gemini(
@@ -100,29 +112,27 @@ class ConsultationService:
                 )
 
                 # 5. DB 업데이트 (성공) - generating 상태인 경우만 업데이트
-                result = supabase.table('consultation_messages').update({
+                updated = await self._update_message(message_id, {
                     'content': ai_content,
                     'message_type': final_type,
                     'status': 'completed',
                     'clarification_round': clarification_round,
-                }).eq('id', message_id).eq('status', 'generating').execute()
+                })
 
                 # 이미 처리된 경우 (중복 요청) 조기 종료
-                if not result.data:
+                if not updated:
                     logger.warning(f"[Consultation:{message_id}] 이미 처리됨 (중복 요청)")
                     return
 
                 # 6. 세션 업데이트
                 if final_type == 'ai_answer':
-                    self._update_session(
-                        supabase,
+                    await self._update_session(
                         request['session_id'],
                         request.get('user_content', ''),
                         increment_question=True
                     )
                 elif final_type == 'ai_clarification':
-                    self._update_session(
-                        supabase,
+                    await self._update_session(
                         request['session_id'],
                         request.get('user_content', ''),
                         increment_clarification=True,
@@ -140,69 +150,142 @@ class ConsultationService:
 
         if not success:
             logger.error(f"[Consultation:{message_id}] 최종 실패: {last_error}")
-            supabase.table('consultation_messages').update({
+            await self._update_message(message_id, {
                 'status': 'failed',
                 'error_message': last_error or 'AI 응답 생성에 실패했습니다',
-            }).eq('id', message_id).eq('status', 'generating').execute()
+            })
+
+    async def _select(self, table: str, params: Dict[str, str]) -> List[dict]:
+        """PostgREST 조회 (행 목록)"""
+        if not supabase_rest.configured:
+            raise ValueError("SUPABASE_URL 또는 SUPABASE_SERVICE_ROLE_KEY 환경변수가 설정되지 않았습니다")
+        response = await supabase_rest.get(table, params=params, timeout=10.0)
+        response.raise_for_status()
+        return response.json() or []
+
+    async def _update_message(self, message_id: str, data: dict) -> bool:
+        """generating 상태인 메시지만 업데이트 (업데이트된 행이 없으면 False)"""
+        response = await supabase_rest.patch(
+            'consultation_messages',
+            params={'id': f'eq.{message_id}', 'status': 'eq.generating', 'select': 'id'},
+            json=data,
+            headers={'Prefer': 'return=representation'},
+            timeout=10.0
+        )
+        response.raise_for_status()
+        return bool(response.json())
+
+    async def _load_context(self, request: dict) -> Tuple[dict, List[dict], List[dict]]:
+        """
+        리포트 / 최근 상담 기록 / 세션 히스토리 동시 조회
 
-    def _get_report_data(self, supabase: Client, report_id: str) -> dict:
-        """리포트 데이터 조회 (신년분석 요약 포함)"""
-        result = supabase.table('profile_reports').select(
-            'profile_id, pillars, daewun, analysis'
-        ).eq('id', report_id).single().execute()
+        profile_id가 요청에 없으면 최근 상담 기록은 리포트 조회 후 (리포트의 profile_id 기준)
+        """
+        profile_id = request.get('profile_id')
+        history_task = self._get_session_history(request['session_id'], request['message_id'])
 
-        if not result.data:
-            raise ValueError("사주 분석 데이터를 불러올 수 없습니다")
+        if profile_id:
+            report, recent_consultations, history = await asyncio.gather(
+                self._get_report_data(request['profile_report_id'], profile_id),
+                self._get_recent_consultations(profile_id),
+                history_task,
+            )
+            return report, recent_consultations, history
 
-        report_data = result.data
+        report, history = await asyncio.gather(
+            self._get_report_data(request['profile_report_id']),
+            history_task,
+        )
+        recent_consultations = await self._get_recent_consultations(report.get('profile_id'))
+        return report, recent_consultations, history
+
+    async def _get_report_data(self, report_id: str, profile_id: Optional[str] = None) -> dict:
+        """
+        리포트 데이터 조회 (신년분석 요약 포함)
 
-        # 신년분석 요약 조회
-        profile_id = report_data.get('profile_id')
+        profile_id를 알면 신년분석 요약도 리포트와 동시 조회
+        """
         if profile_id:
-            yearly_result = supabase.table('yearly_analyses').select(
-                'target_year, overview'
-            ).eq('profile_id', profile_id).eq(
-                'status', 'completed'
-            ).order('target_year', desc=True).limit(1).execute()
-
-            if yearly_result.data:
-                yearly = yearly_result.data[0]
-                overview = yearly.get('overview') or {}
-                if overview.get('summary'):
-                    report_data['yearly_summary'] = {
-                        'year': yearly.get('target_year'),
-                        'summary': overview.get('summary')
-                    }
+            report_rows, yearly_rows = await asyncio.gather(
+                self._select_report(report_id),
+                self._select_yearly_summary(profile_id),
+            )
+        else:
+            report_rows = await self._select_report(report_id)
+            yearly_rows = None
+
+        if not report_rows:
+            raise ValueError("사주 분석 데이터를 불러올 수 없습니다")
+
+        report_data = report_rows[0]
+
+        # 신년분석 요약 조회 (리포트의 profile_id 기준)
+        report_profile_id = report_data.get('profile_id')
+        if not report_profile_id:
+            yearly_rows = None
+        elif report_profile_id != profile_id:
+            yearly_rows = await self._select_yearly_summary(report_profile_id)
+
+        if yearly_rows:
+            yearly = yearly_rows[0]
+            overview = yearly.get('overview') or {}
+            if overview.get('summary'):
+                report_data['yearly_summary'] = {
+                    'year': yearly.get('target_year'),
+                    'summary': overview.get('summary')
+                }
 
         return report_data
 
-    def _get_recent_consultations(
+    async def _select_report(self, report_id: str) -> List[dict]:
+        return await self._select('profile_reports', {
+            'select': 'profile_id,pillars,daewun,analysis',
+            'id': f'eq.{report_id}',
+        })
+
+    async def _select_yearly_summary(self, profile_id: str) -> List[dict]:
+        return await self._select('yearly_analyses', {
+            'select': 'target_year,overview',
+            'profile_id': f'eq.{profile_id}',
+            'status': 'eq.completed',
+            'order': 'target_year.desc',
+            'limit': '1',
+        })
+
+    async def _get_recent_consultations(
         self,
-        supabase: Client,
         profile_id: str,
         limit: int = 5
     ) -> List[dict]:
-        """최근 완료된 상담 기록 조회 (최대 5개)"""
+        """최근 완료된 상담 기록 조회 (최대 5개, 세션별 마지막 답변은 동시 조회)"""
         if not profile_id:
             return []
 
-        result = supabase.table('consultation_sessions').select(
-            'id, title, created_at'
-        ).eq('profile_id', profile_id).eq(
-            'status', 'completed'
-        ).order('created_at', desc=True).limit(limit).execute()
+        sessions = await self._select('consultation_sessions', {
+            'select': 'id,title,created_at',
+            'profile_id': f'eq.{profile_id}',
+            'status': 'eq.completed',
+            'order': 'created_at.desc',
+            'limit': str(limit),
+        })
+
+        # 각 세션의 마지막 AI 답변 조회
+        answers = await asyncio.gather(*(
+            self._select('consultation_messages', {
+                'select': 'content',
+                'session_id': f"eq.{session['id']}",
+                'message_type': 'eq.ai_answer',
+                'status': 'eq.completed',
+                'order': 'created_at.desc',
+                'limit': '1',
+            })
+            for session in sessions
+        ))
 
         consultations = []
-        for session in result.data or []:
-            # 각 세션의 마지막 AI 답변 조회
-            messages = supabase.table('consultation_messages').select(
-                'content'
-            ).eq('session_id', session['id']).eq(
-                'message_type', 'ai_answer'
-            ).eq('status', 'completed').order('created_at', desc=True).limit(1).execute()
-
-            if messages.data and messages.data[0].get('content'):
-                content = messages.data[0]['content']
+        for session, messages in zip(sessions, answers):
+            if messages and messages[0].get('content'):
+                content = messages[0]['content']
                 # 요약 생성 (처음 200자)
                 summary = content[:200].replace('\n', ' ')
                 if len(content) > 200:
@@ -216,20 +299,18 @@ class ConsultationService:
 
         return consultations
 
-    def _get_session_history(
+    async def _get_session_history(
         self,
-        supabase: Client,
         session_id: str,
         exclude_message_id: str
     ) -> List[dict]:
         """현재 세션의 메시지 히스토리 조회"""
-        result = supabase.table('consultation_messages').select(
-            'id, message_type, content, question_round, clarification_round, status'
-        ).eq('session_id', session_id).neq(
-            'id', exclude_message_id
-        ).order('created_at', desc=False).execute()
-
-        return result.data or []
+        return await self._select('consultation_messages', {
+            'select': 'id,message_type,content,question_round,clarification_round,status',
+            'session_id': f'eq.{session_id}',
+            'id': f'neq.{exclude_message_id}',
+            'order': 'created_at.asc',
+        })
 
     def _build_pillars_summary(self, pillars: dict, analysis: dict) -> str:
         """사주 요약 문자열 생성"""
@@ -276,9 +357,8 @@ class ConsultationService:
 
         return clarifications
 
-    def _update_session(
+    async def _update_session(
         self,
-        supabase: Client,
         session_id: str,
         user_content: str,
         increment_question: bool = False,
@@ -286,14 +366,15 @@ class ConsultationService:
         clarification_round: int = 0
     ):
         """세션 업데이트"""
-        session_result = supabase.table('consultation_sessions').select(
-            'question_count, clarification_count, title'
-        ).eq('id', session_id).single().execute()
+        sessions = await self._select('consultation_sessions', {
+            'select': 'question_count,clarification_count,title',
+            'id': f'eq.{session_id}',
+        })
 
-        if not session_result.data:
+        if not sessions:
             return
 
-        session = session_result.data
+        session = sessions[0]
         update_data = {
             'updated_at': datetime.utcnow().isoformat(),
         }
@@ -311,9 +392,13 @@ class ConsultationService:
         if session['question_count'] == 0 and (not current_title or current_title == '새 상담'):
             update_data['title'] = user_content[:30] + ('...' if len(user_content) > 30 else '')
 
-        supabase.table('consultation_sessions').update(
-            update_data
-        ).eq('id', session_id).execute()
+        response = await supabase_rest.patch(
+            f'consultation_sessions?id=eq.{session_id}',
+            json=update_data,
+            headers={'Prefer': 'return=minimal'},
+            timeout=10.0
+        )
+        response.raise_for_status()
 
     async def _call_gemini(
         self,
@@ -350,7 +435,7 @@ class ConsultationService:
         if current_clarification_round >= self.MAX_CLARIFICATIONS or skip_clarification:
             logger.info(f"[Consultation] 바로 답변 생성 (round={current_clarification_round}, skip={skip_clarification})")
             return await self._generate_final_answer(
-                gemini, request, report, clarification_history,
+                gemini, request, report, history, clarification_history,
                 recent_consultations, 100, previous_error
             )
 
@@ -371,7 +456,7 @@ class ConsultationService:
             )
 
             try:
-                assessment = await gemini.generate_json(assessment_prompt)
+                assessment = await gemini.generate_json(assessment_prompt, hedge=True)
                 logger.info(f"[Consultation] 평가 결과: {assessment}")
 
                 # 유효하지 않은 질문
@@ -386,7 +471,7 @@ class ConsultationService:
                 if is_sufficient or confidence >= 80:
                     logger.info(f"[Consultation] 정보 충분 (confidence={confidence}%) → 답변 생성")
                     return await self._generate_final_answer(
-                        gemini, request, report, clarification_history,
+                        gemini, request, report, history, clarification_history,
                         recent_consultations, confidence, previous_error
                     )
 
@@ -403,20 +488,20 @@ class ConsultationService:
                 # nextQuestions가 없으면 답변 생성
                 logger.info("[Consultation] nextQuestions 없음 → 답변 생성")
                 return await self._generate_final_answer(
-                    gemini, request, report, clarification_history,
+                    gemini, request, report, history, clarification_history,
                     recent_consultations, confidence, previous_error
                 )
 
             except Exception as e:
                 logger.warning(f"[Consultation] 평가 실패, 바로 답변 시도: {e}")
                 return await self._generate_final_answer(
-                    gemini, request, report, clarification_history,
+                    gemini, request, report, history, clarification_history,
                     recent_consultations, 50, previous_error
                 )
 
         # 기타 경우 → 답변 생성
         return await self._generate_final_answer(
-            gemini, request, report, clarification_history,
+            gemini, request, report, history, clarification_history,
             recent_consultations, 100, previous_error
         )
 
@@ -444,6 +529,7 @@ class ConsultationService:
         gemini,
         request: dict,
         report: dict,
+        history: List[dict],
         clarification_history: List[Dict[str, str]],
         recent_consultations: List[dict],
         confidence_level: int,
@@ -463,12 +549,8 @@ class ConsultationService:
         # user_clarification인 경우 원래 질문 찾기
         original_question = user_content
         if message_type == 'user_clarification':
-            # 히스토리에서 원래 user_question 찾기
-            for msg in self._get_session_history(
-                get_supabase_client(),
-                request['session_id'],
-                request['message_id']
-            ):
+            # 히스토리에서 원래 user_question 찾기 (응답 생성 전에 조회한 히스토리 재사용)
+            for msg in history:
                 if msg.get('message_type') == 'user_question':
                     original_question = msg.get('content', user_content)
                     break
@@ -478,11 +560,7 @@ class ConsultationService:
             clarification_history = clarification_history.copy()
             # 마지막 ai_clarification 찾기
             last_ai_q = None
-            for msg in self._get_session_history(
-                get_supabase_client(),
-                request['session_id'],
-                request['message_id']
-            ):
+            for msg in history:
                 if msg.get('message_type') == 'ai_clarification' and msg.get('status') == 'completed':
                     last_ai_q = msg.get('content', '')
 
@@ -516,9 +594,10 @@ class ConsultationService:
 오류: {previous_error}
 위 오류를 해결하여 올바르게 응답하세요."""
 
-        answer = await gemini.generate_text(answer_prompt)
+        answer = await gemini.generate_text(answer_prompt, hedge=True)
         return answer, 'ai_answer', len(clarification_history)
 
 
 # 싱글톤 인스턴스
 consultation_service = ConsultationService()
+job_queue.register("consultation", consultation_service.run_queued)
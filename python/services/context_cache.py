@@ -0,0 +1,178 @@
+"""
+정적 시스템 프롬프트 컨텍스트 캐싱
+
+PromptBuilder의 시스템 프롬프트(마스터 + 고전 요약 + 단계 지시)는 언어/단계별로 고정이므로
+Gemini cached content로 한 번 등록하고, 요청마다 사주별 사용자 프롬프트만 전송합니다.
+
+- 키: sha256(model + system_prompt) → 언어/버전이 바뀌면 자동으로 새 핸들
+- TTL 만료 전 자동 재등록
+- 등록 실패 (최소 토큰 미달, 미지원 모델 등) 시 일정 시간 인라인 전송으로 폴백
+- 테스트/로컬에서는 LocalContextBackend로 대체 가능
+"""
+import asyncio
+import datetime
+import hashlib
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+from .single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+GEMINI_CONTEXT_CACHE_ENABLED = os.getenv("GEMINI_CONTEXT_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+# cached content TTL (초)
+GEMINI_CONTEXT_CACHE_TTL = int(os.getenv("GEMINI_CONTEXT_CACHE_TTL", "3600"))
+# 만료 전 재등록 여유 (초)
+CONTEXT_CACHE_REFRESH_MARGIN = 300
+# 등록 실패 후 재시도 대기 (초)
+CONTEXT_CACHE_FAILURE_BACKOFF = 600
+# 캐싱 대상 최소 길이 (짧은 프롬프트는 캐싱 이점 없음 / 공급자 최소 토큰 미달)
+CONTEXT_CACHE_MIN_CHARS = int(os.getenv("GEMINI_CONTEXT_CACHE_MIN_CHARS", "4000"))
+
+
+class GeminiContextBackend:
+    """google.generativeai cached content 백엔드"""
+
+    def __init__(self, model_name: str, generation_config: Dict[str, Any]):
+        self.model_name = model_name
+        self.generation_config = generation_config
+
+    def create(self, system_prompt: str, ttl_seconds: int) -> Any:
+        """cached content 등록 (동기 API)"""
+        from google.generativeai import caching
+
+        return caching.CachedContent.create(
+            model=f"models/{self.model_name}",
+            system_instruction=system_prompt,
+            ttl=datetime.timedelta(seconds=ttl_seconds),
+        )
+
+    def model_for(self, handle: Any) -> Any:
+        """cached content 기반 모델"""
+        import google.generativeai as genai
+
+        return genai.GenerativeModel.from_cached_content(
+            cached_content=handle,
+            generation_config=self.generation_config,
+        )
+
+    def delete(self, handle: Any) -> None:
+        """cached content 삭제"""
+        handle.delete()
+
+
+class LocalContextBackend:
+    """
+    로컬 대체 백엔드 (테스트용)
+
+    model_for()는 등록된 시스템 프롬프트를 앞에 붙여 base_model을 호출하는 래퍼를 반환합니다.
+    """
+
+    def __init__(self, base_model: Any):
+        self.base_model = base_model
+        self.created = 0
+
+    def create(self, system_prompt: str, ttl_seconds: int) -> Any:
+        self.created += 1
+        return {"name": f"local/{self.created}", "system_prompt": system_prompt}
+
+    def model_for(self, handle: Any) -> Any:
+        base_model = self.base_model
+        system_prompt = handle["system_prompt"]
+
+        class _Model:
+            async def generate_content_async(self, prompt, **kwargs):
+                return await base_model.generate_content_async(f"{system_prompt}\n\n{prompt}", **kwargs)
+
+        return _Model()
+
+    def delete(self, handle: Any) -> None:
+        pass
+
+
+class ContextCache:
+    """시스템 프롬프트 → cached content 모델 매핑"""
+
+    def __init__(
+        self,
+        backend: Any,
+        model_name: str,
+        ttl_seconds: int = GEMINI_CONTEXT_CACHE_TTL,
+        min_chars: int = CONTEXT_CACHE_MIN_CHARS,
+    ):
+        self.backend = backend
+        self.model_name = model_name
+        self.ttl_seconds = ttl_seconds
+        self.min_chars = min_chars
+        # key → {"model", "handle", "expires_at"}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # key → 재시도 가능 시각 (등록 실패)
+        self._failures: Dict[str, float] = {}
+        self._flight = SingleFlight("context_cache")
+        self.hits = 0
+        self.created = 0
+
+    def _key(self, system_prompt: str) -> str:
+        material = f"{self.model_name}\n{system_prompt}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def get_model(self, system_prompt: str) -> Optional[Any]:
+        """
+        시스템 프롬프트가 등록된 모델 반환
+
+        Returns:
+            cached content 모델 (캐싱 불가/실패 시 None → 호출자가 인라인 전송)
+        """
+        if len(system_prompt) < self.min_chars:
+            return None
+
+        key = self._key(system_prompt)
+        now = time.monotonic()
+
+        entry = self._entries.get(key)
+        if entry and entry["expires_at"] - CONTEXT_CACHE_REFRESH_MARGIN > now:
+            self.hits += 1
+            return entry["model"]
+
+        if self._failures.get(key, 0) > now:
+            return None
+
+        try:
+            # 동시 첫 요청은 등록 1회로 병합 (모델 객체는 복사하지 않도록 _entries에서 조회)
+            await self._flight.do(key, lambda: self._register(key, system_prompt))
+            return self._entries[key]["model"]
+        except Exception as e:
+            logger.warning(f"[ContextCache] 등록 실패, 인라인 전송으로 폴백: {e}")
+            self._failures[key] = now + CONTEXT_CACHE_FAILURE_BACKOFF
+            return None
+
+    async def _register(self, key: str, system_prompt: str) -> None:
+        """cached content 등록 (기존 핸들은 만료 직전이면 교체)"""
+        handle = await asyncio.to_thread(self.backend.create, system_prompt, self.ttl_seconds)
+        model = self.backend.model_for(handle)
+
+        previous = self._entries.get(key)
+        self._entries[key] = {
+            "model": model,
+            "handle": handle,
+            "expires_at": time.monotonic() + self.ttl_seconds,
+        }
+        self.created += 1
+        logger.info(f"[ContextCache] 시스템 프롬프트 등록 ({len(system_prompt)}자, key={key[:12]})")
+
+        if previous is not None:
+            try:
+                await asyncio.to_thread(self.backend.delete, previous["handle"])
+            except Exception as e:
+                logger.debug(f"[ContextCache] 이전 핸들 삭제 실패 (만료 예정): {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """등록 핸들 / 재사용 통계"""
+        return {
+            "handles": len(self._entries),
+            "created": self.created,
+            "hits": self.hits,
+            "failed_keys": len(self._failures),
+        }
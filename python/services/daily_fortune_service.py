@@ -15,9 +15,7 @@
 """
 import asyncio
 import logging
-import os
 import json
-import httpx
 from datetime import datetime, date
 from typing import Dict, Any, Optional, List, Tuple
 
@@ -28,6 +26,9 @@ from prompts.daily_prompts import (
 )
 from .gemini import get_gemini_service
 from .normalizers import normalize_all_keys, normalize_response
+from .progress_writer import ProgressWriter
+from .single_flight import SingleFlight
+from .supabase_rest import supabase_rest
 from schemas.daily_fortune import validate_daily_fortune
 
 # 점수 계산 모듈에서 기존 상수 가져오기
@@ -47,9 +48,13 @@ from manseryeok.compatibility_engine import (
 
 logger = logging.getLogger(__name__)
 
-# Supabase 설정
-SUPABASE_URL = os.getenv("SUPABASE_URL", "")
-SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
+# 동일 프로필/날짜 운세 생성 병합 (재시도 폭주 시 Gemini 중복 호출 방지)
+daily_fortune_flight = SingleFlight("daily_fortune")
+
+
+def daily_fortune_key(user_id: str, profile_id: str, target_date: str, language: str) -> str:
+    """오늘의 운세 병합 키 (single-flight / 수용 제어 공통)"""
+    return f"{user_id}:{profile_id}:{target_date}:{language}"
 
 # 60갑자 테이블 (일진 계산용)
 STEMS = ['甲', '乙', '丙', '丁', '戊', '己', '庚', '辛', '壬', '癸']
@@ -599,6 +604,8 @@ class DailyFortuneService:
 
     def __init__(self):
         self.gemini = None  # lazy init
+        # v2.10: 단계별 진행 상태 쓰기 병합 (계산 단계는 모아서, Gemini 직전 / 종료 시 즉시 기록)
+        self.progress = ProgressWriter("daily_fortune", self._write_fortune_status)
 
     def _get_gemini(self):
         """Gemini 서비스 지연 로딩"""
@@ -619,10 +626,11 @@ class DailyFortuneService:
         progress_percent: int,
         step_statuses: Dict[str, str],
         partial_result: Dict[str, Any] = None,
-        error: Dict[str, Any] = None
+        error: Dict[str, Any] = None,
+        flush: bool = False
     ) -> bool:
         """
-        운세 분석 중간 상태 저장 (UPSERT)
+        운세 분석 중간 상태 저장 (UPSERT, v2.10: 진행 상태 쓰기 병합)
 
         Args:
             user_id: 사용자 ID
@@ -633,11 +641,12 @@ class DailyFortuneService:
             step_statuses: 단계별 상태
             partial_result: 부분 결과 (선택)
             error: 에러 정보 (선택)
+            flush: 모인 변경과 함께 즉시 기록 (완료 / 실패는 항상 즉시)
 
         Returns:
-            성공 여부
+            성공 여부 (병합 대기 중이면 True)
         """
-        if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
+        if not supabase_rest.configured:
             return False
 
         update_data = {
@@ -654,20 +663,23 @@ class DailyFortuneService:
         if error:
             update_data["error"] = error
 
+        return await self.progress.update(
+            f"{user_id}:{profile_id}:{fortune_date}",
+            update_data,
+            flush=flush,
+            final=status in ("completed", "failed")
+        )
+
+    async def _write_fortune_status(self, key: str, update_data: Dict[str, Any]) -> bool:
+        """병합된 진행 상태 기록 (daily_fortunes UPSERT)"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{SUPABASE_URL}/rest/v1/daily_fortunes",
-                    json=update_data,
-                    headers={
-                        "apikey": SUPABASE_SERVICE_ROLE_KEY,
-                        "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}",
-                        "Content-Type": "application/json",
-                        "Prefer": "return=minimal,resolution=merge-duplicates"
-                    },
-                    timeout=10.0
-                )
-                return response.status_code in [200, 201]
+            response = await supabase_rest.post(
+                "daily_fortunes",
+                json=update_data,
+                headers={"Prefer": "return=minimal,resolution=merge-duplicates"},
+                timeout=10.0
+            )
+            return response.status_code in [200, 201]
         except Exception as e:
             logger.warning(f"[DailyFortune] 중간 저장 실패: {e}")
             return False
@@ -1366,48 +1378,43 @@ class DailyFortuneService:
         Returns:
             용신 오행 (木, 火, 土, 金, 水) 또는 None
         """
-        if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
+        if not supabase_rest.configured:
             return None
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{SUPABASE_URL}/rest/v1/profile_reports",
-                    params={
-                        'select': 'basic_analysis',
-                        'profile_id': f'eq.{profile_id}',
-                        'status': 'eq.completed',
-                        'order': 'created_at.desc',
-                        'limit': '1'
-                    },
-                    headers={
-                        'apikey': SUPABASE_SERVICE_ROLE_KEY,
-                        'Authorization': f'Bearer {SUPABASE_SERVICE_ROLE_KEY}',
-                    },
-                    timeout=10.0
-                )
+            response = await supabase_rest.get(
+                "profile_reports",
+                params={
+                    'select': 'basic_analysis',
+                    'profile_id': f'eq.{profile_id}',
+                    'status': 'eq.completed',
+                    'order': 'created_at.desc',
+                    'limit': '1'
+                },
+                timeout=10.0
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    if data and len(data) > 0:
-                        basic = data[0].get('basic_analysis', {})
-                        if isinstance(basic, str):
-                            try:
-                                basic = json.loads(basic)
-                            except:
-                                return None
-
-                        # usefulGod 또는 useful_god 필드에서 추출
-                        useful_god = basic.get('usefulGod') or basic.get('useful_god', {})
-                        if isinstance(useful_god, dict):
-                            element = useful_god.get('element', '')
-                            if element and element in ['木', '火', '土', '金', '水']:
-                                return element
-                        elif isinstance(useful_god, str) and len(useful_god) > 0:
-                            # '木 (갑목)' 형태에서 첫 글자만 추출
-                            if useful_god[0] in ['木', '火', '土', '金', '水']:
-                                return useful_god[0]
-                return None
+            if response.status_code == 200:
+                data = response.json()
+                if data and len(data) > 0:
+                    basic = data[0].get('basic_analysis', {})
+                    if isinstance(basic, str):
+                        try:
+                            basic = json.loads(basic)
+                        except:
+                            return None
+
+                    # usefulGod 또는 useful_god 필드에서 추출
+                    useful_god = basic.get('usefulGod') or basic.get('useful_god', {})
+                    if isinstance(useful_god, dict):
+                        element = useful_god.get('element', '')
+                        if element and element in ['木', '火', '土', '金', '水']:
+                            return element
+                    elif isinstance(useful_god, str) and len(useful_god) > 0:
+                        # '木 (갑목)' 형태에서 첫 글자만 추출
+                        if useful_god[0] in ['木', '火', '土', '金', '水']:
+                            return useful_god[0]
+            return None
         except Exception as e:
             logger.warning(f"용신 조회 실패: {e}")
             return None
@@ -1729,64 +1736,55 @@ class DailyFortuneService:
             [{"date": "2026-01-10", "question": "...", "summary": "..."}, ...]
         """
         try:
-            async with httpx.AsyncClient() as client:
-                # 1단계: 최근 완료된 세션 조회
-                sessions_response = await client.get(
-                    f"{SUPABASE_URL}/rest/v1/consultation_sessions",
+            # 1단계: 최근 완료된 세션 조회
+            sessions_response = await supabase_rest.get(
+                "consultation_sessions",
+                params={
+                    "profile_id": f"eq.{profile_id}",
+                    "status": "eq.completed",
+                    "select": "id,title,created_at",
+                    "order": "created_at.desc",
+                    "limit": str(limit)
+                },
+                timeout=10.0
+            )
+            sessions_response.raise_for_status()
+            sessions = sessions_response.json()
+
+            if not sessions:
+                return []
+
+            consultations = []
+            for session in sessions:
+                # 2단계: 각 세션의 마지막 AI 답변 조회
+                messages_response = await supabase_rest.get(
+                    "consultation_messages",
                     params={
-                        "profile_id": f"eq.{profile_id}",
+                        "session_id": f"eq.{session['id']}",
+                        "message_type": "eq.ai_answer",
                         "status": "eq.completed",
-                        "select": "id,title,created_at",
+                        "select": "content",
                         "order": "created_at.desc",
-                        "limit": str(limit)
-                    },
-                    headers={
-                        "apikey": SUPABASE_SERVICE_ROLE_KEY,
-                        "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}",
+                        "limit": "1"
                     },
                     timeout=10.0
                 )
-                sessions_response.raise_for_status()
-                sessions = sessions_response.json()
-
-                if not sessions:
-                    return []
-
-                consultations = []
-                for session in sessions:
-                    # 2단계: 각 세션의 마지막 AI 답변 조회
-                    messages_response = await client.get(
-                        f"{SUPABASE_URL}/rest/v1/consultation_messages",
-                        params={
-                            "session_id": f"eq.{session['id']}",
-                            "message_type": "eq.ai_answer",
-                            "status": "eq.completed",
-                            "select": "content",
-                            "order": "created_at.desc",
-                            "limit": "1"
-                        },
-                        headers={
-                            "apikey": SUPABASE_SERVICE_ROLE_KEY,
-                            "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}",
-                        },
-                        timeout=10.0
-                    )
-                    messages_response.raise_for_status()
-                    messages = messages_response.json()
-
-                    if messages and messages[0].get('content'):
-                        content = messages[0]['content']
-                        summary = content[:200].replace('\n', ' ')
-                        if len(content) > 200:
-                            summary += '...'
-
-                        consultations.append({
-                            'date': session['created_at'][:10],
-                            'question': session.get('title') or '(제목 없음)',
-                            'summary': summary
-                        })
+                messages_response.raise_for_status()
+                messages = messages_response.json()
+
+                if messages and messages[0].get('content'):
+                    content = messages[0]['content']
+                    summary = content[:200].replace('\n', ' ')
+                    if len(content) > 200:
+                        summary += '...'
+
+                    consultations.append({
+                        'date': session['created_at'][:10],
+                        'question': session.get('title') or '(제목 없음)',
+                        'summary': summary
+                    })
 
-                return consultations
+            return consultations
 
         except Exception as e:
             logger.warning(f"[DailyFortune] 상담 기록 조회 실패: {e}")
@@ -1831,6 +1829,36 @@ class DailyFortuneService:
         pillars: Dict[str, Any],
         daewun: list = None,
         language: str = 'ko'
+    ) -> Dict[str, Any]:
+        """
+        오늘의 운세 생성 (같은 프로필/날짜 동시 요청은 하나의 생성으로 병합)
+
+        Args:
+            user_id: 사용자 ID
+            profile_id: 프로필 ID
+            target_date: 대상 날짜 (YYYY-MM-DD)
+            pillars: 사주 팔자
+            daewun: 대운 목록 (선택)
+            language: 언어
+
+        Returns:
+            오늘의 운세 결과
+        """
+        return await daily_fortune_flight.do(
+            daily_fortune_key(user_id, profile_id, target_date, language),
+            lambda: self._generate_fortune(
+                user_id, profile_id, target_date, pillars, daewun, language
+            )
+        )
+
+    async def _generate_fortune(
+        self,
+        user_id: str,
+        profile_id: str,
+        target_date: str,
+        pillars: Dict[str, Any],
+        daewun: list = None,
+        language: str = 'ko'
     ) -> Dict[str, Any]:
         """
         오늘의 운세 생성 (v4.0: Task 12-15 고도화 + 14단계 파이프라인)
@@ -2025,7 +2053,8 @@ class DailyFortuneService:
                 user_id, profile_id, target_date,
                 status="in_progress",
                 progress_percent=DAILY_FORTUNE_PROGRESS[current_step],
-                step_statuses=step_statuses
+                step_statuses=step_statuses,
+                flush=True
             )
             fortune_result = await self._analyze_fortune(
                 pillars=pillars,
@@ -2314,16 +2343,19 @@ class DailyFortuneService:
                 logger.info(f"[DailyFortune] Gemini 호출 시도 {attempt}/{max_retries}")
 
                 # response_schema가 있으면 스키마 기반 생성
-                result = await gemini.generate_with_schema(
+                # v4.0: 정규화 + Pydantic 검증 (통과한 결과만 캐시)
+                validated = await gemini.generate_with_schema(
                     prompt,
                     response_schema=DAILY_FORTUNE_SCHEMA,
-                    previous_error=last_error if attempt > 1 else None
+                    previous_error=last_error if attempt > 1 else None,
+                    step="daily_fortune",
+                    hedge=True,  # 대화형 요청 → 지연 시 헤징
+                    postprocess=lambda result: validate_daily_fortune(
+                        normalize_all_keys(normalize_response("daily_fortune", result)),
+                        raise_on_error=True
+                    )
                 )
 
-                # v4.0: 정규화 + Pydantic 검증
-                normalized = normalize_all_keys(normalize_response("daily_fortune", result))
-                validated = validate_daily_fortune(normalized, raise_on_error=True)
-
                 logger.info("[DailyFortune] 정규화 + 검증 완료")
                 return validated
 
@@ -2352,7 +2384,7 @@ class DailyFortuneService:
         Returns:
             저장된 레코드
         """
-        if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
+        if not supabase_rest.configured:
             logger.warning("Supabase 설정이 없어 DB 저장 스킵")
             return None
 
@@ -2379,23 +2411,17 @@ class DailyFortuneService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                # UPSERT (user_id, fortune_date 기준 - DB UNIQUE 제약)
-                response = await client.post(
-                    f"{SUPABASE_URL}/rest/v1/daily_fortunes",
-                    json=insert_data,
-                    headers={
-                        "apikey": SUPABASE_SERVICE_ROLE_KEY,
-                        "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}",
-                        "Content-Type": "application/json",
-                        "Prefer": "return=representation,resolution=merge-duplicates"
-                    },
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                data = response.json()
-                logger.info(f"[DailyFortune] DB 저장 완료: profile={profile_id}, date={result['fortune_date']}")
-                return data[0] if data else None
+            # UPSERT (user_id, fortune_date 기준 - DB UNIQUE 제약)
+            response = await supabase_rest.post(
+                "daily_fortunes",
+                json=insert_data,
+                headers={"Prefer": "return=representation,resolution=merge-duplicates"},
+                timeout=30.0
+            )
+            response.raise_for_status()
+            data = response.json()
+            logger.info(f"[DailyFortune] DB 저장 완료: profile={profile_id}, date={result['fortune_date']}")
+            return data[0] if data else None
 
         except Exception as e:
             logger.error(f"[DailyFortune] DB 저장 실패: {e}")
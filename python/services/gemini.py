@@ -5,18 +5,79 @@ Google Generative AI를 사용한 사주 분석
 v2.7 (2026-01-07):
 - response_schema 지원 추가 (JSON 형식 100% 강제)
 - 에러 피드백 재시도 지원
+
+v2.10:
+- 전역 LLM 동시 호출 제한 (governor) - 모든 파이프라인 공용
+- 내용 주소 기반 응답 캐시 (services/llm_cache.py) - 호출별 use_cache로 비활성화 가능
+- 동일 프롬프트 동시 호출 병합 (single-flight)
+- JSON 로컬 복구 + 검증 실패 필드만 부분 재생성 (전체 재생성 최소화)
+- timeout 실제 적용 + 단계별 p90 기반 헤징 (상담 / 오늘의 운세)
+- 단계별 max_output_tokens 자동 조정 (관측 출력 토큰 p99 + 여유분)
+- 정적 시스템 프롬프트 컨텍스트 캐싱 (services/context_cache.py)
 """
 import os
 import json
-import re
+import asyncio
 import logging
-from typing import Any, Dict, Optional, List
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, List
 
 import google.generativeai as genai
 from google.generativeai.types import GenerationConfig, HarmCategory, HarmBlockThreshold
 
+from .llm_cache import MISS, get_llm_cache, make_cache_key
+from .single_flight import SingleFlight
+from .hedging import HedgePolicy, LatencyHistogram, hedged_call
+from .output_budget import OutputTokenBudget, extract_output_usage
+from .context_cache import (
+    GEMINI_CONTEXT_CACHE_ENABLED,
+    ContextCache,
+    GeminiContextBackend,
+)
+from .normalizers import (
+    build_partial_schema,
+    coerce_to_schema,
+    find_failed_fields,
+    parse_json_lenient,
+)
+
 logger = logging.getLogger(__name__)
 
+# 프로세스 전체 Gemini 동시 호출 상한 (DAG 파이프라인 병렬 실행 시 폭주 방지)
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "8"))
+
+# 컨텍스트 캐싱 모델 (cached content는 버전 고정 모델명 필요)
+GEMINI_CONTEXT_CACHE_MODEL = os.getenv("GEMINI_CONTEXT_CACHE_MODEL", "gemini-2.0-flash-001")
+
+# 동일 프롬프트 동시 호출 병합 (캐시 키 기준)
+llm_single_flight = SingleFlight("gemini")
+
+# 단계별 Gemini 지연 통계 + 헤징 정책 (대화형 호출 tail latency 단축)
+latency_histogram = LatencyHistogram()
+hedge_policy = HedgePolicy(latency_histogram)
+
+# 단계별 출력 토큰 통계 → max_output_tokens 자동 조정
+output_budget = OutputTokenBudget()
+
+# 이벤트 루프별 세마포어 (asyncio.Semaphore는 생성된 루프에 묶임)
+_llm_governors: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _cache_prompt(system_prompt: Optional[str], prompt: str) -> str:
+    """응답 캐시 키용 전체 프롬프트 (시스템 + 사용자)"""
+    return f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+
+
+def get_llm_governor() -> asyncio.Semaphore:
+    """현재 이벤트 루프의 전역 LLM 동시 호출 세마포어 반환"""
+    loop = asyncio.get_running_loop()
+    governor = _llm_governors.get(loop)
+    if governor is None:
+        governor = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+        _llm_governors[loop] = governor
+    return governor
+
 
 class GeminiService:
     """Gemini AI 서비스 클래스"""
@@ -28,19 +89,135 @@ class GeminiService:
             raise ValueError("GOOGLE_AI_API_KEY 환경변수가 설정되지 않았습니다")
 
         genai.configure(api_key=api_key)
+        self.model_name = "gemini-2.0-flash"
+        self.generation_config = {
+            "temperature": 0.7,
+            "top_p": 0.95,
+            "max_output_tokens": 8192,
+        }
         self.model = genai.GenerativeModel(
-            model_name="gemini-2.0-flash",
-            generation_config={
-                "temperature": 0.7,
-                "top_p": 0.95,
-                "max_output_tokens": 8192,
-            }
+            model_name=self.model_name,
+            generation_config=self.generation_config
+        )
+
+        # 정적 시스템 프롬프트 컨텍스트 캐싱 (v2.10)
+        self.context_cache: Optional[ContextCache] = None
+        if GEMINI_CONTEXT_CACHE_ENABLED:
+            self.context_cache = ContextCache(
+                GeminiContextBackend(GEMINI_CONTEXT_CACHE_MODEL, self.generation_config),
+                GEMINI_CONTEXT_CACHE_MODEL,
+            )
+
+    async def _generate_content(
+        self,
+        prompt: str,
+        timeout: Optional[float] = None,
+        step: Optional[str] = None,
+        hedge: bool = False,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Gemini 호출 공통 진입점 (전역 governor + deadline + 헤징 + 컨텍스트 캐싱)
+
+        모든 generate_* 메서드는 이 메서드를 통해 모델을 호출합니다.
+
+        Args:
+            prompt: 프롬프트 (system_prompt가 있으면 사용자 프롬프트)
+            timeout: 생성 제한 시간 (초, 헤징 시 전체 제한 시간)
+            step: 단계별 지연 통계 키
+            hedge: True면 p90 초과 시 동일 요청 추가 (대화형 호출용)
+            system_prompt: 정적 시스템 프롬프트 (cached content 등록 후 사용자 프롬프트만 전송)
+        """
+        model = self.model
+        if system_prompt:
+            cached_model = await self.context_cache.get_model(system_prompt) if self.context_cache else None
+            if cached_model is not None:
+                model = cached_model
+            else:
+                # 캐싱 불가 → 기존처럼 인라인 전송
+                prompt = f"{system_prompt}\n\n{prompt}"
+
+        async def call() -> Any:
+            async with get_llm_governor():
+                request = model.generate_content_async(prompt, **kwargs)
+                if timeout:
+                    return await asyncio.wait_for(request, timeout)
+                return await request
+
+        if hedge and step:
+            return await hedged_call(call, hedge_policy, step, deadline=timeout)
+
+        started = time.monotonic()
+        response = await call()
+        if step:
+            latency_histogram.record(step, time.monotonic() - started)
+        return response
+
+    async def _cached(
+        self,
+        kind: str,
+        prompt: str,
+        produce: Callable[[], Awaitable[Any]],
+        use_cache: bool = True,
+        generation_config: Optional[Dict[str, Any]] = None,
+        response_schema: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        캐시 조회 → 미스 시 produce() 실행 후 결과 저장
+
+        produce()가 예외를 던지면 (파싱/검증 실패) 아무것도 저장하지 않습니다.
+        같은 키의 호출이 진행 중이면 새로 호출하지 않고 그 결과를 공유합니다.
+
+        Args:
+            kind: 호출 종류 (응답 형태가 다른 메서드 간 키 충돌 방지)
+            prompt: 최종 프롬프트
+            produce: 실제 생성 코루틴 팩토리
+            use_cache: False면 캐시 우회
+            generation_config: 키에 포함할 생성 설정
+            response_schema: 키에 포함할 응답 스키마
+        """
+        if not use_cache:
+            return await produce()
+
+        key = make_cache_key(
+            self.model_name,
+            prompt,
+            {"kind": kind, **(generation_config or self.generation_config)},
+            response_schema,
         )
 
+        async def load() -> Any:
+            cache = get_llm_cache()
+            if cache is None:
+                return await produce()
+
+            try:
+                cached = await asyncio.to_thread(cache.get, key)
+            except Exception as e:
+                logger.warning(f"[LLMCache] 조회 실패, 캐시 우회: {e}")
+                return await produce()
+
+            if cached is not MISS:
+                logger.info(f"[LLMCache] 적중 ({kind}, key={key[:12]})")
+                return cached
+
+            started = time.monotonic()
+            result = await produce()
+            try:
+                await asyncio.to_thread(cache.set, key, result, time.monotonic() - started)
+            except Exception as e:
+                logger.warning(f"[LLMCache] 저장 실패: {e}")
+            return result
+
+        # 동일 프롬프트 동시 호출은 하나의 Gemini 호출로 병합
+        return await llm_single_flight.do(key, load)
+
     async def generate_yearly_analysis(
         self,
         prompt: str,
-        timeout: int = 180
+        timeout: int = 180,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         신년 분석 생성
@@ -48,17 +225,18 @@ class GeminiService:
         Args:
             prompt: 분석 프롬프트
             timeout: 타임아웃 (초)
+            use_cache: 응답 캐시 사용 여부
 
         Returns:
             파싱된 분석 결과
         """
-        try:
-            response = await self.model.generate_content_async(prompt)
-            response_text = response.text
-
+        async def produce() -> Dict[str, Any]:
+            response = await self._generate_content(prompt, timeout=timeout, step="yearly_analysis")
             # JSON 파싱
-            result = self._parse_json_response(response_text)
-            return result
+            return self._parse_json_response(response.text)
+
+        try:
+            return await self._cached("yearly_analysis", prompt, produce, use_cache)
 
         except Exception as e:
             logger.error(f"Gemini 분석 실패: {e}")
@@ -67,25 +245,36 @@ class GeminiService:
     async def generate_report_analysis(
         self,
         prompt: str,
-        timeout: int = 300
+        timeout: int = 300,
+        use_cache: bool = True,
+        system_prompt: Optional[str] = None,
+        postprocess: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         리포트 단계별 분석 생성
 
         Args:
-            prompt: 분석 프롬프트
+            prompt: 분석 프롬프트 (system_prompt가 있으면 사용자 프롬프트)
             timeout: 타임아웃 (초)
+            use_cache: 응답 캐시 사용 여부
+            system_prompt: 정적 시스템 프롬프트 (컨텍스트 캐싱)
+            postprocess: 파싱 결과 정규화/검증 함수 (통과한 결과만 캐시)
 
         Returns:
-            파싱된 분석 결과
+            파싱된 분석 결과 (postprocess가 있으면 그 반환값)
         """
-        try:
-            response = await self.model.generate_content_async(prompt)
-            response_text = response.text
-
+        async def produce() -> Dict[str, Any]:
+            response = await self._generate_content(
+                prompt, timeout=timeout, step="report_analysis", system_prompt=system_prompt
+            )
             # JSON 파싱 (필수 필드 검증 없이)
-            result = self._parse_json_response_generic(response_text)
-            return result
+            result = self._parse_json_response_generic(response.text)
+            return postprocess(result) if postprocess else result
+
+        try:
+            return await self._cached(
+                "report_analysis", _cache_prompt(system_prompt, prompt), produce, use_cache
+            )
 
         except Exception as e:
             logger.error(f"Gemini 리포트 분석 실패: {e}")
@@ -97,7 +286,12 @@ class GeminiService:
         response_schema: Dict[str, Any],
         previous_error: Optional[str] = None,
         previous_response: Optional[Dict[str, Any]] = None,
-        timeout: int = 120
+        timeout: int = 120,
+        postprocess: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        use_cache: bool = True,
+        step: Optional[str] = None,
+        hedge: bool = False,
+        system_prompt: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         response_schema를 사용한 JSON 응답 생성 (v2.9)
@@ -105,6 +299,7 @@ class GeminiService:
         JSON 형식을 100% 강제하여 파싱 실패를 방지합니다.
         이전 오류가 있으면 프롬프트에 피드백으로 추가합니다.
         v2.9: 이전 응답도 함께 전송하여 Gemini가 정확히 수정할 수 있도록 함.
+        v2.10: postprocess(정규화 + 검증)를 통과한 결과만 캐시에 저장.
 
         Args:
             prompt: 분석 프롬프트
@@ -112,16 +307,20 @@ class GeminiService:
             previous_error: 이전 시도의 오류 메시지 (재시도 시)
             previous_response: 이전 시도의 응답 (재시도 시)
             timeout: 타임아웃 (초)
+            postprocess: 파싱 결과 정규화/검증 함수 (예외 시 캐시 저장 안 함)
+            use_cache: 응답 캐시 사용 여부
+            step: 단계명 (지연 통계 / 헤징 임계값 키)
+            hedge: 지연 시 헤징 요청 허용 여부 (대화형 호출)
+            system_prompt: 정적 시스템 프롬프트 (컨텍스트 캐싱, prompt는 사용자 프롬프트)
 
         Returns:
-            파싱된 JSON 딕셔너리
+            파싱된 JSON 딕셔너리 (postprocess가 있으면 그 반환값)
         """
-        try:
-            # 이전 오류가 있으면 프롬프트에 피드백 추가 (v2.9: 이전 응답도 포함)
-            final_prompt = prompt
-            if previous_error:
-                prev_resp_str = json.dumps(previous_response, ensure_ascii=False, indent=2) if previous_response else "없음"
-                final_prompt = f"""{prompt}
+        # 이전 오류가 있으면 프롬프트에 피드백 추가 (v2.9: 이전 응답도 포함)
+        final_prompt = prompt
+        if previous_error:
+            prev_resp_str = json.dumps(previous_response, ensure_ascii=False, indent=2) if previous_response else "없음"
+            final_prompt = f"""{prompt}
 
 [이전 시도 실패 - 반드시 수정 필요]
 이전 응답:
@@ -131,55 +330,149 @@ class GeminiService:
 위 응답의 오류를 수정하여 올바른 JSON 형식으로 응답하세요.
 모든 필드를 빠짐없이 포함하고, 타입을 정확히 맞추세요."""
 
-            # response_schema로 JSON 형식 강제 + safety_settings (사주 분석 false positive 방지)
-            response = await self.model.generate_content_async(
-                final_prompt,
-                generation_config=GenerationConfig(
-                    response_mime_type="application/json",
-                    response_schema=response_schema,
-                    temperature=0.7,
-                    top_p=0.95,
-                    max_output_tokens=8192,
-                ),
-                safety_settings={
-                    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-                }
+        # max_output_tokens는 단계별 자동 조정 (캐시 키에서 제외)
+        generation_config = {
+            "response_mime_type": "application/json",
+            "temperature": 0.7,
+            "top_p": 0.95,
+        }
+
+        # deadline / 지연 통계 / 헤징 옵션
+        call_options = {
+            "timeout": timeout,
+            "step": step or "schema",
+            "hedge": hedge,
+            "system_prompt": system_prompt,
+        }
+
+        async def produce() -> Dict[str, Any]:
+            result = await self._generate_schema_json(
+                final_prompt, response_schema, generation_config, call_options
             )
+            if not postprocess:
+                return result
+
+            try:
+                return postprocess(result)
+            except Exception as e:
+                # v2.10: 로컬 복구로 해결 안 된 필드만 부분 재생성 (전체 재생성은 호출자 재시도)
+                patched = await self._regenerate_fields(
+                    final_prompt, response_schema, generation_config, call_options, result, e
+                )
+                if patched is None:
+                    raise
+                return postprocess(patched)
 
-            # Safety block 체크
-            if not response.parts:
-                if hasattr(response, 'prompt_feedback') and response.prompt_feedback:
-                    raise ValueError(f"Gemini Safety Block: {response.prompt_feedback}")
-                raise ValueError("Gemini가 빈 응답을 반환했습니다")
-
-            response_text = response.text
-            if not response_text or not response_text.strip():
-                raise ValueError("빈 응답")
-
-            # JSON 문자열 정리 (Markdown 코드블록 제거)
-            text = response_text.strip()
-            if text.startswith("```json"):
-                text = text[7:]
-            if text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
-
-            return json.loads(text)
+        try:
+            return await self._cached(
+                "schema",
+                _cache_prompt(system_prompt, final_prompt),
+                produce,
+                use_cache,
+                generation_config=generation_config,
+                response_schema=response_schema,
+            )
 
         except Exception as e:
             logger.error(f"Schema 기반 생성 실패: {e}")
             raise
 
+    async def _generate_schema_json(
+        self,
+        prompt: str,
+        response_schema: Dict[str, Any],
+        generation_config: Dict[str, Any],
+        call_options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        response_schema 기반 단일 Gemini 호출 + JSON 복구
+
+        잘린 JSON은 로컬에서 닫고, 스키마 기준으로 타입 보정 / 점수 clamp 후 반환합니다.
+        max_output_tokens는 단계별 관측 출력 크기(p99 + 여유분)로 설정합니다.
+        """
+        call_options = call_options or {}
+        step = call_options.get("step") or "schema"
+
+        # response_schema로 JSON 형식 강제 + safety_settings (사주 분석 false positive 방지)
+        response = await self._generate_content(
+            prompt,
+            **call_options,
+            generation_config=GenerationConfig(
+                response_schema=response_schema,
+                max_output_tokens=output_budget.budget(step),
+                **generation_config,
+            ),
+            safety_settings={
+                HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+                HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+                HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+                HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+            }
+        )
+
+        # Safety block 체크
+        if not response.parts:
+            if hasattr(response, 'prompt_feedback') and response.prompt_feedback:
+                raise ValueError(f"Gemini Safety Block: {response.prompt_feedback}")
+            raise ValueError("Gemini가 빈 응답을 반환했습니다")
+
+        # 출력 토큰 기록 (MAX_TOKENS 잘림 시 상한 상향 → 아래 JSON 복구가 잘린 응답 처리)
+        output_tokens, truncated = extract_output_usage(response)
+        if output_tokens or truncated:
+            output_budget.record(step, output_tokens, truncated=truncated)
+
+        response_text = response.text
+        if not response_text or not response_text.strip():
+            raise ValueError("빈 응답")
+
+        # 코드블록 제거 + 잘린 JSON 복구 + 스키마 타입 보정
+        return coerce_to_schema(parse_json_lenient(response_text), response_schema)
+
+    async def _regenerate_fields(
+        self,
+        prompt: str,
+        response_schema: Dict[str, Any],
+        generation_config: Dict[str, Any],
+        call_options: Dict[str, Any],
+        result: Dict[str, Any],
+        error: Exception
+    ) -> Optional[Dict[str, Any]]:
+        """
+        검증 실패 필드만 부분 재생성 후 병합
+
+        Returns:
+            병합된 결과 (대상 필드를 특정할 수 없거나 전체 필드가 실패한 경우 None)
+        """
+        if not isinstance(result, dict):
+            return None
+
+        fields = find_failed_fields(error, result, response_schema)
+        total = len(response_schema.get("properties", {}))
+        if not fields or len(fields) >= total:
+            return None
+
+        logger.info(f"[Gemini] 부분 재생성: {fields} (오류: {error})")
+        partial_prompt = f"""{prompt}
+
+[부분 재생성]
+이전 응답에서 다음 필드가 누락되었거나 형식이 잘못되었습니다: {', '.join(fields)}
+이 필드만 JSON으로 다시 작성하세요."""
+
+        patch = await self._generate_schema_json(
+            partial_prompt,
+            build_partial_schema(response_schema, fields),
+            generation_config,
+            {**call_options, "hedge": False}
+        )
+        return {**result, **{key: patch[key] for key in fields if key in patch}}
+
     async def generate_yearly_step(
         self,
         prompt: str,
         step: str,
-        timeout: int = 60
+        timeout: int = 60,
+        use_cache: bool = True,
+        postprocess: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         신년 분석 단계별 호출 (순차 파이프라인용)
@@ -188,17 +481,17 @@ class GeminiService:
             prompt: 단계별 프롬프트
             step: 단계 이름 (yearly_overview, monthly_1_3, ...)
             timeout: 타임아웃 (초) - 단계별로 60초
+            use_cache: 응답 캐시 사용 여부
+            postprocess: 파싱 결과 정규화/검증 함수 (통과한 결과만 캐시)
 
         Returns:
-            파싱된 분석 결과
+            파싱된 분석 결과 (postprocess가 있으면 그 반환값)
 
         Raises:
             ValueError: 빈 응답이거나 JSON 파싱 실패 시
         """
-        try:
-            logger.info(f"[Gemini] 신년 분석 단계 시작: {step}")
-
-            response = await self.model.generate_content_async(prompt)
+        async def produce() -> Dict[str, Any]:
+            response = await self._generate_content(prompt, timeout=timeout, step=step)
             response_text = response.text
 
             # 빈 응답 검증 (핵심!)
@@ -213,6 +506,12 @@ class GeminiService:
             if not result or len(result) == 0:
                 logger.error(f"[Gemini] 빈 결과 (step={step})")
                 raise ValueError(f"빈 결과 (step={step})")
+            return postprocess(result) if postprocess else result
+
+        try:
+            logger.info(f"[Gemini] 신년 분석 단계 시작: {step}")
+
+            result = await self._cached("yearly_step", prompt, produce, use_cache)
 
             logger.info(f"[Gemini] 신년 분석 단계 완료: {step}")
             return result
@@ -232,23 +531,18 @@ class GeminiService:
             파싱된 JSON 딕셔너리
         """
         try:
-            json_string = response_text.strip()
-
-            # ```json ... ``` 형태 처리
-            json_match = re.search(r'```(?:json)?\s*([\s\S]*?)```', json_string)
-            if json_match:
-                json_string = json_match.group(1).strip()
+            # ```json ... ``` 처리 + 잘린 JSON 로컬 복구 (v2.10)
+            return parse_json_lenient(response_text)
 
-            return json.loads(json_string)
-
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"JSON 파싱 실패: {e}")
-            raise ValueError(f"JSON 파싱 실패: {e}")
+            raise
 
     async def generate_followup_answer(
         self,
         prompt: str,
-        timeout: int = 60
+        timeout: int = 60,
+        use_cache: bool = True
     ) -> str:
         """
         후속 질문에 대한 답변 생성
@@ -256,13 +550,17 @@ class GeminiService:
         Args:
             prompt: 질문 프롬프트
             timeout: 타임아웃 (초)
+            use_cache: 응답 캐시 사용 여부
 
         Returns:
             답변 텍스트
         """
-        try:
-            response = await self.model.generate_content_async(prompt)
+        async def produce() -> str:
+            response = await self._generate_content(prompt, timeout=timeout, step="followup")
             return response.text.strip()
+
+        try:
+            return await self._cached("followup", prompt, produce, use_cache)
         except Exception as e:
             logger.error(f"후속 질문 답변 생성 실패: {e}")
             raise
@@ -270,7 +568,9 @@ class GeminiService:
     async def generate_text(
         self,
         prompt: str,
-        timeout: int = 60
+        timeout: int = 60,
+        use_cache: bool = True,
+        hedge: bool = False
     ) -> str:
         """
         텍스트 응답 생성 (상담 답변용)
@@ -278,16 +578,21 @@ class GeminiService:
         Args:
             prompt: 프롬프트
             timeout: 타임아웃 (초)
+            use_cache: 응답 캐시 사용 여부
+            hedge: 지연 시 헤징 요청 허용 여부 (대화형 호출)
 
         Returns:
             응답 텍스트
         """
-        try:
-            response = await self.model.generate_content_async(prompt)
+        async def produce() -> str:
+            response = await self._generate_content(prompt, timeout=timeout, step="text", hedge=hedge)
             text = response.text.strip()
             if not text:
                 raise ValueError("AI 응답이 비어있습니다")
             return text
+
+        try:
+            return await self._cached("text", prompt, produce, use_cache)
         except Exception as e:
             logger.error(f"텍스트 생성 실패: {e}")
             raise
@@ -295,7 +600,9 @@ class GeminiService:
     async def generate_json(
         self,
         prompt: str,
-        timeout: int = 60
+        timeout: int = 60,
+        use_cache: bool = True,
+        hedge: bool = False
     ) -> Dict[str, Any]:
         """
         JSON 응답 생성 (상담 clarification용)
@@ -303,18 +610,23 @@ class GeminiService:
         Args:
             prompt: JSON 응답을 요청하는 프롬프트
             timeout: 타임아웃 (초)
+            use_cache: 응답 캐시 사용 여부
+            hedge: 지연 시 헤징 요청 허용 여부 (대화형 호출)
 
         Returns:
             파싱된 JSON 딕셔너리
         """
-        try:
-            response = await self.model.generate_content_async(prompt)
+        async def produce() -> Dict[str, Any]:
+            response = await self._generate_content(prompt, timeout=timeout, step="json", hedge=hedge)
             response_text = response.text
 
             if not response_text or not response_text.strip():
                 raise ValueError("빈 응답")
 
             return self._parse_json_response_generic(response_text)
+
+        try:
+            return await self._cached("json", prompt, produce, use_cache)
         except Exception as e:
             logger.error(f"JSON 생성 실패: {e}")
             raise
@@ -323,26 +635,32 @@ class GeminiService:
         self,
         prompt: str,
         section_type: str,
-        timeout: int = 90
+        timeout: int = 90,
+        use_cache: bool = True,
+        system_prompt: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         섹션 재분석 결과 생성
 
         Args:
-            prompt: 분석 프롬프트
+            prompt: 분석 프롬프트 (system_prompt가 있으면 사용자 프롬프트)
             section_type: 섹션 타입 (personality, aptitude, fortune)
             timeout: 타임아웃 (초)
+            use_cache: 응답 캐시 사용 여부
+            system_prompt: 정적 시스템 프롬프트 (컨텍스트 캐싱)
 
         Returns:
             파싱된 분석 결과
         """
-        try:
-            response = await self.model.generate_content_async(prompt)
-            response_text = response.text
-
+        async def produce() -> Dict[str, Any]:
+            response = await self._generate_content(
+                prompt, timeout=timeout, step=section_type, system_prompt=system_prompt
+            )
             # JSON 파싱
-            result = self._parse_json_response_generic(response_text)
-            return result
+            return self._parse_json_response_generic(response.text)
+
+        try:
+            return await self._cached("section", _cache_prompt(system_prompt, prompt), produce, use_cache)
 
         except Exception as e:
             logger.error(f"섹션 재분석 실패 ({section_type}): {e}")
@@ -359,14 +677,8 @@ class GeminiService:
             파싱된 JSON 딕셔너리
         """
         try:
-            json_string = response_text.strip()
-
-            # ```json ... ``` 형태 처리
-            json_match = re.search(r'```(?:json)?\s*([\s\S]*?)```', json_string)
-            if json_match:
-                json_string = json_match.group(1).strip()
-
-            parsed = json.loads(json_string)
+            # ```json ... ``` 처리 + 잘린 JSON 로컬 복구 (v2.10)
+            parsed = parse_json_lenient(response_text)
 
             # 필수 필드 검증
             required_fields = [
@@ -385,9 +697,9 @@ class GeminiService:
 
             return parsed
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"JSON 파싱 실패: {e}")
-            raise ValueError(f"JSON 파싱 실패: {e}")
+            raise
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,169 @@
+"""
+Gemini 요청 헤징 (tail latency 단축)
+
+대화형 호출(상담 답변, 오늘의 운세)이 단계별 p90 지연을 넘기면
+동일한 요청을 한 번 더 보내고 먼저 끝난 결과를 사용합니다.
+
+- LatencyHistogram: 단계별 최근 지연 시간 (p50/p90 계산)
+- HedgePolicy: 헤징 지연 임계값 + 트래픽 대비 헤징 비율 상한
+- hedged_call(): 실제 헤징 실행 (전체 deadline 포함)
+"""
+import asyncio
+import logging
+import math
+import os
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 헤징 허용 비율 (대화형 호출 대비 %)
+GEMINI_HEDGE_BUDGET_PERCENT = float(os.getenv("GEMINI_HEDGE_BUDGET_PERCENT", "5"))
+# p90 계산에 필요한 최소 표본 수 (부족하면 헤징 안 함)
+GEMINI_HEDGE_MIN_SAMPLES = int(os.getenv("GEMINI_HEDGE_MIN_SAMPLES", "20"))
+# 단계별 보관 표본 수
+LATENCY_WINDOW = 200
+
+
+class LatencyHistogram:
+    """단계별 최근 지연 시간 (슬라이딩 윈도우)"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, step: str, seconds: float) -> None:
+        """지연 시간 기록"""
+        samples = self._samples.get(step)
+        if samples is None:
+            samples = deque(maxlen=self.window)
+            self._samples[step] = samples
+        samples.append(seconds)
+
+    def count(self, step: str) -> int:
+        """표본 수"""
+        return len(self._samples.get(step, ()))
+
+    def percentile(self, step: str, pct: float) -> Optional[float]:
+        """백분위 지연 시간 (표본 없으면 None)"""
+        samples = self._samples.get(step)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """단계별 통계"""
+        return {
+            step: {
+                "count": len(samples),
+                "p50": round(self.percentile(step, 50), 3),
+                "p90": round(self.percentile(step, 90), 3),
+            }
+            for step, samples in self._samples.items()
+            if samples
+        }
+
+
+class HedgePolicy:
+    """헤징 여부 결정 (p90 임계값 + 예산 상한)"""
+
+    def __init__(
+        self,
+        histogram: LatencyHistogram,
+        budget_percent: float = GEMINI_HEDGE_BUDGET_PERCENT,
+        min_samples: int = GEMINI_HEDGE_MIN_SAMPLES,
+    ):
+        self.histogram = histogram
+        self.budget_percent = budget_percent
+        self.min_samples = min_samples
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def hedge_delay(self, step: str) -> Optional[float]:
+        """헤징 요청을 보낼 대기 시간 (p90), 표본 부족 시 None"""
+        if self.budget_percent <= 0 or self.histogram.count(step) < self.min_samples:
+            return None
+        return self.histogram.percentile(step, 90)
+
+    def try_acquire(self) -> bool:
+        """예산 내에서 헤징 1회 허용 여부"""
+        if (self.hedged + 1) * 100 > self.budget_percent * max(self.requests, 1):
+            return False
+        self.hedged += 1
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """헤징 통계"""
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "hedge_ratio": round(self.hedged / self.requests, 4) if self.requests else 0.0,
+            "budget_percent": self.budget_percent,
+        }
+
+
+async def hedged_call(
+    factory: Callable[[], Awaitable[Any]],
+    policy: HedgePolicy,
+    step: str,
+    deadline: Optional[float] = None,
+) -> Any:
+    """
+    헤징 호출 실행
+
+    1차 요청이 p90을 넘기면 (예산 허용 시) 2차 요청을 보내고 먼저 성공한 결과를 반환합니다.
+    한쪽이 실패하면 남은 요청 결과를 기다립니다.
+
+    Args:
+        factory: 요청 코루틴 팩토리 (호출마다 새 요청)
+        policy: 헤징 정책
+        step: 지연 통계 키
+        deadline: 전체 제한 시간 (초)
+
+    Raises:
+        asyncio.TimeoutError: deadline 초과
+    """
+    policy.requests += 1
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    primary = asyncio.create_task(factory())
+    tasks = {primary}
+
+    def remaining() -> Optional[float]:
+        if deadline is None:
+            return None
+        return max(0.0, deadline - (loop.time() - started))
+
+    try:
+        delay = policy.hedge_delay(step)
+        if delay is not None and (deadline is None or delay < deadline):
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and policy.try_acquire():
+                logger.info(f"[Hedge] {step} p90({delay:.1f}s) 초과 → 헤징 요청")
+                tasks.add(asyncio.create_task(factory()))
+
+        last_error: Optional[BaseException] = None
+        while tasks:
+            done, _ = await asyncio.wait(
+                tasks, timeout=remaining(), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                raise asyncio.TimeoutError(f"{step} 제한 시간 {deadline}s 초과")
+
+            for task in done:
+                tasks.discard(task)
+                if task.exception() is None:
+                    if task is not primary:
+                        policy.hedge_wins += 1
+                    policy.histogram.record(step, loop.time() - started)
+                    return task.result()
+                last_error = task.exception()
+
+        raise last_error
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,198 @@
+"""
+작업 진행 이벤트 스트림 (SSE, v2.10)
+
+상태 폴링(/api/analysis/{report,yearly,compatibility}/...)을 대체하는 푸시 채널입니다.
+작업 저장소가 변경될 때마다 작업별 이벤트 로그에 이벤트를 쌓고,
+GET /api/jobs/{job_id}/events가 Server-Sent Events로 전달합니다.
+
+이벤트 종류:
+- snapshot: 현재 작업 상태 전체 (최초 연결 / 이어받기 범위를 벗어난 재연결 / 다른 워커의 작업)
+- progress: status / progress_percent / current_step 변경
+- step: 단계 상태 변경 ({"step", "status"})
+- partial: 결과 필드 변경 (변경된 필드만)
+- done: 작업 종료 (최종 상태 전체, 이후 스트림 종료)
+
+- 이벤트 ID는 작업별 증가 정수 → Last-Event-ID 헤더로 이어받기 (버퍼 JOB_EVENTS_BUFFER개)
+- JOB_EVENTS_HEARTBEAT_SECONDS마다 주석 행(": ping")으로 연결 유지
+- 로컬에 없는 작업(다른 워커 실행 중)은 공유 상태 백엔드 스냅샷을 주기적으로 조회해 전달
+"""
+import asyncio
+import json
+import os
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Sequence, Tuple
+
+JOB_EVENTS_BUFFER = int(os.getenv("JOB_EVENTS_BUFFER", "200"))
+JOB_EVENTS_HEARTBEAT_SECONDS = float(os.getenv("JOB_EVENTS_HEARTBEAT_SECONDS", "15"))
+# 다른 워커가 실행 중인 작업의 스냅샷 조회 간격
+JOB_EVENTS_POLL_SECONDS = float(os.getenv("JOB_EVENTS_POLL_SECONDS", "1.0"))
+# 재연결 대기 시간 (브라우저 EventSource retry)
+JOB_EVENTS_RETRY_MS = int(os.getenv("JOB_EVENTS_RETRY_MS", "3000"))
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+@dataclass
+class JobEvent:
+    """작업 이벤트"""
+    id: int
+    type: str
+    data: Dict[str, Any]
+
+
+class JobEventLog:
+    """작업별 이벤트 로그 (최근 이벤트 링 버퍼 + 구독자 알림)"""
+
+    def __init__(self, maxlen: int = JOB_EVENTS_BUFFER):
+        self._events: Deque[JobEvent] = deque(maxlen=maxlen)
+        self.last_id = 0
+        self._changed = asyncio.Event()
+
+    def append(self, event_type: str, data: Dict[str, Any]) -> JobEvent:
+        self.last_id += 1
+        event = JobEvent(self.last_id, event_type, data)
+        self._events.append(event)
+        self.notify()
+        return event
+
+    def since(self, last_id: int) -> Tuple[List[JobEvent], bool]:
+        """
+        last_id 이후 이벤트
+
+        Returns:
+            (이벤트 목록, 이어받기 가능 여부 - 버퍼에서 밀려난 이벤트가 있으면 False)
+        """
+        if last_id >= self.last_id:
+            return [], True
+        first_id = self._events[0].id if self._events else self.last_id + 1
+        if last_id + 1 < first_id:
+            return [], False
+        return [event for event in self._events if event.id > last_id], True
+
+    def notify(self) -> None:
+        """대기 중인 구독자를 깨우고 다음 대기용 이벤트로 교체"""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def clear(self) -> None:
+        """버퍼 비우기 (결과 해제 시, 이후 재연결은 snapshot으로 시작)"""
+        self._events.clear()
+
+    async def wait(self, timeout: float) -> bool:
+        """새 이벤트 대기 (timeout 내 이벤트 없으면 False)"""
+        changed = self._changed
+        try:
+            await asyncio.wait_for(changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+def format_event(event_type: str, data: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    """SSE 메시지 직렬화"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    payload = json.dumps(data, ensure_ascii=False, default=lambda value: getattr(value, "value", str(value)))
+    lines.append(f"data: {payload}")
+    return "\n".join(lines) + "\n\n"
+
+
+def _is_terminal(job: Dict[str, Any]) -> bool:
+    status = job.get("status")
+    return getattr(status, "value", status) in TERMINAL_STATUSES
+
+
+async def job_event_stream(
+    store: Any,
+    job_id: str,
+    last_event_id: Optional[int] = None,
+    heartbeat_seconds: float = JOB_EVENTS_HEARTBEAT_SECONDS,
+    poll_seconds: float = JOB_EVENTS_POLL_SECONDS,
+) -> AsyncIterator[str]:
+    """
+    작업 이벤트 SSE 스트림
+
+    Args:
+        store: 작업이 속한 작업 저장소 (BoundedJobStore)
+        job_id: 작업 ID
+        last_event_id: 마지막으로 받은 이벤트 ID (재연결 시 Last-Event-ID)
+        heartbeat_seconds: 연결 유지 주석 행 간격
+        poll_seconds: 다른 워커 작업 스냅샷 조회 간격
+    """
+    yield f"retry: {JOB_EVENTS_RETRY_MS}\n\n"
+
+    last_id = last_event_id
+    while True:
+        log = store.event_log(job_id)
+        if log is None:
+            # 다른 워커가 실행 중이거나 이미 제거된 작업 → 공유 스냅샷 폴링
+            async for message in _snapshot_stream(store, job_id, heartbeat_seconds, poll_seconds):
+                yield message
+            return
+
+        events, resumable = log.since(last_id) if last_id is not None else ([], False)
+        if not resumable:
+            job = store.snapshot(job_id)
+            if job is None:
+                # 스냅샷 직전에 로컬에서 제거됨 → 다음 반복에서 공유 스냅샷 폴링으로 전환
+                await asyncio.sleep(0)
+                continue
+            last_id = log.last_id
+            terminal = _is_terminal(job)
+            yield format_event("done" if terminal else "snapshot", job, last_id)
+            if terminal:
+                return
+            continue
+
+        for event in events:
+            last_id = event.id
+            yield format_event(event.type, event.data, event.id)
+            if event.type == "done":
+                return
+
+        if not await log.wait(heartbeat_seconds):
+            yield ": ping\n\n"
+
+
+async def _snapshot_stream(
+    store: Any,
+    job_id: str,
+    heartbeat_seconds: float,
+    poll_seconds: float,
+) -> AsyncIterator[str]:
+    """공유 상태 백엔드 스냅샷이 바뀔 때마다 snapshot 이벤트 전달 (이벤트 ID 없음)"""
+    last_updated: Optional[str] = None
+    idle = 0.0
+    first = True
+    while True:
+        job = await store.fetch(job_id)
+        if job is None:
+            yield format_event("error", {"job_id": job_id, "message": "작업을 찾을 수 없습니다"})
+            return
+        if first or job.get("updated_at") != last_updated:
+            first = False
+            last_updated = job.get("updated_at")
+            idle = 0.0
+            terminal = _is_terminal(job)
+            yield format_event("done" if terminal else "snapshot", job)
+            if terminal:
+                return
+        elif idle >= heartbeat_seconds:
+            idle = 0.0
+            yield ": ping\n\n"
+        await asyncio.sleep(poll_seconds)
+        idle += poll_seconds
+
+
+async def find_job_store(stores: Sequence[Any], job_id: str) -> Optional[Any]:
+    """작업이 속한 저장소 (로컬 우선, 없으면 공유 상태 백엔드)"""
+    for store in stores:
+        if job_id in store:
+            return store
+    for store in stores:
+        if await store.fetch(job_id, results=False) is not None:
+            return store
+    return None
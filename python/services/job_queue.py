@@ -0,0 +1,689 @@
+"""
+영속 작업 큐 (SQLite WAL, v2.10)
+
+분석 파이프라인을 API 프로세스의 asyncio.create_task로 바로 실행하면
+배포/크래시 때 진행 중 작업이 모두 사라지고 DB에는 in_progress 행만 남습니다.
+작업 요청을 로컬 SQLite 큐에 먼저 기록하고, 작업 종류별 워커 풀이 임대(lease)를 잡아 실행합니다.
+
+- enqueue(): 작업 등록 (dedup_key가 같은 대기/실행 중 작업이 있으면 기존 job_id 반환)
+- try_enqueue(): 한도 조건부 등록 (종류별 / 사용자별 대기 + 실행 중 수 확인과 등록을 한 트랜잭션에서)
+- 워커는 lease_seconds 동안 작업을 점유하고, 실행 중에는 주기적으로 임대를 연장(heartbeat)
+- 임대가 만료된 실행 중 작업(프로세스 종료/크래시)은 다른 워커나 재시작된 프로세스가 다시 가져감
+  (임대를 잃은 워커는 핸들러를 취소 → 같은 작업이 두 번 실행되며 DB에 쓰지 않음)
+- 핸들러 예외 시 max_attempts까지 재시도, 초과하면 failed
+  (핸들러에 마지막 시도 여부 전달 → 재시도될 실패는 최종 실패로 기록하지 않음)
+- 같은 큐 파일을 여러 프로세스가 공유할 수 있음 (BEGIN IMMEDIATE로 임대 획득 직렬화)
+- 워커 수: JOB_QUEUE_WORKERS_<KIND> (예: JOB_QUEUE_WORKERS_REPORT=8)
+- 종료(stop) 시 graceful drain: 새 임대 중지 → 실행 중 작업은 JOB_QUEUE_DRAIN_SECONDS까지 완료 대기
+  → 남은 작업은 취소 후 임대 반납 + 중단 훅(on_interrupt)으로 DB 행을 재개 대기 상태로 표시
+- 사용자별 공정 임대: 실행 중 작업이 적은 사용자의 작업을 먼저 가져감 (한 계정이 워커 독점 방지)
+- 작업 종류별 처리 시간 지수 이동 평균 → 수용 제어(services/admission.py)의 대기 시간 추정
+- 워커 / aenqueue()의 SQLite 호출은 스레드에서 1개씩 실행 (잠금 대기가 이벤트 루프를 막지 않음)
+"""
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUE_PATH = os.getenv(
+    "JOB_QUEUE_PATH",
+    os.path.join(tempfile.gettempdir(), "fortune_job_queue.sqlite3"),
+)
+JOB_QUEUE_LEASE_SECONDS = int(os.getenv("JOB_QUEUE_LEASE_SECONDS", "60"))
+JOB_QUEUE_POLL_SECONDS = float(os.getenv("JOB_QUEUE_POLL_SECONDS", "1.0"))
+JOB_QUEUE_MAX_ATTEMPTS = int(os.getenv("JOB_QUEUE_MAX_ATTEMPTS", "3"))
+# 완료/실패 행 보관 시간
+JOB_QUEUE_RETENTION_SECONDS = int(os.getenv("JOB_QUEUE_RETENTION_SECONDS", str(24 * 3600)))
+# 종료 시 실행 중 작업 완료 대기 시간 (컨테이너 종료 유예 시간보다 짧게)
+JOB_QUEUE_DRAIN_SECONDS = float(os.getenv("JOB_QUEUE_DRAIN_SECONDS", "20"))
+# 중단 훅 (DB 상태 기록) 최대 실행 시간
+JOB_QUEUE_INTERRUPT_TIMEOUT_SECONDS = float(os.getenv("JOB_QUEUE_INTERRUPT_TIMEOUT_SECONDS", "5"))
+
+# 작업 종류별 기본 워커 수 (상담은 짧고 대화형이라 더 많이)
+DEFAULT_WORKERS: Dict[str, int] = {
+    "report": 4,
+    "yearly": 4,
+    "compatibility": 4,
+    "consultation": 8,
+    "reanalysis": 4,
+}
+FALLBACK_WORKERS = 4
+
+# 처리 시간 기록 전 기본 추정치 (초), 지수 이동 평균 가중치
+DEFAULT_DURATIONS: Dict[str, float] = {
+    "report": 90.0,
+    "yearly": 60.0,
+    "compatibility": 60.0,
+    "consultation": 15.0,
+    "reanalysis": 30.0,
+}
+FALLBACK_DURATION = 60.0
+DURATION_EWMA_ALPHA = 0.2
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# (job_id, payload, 마지막 시도 여부) → 완료 대기
+JobHandler = Callable[[str, Dict[str, Any], bool], Awaitable[Any]]
+# (job_id, payload) → 종료로 중단된 작업 기록 (DB 행 재개 대기 표시 등)
+InterruptHook = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+
+
+def get_worker_count(kind: str) -> int:
+    """작업 종류별 워커 수"""
+    env_key = f"JOB_QUEUE_WORKERS_{kind.upper()}"
+    return int(os.getenv(env_key, DEFAULT_WORKERS.get(kind, FALLBACK_WORKERS)))
+
+
+@dataclass
+class QueuedJob:
+    """임대된 큐 항목"""
+    id: str
+    kind: str
+    job_id: str
+    payload: Dict[str, Any]
+    attempts: int
+    recovered: bool = False   # 만료된 임대를 회수한 작업 (재시작 후 재개)
+
+
+@dataclass
+class EnqueueResult:
+    """등록 결과"""
+    job_id: str              # 실행될 job_id (중복이면 기존 작업의 job_id)
+    queued: int              # 등록 시점 대기 중인 작업 수 (자신 제외)
+    running: int             # 등록 시점 실행 중인 작업 수
+    joined: bool = False     # 대기/실행 중인 기존 작업에 합류
+
+
+class QueueFull(Exception):
+    """조건부 등록 한도 초과 (try_enqueue)"""
+
+    def __init__(self, kind: str, scope: str, pending: int, limit: int, queued: int, running: int):
+        super().__init__(f"{kind} {scope} limit {limit} reached ({pending})")
+        self.kind = kind
+        self.scope = scope        # "user" | "kind"
+        self.pending = pending
+        self.limit = limit
+        self.queued = queued
+        self.running = running
+
+
+class JobQueue:
+    """SQLite 기반 영속 작업 큐 + 작업 종류별 워커 풀"""
+
+    def __init__(
+        self,
+        path: str = JOB_QUEUE_PATH,
+        lease_seconds: int = JOB_QUEUE_LEASE_SECONDS,
+        poll_seconds: float = JOB_QUEUE_POLL_SECONDS,
+        max_attempts: int = JOB_QUEUE_MAX_ATTEMPTS,
+        retention_seconds: int = JOB_QUEUE_RETENTION_SECONDS,
+        drain_seconds: float = JOB_QUEUE_DRAIN_SECONDS,
+    ):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self.retention_seconds = retention_seconds
+        self.drain_seconds = drain_seconds
+        # 임대 소유자 (호스트 + PID + 인스턴스)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # 비동기 경로의 DB 호출 직렬화 (대기 중인 워커가 스레드 풀을 점유하지 않도록)
+        self._async_lock: Optional[asyncio.Lock] = None
+        self._async_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handlers: Dict[str, Tuple[JobHandler, int]] = {}
+        self._interrupt_hooks: Dict[str, InterruptHook] = {}
+        self._wakeups: Dict[str, asyncio.Event] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._maintenance_task: Optional[asyncio.Task] = None
+        # 실행 중 작업 (큐 항목 ID → 작업), 종료 중에는 새 작업을 임대하지 않음
+        self._inflight: Dict[str, QueuedJob] = {}
+        self._draining = False
+        # 작업 종류별 처리 시간 지수 이동 평균 (초)
+        self._durations: Dict[str, float] = {}
+
+        # 통계 (프로세스 단위)
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.recovered = 0
+        self.interrupted = 0
+        self.leases_lost = 0
+
+    # ------------------------------------------------------------
+    # 저장소
+    # ------------------------------------------------------------
+
+    def _db(self) -> sqlite3.Connection:
+        """연결 (최초 사용 시 생성 + 스키마 준비)"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS job_queue (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    job_id TEXT NOT NULL,
+                    dedup_key TEXT,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    lease_owner TEXT,
+                    lease_expires REAL,
+                    enqueued_at REAL NOT NULL,
+                    finished_at REAL,
+                    error TEXT,
+                    user_id TEXT
+                )
+                """
+            )
+            # v2.10 이전 큐 파일 (user_id 컬럼 없음)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(job_queue)")}
+            if "user_id" not in columns:
+                conn.execute("ALTER TABLE job_queue ADD COLUMN user_id TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_queue_claim ON job_queue(kind, status, enqueued_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_queue_dedup ON job_queue(kind, dedup_key, status)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_queue_user ON job_queue(kind, status, user_id)")
+            self._conn = conn
+        return self._conn
+
+    async def _call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """DB 호출을 스레드에서 실행 (프로세스 내 비동기 호출은 1개씩)"""
+        loop = asyncio.get_running_loop()
+        if self._async_lock is None or self._async_lock_loop is not loop:
+            self._async_lock = asyncio.Lock()
+            self._async_lock_loop = loop
+        async with self._async_lock:
+            return await asyncio.to_thread(fn, *args)
+
+    def _wake(self, kind: str) -> None:
+        wakeup = self._wakeups.get(kind)
+        if wakeup is not None:
+            wakeup.set()
+
+    async def aenqueue(
+        self,
+        kind: str,
+        job_id: str,
+        payload: Dict[str, Any],
+        dedup_key: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> str:
+        """작업 등록 (enqueue()를 스레드에서 실행, API 핸들러용)"""
+        result = await self.try_enqueue(kind, job_id, payload, dedup_key, user_id)
+        return result.job_id
+
+    async def try_enqueue(
+        self,
+        kind: str,
+        job_id: str,
+        payload: Dict[str, Any],
+        dedup_key: Optional[str] = None,
+        user_id: Optional[str] = None,
+        max_pending: Optional[int] = None,
+        max_per_user: Optional[int] = None,
+    ) -> EnqueueResult:
+        """
+        한도 조건부 작업 등록 (스레드에서 실행, 수용 제어용)
+
+        대기/실행 중 작업 수 확인과 등록이 같은 BEGIN IMMEDIATE 트랜잭션이라
+        동시 요청 / 다른 프로세스가 함께 한도를 통과하지 않음
+
+        Args:
+            max_pending: 종류별 대기 + 실행 중 상한 (None이면 제한 없음)
+            max_per_user: user_id의 종류별 대기 + 실행 중 상한 (None / 0이면 제한 없음)
+
+        Raises:
+            QueueFull: 한도 초과 (중복 요청은 기존 작업에 합류하므로 한도와 무관)
+        """
+        result = await self._call(
+            self._insert, kind, job_id, payload, dedup_key, user_id, max_pending, max_per_user
+        )
+        if not result.joined:
+            self._wake(kind)
+        return result
+
+    def enqueue(
+        self,
+        kind: str,
+        job_id: str,
+        payload: Dict[str, Any],
+        dedup_key: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> str:
+        """
+        작업 등록
+
+        Args:
+            kind: 작업 종류 (핸들러 키)
+            job_id: 서비스 작업 ID (핸들러에 전달)
+            payload: JSON 직렬화 가능한 요청 데이터
+            dedup_key: 중복 방지 키 (같은 종류 + 키의 대기/실행 중 작업이 있으면 등록하지 않음)
+            user_id: 요청 사용자 (공정 임대 / 사용자별 수용 한도)
+
+        Returns:
+            실행될 job_id (중복이면 기존 작업의 job_id)
+        """
+        result = self._insert(kind, job_id, payload, dedup_key, user_id)
+        self._wake(kind)
+        return result.job_id
+
+    def _insert(
+        self,
+        kind: str,
+        job_id: str,
+        payload: Dict[str, Any],
+        dedup_key: Optional[str],
+        user_id: Optional[str],
+        max_pending: Optional[int] = None,
+        max_per_user: Optional[int] = None,
+    ) -> EnqueueResult:
+        encoded = json.dumps(payload, ensure_ascii=False, default=str)
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                if dedup_key is not None:
+                    row = db.execute(
+                        "SELECT job_id FROM job_queue WHERE kind = ? AND dedup_key = ? AND status IN (?, ?) LIMIT 1",
+                        (kind, dedup_key, QUEUED, RUNNING),
+                    ).fetchone()
+                    if row is not None:
+                        db.execute("COMMIT")
+                        return EnqueueResult(row[0], 0, 0, joined=True)
+                queued, running, user_pending = self._count(db, kind, user_id)
+                if user_id and max_per_user and user_pending >= max_per_user:
+                    raise QueueFull(kind, "user", user_pending, max_per_user, queued, running)
+                if max_pending is not None and queued + running >= max_pending:
+                    raise QueueFull(kind, "kind", queued + running, max_pending, queued, running)
+                db.execute(
+                    """
+                    INSERT INTO job_queue (id, kind, job_id, dedup_key, payload, status, enqueued_at, user_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (uuid.uuid4().hex, kind, job_id, dedup_key, encoded, QUEUED, now, user_id),
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return EnqueueResult(job_id, queued, running)
+
+    def active_job(self, kind: str, dedup_key: str) -> Optional[str]:
+        """대기/실행 중인 작업 ID (없으면 None)"""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT job_id FROM job_queue WHERE kind = ? AND dedup_key = ? AND status IN (?, ?) LIMIT 1",
+                (kind, dedup_key, QUEUED, RUNNING),
+            ).fetchone()
+        return row[0] if row else None
+
+    def pending_counts(self, kind: str, user_id: Optional[str] = None) -> Tuple[int, int, int]:
+        """
+        대기/실행 중 작업 수 (큐 파일을 공유하는 모든 프로세스 합계)
+
+        Returns:
+            (대기 중, 실행 중, user_id의 대기 + 실행 중)
+        """
+        with self._lock:
+            return self._count(self._db(), kind, user_id)
+
+    @staticmethod
+    def _count(db: sqlite3.Connection, kind: str, user_id: Optional[str]) -> Tuple[int, int, int]:
+        rows = db.execute(
+            """
+            SELECT status, COUNT(*), SUM(CASE WHEN user_id = ? THEN 1 ELSE 0 END) FROM job_queue
+            WHERE kind = ? AND status IN (?, ?) GROUP BY status
+            """,
+            (user_id, kind, QUEUED, RUNNING),
+        ).fetchall()
+        counts = {status: (count, user_count or 0) for status, count, user_count in rows}
+        queued, user_queued = counts.get(QUEUED, (0, 0))
+        running, user_running = counts.get(RUNNING, (0, 0))
+        return queued, running, user_queued + user_running
+
+    def average_duration(self, kind: str) -> float:
+        """작업 종류별 평균 처리 시간 (초, 기록 전에는 기본 추정치)"""
+        return self._durations.get(kind, DEFAULT_DURATIONS.get(kind, FALLBACK_DURATION))
+
+    def record_duration(self, kind: str, seconds: float) -> None:
+        """완료된 작업 처리 시간 반영 (지수 이동 평균)"""
+        previous = self._durations.get(kind)
+        if previous is None:
+            self._durations[kind] = seconds
+        else:
+            self._durations[kind] = previous + DURATION_EWMA_ALPHA * (seconds - previous)
+
+    def claim(self, kind: str, now: Optional[float] = None) -> Optional[QueuedJob]:
+        """
+        다음 작업 임대 (대기 중 작업 또는 임대가 만료된 실행 중 작업)
+
+        실행 중 작업이 가장 적은 사용자의 작업을 먼저, 같으면 먼저 등록된 순서로 가져갑니다.
+        시도 횟수를 넘긴 만료 작업은 failed로 정리하고 다음 작업을 찾습니다.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                while True:
+                    row = db.execute(
+                        """
+                        SELECT id, job_id, payload, status, attempts FROM job_queue AS candidate
+                        WHERE kind = ? AND (status = ? OR (status = ? AND lease_expires < ?))
+                        ORDER BY (
+                            SELECT COUNT(*) FROM job_queue AS active
+                            WHERE active.kind = candidate.kind AND active.status = ?
+                              AND active.user_id = candidate.user_id AND active.lease_expires >= ?
+                        ), enqueued_at
+                        LIMIT 1
+                        """,
+                        (kind, QUEUED, RUNNING, now, RUNNING, now),
+                    ).fetchone()
+                    if row is None:
+                        db.execute("COMMIT")
+                        return None
+
+                    queue_id, job_id, payload, status, attempts = row
+                    if attempts >= self.max_attempts:
+                        db.execute(
+                            "UPDATE job_queue SET status = ?, finished_at = ?, error = ?, lease_owner = NULL WHERE id = ?",
+                            (FAILED, now, "최대 시도 횟수 초과 (임대 만료)", queue_id),
+                        )
+                        self.failed += 1
+                        logger.error(f"[JobQueue:{kind}] {job_id} 최대 시도 횟수 초과 - 포기")
+                        continue
+
+                    db.execute(
+                        """
+                        UPDATE job_queue SET status = ?, attempts = attempts + 1, lease_owner = ?, lease_expires = ?
+                        WHERE id = ?
+                        """,
+                        (RUNNING, self.owner, now + self.lease_seconds, queue_id),
+                    )
+                    db.execute("COMMIT")
+                    break
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+
+        recovered = status == RUNNING
+        if recovered:
+            self.recovered += 1
+            logger.warning(f"[JobQueue:{kind}] 임대 만료 작업 회수: {job_id} (시도 {attempts + 1})")
+        return QueuedJob(queue_id, kind, job_id, json.loads(payload), attempts + 1, recovered)
+
+    def heartbeat(self, queue_id: str) -> bool:
+        """임대 연장 (다른 워커가 회수했으면 False)"""
+        with self._lock:
+            cursor = self._db().execute(
+                "UPDATE job_queue SET lease_expires = ? WHERE id = ? AND lease_owner = ? AND status = ?",
+                (time.time() + self.lease_seconds, queue_id, self.owner, RUNNING),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, queue_id: str) -> None:
+        """작업 완료"""
+        with self._lock:
+            self._db().execute(
+                "UPDATE job_queue SET status = ?, finished_at = ?, lease_owner = NULL WHERE id = ? AND lease_owner = ?",
+                (DONE, time.time(), queue_id, self.owner),
+            )
+        self.completed += 1
+
+    def fail(self, job: QueuedJob, error: str) -> None:
+        """작업 실패 (시도 횟수가 남았으면 다시 대기열로)"""
+        if self._fail(job, error):
+            self._wake(job.kind)
+
+    def _fail(self, job: QueuedJob, error: str) -> bool:
+        """실패 기록 (다시 대기열로 돌아가면 True)"""
+        retry = job.attempts < self.max_attempts
+        with self._lock:
+            self._db().execute(
+                """
+                UPDATE job_queue SET status = ?, finished_at = ?, error = ?, lease_owner = NULL, lease_expires = NULL
+                WHERE id = ? AND lease_owner = ?
+                """,
+                (QUEUED if retry else FAILED, None if retry else time.time(), error, job.id, self.owner),
+            )
+        if retry:
+            self.retried += 1
+        else:
+            self.failed += 1
+        return retry
+
+    def release(self, queue_id: str) -> None:
+        """임대 반납 (종료 시 실행 중 작업을 바로 다른 프로세스가 가져가도록, 시도 횟수 미차감)"""
+        with self._lock:
+            self._db().execute(
+                """
+                UPDATE job_queue SET status = ?, attempts = attempts - 1, lease_owner = NULL, lease_expires = NULL
+                WHERE id = ? AND lease_owner = ? AND status = ?
+                """,
+                (QUEUED, queue_id, self.owner, RUNNING),
+            )
+
+    def purge(self, now: Optional[float] = None) -> int:
+        """보관 기간이 지난 완료/실패 행 삭제"""
+        now = time.time() if now is None else now
+        with self._lock:
+            cursor = self._db().execute(
+                "DELETE FROM job_queue WHERE status IN (?, ?) AND finished_at < ?",
+                (DONE, FAILED, now - self.retention_seconds),
+            )
+        return cursor.rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """종류/상태별 행 수 + 워커 수 + 처리 통계"""
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT kind, status, COUNT(*) FROM job_queue GROUP BY kind, status"
+            ).fetchall()
+        counts: Dict[str, Dict[str, int]] = {}
+        for kind, status, count in rows:
+            counts.setdefault(kind, {})[status] = count
+        return {
+            "path": self.path,
+            "owner": self.owner,
+            "workers": {kind: workers for kind, (_, workers) in self._handlers.items()},
+            "running": bool(self._tasks),
+            "draining": self._draining,
+            "inflight": {kind: sum(1 for job in self._inflight.values() if job.kind == kind) for kind in self._handlers},
+            "counts": counts,
+            "completed": self.completed,
+            "failed": self.failed,
+            "retried": self.retried,
+            "recovered": self.recovered,
+            "interrupted": self.interrupted,
+            "leases_lost": self.leases_lost,
+            "average_seconds": {kind: round(self.average_duration(kind), 1) for kind in self._handlers},
+        }
+
+    # ------------------------------------------------------------
+    # 워커 풀
+    # ------------------------------------------------------------
+
+    def register(
+        self,
+        kind: str,
+        handler: JobHandler,
+        workers: Optional[int] = None,
+        on_interrupt: Optional[InterruptHook] = None,
+    ) -> None:
+        """
+        작업 종류별 핸들러 등록 (start() 전에 호출)
+
+        Args:
+            kind: 작업 종류
+            handler: async (job_id, payload, final_attempt) → 반환값 무시, 예외 시 재시도
+                     (final_attempt: 이번 시도가 실패하면 더 이상 재시도하지 않음)
+            workers: 워커 수 = 종류별 동시 실행 상한 (기본: get_worker_count(kind))
+            on_interrupt: 종료 대기 시간 안에 끝나지 않아 취소된 작업 기록 훅
+        """
+        self._handlers[kind] = (handler, workers if workers is not None else get_worker_count(kind))
+        if on_interrupt is not None:
+            self._interrupt_hooks[kind] = on_interrupt
+
+    def start(self) -> None:
+        """등록된 작업 종류별 워커 + 정리 루프 시작 (이미 실행 중이면 무시)"""
+        if self._tasks:
+            return
+        self._draining = False
+        for kind, (handler, workers) in self._handlers.items():
+            self._wakeups[kind] = asyncio.Event()
+            for index in range(workers):
+                self._tasks.append(asyncio.create_task(self._worker(kind, handler, index)))
+        self._maintenance_task = asyncio.create_task(self._maintenance())
+        logger.info(
+            f"[JobQueue] 워커 시작 ({self.path}): "
+            + ", ".join(f"{kind}={workers}" for kind, (_, workers) in self._handlers.items())
+        )
+
+    async def stop(self, drain_seconds: Optional[float] = None) -> None:
+        """
+        워커 중지 (graceful drain)
+
+        1. 새 작업 임대 중지 (대기 중인 워커는 바로 종료)
+        2. 실행 중 작업은 drain_seconds까지 완료 대기
+        3. 남은 작업은 취소 → 임대 반납 (다른 프로세스 / 재시작 후 재개) + 중단 훅 실행
+
+        Args:
+            drain_seconds: 완료 대기 시간 (기본: self.drain_seconds)
+        """
+        drain_seconds = self.drain_seconds if drain_seconds is None else drain_seconds
+        tasks, self._tasks = self._tasks, []
+        maintenance, self._maintenance_task = self._maintenance_task, None
+        if maintenance is not None:
+            maintenance.cancel()
+            tasks.append(maintenance)
+
+        self._draining = True
+        for wakeup in self._wakeups.values():
+            wakeup.set()
+
+        if self._inflight and drain_seconds > 0:
+            logger.info(f"[JobQueue] 종료 대기: 실행 중 작업 {len(self._inflight)}개 (최대 {drain_seconds}초)")
+        workers = [task for task in tasks if task is not maintenance]
+        if workers and drain_seconds > 0:
+            # 대기 중인 워커는 바로 종료, 임대 중이던 워커는 작업 반납 후 종료
+            await asyncio.wait(workers, timeout=drain_seconds)
+
+        if self._inflight:
+            logger.warning(f"[JobQueue] 대기 시간 초과 - 작업 {len(self._inflight)}개 중단 후 대기열 복귀")
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._wakeups.clear()
+
+    async def _worker(self, kind: str, handler: JobHandler, index: int) -> None:
+        wakeup = self._wakeups[kind]
+        while not self._draining:
+            try:
+                job = await self._call(self.claim, kind)
+            except sqlite3.Error as e:
+                logger.error(f"[JobQueue:{kind}#{index}] 임대 실패: {e}")
+                job = None
+
+            if job is not None and self._draining:
+                # 임대 중에 종료 시작 → 실행하지 않고 반납
+                await self._call(self.release, job.id)
+                return
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+                continue
+
+            await self._run(job, handler)
+
+    async def _run(self, job: QueuedJob, handler: JobHandler) -> None:
+        """핸들러 실행 + 임대 연장 (임대를 잃으면 핸들러 취소)"""
+        runner = asyncio.create_task(
+            handler(job.job_id, job.payload, job.attempts >= self.max_attempts)
+        )
+        lease_lost = asyncio.Event()
+        heartbeat = asyncio.create_task(self._heartbeat(job, runner, lease_lost))
+        self._inflight[job.id] = job
+        started = time.monotonic()
+        try:
+            await runner
+        except asyncio.CancelledError:
+            if lease_lost.is_set() and not asyncio.current_task().cancelling():
+                # 다른 워커가 회수해 실행 중 → 반납 / 중단 훅 없이 종료
+                self.leases_lost += 1
+                return
+            await self._call(self.release, job.id)
+            self.interrupted += 1
+            await self._interrupt(job)
+            raise
+        except Exception as e:
+            logger.error(f"[JobQueue:{job.kind}] {job.job_id} 실패 (시도 {job.attempts}/{self.max_attempts}): {e}")
+            if await self._call(self._fail, job, str(e)):
+                self._wake(job.kind)
+        else:
+            await self._call(self.complete, job.id)
+            self.record_duration(job.kind, time.monotonic() - started)
+        finally:
+            self._inflight.pop(job.id, None)
+            heartbeat.cancel()
+
+    async def _interrupt(self, job: QueuedJob) -> None:
+        """중단 훅 실행 (시간 제한, 실패해도 종료 진행)"""
+        hook = self._interrupt_hooks.get(job.kind)
+        if hook is None:
+            return
+        try:
+            await asyncio.wait_for(hook(job.job_id, job.payload), timeout=JOB_QUEUE_INTERRUPT_TIMEOUT_SECONDS)
+        except (Exception, asyncio.TimeoutError) as e:
+            logger.error(f"[JobQueue:{job.kind}] {job.job_id} 중단 기록 실패: {e}")
+
+    async def _heartbeat(self, job: QueuedJob, runner: asyncio.Task, lease_lost: asyncio.Event) -> None:
+        interval = max(self.lease_seconds / 3, 0.1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self._call(self.heartbeat, job.id):
+                    logger.warning(f"[JobQueue:{job.kind}] {job.job_id} 임대 상실 (다른 워커가 회수) - 실행 취소")
+                    lease_lost.set()
+                    runner.cancel()
+                    return
+            except sqlite3.Error as e:
+                logger.error(f"[JobQueue:{job.kind}] 임대 연장 실패: {e}")
+
+    async def _maintenance(self) -> None:
+        while True:
+            await asyncio.sleep(max(self.lease_seconds, 60))
+            try:
+                removed = await self._call(self.purge)
+                if removed:
+                    logger.info(f"[JobQueue] 보관 기간 지난 작업 {removed}개 삭제")
+            except sqlite3.Error as e:
+                logger.error(f"[JobQueue] 정리 실패: {e}")
+
+
+# 프로세스 전역 큐 (연결은 최초 사용 시 생성)
+job_queue = JobQueue()
@@ -0,0 +1,656 @@
+"""
+공용 인메모리 작업 저장소 (v2.10)
+
+리포트 / 신년 / 궁합 서비스가 각자 들고 있던 무제한 dict 저장소를 대체합니다.
+완료된 작업의 결과(분석 JSON, 분석 컨텍스트 등)가 프로세스 수명 동안 쌓이지 않도록
+항목 수 / 바이트 예산 상한과 TTL 정리를 한곳에서 처리합니다.
+
+- 항목 수(JOB_STORE_MAX_ENTRIES) 또는 추정 바이트(JOB_STORE_MAX_BYTES) 초과 시
+  종료된 작업부터 (DB 저장 완료 → 오래된 순) 제거, 진행 중 작업은 제거하지 않음
+- 종료 후 JOB_STORE_TTL_SECONDS 지난 작업, 생성 후 JOB_STORE_MAX_AGE_SECONDS 지난 작업 제거
+- mark_persisted(): DB 저장이 끝난 작업은 유예 시간 뒤 결과 필드만 비우고 상태는 유지
+- 백그라운드 정리 루프: start_sweeper() / stop_sweeper() (main.py startup/shutdown)
+- 보조 색인(report_id / analysis_id / user_id): 생성/갱신/삭제/제거 시 함께 유지 → O(1) 조회
+- get_stats(): 저장소별 항목 수 / 추정 바이트 / 제거 횟수
+- 공유 상태 백엔드(status_backend): 변경 시 상태 스냅샷 기록, 로컬에 없는 작업은 fetch()로 백엔드에서 조회
+  → 여러 API 워커 / 컨테이너에서 상태 폴링 가능 (색인 조회는 작업을 실행 중인 프로세스 기준)
+  - 백엔드 I/O는 스레드에서 실행 (이벤트 루프 블로킹 없음), 저장소별로 모아
+    JOB_STATUS_PUBLISH_INTERVAL_MS(기본 1000) 간격으로 최신 상태만 기록
+    (처음 기록 / 종료 상태 / 인계는 바로)
+  - 스냅샷은 상태/진행 필드만, 결과 필드는 종료 시 별도 키에 1회 기록 → 종료된 작업 조회 시에만 읽음
+- 작업별 이벤트 로그(job_events): 상태/단계/결과 변경을 이벤트로 기록 → SSE 진행 스트림
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .job_events import JobEventLog
+from .status_backend import StatusBackend, status_backend
+
+logger = logging.getLogger(__name__)
+
+JOB_STORE_MAX_ENTRIES = int(os.getenv("JOB_STORE_MAX_ENTRIES", "1000"))
+JOB_STORE_MAX_BYTES = int(os.getenv("JOB_STORE_MAX_BYTES", str(64 * 1024 * 1024)))
+JOB_STORE_TTL_SECONDS = int(os.getenv("JOB_STORE_TTL_SECONDS", "3600"))
+JOB_STORE_MAX_AGE_SECONDS = int(os.getenv("JOB_STORE_MAX_AGE_SECONDS", str(24 * 3600)))
+# DB 저장 후 결과를 메모리에 남겨 두는 시간 (저장 직전에 시작된 상태 폴링 대비)
+JOB_STORE_RESULT_GRACE_SECONDS = int(os.getenv("JOB_STORE_RESULT_GRACE_SECONDS", "60"))
+JOB_STORE_SWEEP_INTERVAL_SECONDS = int(os.getenv("JOB_STORE_SWEEP_INTERVAL_SECONDS", "60"))
+# 공유 상태 백엔드 기록 간격 (저장소 단위 병합)
+JOB_STATUS_PUBLISH_INTERVAL_MS = int(os.getenv("JOB_STATUS_PUBLISH_INTERVAL_MS", "1000"))
+
+TERMINAL_STATUSES = ("completed", "failed")
+# progress 이벤트 대상 필드
+PROGRESS_FIELDS = ("status", "progress_percent", "current_step")
+
+# 결과 필드 제외 작업 dict 기본 크기 (상태/단계/타임스탬프)
+BASE_JOB_BYTES = 1024
+
+# 상태 백엔드 기록 작업: ("put", namespace, job_id, data, ttl) / ("delete", namespace, job_id)
+BackendOp = Tuple[Any, ...]
+
+
+def estimate_bytes(value: Any) -> int:
+    """JSON 직렬화 기준 크기 추정 (직렬화 불가 객체는 repr 길이)"""
+    if value is None:
+        return 0
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+def _pending_steps(job: Dict[str, Any]) -> Dict[str, str]:
+    """실행 중이던 단계 → pending (완료 / 실패 단계는 유지)"""
+    return {
+        step: "pending" if status == "in_progress" else status
+        for step, status in (job.get("step_statuses") or {}).items()
+    }
+
+
+class BoundedJobStore:
+    """
+    상한이 있는 인메모리 작업 저장소 (서비스별 저장소의 공용 기반)
+
+    하위 클래스는 create()에서 작업 dict를 만들어 _insert()로 등록하고,
+    RESULT_FIELDS에 용량이 큰 결과 필드를 선언합니다 (크기 추정 / 저장 후 해제 대상).
+    """
+
+    RESULT_FIELDS: Tuple[str, ...] = ("result",)
+    # 보조 색인 필드 (작업 dict에 없는 필드는 무시)
+    INDEXED_FIELDS: Tuple[str, ...] = ("report_id", "analysis_id", "user_id")
+    # 공유 상태 백엔드에 기록하지 않는 필드 (직렬화 불가 / 같은 프로세스에서만 쓰는 값)
+    LOCAL_FIELDS: Tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = JOB_STORE_MAX_ENTRIES,
+        max_bytes: int = JOB_STORE_MAX_BYTES,
+        ttl_seconds: int = JOB_STORE_TTL_SECONDS,
+        max_age_seconds: int = JOB_STORE_MAX_AGE_SECONDS,
+        result_grace_seconds: int = JOB_STORE_RESULT_GRACE_SECONDS,
+        backend: Optional[StatusBackend] = None,
+        publish_interval_ms: int = JOB_STATUS_PUBLISH_INTERVAL_MS,
+    ):
+        """
+        Args:
+            name: 통계 / 로그 식별용 이름
+            max_entries: 최대 항목 수
+            max_bytes: 추정 바이트 예산
+            ttl_seconds: 종료된 작업 보관 시간
+            max_age_seconds: 상태와 무관한 최대 보관 시간 (멈춘 작업 정리)
+            result_grace_seconds: DB 저장 후 결과 필드 보관 시간
+            backend: 공유 상태 백엔드 (기본값: 환경 변수 JOB_STATUS_BACKEND 설정)
+            publish_interval_ms: 상태 백엔드 기록 간격 (변경 병합)
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.max_age_seconds = max_age_seconds
+        self.result_grace_seconds = result_grace_seconds
+        self.backend = backend if backend is not None else status_backend
+        self.publish_interval = publish_interval_ms / 1000
+
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        # job_id → 추정 바이트 / (생성, 마지막 갱신, DB 저장) 시각 (monotonic)
+        self._sizes: Dict[str, int] = {}
+        self._created: Dict[str, float] = {}
+        self._touched: Dict[str, float] = {}
+        self._persisted: Dict[str, float] = {}
+        self._total_bytes = 0
+        # field → value → {job_id: None} (삽입 순서 = 생성 순서)
+        self._indexes: Dict[str, Dict[Any, Dict[str, None]]] = {field: {} for field in self.INDEXED_FIELDS}
+        self._event_logs: Dict[str, JobEventLog] = {}
+        self.evictions: Dict[str, int] = {"ttl": 0, "max_age": 0, "capacity": 0}
+        self.results_released = 0
+        self.backend_errors = 0
+        self.backend_writes = 0
+
+        # 상태 백엔드 기록 대기열: job_id → 고정된 기록 작업 (None이면 기록 시점의 로컬 상태)
+        self._outbox: Dict[str, Optional[List[BackendOp]]] = {}
+        self._published: Set[str] = set()
+        self._publisher: Optional[asyncio.Task] = None
+        self._publish_wake: Optional[asyncio.Event] = None
+        self._publish_urgent = False
+        self._last_publish = float("-inf")
+
+        _stores.append(self)
+
+    # ------------------------------------------------------------
+    # 기본 연산
+    # ------------------------------------------------------------
+
+    def _insert(self, job_id: str, job: Dict[str, Any]) -> Dict[str, Any]:
+        """작업 등록 (하위 클래스 create()에서 호출) + 상한 적용"""
+        if job_id in self._jobs:
+            self._remove(job_id)
+        now = time.monotonic()
+        self._jobs[job_id] = job
+        self._event_logs[job_id] = JobEventLog()
+        self._created[job_id] = now
+        self._touched[job_id] = now
+        self._index(job_id, job, self.INDEXED_FIELDS)
+        self._resize(job_id)
+        self._enforce_limits()
+        self._publish(job_id)
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """로컬 작업 조회 (다른 워커의 작업은 fetch())"""
+        return self._jobs.get(job_id)
+
+    async def fetch(self, job_id: str, results: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        작업 조회 (상태 폴링용)
+
+        로컬에 없으면 공유 상태 백엔드의 스냅샷 반환 (다른 워커가 실행 중인 작업, 읽기 전용).
+        결과 필드는 종료된 작업이고 results=True일 때만 별도 키에서 읽고, 그 외에는 None
+
+        Args:
+            job_id: 작업 ID
+            results: 종료된 작업의 결과 필드 조회 여부
+        """
+        job = self._jobs.get(job_id)
+        if job is not None or not self.backend.shared:
+            return job
+        try:
+            job = await asyncio.to_thread(self.backend.get, self.name, job_id)
+            if job is None:
+                return None
+            fields = dict.fromkeys(field for field in self.RESULT_FIELDS if field not in self.LOCAL_FIELDS)
+            if results and job.get("status") in TERMINAL_STATUSES:
+                stored = await asyncio.to_thread(self.backend.get, self._results_namespace, job_id)
+                fields.update(stored or {})
+            return {**fields, **job}
+        except Exception as e:
+            self.backend_errors += 1
+            logger.warning(f"[JobStore:{self.name}] 상태 백엔드 조회 실패: {e}")
+            return None
+
+    def update(self, job_id: str, **kwargs) -> Optional[Dict[str, Any]]:
+        """작업 업데이트"""
+        job = self._jobs.get(job_id)
+        if not job:
+            return None
+
+        reindexed = [field for field in self.INDEXED_FIELDS if field in kwargs and kwargs[field] != job.get(field)]
+        if reindexed:
+            self._unindex(job_id, job, reindexed)
+        progressed = any(field in kwargs and kwargs[field] != job.get(field) for field in PROGRESS_FIELDS)
+        was_terminal = self._is_terminal(job_id)
+        job.update(kwargs)
+        job["updated_at"] = datetime.utcnow().isoformat()
+        self._touched[job_id] = time.monotonic()
+        if reindexed:
+            self._index(job_id, job, reindexed)
+        self._emit_update(job_id, kwargs, progressed, was_terminal)
+        self._publish(job_id)
+        # 결과 필드가 바뀐 경우에만 크기 재계산 (진행률 갱신은 무시)
+        # 갱신 중인 작업은 제거 대상에서 제외 (호출자 / 상태 조회가 결과를 아직 읽어야 함)
+        if any(field in kwargs for field in self.RESULT_FIELDS):
+            self._resize(job_id)
+            self._enforce_limits(keep=job_id)
+        return job
+
+    def update_step_status(self, job_id: str, step: str, status: str) -> None:
+        """단계 상태 업데이트"""
+        job = self._jobs.get(job_id)
+        if job and "step_statuses" in job:
+            job["step_statuses"][step] = status
+            job["updated_at"] = datetime.utcnow().isoformat()
+            self._touched[job_id] = time.monotonic()
+            self._event_logs[job_id].append("step", {"step": step, "status": status})
+            self._publish(job_id)
+
+    def find_by(self, field: str, value: Any) -> List[Dict[str, Any]]:
+        """색인 필드 값으로 작업 목록 조회 (생성 순)"""
+        job_ids = self._indexes[field].get(value, {})
+        return [self._jobs[job_id] for job_id in job_ids]
+
+    def get_by(self, field: str, value: Any) -> Optional[Dict[str, Any]]:
+        """색인 필드 값으로 가장 최근 작업 조회"""
+        job_ids = self._indexes[field].get(value)
+        if not job_ids:
+            return None
+        return self._jobs[next(reversed(job_ids))]
+
+    def list_active(self, user_id: str) -> List[Dict[str, Any]]:
+        """사용자의 진행 중 작업 목록 (종료된 작업 제외, 생성 순)"""
+        return [job for job in self.find_by("user_id", user_id) if job.get("status") not in TERMINAL_STATUSES]
+
+    def delete(self, job_id: str) -> bool:
+        """작업 삭제"""
+        if job_id in self._jobs:
+            self._remove(job_id)
+            return True
+        return False
+
+    def mark_interrupted(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        종료로 중단된 작업을 재개 대기 상태로 표시 (작업 큐 중단 훅에서 호출)
+
+        status → pending, 실행 중이던 단계 → pending (완료 단계는 유지)
+
+        Returns:
+            갱신된 작업 (로컬에 없으면 None)
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        return self.update(job_id, status="pending", step_statuses=_pending_steps(job), interrupted=True)
+
+    def mark_retrying(
+        self, job_id: str, error: str, error_step: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        실패한 시도를 작업 큐 재시도 대기 상태로 표시 (마지막 시도가 아닌 실패)
+
+        status → pending (failed가 아니므로 SSE 스트림 유지), 실행 중이던 단계 → pending,
+        error / error_step은 retrying=True와 함께 기록
+
+        Returns:
+            갱신된 작업 (로컬에 없으면 None)
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        return self.update(
+            job_id,
+            status="pending",
+            step_statuses=_pending_steps(job),
+            error=error,
+            error_step=error_step,
+            retrying=True,
+        )
+
+    def handoff(self, job_id: str) -> None:
+        """
+        작업 실행을 큐 워커에 넘김 (공유 상태 백엔드 사용 시)
+
+        다른 워커 프로세스가 작업을 가져가면 이 프로세스의 항목은 갱신되지 않으므로
+        로컬 항목만 제거하고 스냅샷은 남겨 둡니다. 실행하는 워커가 항목을 다시 만듭니다.
+        """
+        if not self.backend.shared or job_id not in self._jobs:
+            return
+        # 로컬 항목을 지우기 전 상태로 기록 (바로)
+        self._queue_publish(job_id, self._publish_ops(job_id), urgent=True)
+        self._remove(job_id, unpublish=False)
+
+    def mark_persisted(self, job_id: str) -> None:
+        """
+        DB 저장 완료 표시
+
+        작업이 종료되고 유예 시간(result_grace_seconds)이 지나면 정리 루프가 결과 필드를 비웁니다.
+        상태 조회는 계속 가능하며, 용량 초과 시 가장 먼저 제거 대상이 됩니다.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        job["persisted"] = True
+        self._persisted[job_id] = time.monotonic()
+        if self.result_grace_seconds <= 0 and self._is_terminal(job_id):
+            self._release_results(job_id)
+        else:
+            self._publish(job_id)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __contains__(self, job_id: object) -> bool:
+        return job_id in self._jobs
+
+    # ------------------------------------------------------------
+    # 이벤트 / 공유 상태 백엔드
+    # ------------------------------------------------------------
+
+    def snapshot(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """로컬 작업 상태 사본 (LOCAL_FIELDS 제외, 공유 / 이벤트 전달용)"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        return {key: value for key, value in job.items() if key not in self.LOCAL_FIELDS}
+
+    def event_log(self, job_id: str) -> Optional[JobEventLog]:
+        """로컬 작업 이벤트 로그 (다른 워커의 작업이면 None)"""
+        return self._event_logs.get(job_id)
+
+    def _emit_update(self, job_id: str, changes: Dict[str, Any], progressed: bool, was_terminal: bool) -> None:
+        """update() 변경 내용 → progress / partial / done 이벤트"""
+        log = self._event_logs[job_id]
+        job = self._jobs[job_id]
+        if progressed:
+            log.append("progress", {field: job.get(field) for field in PROGRESS_FIELDS})
+        partial = {
+            field: value for field, value in changes.items()
+            if field in self.RESULT_FIELDS and field not in self.LOCAL_FIELDS
+        }
+        if partial:
+            log.append("partial", partial)
+        if not was_terminal and self._is_terminal(job_id):
+            log.append("done", self.snapshot(job_id))
+
+    @property
+    def _results_namespace(self) -> str:
+        return f"{self.name}:results"
+
+    def _publish(self, job_id: str) -> None:
+        """
+        상태 스냅샷 기록 예약 (종료된 작업은 TTL, 진행 중 작업은 최대 보관 시간 후 만료)
+
+        처음 기록 / 종료 상태는 바로, 그 외에는 publish_interval마다 최신 상태만 기록
+        """
+        if not self.backend.shared or job_id not in self._jobs:
+            return
+        urgent = job_id not in self._published or self._is_terminal(job_id)
+        self._published.add(job_id)
+        self._queue_publish(job_id, None, urgent)
+
+    def _unpublish(self, job_id: str) -> None:
+        if not self.backend.shared:
+            return
+        self._published.discard(job_id)
+        self._queue_publish(job_id, [
+            ("delete", self.name, job_id),
+            ("delete", self._results_namespace, job_id),
+        ])
+
+    def _publish_ops(self, job_id: str) -> List[BackendOp]:
+        """로컬 작업 → 상태 스냅샷 기록 (+ 종료된 작업은 결과 기록)"""
+        job = self._jobs[job_id]
+        terminal = self._is_terminal(job_id)
+        ttl = self.ttl_seconds if terminal else self.max_age_seconds
+        # 결과 필드 제외, dict 값(step_statuses 등)은 기록 스레드와 공유하지 않도록 복사
+        status = {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in job.items()
+            if key not in self.LOCAL_FIELDS and key not in self.RESULT_FIELDS
+        }
+        ops: List[BackendOp] = [("put", self.name, job_id, status, ttl)]
+        if terminal and not job.get("results_released"):
+            results = {field: job.get(field) for field in self.RESULT_FIELDS if field not in self.LOCAL_FIELDS}
+            ops.append(("put", self._results_namespace, job_id, results, ttl))
+        return ops
+
+    def _queue_publish(self, job_id: str, ops: Optional[List[BackendOp]], urgent: bool = False) -> None:
+        """기록 대기열 등록 (같은 작업은 마지막 변경만 기록)"""
+        self._outbox[job_id] = ops
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖 (스크립트 / 테스트): 바로 기록
+            self._write_ops(self._take_outbox())
+            return
+        self._schedule_publisher(urgent)
+
+    def _schedule_publisher(self, urgent: bool) -> None:
+        """기록 태스크 시작 (urgent면 대기 중인 태스크를 깨워 바로 기록)"""
+        if urgent:
+            self._publish_urgent = True
+            if self._publish_wake is not None:
+                self._publish_wake.set()
+        if self._publisher is None or self._publisher.done():
+            self._publish_wake = asyncio.Event()
+            self._publisher = asyncio.create_task(self._publish_loop())
+
+    def _take_outbox(self) -> List[BackendOp]:
+        outbox, self._outbox = self._outbox, {}
+        ops: List[BackendOp] = []
+        for job_id, fixed in outbox.items():
+            if fixed is not None:
+                ops.extend(fixed)
+            elif job_id in self._jobs:
+                ops.extend(self._publish_ops(job_id))
+        return ops
+
+    async def _publish_loop(self) -> None:
+        """대기열이 빌 때까지 publish_interval 간격으로 모아서 기록 (I/O는 스레드)"""
+        while self._outbox:
+            delay = self._last_publish + self.publish_interval - time.monotonic()
+            if delay > 0 and not self._publish_urgent:
+                self._publish_wake.clear()
+                try:
+                    await asyncio.wait_for(self._publish_wake.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+            self._publish_urgent = False
+            ops = self._take_outbox()
+            self._last_publish = time.monotonic()
+            if ops:
+                await asyncio.to_thread(self._write_ops, ops)
+
+    def _write_ops(self, ops: List[BackendOp]) -> None:
+        for op in ops:
+            try:
+                if op[0] == "put":
+                    self.backend.put(*op[1:])
+                else:
+                    self.backend.delete(*op[1:])
+                self.backend_writes += 1
+            except Exception as e:
+                # 상태 공유 실패는 파이프라인을 중단하지 않음
+                self.backend_errors += 1
+                logger.warning(f"[JobStore:{self.name}] 상태 백엔드 {op[0]} 실패: {e}")
+
+    async def flush_publishes(self) -> None:
+        """대기 중인 상태 기록 즉시 실행 (종료 시)"""
+        if self._outbox:
+            self._schedule_publisher(urgent=True)
+        if self._publisher is not None and not self._publisher.done():
+            await self._publisher
+
+    # ------------------------------------------------------------
+    # 크기 / 제거
+    # ------------------------------------------------------------
+
+    def _resize(self, job_id: str) -> None:
+        job = self._jobs[job_id]
+        size = BASE_JOB_BYTES + sum(estimate_bytes(job.get(field)) for field in self.RESULT_FIELDS)
+        self._total_bytes += size - self._sizes.get(job_id, 0)
+        self._sizes[job_id] = size
+
+    def _index(self, job_id: str, job: Dict[str, Any], fields: Iterable[str]) -> None:
+        for field in fields:
+            value = job.get(field)
+            if value is not None:
+                self._indexes[field].setdefault(value, {})[job_id] = None
+
+    def _unindex(self, job_id: str, job: Dict[str, Any], fields: Iterable[str]) -> None:
+        for field in fields:
+            value = job.get(field)
+            job_ids = self._indexes[field].get(value)
+            if job_ids is None:
+                continue
+            job_ids.pop(job_id, None)
+            if not job_ids:
+                del self._indexes[field][value]
+
+    def _remove(self, job_id: str, unpublish: bool = True) -> None:
+        job = self._jobs.pop(job_id, None)
+        log = self._event_logs.pop(job_id, None)
+        if log is not None:
+            # 구독 중인 스트림이 공유 스냅샷 조회로 전환하도록 깨움
+            log.notify()
+        if job is not None:
+            self._unindex(job_id, job, self.INDEXED_FIELDS)
+        self._total_bytes -= self._sizes.pop(job_id, 0)
+        self._created.pop(job_id, None)
+        self._touched.pop(job_id, None)
+        self._persisted.pop(job_id, None)
+        if job is not None and unpublish:
+            self._unpublish(job_id)
+
+    def _release_results(self, job_id: str) -> None:
+        """결과 필드 해제 (DB가 원본)"""
+        job = self._jobs.get(job_id)
+        if job is None or job.get("results_released"):
+            return
+        for field in self.RESULT_FIELDS:
+            job[field] = None
+        job["results_released"] = True
+        self._resize(job_id)
+        self.results_released += 1
+        # 이벤트 버퍼도 결과 참조를 놓도록 비움 (이후 재연결은 snapshot으로 시작)
+        self._event_logs[job_id].clear()
+        self._publish(job_id)
+
+    def _is_terminal(self, job_id: str) -> bool:
+        return self._jobs[job_id].get("status") in TERMINAL_STATUSES
+
+    def _enforce_limits(self, keep: Optional[str] = None) -> None:
+        """항목 수 / 바이트 예산 초과 시 종료된 작업부터 제거 (keep 작업 제외)"""
+        if len(self._jobs) <= self.max_entries and self._total_bytes <= self.max_bytes:
+            return
+
+        # DB 저장된 작업 우선, 그다음 마지막 갱신이 오래된 순
+        candidates = sorted(
+            (job_id for job_id in self._jobs if job_id != keep and self._is_terminal(job_id)),
+            key=lambda job_id: (job_id not in self._persisted, self._touched[job_id]),
+        )
+        for job_id in candidates:
+            if len(self._jobs) <= self.max_entries and self._total_bytes <= self.max_bytes:
+                return
+            self._remove(job_id)
+            self.evictions["capacity"] += 1
+
+        if len(self._jobs) > self.max_entries or self._total_bytes > self.max_bytes:
+            logger.warning(
+                f"[JobStore:{self.name}] 진행 중 작업만으로 상한 초과 "
+                f"(항목 {len(self._jobs)}/{self.max_entries}, {self._total_bytes}/{self.max_bytes}B)"
+            )
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """
+        만료 작업 정리 + DB 저장된 작업의 결과 해제
+
+        Args:
+            now: 기준 시각 (time.monotonic, 테스트용)
+
+        Returns:
+            제거된 작업 수
+        """
+        now = time.monotonic() if now is None else now
+        removed = 0
+        for job_id in list(self._jobs):
+            if now - self._created[job_id] > self.max_age_seconds:
+                self._remove(job_id)
+                self.evictions["max_age"] += 1
+                removed += 1
+            elif self._is_terminal(job_id) and now - self._touched[job_id] > self.ttl_seconds:
+                self._remove(job_id)
+                self.evictions["ttl"] += 1
+                removed += 1
+            elif (
+                job_id in self._persisted
+                and self._is_terminal(job_id)
+                and now - self._persisted[job_id] >= self.result_grace_seconds
+            ):
+                self._release_results(job_id)
+        return removed
+
+    def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
+        """생성 후 max_age_hours 지난 작업 정리 (상태 무관)"""
+        cutoff = time.monotonic() - max_age_hours * 3600
+        expired = [job_id for job_id, created in self._created.items() if created < cutoff]
+        for job_id in expired:
+            self._remove(job_id)
+            self.evictions["max_age"] += 1
+        return len(expired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """항목 수 / 추정 바이트 / 상태별 분포 / 제거 횟수"""
+        by_status: Dict[str, int] = {}
+        for job in self._jobs.values():
+            status = job.get("status")
+            key = getattr(status, "value", status) or "unknown"
+            by_status[key] = by_status.get(key, 0) + 1
+        return {
+            "entries": len(self._jobs),
+            "max_entries": self.max_entries,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "by_status": by_status,
+            "persisted": len(self._persisted),
+            "results_released": self.results_released,
+            "evictions": dict(self.evictions),
+            "backend": self.backend.name,
+            "backend_writes": self.backend_writes,
+            "backend_errors": self.backend_errors,
+            "backend_pending": len(self._outbox),
+        }
+
+
+# 생성된 저장소 목록 (정리 루프 / 통계 대상)
+_stores: List[BoundedJobStore] = []
+_sweeper_task: Optional[asyncio.Task] = None
+
+
+def sweep_all() -> int:
+    """모든 저장소 정리"""
+    return sum(store.sweep() for store in _stores)
+
+
+def get_stats() -> Dict[str, Any]:
+    """저장소별 통계"""
+    return {store.name: store.get_stats() for store in _stores}
+
+
+async def flush_publishes() -> None:
+    """모든 저장소의 대기 중인 상태 백엔드 기록 실행 (종료 시)"""
+    await asyncio.gather(*(store.flush_publishes() for store in _stores))
+
+
+async def _sweep_loop(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            removed = sweep_all()
+            if removed:
+                logger.info(f"[JobStore] 만료 작업 {removed}개 정리")
+        except Exception as e:
+            logger.error(f"[JobStore] 정리 실패: {e}")
+
+
+def start_sweeper(interval: float = JOB_STORE_SWEEP_INTERVAL_SECONDS) -> asyncio.Task:
+    """백그라운드 정리 루프 시작 (이미 실행 중이면 기존 태스크 반환)"""
+    global _sweeper_task
+    if _sweeper_task is None or _sweeper_task.done():
+        _sweeper_task = asyncio.create_task(_sweep_loop(interval))
+    return _sweeper_task
+
+
+async def stop_sweeper() -> None:
+    """백그라운드 정리 루프 중지"""
+    global _sweeper_task
+    task, _sweeper_task = _sweeper_task, None
+    if task is not None and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
@@ -0,0 +1,216 @@
+"""
+LLM 응답 캐시 (내용 주소 기반)
+
+동일한 (모델, 생성 설정, 스키마, 프롬프트) 조합은 같은 결과로 간주하고
+검증/정규화가 끝난 결과를 로컬 SQLite 파일에 저장합니다.
+
+- 키: sha256(model + generation_config + schema + prompt)
+- TTL 만료 + 최대 항목 수 초과 시 LRU(last_accessed) 기준 삭제
+- 적중률 / 절약된 Gemini 호출 시간 통계 제공
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_CACHE_PATH = os.getenv(
+    "LLM_CACHE_PATH",
+    os.path.join(tempfile.gettempdir(), "fortune_llm_cache.sqlite3"),
+)
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+
+# 캐시 미스 (None 결과와 구분)
+MISS = object()
+
+
+def make_cache_key(
+    model: str,
+    prompt: str,
+    generation_config: Optional[Dict[str, Any]] = None,
+    response_schema: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    LLM 호출 캐시 키 생성
+
+    Args:
+        model: 모델명
+        prompt: 최종 프롬프트
+        generation_config: 생성 설정 (temperature 등)
+        response_schema: JSON 응답 스키마
+
+    Returns:
+        sha256 hex digest
+    """
+    material = json.dumps(
+        {
+            "model": model,
+            "config": generation_config or {},
+            "schema": response_schema or {},
+            "prompt": prompt,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite 기반 LLM 응답 캐시"""
+
+    def __init__(
+        self,
+        path: str = LLM_CACHE_PATH,
+        ttl_seconds: int = LLM_CACHE_TTL_SECONDS,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        # 통계 (프로세스 단위)
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL,
+                latency REAL NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed ON llm_cache(last_accessed)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Any:
+        """
+        캐시 조회
+
+        Returns:
+            저장된 값 또는 MISS
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at, latency FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return MISS
+
+            self._conn.execute(
+                "UPDATE llm_cache SET last_accessed = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            self.saved_seconds += row[2]
+
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, latency: float = 0.0) -> None:
+        """
+        캐시 저장 (최대 항목 수 초과 시 오래 사용되지 않은 항목부터 삭제)
+
+        Args:
+            key: 캐시 키
+            value: JSON 직렬화 가능한 결과
+            latency: 원본 생성에 걸린 시간 (초) - 적중 시 절약 시간 통계용
+        """
+        try:
+            payload = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"[LLMCache] 직렬화 불가, 저장 건너뜀: {e}")
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_cache (key, value, created_at, last_accessed, latency)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (key, payload, now, now, latency),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """TTL 만료 항목 + 최대 항목 수 초과분 삭제 (lock 보유 상태에서 호출)"""
+        self._conn.execute(
+            "DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+        )
+        count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                """
+                DELETE FROM llm_cache WHERE key IN (
+                    SELECT key FROM llm_cache ORDER BY last_accessed ASC LIMIT ?
+                )
+                """,
+                (overflow,),
+            )
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중률 / 절약 시간 통계"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "enabled": True,
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "saved_seconds": round(self.saved_seconds, 2),
+        }
+
+
+# 싱글톤 인스턴스
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """LLM 캐시 인스턴스 반환 (비활성화 또는 초기화 실패 시 None)"""
+    global _llm_cache
+    if not LLM_CACHE_ENABLED:
+        return None
+    if _llm_cache is None:
+        try:
+            _llm_cache = LLMResponseCache()
+        except sqlite3.Error as e:
+            logger.error(f"[LLMCache] 초기화 실패, 캐시 없이 진행: {e}")
+            return None
+    return _llm_cache
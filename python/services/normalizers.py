@@ -1,9 +1,12 @@
 """
 Gemini 응답 정규화 모듈
 DB 저장 전 키 이름을 표준화하여 TypeScript와의 일관성 유지
+
+v2.10: JSON 복구 (잘린 JSON 닫기, 스키마 기반 타입 보정, 점수 clamp)
 """
+import json
 import re
-from typing import Any, Dict, Union, List
+from typing import Any, Dict, Union, List, Optional
 
 # ============================================
 # 키 매핑 정의
@@ -740,3 +743,259 @@ def normalize_response(step_name: str, raw_response: Dict[str, Any]) -> Dict[str
         return normalizer(raw_response)
 
     return raw_response  # 미등록 단계는 원본 반환
+
+
+# ============================================
+# JSON 복구 (v2.10) - 전체 재생성 전 로컬 복구 단계
+# ============================================
+
+# description의 "0-100 사이" 형식 범위 (Gemini 스키마는 minimum/maximum 미지원)
+_RANGE_PATTERN = re.compile(r'(-?\d+)\s*-\s*(-?\d+)\s*사이')
+_NUMBER_PATTERN = re.compile(r'-?\d+(?:\.\d+)?')
+_CODE_BLOCK_PATTERN = re.compile(r'```(?:json)?\s*([\s\S]*?)(?:```|$)')
+
+
+def _strip_code_block(text: str) -> str:
+    """Markdown 코드블록 제거 후 첫 JSON 시작 문자부터 반환"""
+    text = text.strip()
+    match = _CODE_BLOCK_PATTERN.search(text)
+    if match:
+        text = match.group(1).strip()
+
+    starts = [i for i in (text.find('{'), text.find('[')) if i >= 0]
+    return text[min(starts):] if starts else text
+
+
+def _close_json(prefix: str, stack: List[str]) -> str:
+    """잘린 JSON 끝 정리 + 열린 괄호 닫기"""
+    body = prefix.rstrip()
+    if body.endswith(','):
+        body = body[:-1].rstrip()
+    if body.endswith(':'):
+        body += ' null'
+    closers = {'{': '}', '[': ']'}
+    return body + ''.join(closers[c] for c in reversed(stack))
+
+
+def repair_json_text(text: str) -> str:
+    """
+    깨진 JSON 문자열 복구 (max_output_tokens 잘림 / 후행 쉼표 / 앞뒤 잡문)
+
+    - 코드블록 및 JSON 앞뒤 텍스트 제거
+    - 닫히지 않은 문자열 / 배열 / 객체 닫기
+    - 후행 쉼표 제거
+    - 값 없이 잘린 키는 마지막 완결 항목까지 되돌림
+
+    Returns:
+        복구된 JSON 문자열 (파싱 성공은 보장하지 않음)
+    """
+    text = _strip_code_block(text)
+
+    out: List[str] = []
+    stack: List[str] = []
+    # 문자열 밖 쉼표 위치 (잘린 마지막 항목 제거용)
+    cut_points: List[tuple] = []
+    in_string = False
+    escape = False
+
+    for i, ch in enumerate(text):
+        if in_string:
+            out.append(ch)
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch in '{[':
+            stack.append(ch)
+        elif ch in '}]':
+            if not stack:
+                break
+            stack.pop()
+            out.append(ch)
+            if not stack:
+                break  # 최상위 값 완료 → 뒤쪽 잡문 무시
+            continue
+        elif ch == ',':
+            rest = text[i + 1:].lstrip()
+            if rest[:1] in ('}', ']'):
+                continue  # 후행 쉼표
+            cut_points.append((len(out), list(stack)))
+        out.append(ch)
+
+    prefix = ''.join(out)
+    if in_string:
+        if escape:
+            prefix = prefix[:-1]
+        prefix += '"'
+
+    candidate = _close_json(prefix, stack)
+    if not stack:
+        return candidate
+
+    try:
+        json.loads(candidate)
+        return candidate
+    except json.JSONDecodeError:
+        pass
+
+    # 마지막 항목이 불완전 (예: 값 없는 키) → 완결된 항목까지 되돌림
+    for position, cut_stack in reversed(cut_points[-5:]):
+        retry = _close_json(''.join(out[:position]), cut_stack)
+        try:
+            json.loads(retry)
+            return retry
+        except json.JSONDecodeError:
+            continue
+
+    return candidate
+
+
+def parse_json_lenient(text: str) -> Any:
+    """
+    JSON 파싱 (실패 시 로컬 복구 후 재시도)
+
+    Raises:
+        ValueError: 복구 후에도 파싱 실패 시
+    """
+    try:
+        return json.loads(_strip_code_block(text))
+    except json.JSONDecodeError:
+        pass
+
+    repaired = repair_json_text(text)
+    try:
+        return json.loads(repaired)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"JSON 파싱 실패: {e}")
+
+
+def _schema_range(schema: Dict[str, Any]) -> Optional[tuple]:
+    """description에서 숫자 범위 추출 (예: '0-100 사이 점수' → (0, 100))"""
+    match = _RANGE_PATTERN.search(schema.get('description') or '')
+    if not match:
+        return None
+    low, high = int(match.group(1)), int(match.group(2))
+    return (low, high) if low <= high else None
+
+
+def _coerce_number(value: Any, integer: bool) -> Any:
+    """문자열/실수 → 숫자 변환 ('85점' → 85, 72.6 → 73)"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        match = _NUMBER_PATTERN.search(value)
+        if not match:
+            return value
+        value = float(match.group(0))
+    if isinstance(value, (int, float)):
+        return int(round(value)) if integer else float(value)
+    return value
+
+
+def coerce_to_schema(value: Any, schema: Optional[Dict[str, Any]]) -> Any:
+    """
+    Gemini response_schema 기준 타입 보정
+
+    - integer/number: 문자열 숫자 변환 + description 범위로 clamp
+    - string: 숫자 → 문자열
+    - array: 단일 값 → 1개짜리 배열, null → []
+    - object: null 필드 제거 (Pydantic default 적용 유도)
+    """
+    if not schema:
+        return value
+
+    schema_type = schema.get('type')
+
+    if schema_type == 'object':
+        if not isinstance(value, dict):
+            return value
+        properties = schema.get('properties', {})
+        result = {}
+        for key, item in value.items():
+            if item is None and not properties.get(key, {}).get('nullable'):
+                continue
+            result[key] = coerce_to_schema(item, properties.get(key))
+        return result
+
+    if schema_type == 'array':
+        if value is None:
+            return []
+        if not isinstance(value, list):
+            value = [value]
+        return [coerce_to_schema(item, schema.get('items')) for item in value]
+
+    if schema_type in ('integer', 'number'):
+        value = _coerce_number(value, integer=schema_type == 'integer')
+        bounds = _schema_range(schema)
+        if bounds and isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = min(max(value, bounds[0]), bounds[1])
+        return value
+
+    if schema_type == 'string':
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        return value
+
+    if schema_type == 'boolean' and isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ('true', 'yes', '1'):
+            return True
+        if lowered in ('false', 'no', '0'):
+            return False
+
+    return value
+
+
+def find_missing_fields(data: Any, schema: Optional[Dict[str, Any]]) -> List[str]:
+    """최상위 required 필드 중 누락된 필드 목록"""
+    if not schema or not isinstance(data, dict):
+        return []
+    return [key for key in schema.get('required', []) if key not in data]
+
+
+def find_failed_fields(error: Exception, data: Any, schema: Optional[Dict[str, Any]]) -> List[str]:
+    """
+    부분 재생성 대상 최상위 필드 추출
+
+    Pydantic ValidationError의 loc (camelCase)을 스키마 키와 대조하고
+    스키마 required 누락 필드를 합칩니다.
+
+    Returns:
+        스키마 키 목록 (식별 불가 시 빈 목록)
+    """
+    if not schema:
+        return []
+
+    properties = schema.get('properties', {})
+    # 정규화된 키 (camelCase) → 스키마 원본 키
+    key_lookup = {next(iter(normalize_all_keys({key: None}))): key for key in properties}
+    key_lookup.update({key: key for key in properties})
+
+    fields = set(find_missing_fields(data, schema))
+    errors = getattr(error, 'errors', None)
+    if callable(errors):
+        try:
+            for detail in errors():
+                loc = detail.get('loc') or ()
+                if loc and loc[0] in key_lookup:
+                    fields.add(key_lookup[loc[0]])
+        except Exception:
+            pass
+
+    return [key for key in properties if key in fields]
+
+
+def build_partial_schema(schema: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """지정 필드만 포함한 부분 response_schema"""
+    properties = schema.get('properties', {})
+    return {
+        'type': 'object',
+        'properties': {key: properties[key] for key in fields if key in properties},
+        'required': [key for key in fields if key in properties],
+    }
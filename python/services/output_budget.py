@@ -0,0 +1,116 @@
+"""
+단계별 max_output_tokens 자동 조정
+
+단계별 실제 출력 토큰 수를 기록하고 p99 + 여유분으로 출력 상한을 정합니다.
+생성 지연은 출력 길이에 비례하므로 상한을 맞추면 지연/비용이 함께 줄어듭니다.
+
+- 표본이 부족하면 기본 상한 (8192) 사용
+- MAX_TOKENS로 잘린 응답은 상한의 2배를 표본으로 기록 → 다음 호출부터 상한 증가
+"""
+import logging
+import math
+import os
+from collections import deque
+from typing import Any, Deque, Dict
+
+logger = logging.getLogger(__name__)
+
+# 모델 최대 출력 토큰 (기존 고정값)
+DEFAULT_MAX_OUTPUT_TOKENS = 8192
+# 자동 조정 최소 상한 (짧은 응답도 여유 확보)
+MIN_MAX_OUTPUT_TOKENS = int(os.getenv("GEMINI_MIN_OUTPUT_TOKENS", "1024"))
+# p99 대비 여유 비율
+OUTPUT_TOKEN_MARGIN = float(os.getenv("GEMINI_OUTPUT_TOKEN_MARGIN", "0.25"))
+# 자동 조정 시작 최소 표본 수
+OUTPUT_BUDGET_MIN_SAMPLES = int(os.getenv("GEMINI_OUTPUT_BUDGET_MIN_SAMPLES", "20"))
+# 단계별 보관 표본 수
+OUTPUT_TOKEN_WINDOW = 200
+# 상한 반올림 단위
+TOKEN_ROUNDING = 256
+
+
+class OutputTokenBudget:
+    """단계별 출력 토큰 통계 + 상한 계산"""
+
+    def __init__(
+        self,
+        default: int = DEFAULT_MAX_OUTPUT_TOKENS,
+        minimum: int = MIN_MAX_OUTPUT_TOKENS,
+        margin: float = OUTPUT_TOKEN_MARGIN,
+        min_samples: int = OUTPUT_BUDGET_MIN_SAMPLES,
+        window: int = OUTPUT_TOKEN_WINDOW,
+    ):
+        self.default = default
+        self.minimum = minimum
+        self.margin = margin
+        self.min_samples = min_samples
+        self.window = window
+        self._samples: Dict[str, Deque[int]] = {}
+        self.truncations: Dict[str, int] = {}
+
+    def record(self, step: str, tokens: int, truncated: bool = False) -> None:
+        """
+        출력 토큰 수 기록
+
+        Args:
+            step: 단계명
+            tokens: 실제 출력 토큰 수
+            truncated: MAX_TOKENS로 잘렸는지 여부
+        """
+        if truncated:
+            self.truncations[step] = self.truncations.get(step, 0) + 1
+            # 실제 필요량을 알 수 없으므로 현재 상한의 2배로 기록 → p99 상승
+            tokens = min(self.default, max(tokens, self.budget(step)) * 2)
+            logger.warning(f"[OutputBudget] {step} 출력 잘림 → 상한 상향 ({tokens})")
+
+        samples = self._samples.get(step)
+        if samples is None:
+            samples = deque(maxlen=self.window)
+            self._samples[step] = samples
+        samples.append(tokens)
+
+    def _p99(self, step: str) -> int:
+        ordered = sorted(self._samples[step])
+        index = min(len(ordered) - 1, max(0, math.ceil(0.99 * len(ordered)) - 1))
+        return ordered[index]
+
+    def budget(self, step: str) -> int:
+        """단계별 max_output_tokens (p99 × (1 + margin), 256 단위 올림)"""
+        samples = self._samples.get(step)
+        if not samples or len(samples) < self.min_samples:
+            return self.default
+
+        target = self._p99(step) * (1 + self.margin)
+        rounded = int(math.ceil(target / TOKEN_ROUNDING) * TOKEN_ROUNDING)
+        return max(self.minimum, min(self.default, rounded))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """단계별 출력 토큰 통계"""
+        return {
+            step: {
+                "count": len(samples),
+                "p99": self._p99(step),
+                "budget": self.budget(step),
+                "truncations": self.truncations.get(step, 0),
+            }
+            for step, samples in self._samples.items()
+            if samples
+        }
+
+
+def extract_output_usage(response: Any) -> tuple:
+    """
+    Gemini 응답에서 (출력 토큰 수, MAX_TOKENS 잘림 여부) 추출
+
+    usage_metadata가 없으면 토큰 수 0
+    """
+    usage = getattr(response, "usage_metadata", None)
+    tokens = getattr(usage, "candidates_token_count", 0) or 0
+
+    truncated = False
+    candidates = getattr(response, "candidates", None) or []
+    if candidates:
+        reason = getattr(candidates[0], "finish_reason", None)
+        truncated = getattr(reason, "name", str(reason)) == "MAX_TOKENS" or reason == 2
+
+    return int(tokens), truncated
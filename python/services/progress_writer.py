@@ -0,0 +1,158 @@
+"""
+진행 상태 DB 쓰기 병합 (v2.10)
+
+오늘의 운세는 약 14단계마다 daily_fortunes에 진행 상태를 쓰고,
+리포트 / 궁합 파이프라인도 단계 전환마다 step_statuses / progress_percent를 기록합니다.
+대부분의 단계는 CPU 수 마이크로초라 작업 시간의 대부분이 DB 왕복입니다.
+
+ProgressWriter는 행(key)별로 변경을 모아 최신 상태만 씁니다.
+- 첫 변경은 바로 기록 (진행 시작이 폴링에 즉시 보이도록)
+- 이후 변경은 PROGRESS_FLUSH_INTERVAL_MS(기본 1000) 간격으로 최대 1회 기록 (타이머가 마지막 상태 기록)
+- flush=True (LLM 호출 직전 / 종료 상태) 는 모인 변경과 함께 즉시 기록
+- 필드는 나중 값이 우선, merge_keys(기본 step_statuses) dict는 단계별로 병합
+- 같은 행의 쓰기는 순서대로 1개씩 실행 (오래된 상태가 최신 상태를 덮어쓰지 않음)
+- 기록 실패 시 변경을 다시 대기 목록에 병합 (이후 변경이 우선), 다음 간격 / flush에 재시도
+  (close()는 호출자가 직접 최종 저장하므로 실패한 변경을 버림)
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_FLUSH_INTERVAL_MS = int(os.getenv("PROGRESS_FLUSH_INTERVAL_MS", "1000"))
+
+# (key, 병합된 변경) → 성공 여부
+ProgressWrite = Callable[[str, Dict[str, Any]], Awaitable[bool]]
+
+# 통계 조회용 등록 목록 (GET /api/jobs/stats)
+progress_writers: List["ProgressWriter"] = []
+
+
+class ProgressWriter:
+    """행별 진행 상태 쓰기 병합기"""
+
+    def __init__(
+        self,
+        name: str,
+        write: ProgressWrite,
+        interval_ms: int = PROGRESS_FLUSH_INTERVAL_MS,
+        merge_keys: Sequence[str] = ("step_statuses",),
+    ):
+        self.name = name
+        self._write = write
+        self.interval = interval_ms / 1000
+        self.merge_keys = tuple(merge_keys)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._last_flush: Dict[str, float] = {}
+        self._timers: Dict[str, asyncio.Task] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+        # 통계 (프로세스 단위)
+        self.updates = 0
+        self.writes = 0
+        self.failures = 0
+
+        progress_writers.append(self)
+
+    async def update(self, key: str, data: Dict[str, Any], flush: bool = False, final: bool = False) -> bool:
+        """
+        진행 상태 변경
+
+        Args:
+            key: 행 식별자 (리포트 ID 등)
+            data: 변경할 필드 (dict 값은 호출 시점 스냅샷으로 복사)
+            flush: 즉시 기록 (LLM 호출 직전 등)
+            final: 종료 상태 - 즉시 기록 후 행 상태 정리
+
+        Returns:
+            기록 성공 여부 (지연된 변경은 True)
+        """
+        self.updates += 1
+        self._merge(key, data)
+        if final:
+            return await self.close(key)
+        if flush:
+            return await self.flush(key)
+
+        elapsed = time.monotonic() - self._last_flush.get(key, float("-inf"))
+        if elapsed >= self.interval:
+            return await self.flush(key)
+        if key not in self._timers:
+            self._timers[key] = asyncio.create_task(self._flush_later(key, self.interval - elapsed))
+        return True
+
+    async def flush(self, key: str) -> bool:
+        """모인 변경 즉시 기록 (없으면 True, 실패하면 다음 간격에 재시도)"""
+        return await self._flush(key, requeue=True)
+
+    async def _flush(self, key: str, requeue: bool) -> bool:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            data = self._pending.pop(key, None)
+            if not data:
+                return True
+            self._last_flush[key] = time.monotonic()
+            try:
+                saved = bool(await self._write(key, data))
+            except Exception as e:
+                logger.error(f"[ProgressWriter:{self.name}] {key} 기록 실패: {e}")
+                saved = False
+            if not saved and requeue:
+                self._requeue(key, data)
+        if saved:
+            self.writes += 1
+        else:
+            self.failures += 1
+        return saved
+
+    async def close(self, key: str) -> bool:
+        """종료된 행 - 모인 변경 기록 후 행 상태 정리 (직접 최종 저장하기 전에도 호출)"""
+        saved = await self._flush(key, requeue=False)
+        # 기록 대기 중 실패한 이전 flush가 예약한 재시도 (변경은 위에서 함께 기록됨)
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        if key not in self._pending:
+            self._last_flush.pop(key, None)
+            self._locks.pop(key, None)
+        return saved
+
+    def _requeue(self, key: str, data: Dict[str, Any]) -> None:
+        """실패한 변경을 대기 목록에 되돌림 (기록 중 들어온 변경이 우선) + 재시도 예약"""
+        pending = self._pending.pop(key, {})
+        self._pending[key] = data
+        self._merge(key, pending)
+        if key not in self._timers:
+            self._timers[key] = asyncio.create_task(self._flush_later(key, self.interval))
+
+    def _merge(self, key: str, data: Dict[str, Any]) -> None:
+        pending = self._pending.setdefault(key, {})
+        for field, value in data.items():
+            if isinstance(value, dict):
+                value = dict(value)
+                if field in self.merge_keys and isinstance(pending.get(field), dict):
+                    value = {**pending[field], **value}
+            pending[field] = value
+
+    async def _flush_later(self, key: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        # 기록 중에는 이후 flush()가 이 작업을 취소하지 않도록 먼저 해제
+        self._timers.pop(key, None)
+        await self.flush(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "interval_ms": int(self.interval * 1000),
+            "updates": self.updates,
+            "writes": self.writes,
+            "failures": self.failures,
+            "coalesced": max(self.updates - self.writes - self.failures, 0),
+            "pending_rows": len(self._pending),
+        }
@@ -2,7 +2,6 @@
 섹션 재분석 서비스
 비동기 백그라운드 작업으로 특정 섹션 AI 재분석 실행
 """
-import asyncio
 import os
 import logging
 from typing import Dict, Any, Optional
@@ -14,6 +13,7 @@ from schemas.analysis import SectionReanalyzeRequest
 from prompts.builder import PromptBuilder, PromptBuildOptions
 from .gemini import get_gemini_service
 from .normalizers import normalize_all_keys
+from .job_queue import job_queue
 
 logger = logging.getLogger(__name__)
 
@@ -47,19 +47,17 @@ class ReanalyzeService:
             request: 재분석 요청
         """
         logger.info(f"[Reanalyze:{request.reanalysis_id}] 백그라운드 작업 시작 요청")
-        # 백그라운드에서 재분석 실행 (예외 처리 포함)
-        task = asyncio.create_task(self._safe_run_reanalysis(request))
-        # 태스크 예외 로깅
-        task.add_done_callback(self._task_done_callback)
-
-    def _task_done_callback(self, task: asyncio.Task):
-        """백그라운드 태스크 완료 콜백"""
-        try:
-            exc = task.exception()
-            if exc:
-                logger.error(f"[Reanalyze] 백그라운드 태스크 예외: {exc}")
-        except asyncio.CancelledError:
-            logger.warning("[Reanalyze] 백그라운드 태스크 취소됨")
+        # v2.10: 영속 작업 큐에 등록 (워커가 실행, 재시작 후 재개)
+        await job_queue.aenqueue(
+            "reanalysis",
+            request.reanalysis_id,
+            request.model_dump(mode="json"),
+            dedup_key=request.reanalysis_id,
+        )
+
+    async def run_queued(self, reanalysis_id: str, payload: Dict[str, Any], final_attempt: bool = True):
+        """작업 큐 워커 진입점 (최상위 예외 처리 포함 - 큐 재시도 없음)"""
+        await self._safe_run_reanalysis(SectionReanalyzeRequest(**payload))
 
     async def _safe_run_reanalysis(self, request: SectionReanalyzeRequest):
         """
@@ -105,10 +103,11 @@ class ReanalyzeService:
             logger.info(f"[Reanalyze:{request.reanalysis_id}] Gemini 호출 시작")
             gemini = self._get_gemini()
 
-            full_prompt = f"{prompt_result.system_prompt}\n\n{prompt_result.user_prompt}"
+            # 시스템 프롬프트는 언어/단계별 고정 → 컨텍스트 캐싱
             result = await gemini.generate_section_analysis(
-                prompt=full_prompt,
+                prompt=prompt_result.user_prompt,
                 section_type=request.section_type,
+                system_prompt=prompt_result.system_prompt,
             )
 
             # 3. DB 저장 전 키 정규화 (camelCase 통일)
@@ -166,3 +165,4 @@ class ReanalyzeService:
 
 # 싱글톤 인스턴스
 reanalyze_service = ReanalyzeService()
+job_queue.register("reanalysis", reanalyze_service.run_queued)
@@ -3,13 +3,12 @@
 비동기 백그라운드 작업으로 파이프라인 실행
 """
 import asyncio
+import copy
 import uuid
 import logging
-import os
 import json
-import httpx
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Sequence, Tuple
 
 from schemas.report import (
     JobStatus,
@@ -20,27 +19,36 @@ from prompts.builder import PromptBuilder, PromptBuildOptions
 from .gemini import get_gemini_service
 from manseryeok.engine import ManseryeokEngine
 from manseryeok.constants import JIJANGGAN_TABLE
+from prompts.analysis_context import AnalysisContext
 from schemas.saju import CalculateRequest, Pillars, Pillar
 from visualization import SajuVisualizer
 from services.normalizers import normalize_response, normalize_all_keys
 from schemas.report_steps import validate_step_response, STEP_SCHEMAS
 from schemas.gemini_schemas import get_gemini_schema
+from .step_executor import StepExecutor, StepSpec, StepContext, downstream_steps
+from .job_store import BoundedJobStore
+from .admission import Admission, AdmissionRejected, admission_controller
+from .job_queue import job_queue
+from .progress_writer import ProgressWriter
+from .supabase_rest import supabase_rest
 
 logger = logging.getLogger(__name__)
 
 # 시각화 인스턴스
 visualizer = SajuVisualizer()
 
-# Supabase 설정
-SUPABASE_URL = os.getenv("SUPABASE_URL", "")
-SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
 
+class JobStore(BoundedJobStore):
+    """리포트 작업 저장소 (v2.10: 공용 상한/TTL 저장소 기반)"""
 
-class JobStore:
-    """인메모리 작업 저장소"""
+    RESULT_FIELDS = (
+        "pillars", "daewun", "jijanggan", "analysis_context", "analysis", "scores", "visualization_url",
+    )
+    # 분석 컨텍스트는 같은 프로세스의 단계 간에만 공유 (상태 백엔드에 기록하지 않음)
+    LOCAL_FIELDS = ("analysis_context",)
 
     def __init__(self):
-        self._jobs: Dict[str, Dict[str, Any]] = {}
+        super().__init__("report")
 
     def create(self, job_id: str, report_id: str, user_id: str) -> Dict[str, Any]:
         """작업 생성"""
@@ -68,6 +76,8 @@ class JobStore:
             "pillars": None,
             "daewun": None,
             "jijanggan": None,
+            # v2.10: 작업 단위 분석 컨텍스트 (jijanggan 단계에서 1회 생성, 단계 간 공유)
+            "analysis_context": None,
             "analysis": None,
             "scores": None,
             "visualization_url": None,
@@ -77,70 +87,73 @@ class JobStore:
             "created_at": now,
             "updated_at": now,
         }
-        self._jobs[job_id] = job
-        return job
-
-    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """작업 조회"""
-        return self._jobs.get(job_id)
+        return self._insert(job_id, job)
 
     def get_by_report_id(self, report_id: str) -> Optional[Dict[str, Any]]:
-        """리포트 ID로 작업 조회"""
-        for job in self._jobs.values():
-            if job["report_id"] == report_id:
-                return job
-        return None
-
-    def update(self, job_id: str, **kwargs) -> Optional[Dict[str, Any]]:
-        """작업 업데이트"""
-        job = self._jobs.get(job_id)
-        if not job:
-            return None
+        """리포트 ID로 가장 최근 작업 조회 (v2.10: 색인 조회)"""
+        return self.get_by("report_id", report_id)
 
-        job.update(kwargs)
-        job["updated_at"] = datetime.utcnow().isoformat()
-        return job
 
-    def update_step_status(self, job_id: str, step: str, status: str) -> None:
-        """단계 상태 업데이트"""
-        job = self._jobs.get(job_id)
-        if job and "step_statuses" in job:
-            job["step_statuses"][step] = status
-            job["updated_at"] = datetime.utcnow().isoformat()
+# 글로벌 작업 저장소
+job_store = JobStore()
 
-    def cleanup_old_jobs(self, max_age_hours: int = 24):
-        """오래된 작업 정리"""
-        now = datetime.utcnow()
-        to_delete = []
 
-        for job_id, job in self._jobs.items():
-            created = datetime.fromisoformat(job["created_at"])
-            age = (now - created).total_seconds() / 3600
-            if age > max_age_hours:
-                to_delete.append(job_id)
+# 단계별 진행률 가중치 (StepExecutor가 progress_percent 자동 계산)
+STEP_WEIGHTS = {
+    "manseryeok": 10,
+    "jijanggan": 5,
+    "basic_analysis": 15,
+    "personality": 15,
+    "aptitude": 10,
+    "fortune": 10,
+    "daewun_analysis": 10,
+    "scoring": 8,
+    "visualization": 7,
+    "saving": 5,
+}
 
-        for job_id in to_delete:
-            del self._jobs[job_id]
+# 순차 분석 섹션 (basic_analysis 결과만 참조 → 서로 독립적으로 병렬 실행)
+SECTION_STEPS = ["personality", "aptitude", "fortune"]
 
+# v2.10: 체크포인트 조회 컬럼 (단계별 DB 중간 저장 결과)
+CHECKPOINT_COLUMNS = "pillars,daewun,analysis,basic_analysis,personality,aptitude,fortune"
 
-# 글로벌 작업 저장소
-job_store = JobStore()
 
+def report_checkpoint_results(row: Dict[str, Any], excluded: Sequence[str] = ()) -> Dict[str, Any]:
+    """
+    profile_reports 중간 저장 결과 → 복원 가능한 단계 결과
 
-# 단계별 진행률
-STEP_PROGRESS = {
-    "manseryeok": 10,
-    "jijanggan": 15,
-    "basic_analysis": 30,
-    "personality": 45,
-    "aptitude": 55,
-    "fortune": 65,
-    "daewun_analysis": 75,
-    "scoring": 85,
-    "visualization": 92,
-    "saving": 97,
-    "complete": 100,
-}
+    선행 단계가 복원된 경우에만 복원 (basic_analysis 없이 저장된 섹션은 재사용하지 않음)
+
+    Args:
+        row: profile_reports 행 (CHECKPOINT_COLUMNS)
+        excluded: 다시 실행할 단계 (retry_from_step 및 그 이후 단계)
+
+    Returns:
+        단계명 → 결과 (manseryeok: {"pillars", "daewun"}, daewun_analysis: 대운 목록)
+    """
+    restored: Dict[str, Any] = {}
+    analysis = row.get("analysis") or {}
+
+    if "manseryeok" in excluded or not row.get("pillars") or not row.get("daewun"):
+        return restored
+    restored["manseryeok"] = {"pillars": row["pillars"], "daewun": row["daewun"]}
+
+    basic = row.get("basic_analysis") or analysis.get("basicAnalysis")
+    if "basic_analysis" in excluded or not basic:
+        return restored
+    restored["basic_analysis"] = basic
+
+    for step_name in SECTION_STEPS:
+        section = row.get(step_name) or analysis.get(step_name)
+        if step_name not in excluded and section:
+            restored[step_name] = section
+
+    # 대운 분석 결과는 daewun 항목에 병합되어 저장됨
+    if "daewun_analysis" not in excluded and any(dw.get("summary") for dw in row["daewun"]):
+        restored["daewun_analysis"] = row["daewun"]
+
+    return restored
 
 
 class ReportAnalysisService:
@@ -149,6 +162,8 @@ class ReportAnalysisService:
     def __init__(self):
         self.gemini = None
         self.engine = ManseryeokEngine()
+        # v2.10: in_progress 중간 저장 쓰기 병합 (병렬 섹션 완료가 몰리면 1회로)
+        self.progress = ProgressWriter("report", self._write_db_status)
 
     def _get_gemini(self):
         """Gemini 서비스 지연 로딩"""
@@ -156,7 +171,7 @@ class ReportAnalysisService:
             self.gemini = get_gemini_service()
         return self.gemini
 
-    async def start_analysis(self, request: ReportAnalysisRequest) -> str:
+    async def start_analysis(self, request: ReportAnalysisRequest) -> Admission:
         """
         분석 작업 시작 (백그라운드)
 
@@ -164,48 +179,149 @@ class ReportAnalysisService:
             request: 분석 요청
 
         Returns:
-            작업 ID
+            수용 결과 (job_id: 같은 리포트 분석이 대기/진행 중이면 기존 작업 ID)
+
+        Raises:
+            AdmissionRejected: 작업 큐 수용 한도 초과
         """
         job_id = str(uuid.uuid4())
 
         # 작업 생성
         job_store.create(job_id, request.report_id, request.user_id)
 
-        # 백그라운드에서 분석 실행
-        asyncio.create_task(self._run_analysis(job_id, request))
-
-        return job_id
-
-    async def _run_analysis(self, job_id: str, request: ReportAnalysisRequest):
-        """백그라운드 분석 실행"""
+        # v2.10: 영속 작업 큐에 수용 한도 조건부 등록 (워커가 실행, 재시작 후 재개)
+        # 중복 요청 (더블 클릭 / 재시도) → 대기/진행 중인 작업에 합류
         try:
-            logger.info(f"[{job_id}] 리포트 분석 시작: report_id={request.report_id}")
-
-            # 1. 만세력 계산
-            await self._step_manseryeok(job_id, request)
+            admission = await admission_controller.enqueue(
+                "report", job_id, request.model_dump(mode="json"),
+                dedup_key=request.report_id, user_id=request.user_id,
+            )
+        except AdmissionRejected:
+            job_store.delete(job_id)
+            raise
+        queued_job_id = admission.job_id
+        if queued_job_id != job_id:
+            job_store.delete(job_id)
+            logger.info(f"[{queued_job_id}] 진행 중인 리포트 분석 재사용: {request.report_id}")
+        else:
+            # 공유 상태 백엔드 사용 시 실행은 작업을 가져간 워커 프로세스가 담당
+            job_store.handoff(job_id)
+        return admission
+
+    async def run_queued(self, job_id: str, payload: Dict[str, Any], final_attempt: bool = True):
+        """작업 큐 워커 진입점 (재시작 후 재개 시 작업 상태 재생성)"""
+        request = ReportAnalysisRequest(**payload)
+        if job_id not in job_store:
+            job_store.create(job_id, request.report_id, request.user_id)
+        await self._run_analysis(job_id, request, final_attempt)
+
+    async def on_interrupted(self, job_id: str, payload: Dict[str, Any]):
+        """
+        작업 큐 중단 훅 (종료 대기 시간 초과)
 
-            # 2. 지장간 추출
-            await self._step_jijanggan(job_id)
+        완료된 단계는 이미 DB에 중간 저장되어 있으므로 행을 pending으로 되돌려 두고,
+        대기열로 돌아간 작업을 다른 워커 / 재시작한 프로세스가 체크포인트부터 이어서 실행
+        """
+        request = ReportAnalysisRequest(**payload)
+        job = job_store.mark_interrupted(job_id)
+        if job is None:
+            return
+        await self._update_db_status(
+            request.report_id,
+            status="pending",
+            step_statuses=job["step_statuses"],
+            progress_percent=job.get("progress_percent", 0)
+        )
 
-            # 3. 기본 분석 (Gemini)
-            await self._step_basic_analysis(job_id, request.language)
+    def _build_pipeline(self, job_id: str, request: ReportAnalysisRequest) -> List[StepSpec]:
+        """
+        리포트 파이프라인 DAG 정의
 
-            # 4-6. 순차 분석 (Gemini) - 각 단계별 3회 재시도 + DB 중간 저장
-            await self._step_sequential_analysis(job_id, request.report_id, request.language)
+        manseryeok → jijanggan → basic_analysis → (personality | aptitude | fortune | daewun_analysis)
+        scoring / visualization은 Gemini 결과와 무관하므로 만세력 직후 병렬 실행
+        """
+        language = request.language
+        report_id = request.report_id
+
+        def section_step(step_name: str) -> StepSpec:
+            return StepSpec(
+                name=step_name,
+                run=lambda ctx: self._step_section_analysis(ctx, report_id, language),
+                depends_on=("basic_analysis",),
+                max_attempts=3,
+                weight=STEP_WEIGHTS[step_name],
+                fallback=lambda ctx, error: self._section_fallback(ctx),
+            )
 
-            # 7. 대운 분석 (Gemini) - 8개 대운 상세 분석
-            await self._step_daewun_analysis(job_id, request.report_id, request.language)
+        return [
+            StepSpec(
+                name="manseryeok",
+                run=lambda ctx: self._step_manseryeok(job_id, request),
+                weight=STEP_WEIGHTS["manseryeok"],
+            ),
+            StepSpec(
+                name="jijanggan",
+                run=lambda ctx: self._step_jijanggan(job_id, language),
+                depends_on=("manseryeok",),
+                weight=STEP_WEIGHTS["jijanggan"],
+            ),
+            StepSpec(
+                name="basic_analysis",
+                run=lambda ctx: self._step_basic_analysis(job_id, report_id, language),
+                depends_on=("jijanggan",),
+                weight=STEP_WEIGHTS["basic_analysis"],
+            ),
+            *[section_step(step_name) for step_name in SECTION_STEPS],
+            StepSpec(
+                name="daewun_analysis",
+                run=lambda ctx: self._step_daewun_analysis(ctx, report_id, language),
+                depends_on=("basic_analysis",),
+                max_attempts=3,
+                weight=STEP_WEIGHTS["daewun_analysis"],
+                # 대운 분석 실패해도 다음 단계로 진행 (기존 대운 데이터 유지)
+                critical=False,
+            ),
+            StepSpec(
+                name="scoring",
+                run=lambda ctx: self._step_scoring(job_id),
+                depends_on=("jijanggan",),
+                weight=STEP_WEIGHTS["scoring"],
+            ),
+            StepSpec(
+                name="visualization",
+                run=lambda ctx: self._step_visualization(job_id),
+                depends_on=("manseryeok",),
+                weight=STEP_WEIGHTS["visualization"],
+            ),
+            StepSpec(
+                name="saving",
+                run=lambda ctx: self._step_saving(ctx, report_id),
+                depends_on=(*SECTION_STEPS, "daewun_analysis", "scoring", "visualization"),
+                weight=STEP_WEIGHTS["saving"],
+            ),
+        ]
 
-            # 8. 점수 계산
-            await self._step_scoring(job_id)
+    async def _run_analysis(self, job_id: str, request: ReportAnalysisRequest, final_attempt: bool = True):
+        """
+        백그라운드 분석 실행 (DAG 실행기)
 
-            # 9. 시각화 생성
-            await self._step_visualization(job_id)
+        실패 시 상태 / DB 기록 후 예외를 다시 던짐 → 작업 큐가 max_attempts까지 재시도
+        (마지막 시도가 아니면 failed 대신 재시도 대기(pending)로 기록)
+        """
+        try:
+            logger.info(f"[{job_id}] 리포트 분석 시작: report_id={request.report_id}")
 
-            # 10. DB 저장
-            await self._step_saving(job_id, request.report_id)
+            # 재시도 시 이전 실패 정보 초기화
+            job_store.update(
+                job_id, status=JobStatus.IN_PROGRESS, error=None, error_step=None, retrying=False
+            )
+            steps = self._build_pipeline(job_id, request)
+            # v2.10: 재시도 / 재시작 시 이미 완료된 단계는 DB 중간 저장 결과로 복원
+            restored = await self._load_checkpoint(job_id, request, steps)
+            executor = StepExecutor(steps, job_store, job_id, restored=restored)
+            await executor.run()
 
-            # 11. 완료
+            # 완료
             job_store.update_step_status(job_id, "complete", "completed")
             job_store.update(
                 job_id,
@@ -221,6 +337,18 @@ class ReportAnalysisService:
             job = job_store.get(job_id)
             current_step = job.get("current_step") if job else "unknown"
 
+            if not final_attempt:
+                # 작업 큐가 다시 실행 → 최종 실패로 표시하지 않음 (완료 단계는 체크포인트에서 복원)
+                job = job_store.mark_retrying(job_id, str(e), current_step)
+                if job is not None:
+                    await self._update_db_status(
+                        request.report_id,
+                        status="pending",
+                        step_statuses=job["step_statuses"],
+                        progress_percent=job.get("progress_percent", 0)
+                    )
+                raise
+
             job_store.update(
                 job_id,
                 status=JobStatus.FAILED,
@@ -239,17 +367,59 @@ class ReportAnalysisService:
                     "retryable": True
                 }
             )
+            raise
+
+    async def _load_checkpoint(
+        self,
+        job_id: str,
+        request: ReportAnalysisRequest,
+        steps: List[StepSpec]
+    ) -> Dict[str, Any]:
+        """
+        DB 중간 저장 결과 조회 → 복원 단계 결과 + job_store 반영
+
+        Returns:
+            단계명 → 결과 (조회 실패 시 빈 딕셔너리 = 처음부터 실행)
+        """
+        row = await self._fetch_checkpoint_row(request.report_id)
+        if not row:
+            return {}
+
+        restored = report_checkpoint_results(row, downstream_steps(steps, [request.retry_from_step]))
+        if "manseryeok" in restored:
+            job_store.update(job_id, **restored["manseryeok"])
+
+        analysis = {}
+        if "basic_analysis" in restored:
+            analysis["basicAnalysis"] = restored["basic_analysis"]
+        for step_name in SECTION_STEPS:
+            if step_name in restored:
+                analysis[step_name] = restored[step_name]
+        if analysis:
+            job_store.update(job_id, analysis=analysis)
+
+        return restored
+
+    async def _fetch_checkpoint_row(self, report_id: str) -> Optional[Dict[str, Any]]:
+        """profile_reports 중간 저장 결과 조회"""
+        if not supabase_rest.configured:
+            return None
+
+        try:
+            response = await supabase_rest.get(
+                "profile_reports",
+                params={"select": CHECKPOINT_COLUMNS, "id": f"eq.{report_id}"},
+                timeout=10.0
+            )
+            response.raise_for_status()
+            rows = response.json()
+            return rows[0] if rows else None
+        except Exception as e:
+            logger.warning(f"체크포인트 조회 실패 (처음부터 실행): report_id={report_id}, {e}")
+            return None
 
     async def _step_manseryeok(self, job_id: str, request: ReportAnalysisRequest):
         """만세력 계산 단계"""
-        job_store.update(
-            job_id,
-            status=JobStatus.IN_PROGRESS,
-            current_step="manseryeok",
-            progress_percent=STEP_PROGRESS["manseryeok"]
-        )
-        job_store.update_step_status(job_id, "manseryeok", "in_progress")
-
         # 기존 데이터 있으면 재사용
         if request.existing_pillars and request.retry_from_step != "manseryeok":
             logger.info(f"[{job_id}] 기존 만세력 데이터 재사용")
@@ -278,18 +448,21 @@ class ReportAnalysisService:
                 daewun=[d.model_dump() if hasattr(d, 'model_dump') else d for d in result.daewun]
             )
 
-        job_store.update_step_status(job_id, "manseryeok", "completed")
-        logger.info(f"[{job_id}] 만세력 계산 완료")
-
-    async def _step_jijanggan(self, job_id: str):
-        """지장간 추출 단계"""
-        job_store.update(
-            job_id,
-            current_step="jijanggan",
-            progress_percent=STEP_PROGRESS["jijanggan"]
+        # Supabase 중간 저장 (재시도 / 재시작 시 복원용)
+        job = job_store.get(job_id)
+        await self._update_db_status(
+            request.report_id,
+            status="in_progress",
+            pillars=job.get("pillars"),
+            daewun=job.get("daewun"),
+            step_statuses={**job.get("step_statuses", {}), "manseryeok": "completed"},
+            progress_percent=job.get("progress_percent", 0)
         )
-        job_store.update_step_status(job_id, "jijanggan", "in_progress")
 
+        logger.info(f"[{job_id}] 만세력 계산 완료")
+
+    async def _step_jijanggan(self, job_id: str, language: str):
+        """지장간 추출 + 분석 컨텍스트 생성 단계"""
         job = job_store.get(job_id)
         pillars = job.get("pillars", {})
 
@@ -302,140 +475,115 @@ class ReportAnalysisService:
             else:
                 jijanggan[pillar_name] = []
 
-        job_store.update(job_id, jijanggan=jijanggan)
-        job_store.update_step_status(job_id, "jijanggan", "completed")
+        # v2.10: 십신/상호작용/신살/격국 + 렌더링 블록을 1회만 계산
+        analysis_context = AnalysisContext.build(pillars, language, jijanggan)
+
+        job_store.update(job_id, jijanggan=jijanggan, analysis_context=analysis_context)
         logger.info(f"[{job_id}] 지장간 추출 완료")
 
-    async def _step_basic_analysis(self, job_id: str, language: str):
+    async def _step_basic_analysis(self, job_id: str, report_id: str, language: str):
         """기본 분석 단계 (Gemini)"""
-        job_store.update(
-            job_id,
-            current_step="basic_analysis",
-            progress_percent=STEP_PROGRESS["basic_analysis"]
-        )
-        job_store.update_step_status(job_id, "basic_analysis", "in_progress")
-
         job = job_store.get(job_id)
         pillars = job.get("pillars", {})
         daewun = job.get("daewun", [])
         jijanggan = job.get("jijanggan", {})
 
-        prompt = await self._build_step_prompt("basic", language, pillars, daewun, jijanggan)
+        system_prompt, prompt = await self._build_step_prompt(
+            "basic", language, pillars, daewun, jijanggan,
+            analysis_context=job.get("analysis_context")
+        )
         # v2.7: response_schema 적용
-        result = await self._call_gemini(prompt, step_name="basic")
+        result = await self._call_gemini(prompt, step_name="basic", system_prompt=system_prompt)
 
         # analysis에 저장
         analysis = job.get("analysis") or {}
         analysis["basicAnalysis"] = result
         job_store.update(job_id, analysis=analysis)
-        job_store.update_step_status(job_id, "basic_analysis", "completed")
+
+        # Supabase 중간 저장 (재시도 / 재시작 시 복원용)
+        job = job_store.get(job_id)
+        await self._update_db_status(
+            report_id,
+            status="in_progress",
+            analysis=analysis,
+            basic_analysis=result,
+            step_statuses={**job.get("step_statuses", {}), "basic_analysis": "completed"},
+            progress_percent=job.get("progress_percent", 0)
+        )
         logger.info(f"[{job_id}] 기본 분석 완료")
 
-    async def _step_sequential_analysis(self, job_id: str, report_id: str, language: str):
-        """순차 분석 단계 (personality → aptitude → fortune) - 각 단계 성공 시 DB 중간 저장"""
+    async def _step_section_analysis(self, ctx: StepContext, report_id: str, language: str):
+        """섹션 분석 단계 (personality / aptitude / fortune) - 성공 시 DB 중간 저장"""
+        job_id = ctx.job_id
+        step_name = ctx.step
         job = job_store.get(job_id)
         pillars = job.get("pillars", {})
         daewun = job.get("daewun", [])
         jijanggan = job.get("jijanggan", {})
         analysis = job.get("analysis") or {}
 
-        steps = ["personality", "aptitude", "fortune"]
-        max_retries = 3
-
-        for step_name in steps:
-            job_store.update_step_status(job_id, step_name, "in_progress")
-            job_store.update(
-                job_id,
-                current_step=step_name,
-                progress_percent=STEP_PROGRESS[step_name]
-            )
-
-            success = False
-            last_error = None
-
-            for attempt in range(1, max_retries + 1):
-                try:
-                    logger.info(f"[{job_id}] {step_name} 분석 시도 {attempt}/{max_retries}")
+        logger.info(f"[{job_id}] {step_name} 분석 시도 {ctx.attempt}/3")
 
-                    prompt = await self._build_step_prompt(
-                        step_name, language, pillars, daewun, jijanggan, analysis
-                    )
-
-                    # v2.7: step_name + 이전 오류 피드백 전달
-                    result = await self._call_gemini(
-                        prompt,
-                        step_name=step_name,
-                        previous_error=last_error if attempt > 1 else None
-                    )
-
-                    # 응답 검증
-                    if not result or (isinstance(result, dict) and len(result) == 0):
-                        raise ValueError("빈 응답")
-
-                    # Step 1: Normalize (한글/snake_case → camelCase)
-                    normalized_result = normalize_all_keys(normalize_response(step_name, result))
-
-                    # Step 2: Validate (Pydantic 스키마 검증, 실패 시 재시도)
-                    validated_result = validate_step_response(step_name, normalized_result, raise_on_error=True)
-
-                    logger.info(f"[{job_id}] {step_name} 성공 (정규화+검증): {json.dumps(validated_result, ensure_ascii=False)[:300]}")
-                    analysis[step_name] = validated_result
-                    job_store.update(job_id, analysis=analysis)
-                    job_store.update_step_status(job_id, step_name, "completed")
-
-                    # Supabase 중간 저장 (크래시 복구용)
-                    # v2.5: 개별 컬럼 + 기존 analysis 동시 저장
-                    await self._update_db_status(
-                        report_id,
-                        status="in_progress",
-                        analysis=analysis,
-                        **{step_name: validated_result},  # 개별 컬럼
-                        step_statuses=job_store.get(job_id).get("step_statuses"),
-                        progress_percent=STEP_PROGRESS[step_name]
-                    )
-                    logger.info(f"[{job_id}] {step_name} DB 중간 저장 완료 (컬럼: {step_name})")
+        system_prompt, prompt = await self._build_step_prompt(
+            step_name, language, pillars, daewun, jijanggan, analysis,
+            analysis_context=job.get("analysis_context")
+        )
 
-                    success = True
-                    break
+        # v2.7: step_name + 이전 오류 피드백 전달
+        # Normalize (한글/snake_case → camelCase) + Validate (Pydantic 스키마 검증, 실패 시 재시도)
+        validated_result = await self._call_gemini(
+            prompt,
+            step_name=step_name,
+            previous_error=ctx.last_error if ctx.attempt > 1 else None,
+            validate=True,
+            system_prompt=system_prompt
+        )
 
-                except Exception as e:
-                    last_error = str(e)
-                    logger.warning(f"[{job_id}] {step_name} 실패 ({attempt}/{max_retries}): {e}")
+        logger.info(f"[{job_id}] {step_name} 성공 (정규화+검증): {json.dumps(validated_result, ensure_ascii=False)[:300]}")
+        analysis[step_name] = validated_result
+        job_store.update(job_id, analysis=analysis)
 
-            if not success:
-                logger.error(f"[{job_id}] {step_name} 최종 실패 (3회 재시도 후): {last_error}")
-                job_store.update_step_status(job_id, step_name, "failed")
-                # Fallback: 기본값으로 채우기 (null 방지)
-                fallback_result = validate_step_response(step_name, {})
-                analysis[step_name] = fallback_result
-                logger.info(f"[{job_id}] {step_name} 기본값으로 대체됨")
+        # Supabase 중간 저장 (크래시 복구용)
+        # v2.5: 개별 컬럼 + 기존 analysis 동시 저장
+        job = job_store.get(job_id)
+        await self._update_db_status(
+            report_id,
+            status="in_progress",
+            analysis=analysis,
+            **{step_name: validated_result},  # 개별 컬럼
+            step_statuses={**job.get("step_statuses", {}), step_name: "completed"},
+            progress_percent=job.get("progress_percent", 0)
+        )
+        logger.info(f"[{job_id}] {step_name} DB 중간 저장 완료 (컬럼: {step_name})")
 
-        # 최종 상태 저장
-        job_store.update(job_id, analysis=analysis)
+        return validated_result
 
-        # 모두 실패했는지 확인
-        success_count = sum(1 for s in steps if s in analysis)
-        logger.info(f"[{job_id}] 순차 분석 완료 ({success_count}/{len(steps)} 성공)")
+    def _section_fallback(self, ctx: StepContext) -> Dict[str, Any]:
+        """섹션 분석 최종 실패 시 기본값으로 채우기 (null 방지)"""
+        fallback_result = validate_step_response(ctx.step, {})
+        job = job_store.get(ctx.job_id)
+        analysis = job.get("analysis") or {}
+        analysis[ctx.step] = fallback_result
+        job_store.update(ctx.job_id, analysis=analysis)
+        return fallback_result
 
-        if success_count == 0:
-            raise Exception("모든 분석 실패 (personality, aptitude, fortune)")
+    async def _step_daewun_analysis(
+        self, ctx: StepContext, report_id: str, language: str
+    ) -> List[Dict[str, Any]]:
+        """
+        대운 분석 단계 - 8개 대운 각각에 대해 AI 상세 분석 생성
 
-    async def _step_daewun_analysis(self, job_id: str, report_id: str, language: str):
-        """대운 분석 단계 - 8개 대운 각각에 대해 AI 상세 분석 생성"""
+        v2.10: 병렬 섹션 단계가 프롬프트에 읽는 job_store 대운 목록은 바꾸지 않고
+        복사본에 점수 / 분석을 병합해 단계 결과로 반환 (saving 단계에서 반영)
+        """
         from prompts.daewun_analysis import build_daewun_analysis_prompt
         from manseryeok.daewun import _calculate_favorable_percent, _calculate_unfavorable_percent
         from datetime import date
 
-        job_store.update(
-            job_id,
-            current_step="daewun_analysis",
-            progress_percent=STEP_PROGRESS["daewun_analysis"]
-        )
-        job_store.update_step_status(job_id, "daewun_analysis", "in_progress")
-
+        job_id = ctx.job_id
         job = job_store.get(job_id)
         pillars = job.get("pillars", {})
-        daewun = job.get("daewun", [])
+        daewun = copy.deepcopy(job.get("daewun") or [])
         analysis = job.get("analysis", {})
 
         # 기본 분석에서 용신/기신 정보 추출
@@ -450,7 +598,7 @@ class ReportAnalysisService:
         useful_god = useful_god_data.get("primary", "")
         harmful_god = useful_god_data.get("harmful", "")
 
-        # v5.0: 대운 점수 재계산 (용신/기신 보정 적용)
+        # v5.0: 대운 점수 재계산 (용신/기신 보정 적용, 시도마다 새 복사본)
         for dw in daewun:
             ten_god = dw.get("tenGod", "")
             branch = dw.get("branch", "")
@@ -462,96 +610,72 @@ class ReportAnalysisService:
             dw["unfavorablePercent"] = _calculate_unfavorable_percent(
                 ten_god, branch, harmful_god, stem
             )
-
-        logger.info(f"[{job_id}] 대운 점수 재계산 완료 (용신: {useful_god}, 기신: {harmful_god})")
+        if ctx.attempt == 1:
+            logger.info(f"[{job_id}] 대운 점수 재계산 완료 (용신: {useful_god}, 기신: {harmful_god})")
 
         # 현재 나이 계산 (대략적)
         birth_year = pillars.get("year", {}).get("yearNum", date.today().year - 30)
         current_age = date.today().year - birth_year
 
-        max_retries = 3
-        success = False
-        last_error = None
-
-        for attempt in range(1, max_retries + 1):
-            try:
-                logger.info(f"[{job_id}] 대운 분석 시도 {attempt}/{max_retries}")
-
-                # 대운 분석 프롬프트 빌드
-                prompt = build_daewun_analysis_prompt(
-                    day_master=day_master,
-                    day_master_element=day_master_element,
-                    useful_god=useful_god,
-                    harmful_god=harmful_god,
-                    current_age=current_age,
-                    daewun_list=daewun,
-                    language=language
-                )
-
-                # v2.7: 에러 피드백 포함 Gemini 호출
-                result = await self._call_gemini(
-                    prompt,
-                    step_name="daewun_analysis",
-                    previous_error=last_error if attempt > 1 else None
-                )
-
-                # 응답 검증
-                if not result or not isinstance(result, dict):
-                    raise ValueError("빈 응답 또는 잘못된 형식")
-
-                daewun_analysis = result.get("daewunAnalysis", [])
-                if not daewun_analysis:
-                    raise ValueError("daewunAnalysis 필드 없음")
-
-                # 대운 데이터에 AI 분석 결과 병합 (v5.0: 점수는 Python 엔진에서 계산)
-                for i, dw in enumerate(daewun):
-                    if i < len(daewun_analysis):
-                        ai_result = daewun_analysis[i]
-                        dw["scoreReasoning"] = ai_result.get("scoreReasoning", "")
-                        dw["summary"] = ai_result.get("summary", "")
-                        # v5.0: favorablePercent/unfavorablePercent는 Python 엔진에서 계산
-                        # Gemini 점수 덮어쓰기 제거 (일관된 점수 계산을 위해)
-
-                        # 300자 미만이면 경고 로그
-                        summary = dw.get("summary", "")
-                        if summary and len(summary) < 300:
-                            logger.warning(f"[{job_id}] 대운 {i} summary 길이 부족: {len(summary)}자")
-
-                # 성공 - 인메모리 저장
-                job_store.update(job_id, daewun=daewun)
-                job_store.update_step_status(job_id, "daewun_analysis", "completed")
-
-                # Supabase 중간 저장
-                await self._update_db_status(
-                    report_id,
-                    status="in_progress",
-                    daewun=daewun,
-                    step_statuses=job_store.get(job_id).get("step_statuses"),
-                    progress_percent=STEP_PROGRESS["daewun_analysis"]
-                )
-
-                logger.info(f"[{job_id}] 대운 분석 완료: {len(daewun_analysis)}개 대운 분석됨")
-                success = True
-                break
+        logger.info(f"[{job_id}] 대운 분석 시도 {ctx.attempt}/3")
+
+        # 대운 분석 프롬프트 빌드
+        prompt = build_daewun_analysis_prompt(
+            day_master=day_master,
+            day_master_element=day_master_element,
+            useful_god=useful_god,
+            harmful_god=harmful_god,
+            current_age=current_age,
+            daewun_list=daewun,
+            language=language
+        )
 
-            except Exception as e:
-                last_error = str(e)
-                logger.warning(f"[{job_id}] 대운 분석 실패 ({attempt}/{max_retries}): {e}")
+        def validate_daewun(result: Dict[str, Any]) -> Dict[str, Any]:
+            # 응답 검증 (통과한 응답만 캐시)
+            if not result or not isinstance(result, dict):
+                raise ValueError("빈 응답 또는 잘못된 형식")
+            if not result.get("daewunAnalysis"):
+                raise ValueError("daewunAnalysis 필드 없음")
+            return result
+
+        # v2.7: 에러 피드백 포함 Gemini 호출
+        result = await self._call_gemini(
+            prompt,
+            step_name="daewun_analysis",
+            previous_error=ctx.last_error if ctx.attempt > 1 else None,
+            validator=validate_daewun
+        )
+        daewun_analysis = result["daewunAnalysis"]
+
+        # 대운 데이터에 AI 분석 결과 병합 (v5.0: 점수는 Python 엔진에서 계산)
+        for i, dw in enumerate(daewun):
+            if i < len(daewun_analysis):
+                ai_result = daewun_analysis[i]
+                dw["scoreReasoning"] = ai_result.get("scoreReasoning", "")
+                dw["summary"] = ai_result.get("summary", "")
+                # v5.0: favorablePercent/unfavorablePercent는 Python 엔진에서 계산
+                # Gemini 점수 덮어쓰기 제거 (일관된 점수 계산을 위해)
+
+                # 300자 미만이면 경고 로그
+                summary = dw.get("summary", "")
+                if summary and len(summary) < 300:
+                    logger.warning(f"[{job_id}] 대운 {i} summary 길이 부족: {len(summary)}자")
+
+        # Supabase 중간 저장 (job_store 반영은 saving 단계)
+        job = job_store.get(job_id)
+        await self._update_db_status(
+            report_id,
+            status="in_progress",
+            daewun=daewun,
+            step_statuses={**job.get("step_statuses", {}), "daewun_analysis": "completed"},
+            progress_percent=job.get("progress_percent", 0)
+        )
 
-        if not success:
-            logger.error(f"[{job_id}] 대운 분석 최종 실패 (3회 재시도 후): {last_error}")
-            job_store.update_step_status(job_id, "daewun_analysis", "failed")
-            # 대운 분석 실패해도 다음 단계로 진행 (기존 대운 데이터 유지)
+        logger.info(f"[{job_id}] 대운 분석 완료: {len(daewun_analysis)}개 대운 분석됨")
+        return daewun
 
     async def _step_scoring(self, job_id: str):
         """점수 계산 단계"""
-        job_store.update(
-            job_id,
-            current_step="scoring",
-            progress_percent=STEP_PROGRESS["scoring"]
-        )
-        job_store.update_step_status(job_id, "scoring", "in_progress")
-
         job = job_store.get(job_id)
         pillars = job.get("pillars", {})
         jijanggan = job.get("jijanggan", {})
@@ -573,18 +697,10 @@ class ReportAnalysisService:
             }
 
         job_store.update(job_id, scores=scores)
-        job_store.update_step_status(job_id, "scoring", "completed")
         logger.info(f"[{job_id}] 점수 계산 완료: {scores}")
 
     async def _step_visualization(self, job_id: str):
         """시각화 생성 단계"""
-        job_store.update(
-            job_id,
-            current_step="visualization",
-            progress_percent=STEP_PROGRESS["visualization"]
-        )
-        job_store.update_step_status(job_id, "visualization", "in_progress")
-
         job = job_store.get(job_id)
         pillars_dict = job.get("pillars", {})
 
@@ -596,38 +712,35 @@ class ReportAnalysisService:
                 day=Pillar(**pillars_dict.get("day", {})),
                 hour=Pillar(**pillars_dict.get("hour", {})),
             )
-            # 시각화 생성
-            image_base64 = visualizer.generate(pillars)
+            # 시각화 생성 (CPU 작업 - 이벤트 루프 차단 방지)
+            image_base64 = await asyncio.to_thread(visualizer.generate, pillars)
             job_store.update(job_id, visualization_url=image_base64)
         except Exception as e:
             logger.warning(f"[{job_id}] 시각화 생성 실패 (스킵): {e}")
             job_store.update(job_id, visualization_url="")
 
-        job_store.update_step_status(job_id, "visualization", "completed")
         logger.info(f"[{job_id}] 시각화 생성 완료")
 
-    async def _step_saving(self, job_id: str, report_id: str):
+    async def _step_saving(self, ctx: StepContext, report_id: str):
         """DB 저장 단계"""
-        job_store.update(
-            job_id,
-            current_step="saving",
-            progress_percent=STEP_PROGRESS["saving"]
-        )
-        job_store.update_step_status(job_id, "saving", "in_progress")
-
+        job_id = ctx.job_id
+        # 대운 분석 결과 (점수 / 분석 병합된 대운 목록, 실패 시 기존 대운 데이터 유지)
+        daewun = ctx.results.get("daewun_analysis")
+        if daewun:
+            job_store.update(job_id, daewun=daewun)
         job = job_store.get(job_id)
         step_statuses = job.get("step_statuses", {})
 
         # 실패한 단계 수집
         failed_steps = [
             step for step, status in step_statuses.items()
-            if status == "failed" and step in ["personality", "aptitude", "fortune"]
+            if status == "failed" and step in SECTION_STEPS
         ]
 
         # Supabase에 결과 저장
         # v2.5: 개별 컬럼 + 기존 analysis 동시 저장
         analysis = job.get("analysis") or {}
-        await self._update_db_status(
+        saved = await self._update_db_status(
             report_id,
             status="completed",
             pillars=job.get("pillars"),
@@ -645,8 +758,10 @@ class ReportAnalysisService:
             failed_steps=failed_steps,
             progress_percent=100
         )
+        # v2.10: DB가 원본이 되었으므로 작업 종료 후 메모리 결과 해제 대상
+        if saved:
+            job_store.mark_persisted(job_id)
 
-        job_store.update_step_status(job_id, "saving", "completed")
         logger.info(f"[{job_id}] DB 저장 완료")
 
     async def _build_step_prompt(
@@ -656,9 +771,18 @@ class ReportAnalysisService:
         pillars: Dict[str, Any],
         daewun: List[Dict[str, Any]],
         jijanggan: Dict[str, Any],
-        previous_results: Dict[str, Any] = None
-    ) -> str:
-        """단계별 프롬프트 빌드"""
+        previous_results: Dict[str, Any] = None,
+        analysis_context: Optional[AnalysisContext] = None
+    ) -> Tuple[str, str]:
+        """
+        단계별 프롬프트 빌드
+
+        Args:
+            analysis_context: 작업 단위 분석 컨텍스트 (십신/상호작용/신살/격국 블록 재사용)
+
+        Returns:
+            (시스템 프롬프트, 사용자 프롬프트) - 시스템 프롬프트는 언어/단계별 고정 (컨텍스트 캐싱 대상)
+        """
         from prompts.builder import PromptBuilder
 
         result = PromptBuilder.build_step(
@@ -667,49 +791,80 @@ class ReportAnalysisService:
             language=language,
             daewun=daewun,
             jijanggan=jijanggan,
-            previous_results=previous_results
+            previous_results=previous_results,
+            analysis_context=analysis_context
         )
 
-        return f"{result.system_prompt}\n\n{result.user_prompt}"
+        return result.system_prompt, result.user_prompt
 
     async def _call_gemini(
         self,
         prompt: str,
         step_name: str = None,
-        previous_error: str = None
+        previous_error: str = None,
+        validate: bool = False,
+        system_prompt: Optional[str] = None,
+        validator: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Gemini API 호출 (v2.7 - response_schema 지원)
 
         Args:
-            prompt: 프롬프트
+            prompt: 프롬프트 (system_prompt가 있으면 사용자 프롬프트)
             step_name: 단계명 (response_schema 적용용)
             previous_error: 이전 시도 오류 (재시도 시 피드백)
+            validate: True면 정규화 + Pydantic 검증까지 수행 (통과한 결과만 캐시)
+            system_prompt: 정적 시스템 프롬프트 (컨텍스트 캐싱)
+            validator: 단계 전용 검증 함수 (validate 대신 사용, 통과한 결과만 캐시)
 
         Returns:
-            파싱된 JSON 응답
+            파싱된 JSON 응답 (validate=True / validator가 있으면 검증된 결과)
         """
         gemini = self._get_gemini()
 
         # response_schema가 있는 단계면 스키마 기반 생성 사용
         schema = get_gemini_schema(step_name) if step_name else None
 
+        def postprocess(result: Dict[str, Any]) -> Dict[str, Any]:
+            # 응답 검증
+            if not result or (isinstance(result, dict) and len(result) == 0):
+                raise ValueError("빈 응답")
+            # Normalize (한글/snake_case → camelCase) → Validate (실패 시 재시도)
+            normalized = normalize_all_keys(normalize_response(step_name, result))
+            return validate_step_response(step_name, normalized, raise_on_error=True)
+
+        # 검증은 캐시 호출 안에서 실행 (검증 실패 응답은 캐시에 저장되지 않아 재시도 시 새로 생성)
+        check = validator or (postprocess if validate else None)
+
         if schema:
             # 스키마 기반 생성 (JSON 100% 강제 + 에러 피드백)
             return await gemini.generate_with_schema(
                 prompt,
                 response_schema=schema,
-                previous_error=previous_error
+                previous_error=previous_error,
+                postprocess=check,
+                step=step_name,
+                system_prompt=system_prompt
             )
         else:
             # 기존 방식 (fallback)
-            return await gemini.generate_report_analysis(prompt)
+            return await gemini.generate_report_analysis(
+                prompt, system_prompt=system_prompt, postprocess=check
+            )
+
+    async def _update_db_status(self, report_id: str, **kwargs) -> bool:
+        """
+        Supabase DB 상태 업데이트
+
+        v2.10: status=in_progress 중간 저장은 ProgressWriter로 병합,
+        그 외 (완료 / 실패 / 중단 / 재분석)는 모인 변경과 함께 즉시 기록
 
-    async def _update_db_status(self, report_id: str, **kwargs):
-        """Supabase DB 상태 업데이트"""
-        if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
+        Returns:
+            저장 성공 여부 (Supabase 미설정 / 최종 실패 시 False, 병합 대기 중이면 True)
+        """
+        if not supabase_rest.configured:
             logger.warning("Supabase 설정이 없어 DB 업데이트 스킵")
-            return
+            return False
 
         update_data = {
             "updated_at": datetime.utcnow().isoformat(),
@@ -748,27 +903,31 @@ class ReportAnalysisService:
         if "fortune" in kwargs:
             update_data["fortune"] = kwargs["fortune"]
 
+        status = kwargs.get("status")
+        return await self.progress.update(
+            report_id,
+            update_data,
+            flush=status != "in_progress",
+            final=status in ("completed", "failed", "pending")
+        )
+
+    async def _write_db_status(self, report_id: str, update_data: Dict[str, Any]) -> bool:
+        """병합된 변경 기록 (profile_reports PATCH)"""
         # DB 업데이트 재시도 로직 (최대 3회)
         max_retries = 3
         last_error = None
 
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.patch(
-                        f"{SUPABASE_URL}/rest/v1/profile_reports?id=eq.{report_id}",
-                        json=update_data,
-                        headers={
-                            "apikey": SUPABASE_SERVICE_ROLE_KEY,
-                            "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}",
-                            "Content-Type": "application/json",
-                            "Prefer": "return=minimal"
-                        },
-                        timeout=30.0
-                    )
-                    response.raise_for_status()
-                    logger.info(f"DB 상태 업데이트 완료: report_id={report_id}")
-                    return  # 성공 시 종료
+                response = await supabase_rest.patch(
+                    f"profile_reports?id=eq.{report_id}",
+                    json=update_data,
+                    headers={"Prefer": "return=minimal"},
+                    timeout=30.0
+                )
+                response.raise_for_status()
+                logger.info(f"DB 상태 업데이트 완료: report_id={report_id}")
+                return True  # 성공 시 종료
             except Exception as e:
                 last_error = e
                 logger.warning(f"DB 업데이트 시도 {attempt + 1}/{max_retries} 실패: {e}")
@@ -781,10 +940,11 @@ class ReportAnalysisService:
         job = job_store.get_by_report_id(report_id)
         if job:
             job_store.update(job.get("job_id"), db_save_failed=True)
+        return False
 
-    def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """작업 상태 조회"""
-        return job_store.get(job_id)
+    async def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 조회 (다른 워커의 작업은 공유 상태 백엔드에서)"""
+        return await job_store.fetch(job_id)
 
     def get_status_by_report_id(self, report_id: str) -> Optional[Dict[str, Any]]:
         """리포트 ID로 작업 상태 조회"""
@@ -822,6 +982,8 @@ class ReportAnalysisService:
 
         # 이전 단계 결과 수집 (컨텍스트용)
         previous_results = existing_analysis or {}
+        # v2.10: 재시도 간 공유하는 분석 컨텍스트
+        analysis_context = AnalysisContext.build(pillars, language, jijanggan or None)
 
         max_retries = 3
         last_error = None
@@ -830,24 +992,21 @@ class ReportAnalysisService:
             try:
                 logger.info(f"[Reanalyze:{report_id}] {step_type} 시도 {attempt}/{max_retries}")
 
-                prompt = await self._build_step_prompt(
-                    step_type, language, pillars, daewun, jijanggan, previous_results
+                system_prompt, prompt = await self._build_step_prompt(
+                    step_type, language, pillars, daewun, jijanggan, previous_results,
+                    analysis_context=analysis_context
                 )
 
                 # v2.7: step_name + 이전 오류 피드백 전달
-                result = await self._call_gemini(
+                # Normalize → Validate (실패 시 재시도)
+                validated = await self._call_gemini(
                     prompt,
                     step_name=step_type,
-                    previous_error=last_error if attempt > 1 else None
+                    previous_error=last_error if attempt > 1 else None,
+                    validate=True,
+                    system_prompt=system_prompt
                 )
 
-                if not result:
-                    raise ValueError("빈 응답")
-
-                # Normalize → Validate (실패 시 재시도)
-                normalized = normalize_all_keys(normalize_response(step_type, result))
-                validated = validate_step_response(step_type, normalized, raise_on_error=True)
-
                 # 기존 분석 결과와 병합
                 updated_analysis = dict(existing_analysis) if existing_analysis else {}
                 updated_analysis[step_type] = validated
@@ -884,3 +1043,6 @@ class ReportAnalysisService:
 
 # 싱글톤 인스턴스
 report_analysis_service = ReportAnalysisService()
+job_queue.register(
+    "report", report_analysis_service.run_queued, on_interrupt=report_analysis_service.on_interrupted
+)
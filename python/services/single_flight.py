@@ -0,0 +1,73 @@
+"""
+동일 요청 병합 (single-flight)
+
+더블 클릭 / 클라이언트 재시도로 같은 작업이 동시에 여러 번 시작되는 것을 막습니다.
+
+- do(): 같은 키로 동시에 들어온 코루틴 호출은 첫 호출(leader)의 결과를 공유
+  (백그라운드 작업 중복은 작업 큐의 dedup_key가 담당)
+"""
+import asyncio
+import copy
+import logging
+from typing import Awaitable, Callable, Dict, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _LeaderCancelled(Exception):
+    """leader 호출 취소 (대기자는 fn()을 다시 시도)"""
+
+
+class SingleFlight:
+    """키 단위 진행 중 작업 병합"""
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: 로그 식별용 이름
+        """
+        self.name = name
+        self._calls: Dict[str, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        같은 키의 호출이 진행 중이면 그 결과를 기다리고, 없으면 fn()을 실행
+
+        대기자(follower)에게는 결과의 deepcopy를 반환합니다 (호출자별 변경 격리).
+        leader가 실패하면 대기자도 같은 예외를 받습니다.
+        leader가 취소되면 (클라이언트 연결 종료, 종료 대기 시간 초과 등) 대기자는 취소되지 않고
+        다시 시도합니다 (먼저 깨어난 대기자가 새 leader).
+        """
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+            self.coalesced += 1
+            logger.info(f"[SingleFlight:{self.name}] 진행 중인 호출에 합류 (key={key[:40]})")
+            try:
+                result = await asyncio.shield(future)
+            except _LeaderCancelled:
+                logger.info(f"[SingleFlight:{self.name}] leader 취소 - 다시 시도 (key={key[:40]})")
+                continue
+            return copy.deepcopy(result)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except BaseException as e:
+            if not future.done():
+                # 취소는 대기자에게 전파하지 않음 (대기자는 다시 시도)
+                future.set_exception(_LeaderCancelled() if isinstance(e, asyncio.CancelledError) else e)
+                # 대기자가 없으면 "Future exception was never retrieved" 경고 방지
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
@@ -0,0 +1,189 @@
+"""
+작업 상태 공유 백엔드 (v2.10)
+
+작업 저장소(BoundedJobStore)는 작업을 실행하는 프로세스의 메모리에만 있으므로
+uvicorn 워커 / 컨테이너가 2개 이상이면 다른 워커로 들어온 상태 폴링이 404가 됩니다.
+작업 저장소는 변경 시 상태 스냅샷을 이 백엔드에 기록하고,
+로컬에 없는 작업은 백엔드에서 조회합니다.
+
+- JOB_STATUS_BACKEND=memory (기본): 공유 없음 (단일 워커)
+- JOB_STATUS_BACKEND=sqlite: 같은 호스트의 워커끼리 SQLite 파일 공유 (JOB_STATUS_PATH)
+- JOB_STATUS_BACKEND=redis: Redis 프로토콜 저장소 (JOB_STATUS_REDIS_URL, redis 패키지 필요)
+
+스냅샷은 JSON 직렬화되며 종료된 작업은 저장소 TTL, 진행 중 작업은 최대 보관 시간 후 만료됩니다.
+"""
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUS_BACKEND = os.getenv("JOB_STATUS_BACKEND", "memory")
+JOB_STATUS_PATH = os.getenv(
+    "JOB_STATUS_PATH",
+    os.path.join(tempfile.gettempdir(), "fortune_job_status.sqlite3"),
+)
+JOB_STATUS_REDIS_URL = os.getenv("JOB_STATUS_REDIS_URL", "redis://localhost:6379/0")
+JOB_STATUS_KEY_PREFIX = os.getenv("JOB_STATUS_KEY_PREFIX", "fortune:job")
+
+
+def dump_snapshot(job: Dict[str, Any]) -> str:
+    """작업 dict → JSON (Enum은 값, datetime 등은 문자열)"""
+    return json.dumps(job, ensure_ascii=False, default=lambda value: getattr(value, "value", str(value)))
+
+
+class StatusBackend:
+    """
+    상태 백엔드 기본 구현 (공유 없음)
+
+    shared가 False이면 작업 저장소는 스냅샷을 기록하지 않습니다.
+    """
+
+    name = "memory"
+    shared = False
+
+    def put(self, namespace: str, job_id: str, job: Dict[str, Any], ttl_seconds: float) -> None:
+        """작업 스냅샷 기록 (ttl_seconds 후 만료)"""
+
+    def get(self, namespace: str, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 스냅샷 조회"""
+        return None
+
+    def delete(self, namespace: str, job_id: str) -> None:
+        """작업 스냅샷 삭제"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": self.name}
+
+
+class SQLiteStatusBackend(StatusBackend):
+    """SQLite WAL 파일 공유 백엔드 (같은 호스트의 여러 워커 프로세스)"""
+
+    name = "sqlite"
+    shared = True
+
+    def __init__(self, path: str = JOB_STATUS_PATH):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+
+    def _db(self) -> sqlite3.Connection:
+        """연결 (최초 사용 시 생성 + 스키마 준비)"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS job_status (
+                    namespace TEXT NOT NULL,
+                    job_id TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, job_id)
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_status_expires ON job_status(expires_at)")
+            self._conn = conn
+        return self._conn
+
+    def put(self, namespace: str, job_id: str, job: Dict[str, Any], ttl_seconds: float) -> None:
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            db.execute(
+                "INSERT OR REPLACE INTO job_status (namespace, job_id, data, expires_at) VALUES (?, ?, ?, ?)",
+                (namespace, job_id, dump_snapshot(job), now + ttl_seconds),
+            )
+            # 만료 행 정리 (분당 1회)
+            if now - self._last_purge > 60:
+                db.execute("DELETE FROM job_status WHERE expires_at < ?", (now,))
+                self._last_purge = now
+
+    def get(self, namespace: str, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db().execute(
+                "SELECT data FROM job_status WHERE namespace = ? AND job_id = ? AND expires_at >= ?",
+                (namespace, job_id, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, namespace: str, job_id: str) -> None:
+        with self._lock:
+            self._db().execute(
+                "DELETE FROM job_status WHERE namespace = ? AND job_id = ?", (namespace, job_id)
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (entries,) = self._db().execute(
+                "SELECT COUNT(*) FROM job_status WHERE expires_at >= ?", (time.time(),)
+            ).fetchone()
+        return {"backend": self.name, "path": self.path, "entries": entries}
+
+
+class RedisStatusBackend(StatusBackend):
+    """
+    Redis 프로토콜 백엔드 (여러 호스트 / 컨테이너)
+
+    client는 get(key) / set(key, value, ex=초) / delete(key)를 제공하는 동기 클라이언트
+    (redis.Redis 또는 호환 구현)
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, client: Any, key_prefix: str = JOB_STATUS_KEY_PREFIX):
+        self.client = client
+        self.key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str = JOB_STATUS_REDIS_URL) -> "RedisStatusBackend":
+        import redis
+
+        return cls(redis.Redis.from_url(url, socket_timeout=1.0))
+
+    def _key(self, namespace: str, job_id: str) -> str:
+        return f"{self.key_prefix}:{namespace}:{job_id}"
+
+    def put(self, namespace: str, job_id: str, job: Dict[str, Any], ttl_seconds: float) -> None:
+        self.client.set(self._key(namespace, job_id), dump_snapshot(job), ex=max(1, int(ttl_seconds)))
+
+    def get(self, namespace: str, job_id: str) -> Optional[Dict[str, Any]]:
+        data = self.client.get(self._key(namespace, job_id))
+        return json.loads(data) if data else None
+
+    def delete(self, namespace: str, job_id: str) -> None:
+        self.client.delete(self._key(namespace, job_id))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": self.name, "key_prefix": self.key_prefix}
+
+
+def create_status_backend(kind: str = JOB_STATUS_BACKEND) -> StatusBackend:
+    """환경 변수 설정에 맞는 상태 백엔드 생성 (알 수 없는 값 / redis 미설치 시 memory)"""
+    if kind == "sqlite":
+        return SQLiteStatusBackend()
+    if kind == "redis":
+        try:
+            return RedisStatusBackend.from_url()
+        except ImportError:
+            logger.error("[JobStatus] redis 패키지가 없어 memory 백엔드 사용")
+            return StatusBackend()
+    if kind != "memory":
+        logger.warning(f"[JobStatus] 알 수 없는 백엔드 {kind}, memory 사용")
+    return StatusBackend()
+
+
+# 전역 상태 백엔드
+status_backend = create_status_backend()
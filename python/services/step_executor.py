@@ -0,0 +1,254 @@
+"""
+DAG 기반 파이프라인 단계 실행기
+리포트/신년/궁합 파이프라인 공용
+
+각 단계는 의존 단계, 재시도 횟수, 진행률 가중치, Fallback을 선언합니다.
+의존성이 충족된 단계는 동시에 실행되며 (Gemini 호출은 전역 governor로 제한),
+step_statuses / progress_percent / current_step은 실행기가 job_store에 자동 반영합니다.
+
+v2.10: DB에 저장된 단계 결과(체크포인트)를 restored로 넘기면 해당 단계는
+실행하지 않고 완료 처리 (재시도 / 프로세스 재시작 시 LLM 재호출 방지)
+"""
+import asyncio
+import inspect
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StepContext:
+    """단계 실행 컨텍스트 (재시도 간 유지)"""
+    job_id: str
+    step: str
+    results: Dict[str, Any]
+    attempt: int = 1
+    last_error: Optional[str] = None
+    # 단계 내부에서 재시도 간 공유할 값 (예: 이전 응답 피드백)
+    state: Dict[str, Any] = field(default_factory=dict)
+
+
+StepRunner = Callable[[StepContext], Awaitable[Any]]
+StepFallback = Callable[[StepContext, Exception], Any]
+StepFailureHook = Callable[[StepContext, Exception], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class StepSpec:
+    """
+    파이프라인 단계 선언
+
+    Attributes:
+        name: 단계명 (step_statuses 키)
+        run: 단계 실행 코루틴 (StepContext → 결과)
+        depends_on: 선행 단계명 목록
+        max_attempts: 최대 시도 횟수 (1 = 재시도 없음)
+        weight: 진행률 가중치
+        fallback: 최종 실패 시 대체 결과 생성 함수 (있으면 파이프라인 계속)
+        critical: Fallback 없이 최종 실패 시 파이프라인 중단 여부
+        retry_delay: 재시도 전 대기 시간 (초)
+    """
+    name: str
+    run: StepRunner
+    depends_on: Tuple[str, ...] = ()
+    max_attempts: int = 1
+    weight: int = 1
+    fallback: Optional[StepFallback] = None
+    critical: bool = True
+    retry_delay: float = 0.0
+
+
+def downstream_steps(steps: Sequence[StepSpec], names: Iterable[str]) -> Set[str]:
+    """
+    지정 단계와 이를 (직간접적으로) 의존하는 모든 단계
+
+    retry_from_step 재실행 시 체크포인트에서 제외할 단계 계산에 사용
+    """
+    result = {name for name in names if name}
+    changed = True
+    while changed:
+        changed = False
+        for spec in steps:
+            if spec.name not in result and any(dep in result for dep in spec.depends_on):
+                result.add(spec.name)
+                changed = True
+    return result
+
+
+class StepExecutor:
+    """DAG 단계 실행기"""
+
+    def __init__(
+        self,
+        steps: Sequence[StepSpec],
+        store: Any,
+        job_id: str,
+        on_failure: Optional[StepFailureHook] = None,
+        log_prefix: Optional[str] = None,
+        restored: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            steps: 단계 선언 목록
+            store: update() / update_step_status()를 제공하는 작업 저장소
+            job_id: 작업 ID
+            on_failure: 단계 최종 실패 시 호출할 훅 (DB 기록 등)
+            log_prefix: 로그 접두사 (기본값: job_id)
+            restored: 체크포인트에서 복원한 단계명 → 결과 (실행 생략)
+        """
+        self.steps: Dict[str, StepSpec] = {}
+        for spec in steps:
+            if spec.name in self.steps:
+                raise ValueError(f"중복된 단계: {spec.name}")
+            self.steps[spec.name] = spec
+
+        self.store = store
+        self.job_id = job_id
+        self.on_failure = on_failure
+        self.log_prefix = log_prefix or job_id
+
+        self.results: Dict[str, Any] = {}
+        self._completed: set = set()
+        self._finished_weight = 0
+        self._total_weight = sum(max(spec.weight, 0) for spec in steps) or 1
+        self.restored: Dict[str, Any] = {
+            name: result for name, result in (restored or {}).items()
+            if name in self.steps
+        }
+
+        self._validate()
+
+    def _validate(self) -> None:
+        """의존성 검증 (미정의 단계 / 순환 참조)"""
+        for spec in self.steps.values():
+            for dep in spec.depends_on:
+                if dep not in self.steps:
+                    raise ValueError(f"{spec.name}: 정의되지 않은 의존 단계 {dep}")
+
+        visiting, visited = set(), set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"순환 의존성: {name}")
+            visiting.add(name)
+            for dep in self.steps[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self.steps:
+            visit(name)
+
+    @property
+    def progress_percent(self) -> int:
+        """완료 가중치 기준 진행률 (0-99, 완료 처리는 호출자가 담당)"""
+        return min(99, int(self._finished_weight * 100 / self._total_weight))
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        전체 DAG 실행
+
+        Returns:
+            단계명 → 결과 딕셔너리
+
+        Raises:
+            critical 단계의 최종 예외 (실행 중인 다른 단계는 취소)
+        """
+        pending: Dict[str, StepSpec] = dict(self.steps)
+        running: Dict[asyncio.Task, str] = {}
+
+        for name, result in self.restored.items():
+            del pending[name]
+            self.results[name] = result
+            self._mark(name, "completed", finished=True)
+            self._completed.add(name)
+        if self.restored:
+            logger.info(f"[{self.log_prefix}] 체크포인트 복원: {list(self.restored)}")
+
+        try:
+            while pending or running:
+                ready: List[StepSpec] = [
+                    spec for spec in pending.values()
+                    if all(dep in self._completed for dep in spec.depends_on)
+                ]
+                for spec in ready:
+                    del pending[spec.name]
+                    task = asyncio.create_task(self._run_step(spec))
+                    running[task] = spec.name
+
+                if not running:
+                    raise RuntimeError(f"실행 불가 단계: {list(pending)}")
+
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = running.pop(task)
+                    task.result()  # critical 실패 시 예외 전파
+                    self._completed.add(name)
+        except BaseException:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running.keys(), return_exceptions=True)
+            raise
+
+        return self.results
+
+    async def _run_step(self, spec: StepSpec) -> None:
+        """단일 단계 실행 (재시도 + Fallback)"""
+        ctx = StepContext(job_id=self.job_id, step=spec.name, results=self.results)
+        self._mark(spec.name, "in_progress")
+
+        last_exc: Optional[Exception] = None
+        for attempt in range(1, spec.max_attempts + 1):
+            ctx.attempt = attempt
+            try:
+                self.results[spec.name] = await spec.run(ctx)
+                self._mark(spec.name, "completed", finished=True)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                last_exc = e
+                ctx.last_error = str(e)
+                logger.warning(
+                    f"[{self.log_prefix}] {spec.name} 실패 ({attempt}/{spec.max_attempts}): {e}"
+                )
+                if attempt < spec.max_attempts and spec.retry_delay > 0:
+                    await asyncio.sleep(spec.retry_delay)
+
+        logger.error(f"[{self.log_prefix}] {spec.name} 최종 실패: {last_exc}")
+        self._mark(spec.name, "failed", finished=True)
+
+        if self.on_failure is not None:
+            try:
+                await self.on_failure(ctx, last_exc)
+            except Exception as hook_error:
+                logger.error(f"[{self.log_prefix}] {spec.name} 실패 훅 오류: {hook_error}")
+
+        if spec.fallback is not None:
+            fallback_result = spec.fallback(ctx, last_exc)
+            if inspect.isawaitable(fallback_result):
+                fallback_result = await fallback_result
+            self.results[spec.name] = fallback_result
+            logger.info(f"[{self.log_prefix}] {spec.name} 기본값으로 대체됨")
+            return
+
+        if spec.critical:
+            # 실패 단계를 current_step으로 남겨 error_step 기록에 사용
+            self.store.update(self.job_id, current_step=spec.name)
+            raise last_exc
+
+        self.results[spec.name] = None
+
+    def _mark(self, step: str, status: str, finished: bool = False) -> None:
+        """step_statuses / progress_percent / current_step 반영"""
+        self.store.update_step_status(self.job_id, step, status)
+        if finished:
+            self._finished_weight += max(self.steps[step].weight, 0)
+            self.store.update(self.job_id, progress_percent=self.progress_percent)
+        else:
+            self.store.update(self.job_id, current_step=step)
@@ -0,0 +1,160 @@
+"""
+Supabase REST(PostgREST) 공유 HTTP 클라이언트 (v2.10)
+
+서비스마다 DB 호출 때 httpx.AsyncClient()를 새로 만들면 상태 업데이트 1회마다
+TCP + TLS 핸드셰이크가 반복됩니다 (오늘의 운세 1건에 약 15회).
+프로세스 전체가 연결 풀 1개를 공유합니다.
+
+- base_url = {SUPABASE_URL}/rest/v1, 인증 헤더(apikey / Authorization) 기본 포함
+- HTTP/2 (h2 패키지 있으면, SUPABASE_HTTP2=false로 비활성화) + keep-alive
+- 연결 한도: SUPABASE_MAX_CONNECTIONS(기본 50), SUPABASE_MAX_KEEPALIVE(기본 20),
+  유휴 연결 유지 SUPABASE_KEEPALIVE_EXPIRY_SECONDS(기본 30)
+- 풀 사용 통계: 요청 수 / 실행 중 / 최대 동시 요청 / 오류 / 평균 지연 (GET /api/jobs/stats)
+- 최초 요청 시 생성, 이벤트 루프가 바뀌면 재생성 (테스트의 asyncio.run 등), 종료 시 aclose()
+"""
+import asyncio
+import importlib.util
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+SUPABASE_URL = os.getenv("SUPABASE_URL", "")
+SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
+SUPABASE_MAX_CONNECTIONS = int(os.getenv("SUPABASE_MAX_CONNECTIONS", "50"))
+SUPABASE_MAX_KEEPALIVE = int(os.getenv("SUPABASE_MAX_KEEPALIVE", "20"))
+SUPABASE_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("SUPABASE_KEEPALIVE_EXPIRY_SECONDS", "30"))
+SUPABASE_TIMEOUT_SECONDS = float(os.getenv("SUPABASE_TIMEOUT_SECONDS", "30"))
+# 풀에서 연결을 기다리는 최대 시간 (초과 시 httpx.PoolTimeout)
+SUPABASE_POOL_TIMEOUT_SECONDS = float(os.getenv("SUPABASE_POOL_TIMEOUT_SECONDS", "10"))
+SUPABASE_HTTP2 = os.getenv("SUPABASE_HTTP2", "true").lower() == "true"
+
+
+class SupabaseRestClient:
+    """PostgREST 공유 클라이언트 (연결 풀 + 사용 통계)"""
+
+    def __init__(
+        self,
+        url: str = SUPABASE_URL,
+        key: str = SUPABASE_SERVICE_ROLE_KEY,
+        max_connections: int = SUPABASE_MAX_CONNECTIONS,
+        max_keepalive: int = SUPABASE_MAX_KEEPALIVE,
+        http2: bool = SUPABASE_HTTP2,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.url = url
+        self.key = key
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        # HTTP/2는 h2 패키지 필요 (httpx[http2])
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 통계 (프로세스 단위)
+        self.requests = 0
+        self.errors = 0
+        self.pool_timeouts = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.clients_created = 0
+        self._total_seconds = 0.0
+
+    @property
+    def configured(self) -> bool:
+        """SUPABASE_URL / 서비스 키 설정 여부"""
+        return bool(self.url and self.key)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """공유 클라이언트 (최초 사용 / 이벤트 루프 변경 시 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=f"{self.url}/rest/v1",
+                headers={
+                    "apikey": self.key,
+                    "Authorization": f"Bearer {self.key}",
+                },
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive,
+                    keepalive_expiry=SUPABASE_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+                timeout=httpx.Timeout(SUPABASE_TIMEOUT_SECONDS, pool=SUPABASE_POOL_TIMEOUT_SECONDS),
+                transport=self._transport,
+            )
+            self._loop = loop
+            self.clients_created += 1
+        return self._client
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        PostgREST 요청
+
+        Args:
+            method: HTTP 메서드
+            path: /rest/v1 기준 경로 (예: "profile_reports?id=eq.1")
+            **kwargs: httpx 요청 인자 (params, json, headers, timeout 등, 헤더는 기본 인증 헤더에 병합)
+        """
+        client = self._get_client()
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        started = time.perf_counter()
+        try:
+            return await client.request(method, path, **kwargs)
+        except httpx.PoolTimeout:
+            self.pool_timeouts += 1
+            self.errors += 1
+            raise
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self._total_seconds += time.perf_counter() - started
+
+    async def get(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", path, **kwargs)
+
+    async def patch(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", path, **kwargs)
+
+    async def aclose(self) -> None:
+        """연결 풀 종료 (애플리케이션 종료 시)"""
+        client, self._client = self._client, None
+        self._loop = None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        completed = self.requests - self.in_flight
+        return {
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "max_keepalive": self.max_keepalive,
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "pool_utilization": round(self.in_flight / max(self.max_connections, 1), 3),
+            "errors": self.errors,
+            "pool_timeouts": self.pool_timeouts,
+            "avg_ms": round(self._total_seconds / completed * 1000, 1) if completed else 0.0,
+            "clients_created": self.clients_created,
+        }
+
+
+# 전역 클라이언트 (연결은 최초 요청 시 생성)
+supabase_rest = SupabaseRestClient()
@@ -1,19 +1,17 @@
 """
 신년 사주 분석 서비스
-비동기 백그라운드 작업 처리 (7단계 순차 파이프라인)
+비동기 백그라운드 작업 처리 (7단계 DAG 파이프라인)
 
 파이프라인 단계:
 1. yearly_overview - 기본 정보 (year, summary, theme, score)
 2-5. monthly_1_3, monthly_4_6, monthly_7_9, monthly_10_12 - 월별 운세
 6. yearly_advice - 6섹션 연간 조언
 7. classical_refs - 고전 인용
+(2-7은 yearly_overview 완료 후 병렬 실행)
 """
-import asyncio
 import uuid
 import logging
-import os
 import json
-import httpx
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
@@ -23,23 +21,26 @@ from schemas.yearly import (
     YearlyAnalysisResult,
 )
 from prompts.yearly_steps import YearlyStepPrompts
+from prompts.analysis_context import AnalysisContext
 from .gemini import get_gemini_service
 from .normalizers import normalize_all_keys, normalize_response
 from schemas.gemini_schemas import get_gemini_schema
 from schemas.yearly_fortune import validate_yearly_step
+from .step_executor import StepExecutor, StepSpec, StepContext
+from .job_store import BoundedJobStore
+from .admission import Admission, AdmissionRejected, admission_controller
+from .job_queue import job_queue
+from .progress_writer import ProgressWriter
+from .supabase_rest import supabase_rest
 
 logger = logging.getLogger(__name__)
 
-# Supabase 설정
-SUPABASE_URL = os.getenv("SUPABASE_URL", "")
-SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
 
-
-class JobStore:
-    """인메모리 작업 저장소 (Railway에서는 충분)"""
+class JobStore(BoundedJobStore):
+    """신년 분석 작업 저장소 (v2.10: 공용 상한/TTL 저장소 기반)"""
 
     def __init__(self):
-        self._jobs: Dict[str, Dict[str, Any]] = {}
+        super().__init__("yearly")
 
     def create(self, job_id: str, user_id: str, analysis_id: str = None) -> Dict[str, Any]:
         """작업 생성"""
@@ -67,74 +68,83 @@ class JobStore:
             "created_at": now,
             "updated_at": now,
         }
-        self._jobs[job_id] = job
-        return job
-
-    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """작업 조회"""
-        return self._jobs.get(job_id)
-
-    def update(self, job_id: str, **kwargs) -> Optional[Dict[str, Any]]:
-        """작업 업데이트"""
-        job = self._jobs.get(job_id)
-        if not job:
-            return None
-
-        job.update(kwargs)
-        job["updated_at"] = datetime.utcnow().isoformat()
-        return job
-
-    def update_step_status(self, job_id: str, step: str, status: str) -> None:
-        """단계 상태 업데이트"""
-        job = self._jobs.get(job_id)
-        if job and "step_statuses" in job:
-            job["step_statuses"][step] = status
-            job["updated_at"] = datetime.utcnow().isoformat()
-
-    def delete(self, job_id: str) -> bool:
-        """작업 삭제"""
-        if job_id in self._jobs:
-            del self._jobs[job_id]
-            return True
-        return False
-
-    def cleanup_old_jobs(self, max_age_hours: int = 24):
-        """오래된 작업 정리"""
-        now = datetime.utcnow()
-        to_delete = []
-
-        for job_id, job in self._jobs.items():
-            created = datetime.fromisoformat(job["created_at"])
-            age = (now - created).total_seconds() / 3600
-            if age > max_age_hours:
-                to_delete.append(job_id)
-
-        for job_id in to_delete:
-            del self._jobs[job_id]
+        return self._insert(job_id, job)
 
 
 # 글로벌 작업 저장소
 job_store = JobStore()
 
 
-# 단계별 진행률 (7단계)
-STEP_PROGRESS = {
+# 단계별 진행률 가중치 (7단계, StepExecutor가 progress_percent 자동 계산)
+STEP_WEIGHTS = {
     "yearly_overview": 10,
-    "monthly_1_3": 25,
-    "monthly_4_6": 40,
-    "monthly_7_9": 55,
-    "monthly_10_12": 70,
-    "yearly_advice": 85,
-    "classical_refs": 95,
-    "complete": 100,
+    "monthly_1_3": 15,
+    "monthly_4_6": 15,
+    "monthly_7_9": 15,
+    "monthly_10_12": 15,
+    "yearly_advice": 15,
+    "classical_refs": 10,
 }
 
+# 월별 단계 (overview 결과만 참조 → 서로 독립적으로 병렬 실행)
+MONTHLY_STEPS = {
+    "monthly_1_3": [1, 2, 3],
+    "monthly_4_6": [4, 5, 6],
+    "monthly_7_9": [7, 8, 9],
+    "monthly_10_12": [10, 11, 12],
+}
+
+YEARLY_ADVICE_SECTIONS = [
+    "natureAndSoul", "wealthAndSuccess", "careerAndHonor",
+    "documentAndWisdom", "relationshipAndLove", "healthAndMovement"
+]
+
+# overview 단계 결과가 아닌 analysis 키 (체크포인트 복원 시 제외)
+NON_OVERVIEW_KEYS = ("monthlyFortunes", "yearlyAdvice", "classicalReferences", "quarterlyHighlights")
+
+
+def yearly_checkpoint_results(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    yearly_analyses.analysis 중간 저장 결과 → 복원 가능한 단계 결과
+
+    각 단계의 검증 조건을 만족하는 결과만 복원하며,
+    이후 단계는 overview 결과를 참조하므로 overview가 있어야 복원
+
+    Returns:
+        단계명 → 단계 결과 (단계 실행 시 반환값과 같은 형태)
+    """
+    restored: Dict[str, Any] = {}
+    if not analysis or not analysis.get("year"):
+        return restored
+    restored["yearly_overview"] = {
+        key: value for key, value in analysis.items() if key not in NON_OVERVIEW_KEYS
+    }
+
+    by_month = {
+        m.get("month"): m for m in analysis.get("monthlyFortunes") or [] if isinstance(m, dict)
+    }
+    for step_name, months in MONTHLY_STEPS.items():
+        if all(month in by_month for month in months):
+            restored[step_name] = {"monthlyFortunes": [by_month[month] for month in months]}
+
+    advice = analysis.get("yearlyAdvice")
+    if advice and all(section in advice for section in YEARLY_ADVICE_SECTIONS):
+        restored["yearly_advice"] = {"yearlyAdvice": advice}
+
+    refs = analysis.get("classicalReferences")
+    if refs and len(refs) >= 2:
+        restored["classical_refs"] = {"classicalReferences": refs}
+
+    return restored
+
 
 class YearlyAnalysisService:
-    """신년 분석 서비스 (7단계 순차 파이프라인)"""
+    """신년 분석 서비스 (7단계 DAG 파이프라인)"""
 
     def __init__(self):
         self.gemini = None  # lazy init
+        # v2.10: in_progress 중간 저장 쓰기 병합 + 순서 보장 (병렬 단계 완료가 몰리면 1회로)
+        self.progress = ProgressWriter("yearly", self._write_db_analysis)
 
     def _get_gemini(self):
         """Gemini 서비스 지연 로딩"""
@@ -142,7 +152,7 @@ class YearlyAnalysisService:
             self.gemini = get_gemini_service()
         return self.gemini
 
-    async def start_analysis(self, request: YearlyAnalysisRequest) -> str:
+    async def start_analysis(self, request: YearlyAnalysisRequest) -> Admission:
         """
         분석 작업 시작 (백그라운드)
 
@@ -150,70 +160,165 @@ class YearlyAnalysisService:
             request: 분석 요청
 
         Returns:
-            작업 ID
+            수용 결과 (job_id: 같은 분석이 진행 중이면 기존 작업 ID)
+
+        Raises:
+            AdmissionRejected: 작업 큐 수용 한도 초과
         """
+        analysis_id = getattr(request, 'analysis_id', None)
+
         # 작업 ID 생성
         job_id = str(uuid.uuid4())
 
         # 작업 생성 (analysis_id 포함)
-        analysis_id = getattr(request, 'analysis_id', None)
         job_store.create(job_id, request.user_id, analysis_id)
 
-        # 백그라운드에서 분석 실행
-        asyncio.create_task(self._run_analysis(job_id, request))
+        # v2.10: 영속 작업 큐에 수용 한도 조건부 등록 (워커가 실행, 재시작 후 재개)
+        # 중복 요청 (더블 클릭 / 재시도) → 대기/진행 중인 작업에 합류
+        try:
+            admission = await admission_controller.enqueue(
+                "yearly", job_id, request.model_dump(mode="json"),
+                dedup_key=analysis_id, user_id=request.user_id,
+            )
+        except AdmissionRejected:
+            job_store.delete(job_id)
+            raise
+        queued_job_id = admission.job_id
+        if queued_job_id != job_id:
+            job_store.delete(job_id)
+            logger.info(f"[YearlyAnalysis] 진행 중인 작업 재사용: {analysis_id} → {queued_job_id}")
+        else:
+            # 공유 상태 백엔드 사용 시 실행은 작업을 가져간 워커 프로세스가 담당
+            job_store.handoff(job_id)
+        return admission
+
+    async def run_queued(self, job_id: str, payload: Dict[str, Any], final_attempt: bool = True):
+        """작업 큐 워커 진입점 (재시작 후 재개 시 작업 상태 재생성)"""
+        request = YearlyAnalysisRequest(**payload)
+        if job_id not in job_store:
+            job_store.create(job_id, request.user_id, request.analysis_id)
+        await self._run_analysis(job_id, request, final_attempt)
+
+    async def on_interrupted(self, job_id: str, payload: Dict[str, Any]):
+        """
+        작업 큐 중단 훅 (종료 대기 시간 초과)
 
-        return job_id
+        완료된 단계는 analysis에 중간 저장되어 있으므로 행을 pending으로 되돌려
+        재개한 워커가 체크포인트부터 이어서 실행
+        """
+        request = YearlyAnalysisRequest(**payload)
+        if job_store.mark_interrupted(job_id) is None or not request.analysis_id:
+            return
+        await self._update_db_status(request.analysis_id, "pending")
 
-    async def _run_analysis(self, job_id: str, request: YearlyAnalysisRequest):
+    def _build_pipeline(
+        self,
+        request: YearlyAnalysisRequest,
+        partial_result: Dict[str, Any],
+        analysis_context: Optional[AnalysisContext] = None
+    ) -> List[StepSpec]:
         """
-        백그라운드 분석 실행 (8단계 순차 파이프라인)
+        신년 파이프라인 DAG 정의
+
+        yearly_overview → (monthly_1_3 | monthly_4_6 | monthly_7_9 | monthly_10_12 | yearly_advice | classical_refs)
+        overview 이후 단계는 yearlyTheme/overallScore만 참조하므로 병렬 실행
+
+        모든 단계는 3회 재시도 후 실패해도 파이프라인 계속 (결과 None)
+        analysis_context는 모든 단계가 공유 (v2.10)
+        """
+        steps = [
+            StepSpec(
+                name="yearly_overview",
+                run=lambda ctx: self._step_yearly_overview(ctx, request, partial_result, analysis_context),
+                max_attempts=3,
+                weight=STEP_WEIGHTS["yearly_overview"],
+                critical=False,
+            ),
+        ]
+        for step_name, months in MONTHLY_STEPS.items():
+            steps.append(StepSpec(
+                name=step_name,
+                run=lambda ctx, months=months: self._step_monthly(
+                    ctx, request, months, partial_result, analysis_context
+                ),
+                depends_on=("yearly_overview",),
+                max_attempts=3,
+                weight=STEP_WEIGHTS[step_name],
+                critical=False,
+            ))
+        steps.append(StepSpec(
+            name="yearly_advice",
+            run=lambda ctx: self._step_yearly_advice(ctx, request, partial_result, analysis_context),
+            depends_on=("yearly_overview",),
+            max_attempts=3,
+            weight=STEP_WEIGHTS["yearly_advice"],
+            critical=False,
+        ))
+        steps.append(StepSpec(
+            name="classical_refs",
+            run=lambda ctx: self._step_classical_refs(ctx, request, partial_result, analysis_context),
+            depends_on=("yearly_overview",),
+            max_attempts=3,
+            weight=STEP_WEIGHTS["classical_refs"],
+            critical=False,
+        ))
+        return steps
+
+    async def _run_analysis(self, job_id: str, request: YearlyAnalysisRequest, final_attempt: bool = True):
+        """
+        백그라운드 분석 실행 (DAG 실행기)
+
+        실패 시 상태 / DB 기록 후 예외를 다시 던짐 → 작업 큐가 max_attempts까지 재시도
+        (마지막 시도가 아니면 failed 대신 재시도 대기(pending)로 기록)
 
         Args:
             job_id: 작업 ID
             request: 분석 요청
+            final_attempt: 작업 큐의 마지막 시도 여부
         """
         analysis_id = getattr(request, 'analysis_id', None)
 
         try:
             logger.info(f"[{job_id}] 신년 분석 시작: year={request.target_year}")
 
-            # 결과 저장용 딕셔너리
+            # 재시도 시 이전 실패 정보 초기화
+            job_store.update(
+                job_id, status=JobStatus.IN_PROGRESS, error=None, error_step=None, retrying=False
+            )
+
+            # 단계 간 공유되는 누적 결과 (DB 중간 저장용)
+            partial_result: Dict[str, Any] = {"monthlyFortunes": []}
+            # v2.10: 재시도 / 재시작 시 이미 완료된 단계는 DB 중간 저장 결과로 복원
+            restored = await self._load_checkpoint(analysis_id, partial_result)
+            # v2.10: 단계 간 공유하는 분석 컨텍스트 (사주 블록 1회 렌더링)
+            analysis_context = AnalysisContext.build(request.pillars, request.language)
+            executor = StepExecutor(
+                self._build_pipeline(request, partial_result, analysis_context), job_store, job_id,
+                restored=restored
+            )
+            step_results = await executor.run()
+
+            # 결과 조립 (월 순서 보장)
             result = {}
 
-            # 1. yearly_overview
-            overview = await self._step_yearly_overview(job_id, request)
+            overview = step_results.get("yearly_overview")
             if overview:
                 result.update(overview)
 
-            # 2-5. monthly_1_3 → monthly_4_6 → monthly_7_9 → monthly_10_12 (순차)
             result["monthlyFortunes"] = []
+            for step_name in MONTHLY_STEPS:
+                monthly = step_results.get(step_name)
+                if monthly:
+                    result["monthlyFortunes"].extend(monthly.get("monthlyFortunes", []))
 
-            monthly_1_3 = await self._step_monthly(job_id, request, [1, 2, 3], result)
-            if monthly_1_3:
-                result["monthlyFortunes"].extend(monthly_1_3.get("monthlyFortunes", []))
-
-            monthly_4_6 = await self._step_monthly(job_id, request, [4, 5, 6], result)
-            if monthly_4_6:
-                result["monthlyFortunes"].extend(monthly_4_6.get("monthlyFortunes", []))
-
-            monthly_7_9 = await self._step_monthly(job_id, request, [7, 8, 9], result)
-            if monthly_7_9:
-                result["monthlyFortunes"].extend(monthly_7_9.get("monthlyFortunes", []))
-
-            monthly_10_12 = await self._step_monthly(job_id, request, [10, 11, 12], result)
-            if monthly_10_12:
-                result["monthlyFortunes"].extend(monthly_10_12.get("monthlyFortunes", []))
-
-            # 6. yearly_advice
-            advice = await self._step_yearly_advice(job_id, request, result)
+            advice = step_results.get("yearly_advice")
             if advice:
                 result["yearlyAdvice"] = advice.get("yearlyAdvice", {})
             else:
                 result["yearlyAdvice"] = None
                 logger.warning(f"[{job_id}] yearlyAdvice 단계 실패 - null 설정")
 
-            # 7. classical_refs
-            refs = await self._step_classical_refs(job_id, request, result)
+            refs = step_results.get("classical_refs")
             if refs:
                 result["classicalReferences"] = refs.get("classicalReferences", [])
             else:
@@ -232,7 +337,7 @@ class YearlyAnalysisService:
             if len(result.get("monthlyFortunes", [])) < 12:
                 failed_steps.append("monthlyFortunes")
 
-            # 8. 완료 - DB 최종 저장
+            # 완료 - DB 최종 저장
             job_store.update_step_status(job_id, "complete", "completed")
             job_store.update(
                 job_id,
@@ -244,8 +349,9 @@ class YearlyAnalysisService:
             )
 
             # Supabase에 최종 결과 저장
-            if analysis_id:
-                await self._update_db_analysis(analysis_id, result, "completed")
+            # v2.10: DB 저장 성공 시 메모리 결과 해제 대상
+            if analysis_id and await self._update_db_analysis(analysis_id, result, "completed"):
+                job_store.mark_persisted(job_id)
 
             logger.info(f"[{job_id}] 신년 분석 완료")
 
@@ -254,6 +360,12 @@ class YearlyAnalysisService:
             job = job_store.get(job_id)
             current_step = job.get("current_step") if job else "unknown"
 
+            if not final_attempt:
+                # 작업 큐가 다시 실행 → 최종 실패로 표시하지 않음 (완료 단계는 체크포인트에서 복원)
+                if job_store.mark_retrying(job_id, str(e), current_step) is not None and analysis_id:
+                    await self._update_db_status(analysis_id, "pending")
+                raise
+
             job_store.update(
                 job_id,
                 status=JobStatus.FAILED,
@@ -264,317 +376,235 @@ class YearlyAnalysisService:
             # DB에 실패 상태 저장
             if analysis_id:
                 await self._update_db_status(analysis_id, "failed", str(e))
+            raise
 
-    async def _step_yearly_overview(
+    async def _load_checkpoint(
         self,
-        job_id: str,
-        request: YearlyAnalysisRequest
-    ) -> Optional[Dict[str, Any]]:
-        """Step 1: 연간 기본 정보 (3회 재시도)"""
-        step_name = "yearly_overview"
-        max_retries = 3
-
-        job_store.update(
-            job_id,
-            status=JobStatus.IN_PROGRESS,
-            current_step=step_name,
-            progress_percent=STEP_PROGRESS[step_name]
-        )
-        job_store.update_step_status(job_id, step_name, "in_progress")
-
-        analysis_id = getattr(request, 'analysis_id', None)
-        success = False
-        last_error = None
-        result = None
+        analysis_id: Optional[str],
+        partial_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        DB 중간 저장 결과 조회 → 복원 단계 결과 + partial_result 반영
 
-        for attempt in range(1, max_retries + 1):
-            try:
-                logger.info(f"[{job_id}] {step_name} 시도 {attempt}/{max_retries}")
-
-                # 프롬프트 빌드
-                prompt = YearlyStepPrompts.build_overview(
-                    language=request.language,
-                    year=request.target_year,
-                    pillars=request.pillars,
-                    daewun=request.daewun
-                )
+        Returns:
+            단계명 → 결과 (조회 실패 시 빈 딕셔너리 = 처음부터 실행)
+        """
+        if not analysis_id or not supabase_rest.configured:
+            return {}
 
-                # v2.7: 에러 피드백 포함 Gemini 호출
-                result = await self._call_gemini(
-                    prompt, step_name,
-                    previous_error=last_error if attempt > 1 else None
+        try:
+            response = await supabase_rest.get(
+                "yearly_analyses",
+                params={"select": "analysis", "id": f"eq.{analysis_id}"},
+                timeout=10.0
+            )
+            response.raise_for_status()
+            rows = response.json()
+        except Exception as e:
+            logger.warning(f"체크포인트 조회 실패 (처음부터 실행): analysis_id={analysis_id}, {e}")
+            return {}
+
+        restored = yearly_checkpoint_results((rows[0].get("analysis") or {}) if rows else {})
+        for step_name, result in restored.items():
+            if step_name in MONTHLY_STEPS:
+                partial_result["monthlyFortunes"] = sorted(
+                    partial_result["monthlyFortunes"] + result["monthlyFortunes"],
+                    key=lambda m: m.get("month", 0)
                 )
+            elif step_name == "yearly_advice":
+                partial_result["yearlyAdvice"] = result["yearlyAdvice"]
+            elif step_name == "classical_refs":
+                partial_result["classicalReferences"] = result["classicalReferences"]
+            else:
+                partial_result.update(result)
+        return restored
 
-                # 빈 응답 검증
-                if not result or not result.get("year"):
-                    raise ValueError("빈 응답 또는 year 필드 없음")
+    @staticmethod
+    def _overview_context(partial_result: Dict[str, Any]) -> Dict[str, Any]:
+        """이전 결과에서 overview 정보 추출"""
+        return {
+            "yearlyTheme": partial_result.get("yearlyTheme", ""),
+            "overallScore": partial_result.get("overallScore", 50)
+        }
 
-                # 성공
-                logger.info(f"[{job_id}] {step_name} 성공: {json.dumps(result, ensure_ascii=False)[:200]}")
-                job_store.update_step_status(job_id, step_name, "completed")
+    async def _step_yearly_overview(
+        self,
+        ctx: StepContext,
+        request: YearlyAnalysisRequest,
+        partial_result: Dict[str, Any],
+        analysis_context: Optional[AnalysisContext] = None
+    ) -> Dict[str, Any]:
+        """Step 1: 연간 기본 정보"""
+        step_name = ctx.step
+        logger.info(f"[{ctx.job_id}] {step_name} 시도 {ctx.attempt}/3")
+
+        # 프롬프트 빌드
+        prompt = YearlyStepPrompts.build_overview(
+            language=request.language,
+            year=request.target_year,
+            pillars=request.pillars,
+            daewun=request.daewun,
+            analysis_context=analysis_context
+        )
 
-                # DB 중간 저장
-                if analysis_id:
-                    await self._update_db_analysis(analysis_id, result, "in_progress")
+        # v2.7: 에러 피드백 포함 Gemini 호출
+        result = await self._call_gemini(
+            prompt, step_name,
+            previous_error=ctx.last_error if ctx.attempt > 1 else None
+        )
 
-                success = True
-                break
+        # 빈 응답 검증
+        if not result or not result.get("year"):
+            raise ValueError("빈 응답 또는 year 필드 없음")
 
-            except Exception as e:
-                last_error = str(e)
-                logger.warning(f"[{job_id}] {step_name} 실패 ({attempt}/{max_retries}): {e}")
+        logger.info(f"[{ctx.job_id}] {step_name} 성공: {json.dumps(result, ensure_ascii=False)[:200]}")
 
-        if not success:
-            logger.error(f"[{job_id}] {step_name} 최종 실패: {last_error}")
-            job_store.update_step_status(job_id, step_name, "failed")
-            return None
+        # DB 중간 저장
+        partial_result.update(result)
+        analysis_id = getattr(request, 'analysis_id', None)
+        if analysis_id:
+            await self._update_db_analysis(analysis_id, partial_result, "in_progress")
 
         return result
 
     async def _step_monthly(
         self,
-        job_id: str,
+        ctx: StepContext,
         request: YearlyAnalysisRequest,
         months: List[int],
-        previous_result: Dict[str, Any]
-    ) -> Optional[Dict[str, Any]]:
-        """Steps 2-5: 월별 운세 (3회 재시도)"""
-        step_name = f"monthly_{months[0]}_{months[-1]}"
-        max_retries = 3
-
-        job_store.update(
-            job_id,
-            current_step=step_name,
-            progress_percent=STEP_PROGRESS[step_name]
+        partial_result: Dict[str, Any],
+        analysis_context: Optional[AnalysisContext] = None
+    ) -> Dict[str, Any]:
+        """Steps 2-5: 월별 운세"""
+        step_name = ctx.step
+        logger.info(f"[{ctx.job_id}] {step_name} 시도 {ctx.attempt}/3")
+
+        # 프롬프트 빌드
+        prompt = YearlyStepPrompts.build_monthly(
+            language=request.language,
+            year=request.target_year,
+            months=months,
+            pillars=request.pillars,
+            daewun=request.daewun,
+            overview_result=self._overview_context(partial_result),
+            analysis_context=analysis_context
         )
-        job_store.update_step_status(job_id, step_name, "in_progress")
-
-        analysis_id = getattr(request, 'analysis_id', None)
-        success = False
-        last_error = None
-        result = None
 
-        for attempt in range(1, max_retries + 1):
-            try:
-                logger.info(f"[{job_id}] {step_name} 시도 {attempt}/{max_retries}")
-
-                # 이전 결과에서 overview 정보 추출
-                overview_result = {
-                    "yearlyTheme": previous_result.get("yearlyTheme", ""),
-                    "overallScore": previous_result.get("overallScore", 50)
-                }
-
-                # 프롬프트 빌드
-                prompt = YearlyStepPrompts.build_monthly(
-                    language=request.language,
-                    year=request.target_year,
-                    months=months,
-                    pillars=request.pillars,
-                    daewun=request.daewun,
-                    overview_result=overview_result
-                )
-
-                # v2.7: 에러 피드백 포함 Gemini 호출
-                result = await self._call_gemini(
-                    prompt, step_name,
-                    previous_error=last_error if attempt > 1 else None
-                )
-
-                # 빈 응답 검증
-                monthly_data = result.get("monthlyFortunes", [])
-                if not result or not monthly_data or len(monthly_data) != len(months):
-                    raise ValueError(f"monthlyFortunes 누락 또는 개수 불일치 (expected={len(months)}, got={len(monthly_data)})")
-
-                # 성공
-                logger.info(f"[{job_id}] {step_name} 성공: {len(monthly_data)}개월 데이터")
-                job_store.update_step_status(job_id, step_name, "completed")
-
-                # DB 중간 저장
-                if analysis_id:
-                    partial_result = dict(previous_result)
-                    if "monthlyFortunes" not in partial_result:
-                        partial_result["monthlyFortunes"] = []
-                    partial_result["monthlyFortunes"].extend(monthly_data)
-                    await self._update_db_analysis(analysis_id, partial_result, "in_progress")
+        # v2.7: 에러 피드백 포함 Gemini 호출
+        result = await self._call_gemini(
+            prompt, step_name,
+            previous_error=ctx.last_error if ctx.attempt > 1 else None
+        )
 
-                success = True
-                break
+        # 빈 응답 검증
+        monthly_data = result.get("monthlyFortunes", [])
+        if not result or not monthly_data or len(monthly_data) != len(months):
+            raise ValueError(f"monthlyFortunes 누락 또는 개수 불일치 (expected={len(months)}, got={len(monthly_data)})")
 
-            except Exception as e:
-                last_error = str(e)
-                logger.warning(f"[{job_id}] {step_name} 실패 ({attempt}/{max_retries}): {e}")
+        logger.info(f"[{ctx.job_id}] {step_name} 성공: {len(monthly_data)}개월 데이터")
 
-        if not success:
-            logger.error(f"[{job_id}] {step_name} 최종 실패: {last_error}")
-            job_store.update_step_status(job_id, step_name, "failed")
-            return None
+        # DB 중간 저장 (병렬 완료 순서와 무관하게 월 순서 유지)
+        partial_result["monthlyFortunes"] = sorted(
+            partial_result.get("monthlyFortunes", []) + monthly_data,
+            key=lambda m: m.get("month", 0) if isinstance(m, dict) else 0
+        )
+        analysis_id = getattr(request, 'analysis_id', None)
+        if analysis_id:
+            await self._update_db_analysis(analysis_id, partial_result, "in_progress")
 
         return result
 
     async def _step_yearly_advice(
         self,
-        job_id: str,
+        ctx: StepContext,
         request: YearlyAnalysisRequest,
-        previous_result: Dict[str, Any]
-    ) -> Optional[Dict[str, Any]]:
-        """Step 6: 연간 조언 6섹션 (3회 재시도)"""
-        step_name = "yearly_advice"
-        max_retries = 3
+        partial_result: Dict[str, Any],
+        analysis_context: Optional[AnalysisContext] = None
+    ) -> Dict[str, Any]:
+        """Step 6: 연간 조언 6섹션"""
+        step_name = ctx.step
+        logger.info(f"[{ctx.job_id}] {step_name} 시도 {ctx.attempt}/3")
+
+        # 프롬프트 빌드
+        prompt = YearlyStepPrompts.build_yearly_advice(
+            language=request.language,
+            year=request.target_year,
+            pillars=request.pillars,
+            daewun=request.daewun,
+            overview_result=self._overview_context(partial_result),
+            analysis_context=analysis_context
+        )
 
-        job_store.update(
-            job_id,
-            current_step=step_name,
-            progress_percent=STEP_PROGRESS[step_name]
+        # v2.9: 에러 + 이전 응답 피드백 포함 Gemini 호출
+        result = await self._call_gemini(
+            prompt, step_name,
+            previous_error=ctx.last_error if ctx.attempt > 1 else None,
+            previous_response=ctx.state.get("last_response") if ctx.attempt > 1 else None
         )
-        job_store.update_step_status(job_id, step_name, "in_progress")
+        ctx.state["last_response"] = result  # 응답 저장 (다음 시도 피드백용)
 
-        analysis_id = getattr(request, 'analysis_id', None)
-        success = False
-        last_error = None
-        last_response = None  # v2.9: 이전 응답 저장
-        result = None
+        # 빈 응답 검증
+        advice = result.get("yearlyAdvice", {})
+        if not result or not advice:
+            raise ValueError("yearlyAdvice 필드 누락")
 
-        for attempt in range(1, max_retries + 1):
-            try:
-                logger.info(f"[{job_id}] {step_name} 시도 {attempt}/{max_retries}")
-
-                # 이전 결과에서 overview 정보 추출
-                overview_result = {
-                    "yearlyTheme": previous_result.get("yearlyTheme", ""),
-                    "overallScore": previous_result.get("overallScore", 50)
-                }
-
-                # 프롬프트 빌드
-                prompt = YearlyStepPrompts.build_yearly_advice(
-                    language=request.language,
-                    year=request.target_year,
-                    pillars=request.pillars,
-                    daewun=request.daewun,
-                    overview_result=overview_result
-                )
+        # 6개 섹션 확인 (camelCase - 정규화 후 키와 일치)
+        missing = [s for s in YEARLY_ADVICE_SECTIONS if s not in advice]
+        if missing:
+            raise ValueError(f"누락된 섹션: {missing}")
 
-                # v2.9: 에러 + 이전 응답 피드백 포함 Gemini 호출
-                result = await self._call_gemini(
-                    prompt, step_name,
-                    previous_error=last_error if attempt > 1 else None,
-                    previous_response=last_response if attempt > 1 else None
-                )
-                last_response = result  # 응답 저장 (다음 시도 피드백용)
-
-                # 빈 응답 검증
-                advice = result.get("yearlyAdvice", {})
-                if not result or not advice:
-                    raise ValueError("yearlyAdvice 필드 누락")
-
-                # 6개 섹션 확인 (camelCase - 정규화 후 키와 일치)
-                required_sections = [
-                    "natureAndSoul", "wealthAndSuccess", "careerAndHonor",
-                    "documentAndWisdom", "relationshipAndLove", "healthAndMovement"
-                ]
-                missing = [s for s in required_sections if s not in advice]
-                if missing:
-                    raise ValueError(f"누락된 섹션: {missing}")
-
-                # 성공
-                logger.info(f"[{job_id}] {step_name} 성공: {len(advice)}개 섹션")
-                job_store.update_step_status(job_id, step_name, "completed")
-
-                # DB 중간 저장
-                if analysis_id:
-                    partial_result = dict(previous_result)
-                    partial_result["yearlyAdvice"] = advice
-                    await self._update_db_analysis(analysis_id, partial_result, "in_progress")
-
-                success = True
-                break
+        logger.info(f"[{ctx.job_id}] {step_name} 성공: {len(advice)}개 섹션")
 
-            except Exception as e:
-                last_error = str(e)
-                logger.warning(f"[{job_id}] {step_name} 실패 ({attempt}/{max_retries}): {e}")
-
-        if not success:
-            logger.error(f"[{job_id}] {step_name} 최종 실패: {last_error}")
-            job_store.update_step_status(job_id, step_name, "failed")
-            return None
+        # DB 중간 저장
+        partial_result["yearlyAdvice"] = advice
+        analysis_id = getattr(request, 'analysis_id', None)
+        if analysis_id:
+            await self._update_db_analysis(analysis_id, partial_result, "in_progress")
 
         return result
 
     async def _step_classical_refs(
         self,
-        job_id: str,
+        ctx: StepContext,
         request: YearlyAnalysisRequest,
-        previous_result: Dict[str, Any]
-    ) -> Optional[Dict[str, Any]]:
-        """Step 7: 고전 인용 (3회 재시도)"""
-        step_name = "classical_refs"
-        max_retries = 3
-
-        job_store.update(
-            job_id,
-            current_step=step_name,
-            progress_percent=STEP_PROGRESS[step_name]
+        partial_result: Dict[str, Any],
+        analysis_context: Optional[AnalysisContext] = None
+    ) -> Dict[str, Any]:
+        """Step 7: 고전 인용"""
+        step_name = ctx.step
+        logger.info(f"[{ctx.job_id}] {step_name} 시도 {ctx.attempt}/3")
+
+        # 프롬프트 빌드
+        prompt = YearlyStepPrompts.build_classical_refs(
+            language=request.language,
+            year=request.target_year,
+            pillars=request.pillars,
+            overview_result=self._overview_context(partial_result),
+            analysis_context=analysis_context
         )
-        job_store.update_step_status(job_id, step_name, "in_progress")
-
-        analysis_id = getattr(request, 'analysis_id', None)
-        success = False
-        last_error = None
-        result = None
-
-        for attempt in range(1, max_retries + 1):
-            try:
-                logger.info(f"[{job_id}] {step_name} 시도 {attempt}/{max_retries}")
-
-                # 이전 결과에서 overview 정보 추출
-                overview_result = {
-                    "yearlyTheme": previous_result.get("yearlyTheme", ""),
-                    "overallScore": previous_result.get("overallScore", 50)
-                }
-
-                # 프롬프트 빌드
-                prompt = YearlyStepPrompts.build_classical_refs(
-                    language=request.language,
-                    year=request.target_year,
-                    pillars=request.pillars,
-                    overview_result=overview_result
-                )
 
-                # v2.7: 에러 피드백 포함 Gemini 호출
-                result = await self._call_gemini(
-                    prompt, step_name,
-                    previous_error=last_error if attempt > 1 else None
-                )
-
-                # 빈 응답 검증
-                refs = result.get("classicalReferences", [])
-                if not result or not refs:
-                    raise ValueError("classicalReferences 필드 누락 또는 빈 배열")
-
-                # 최소 2개 이상 확인
-                if len(refs) < 2:
-                    raise ValueError(f"classicalReferences 개수 부족 (min=2, got={len(refs)})")
-
-                # 성공
-                logger.info(f"[{job_id}] {step_name} 성공: {len(refs)}개 인용")
-                job_store.update_step_status(job_id, step_name, "completed")
+        # v2.7: 에러 피드백 포함 Gemini 호출
+        result = await self._call_gemini(
+            prompt, step_name,
+            previous_error=ctx.last_error if ctx.attempt > 1 else None
+        )
 
-                # DB 중간 저장
-                if analysis_id:
-                    partial_result = dict(previous_result)
-                    partial_result["classicalReferences"] = refs
-                    await self._update_db_analysis(analysis_id, partial_result, "in_progress")
+        # 빈 응답 검증
+        refs = result.get("classicalReferences", [])
+        if not result or not refs:
+            raise ValueError("classicalReferences 필드 누락 또는 빈 배열")
 
-                success = True
-                break
+        # 최소 2개 이상 확인
+        if len(refs) < 2:
+            raise ValueError(f"classicalReferences 개수 부족 (min=2, got={len(refs)})")
 
-            except Exception as e:
-                last_error = str(e)
-                logger.warning(f"[{job_id}] {step_name} 실패 ({attempt}/{max_retries}): {e}")
+        logger.info(f"[{ctx.job_id}] {step_name} 성공: {len(refs)}개 인용")
 
-        if not success:
-            logger.error(f"[{job_id}] {step_name} 최종 실패: {last_error}")
-            job_store.update_step_status(job_id, step_name, "failed")
-            return None
+        # DB 중간 저장
+        partial_result["classicalReferences"] = refs
+        analysis_id = getattr(request, 'analysis_id', None)
+        if analysis_id:
+            await self._update_db_analysis(analysis_id, partial_result, "in_progress")
 
         return result
 
@@ -599,24 +629,27 @@ class YearlyAnalysisService:
         """
         gemini = self._get_gemini()
 
+        def postprocess(result: Dict[str, Any]) -> Dict[str, Any]:
+            # v4.0: 단계별 정규화 + Pydantic 검증 (통과한 결과만 캐시)
+            normalized = normalize_all_keys(normalize_response(step, result))
+            return validate_yearly_step(step, normalized, raise_on_error=True)
+
         # response_schema가 있는 단계면 스키마 기반 생성 사용
         schema = get_gemini_schema(step)
 
         if schema:
             # 스키마 기반 생성 (JSON 100% 강제 + 에러/응답 피드백)
-            result = await gemini.generate_with_schema(
+            validated = await gemini.generate_with_schema(
                 prompt,
                 response_schema=schema,
                 previous_error=previous_error,
-                previous_response=previous_response
+                previous_response=previous_response,
+                postprocess=postprocess,
+                step=step
             )
         else:
             # 기존 방식 (fallback)
-            result = await gemini.generate_yearly_step(prompt, step)
-
-        # v4.0: 단계별 정규화 + Pydantic 검증
-        normalized = normalize_all_keys(normalize_response(step, result))
-        validated = validate_yearly_step(step, normalized, raise_on_error=True)
+            validated = await gemini.generate_yearly_step(prompt, step, postprocess=postprocess)
 
         logger.info(f"[YearlyAnalysis] {step} 정규화 + 검증 완료")
         return validated
@@ -626,11 +659,19 @@ class YearlyAnalysisService:
         analysis_id: str,
         analysis: Dict[str, Any],
         status: str = "in_progress"
-    ):
-        """Supabase yearly_analyses 테이블 업데이트"""
-        if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
+    ) -> bool:
+        """
+        Supabase yearly_analyses 테이블 업데이트
+
+        v2.10: 병렬 단계의 중간 저장은 ProgressWriter로 병합 + 행별 순서대로 기록
+        (늦게 끝난 이전 스냅샷이 최신 단계 결과를 덮어쓰지 않음), 그 외 상태는 즉시 기록
+
+        Returns:
+            저장 성공 여부 (Supabase 미설정 / 실패 시 False, 병합 대기 중이면 True)
+        """
+        if not supabase_rest.configured:
             logger.warning("Supabase 설정이 없어 DB 업데이트 스킵")
-            return
+            return False
 
         # v2.5: 개별 컬럼 + 기존 analysis 동시 저장
         update_data = {
@@ -648,35 +689,18 @@ class YearlyAnalysisService:
             "yearly_advice": analysis.get("yearlyAdvice"),
             "classical_refs": analysis.get("classicalReferences"),
         }
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.patch(
-                    f"{SUPABASE_URL}/rest/v1/yearly_analyses?id=eq.{analysis_id}",
-                    json=update_data,
-                    headers={
-                        "apikey": SUPABASE_SERVICE_ROLE_KEY,
-                        "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}",
-                        "Content-Type": "application/json",
-                        "Prefer": "return=minimal"
-                    },
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                logger.info(f"DB 분석 업데이트 완료: analysis_id={analysis_id}, status={status}")
-        except Exception as e:
-            logger.error(f"DB 분석 업데이트 실패: {e}")
+        return await self._queue_db_write(analysis_id, update_data, status)
 
     async def _update_db_status(
         self,
         analysis_id: str,
         status: str,
         error: str = None
-    ):
-        """Supabase yearly_analyses 상태만 업데이트"""
-        if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
+    ) -> bool:
+        """Supabase yearly_analyses 상태만 업데이트 (대기 중인 중간 저장과 함께 순서대로 기록)"""
+        if not supabase_rest.configured:
             logger.warning("Supabase 설정이 없어 DB 업데이트 스킵")
-            return
+            return False
 
         update_data = {
             "status": status,
@@ -684,28 +708,37 @@ class YearlyAnalysisService:
         }
         if error:
             update_data["error"] = error
+        return await self._queue_db_write(analysis_id, update_data, status)
+
+    async def _queue_db_write(self, analysis_id: str, update_data: Dict[str, Any], status: str) -> bool:
+        return await self.progress.update(
+            analysis_id,
+            update_data,
+            flush=status != "in_progress",
+            final=status in ("completed", "failed", "pending")
+        )
 
+    async def _write_db_analysis(self, analysis_id: str, update_data: Dict[str, Any]) -> bool:
+        """병합된 변경 기록 (yearly_analyses PATCH)"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.patch(
-                    f"{SUPABASE_URL}/rest/v1/yearly_analyses?id=eq.{analysis_id}",
-                    json=update_data,
-                    headers={
-                        "apikey": SUPABASE_SERVICE_ROLE_KEY,
-                        "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}",
-                        "Content-Type": "application/json",
-                        "Prefer": "return=minimal"
-                    },
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                logger.info(f"DB 상태 업데이트 완료: analysis_id={analysis_id}, status={status}")
+            response = await supabase_rest.patch(
+                f"yearly_analyses?id=eq.{analysis_id}",
+                json=update_data,
+                headers={"Prefer": "return=minimal"},
+                timeout=30.0
+            )
+            response.raise_for_status()
+            logger.info(
+                f"DB 분석 업데이트 완료: analysis_id={analysis_id}, status={update_data.get('status')}"
+            )
+            return True
         except Exception as e:
-            logger.error(f"DB 상태 업데이트 실패: {e}")
+            logger.error(f"DB 분석 업데이트 실패: {e}")
+            return False
 
-    def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """작업 상태 조회"""
-        return job_store.get(job_id)
+    async def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 조회 (다른 워커의 작업은 공유 상태 백엔드에서)"""
+        return await job_store.fetch(job_id)
 
     async def reanalyze_step(
         self,
@@ -797,11 +830,7 @@ class YearlyAnalysisService:
                     advice = result.get("yearlyAdvice", {})
                     if not advice:
                         raise ValueError("yearlyAdvice 필드 누락")
-                    required_sections = [
-                        "natureAndSoul", "wealthAndSuccess", "careerAndHonor",
-                        "documentAndWisdom", "relationshipAndLove", "healthAndMovement"
-                    ]
-                    missing = [s for s in required_sections if s not in advice]
+                    missing = [s for s in YEARLY_ADVICE_SECTIONS if s not in advice]
                     if missing:
                         raise ValueError(f"누락된 섹션: {missing}")
 
@@ -859,3 +888,6 @@ class YearlyAnalysisService:
 
 # 싱글톤 인스턴스
 yearly_analysis_service = YearlyAnalysisService()
+job_queue.register(
+    "yearly", yearly_analysis_service.run_queued, on_interrupt=yearly_analysis_service.on_interrupted
+)
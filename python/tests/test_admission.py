@@ -0,0 +1,127 @@
+"""
+작업 수용 제어 (종류별 / 사용자별 한도, Retry-After, 예상 시작 시간) 테스트
+"""
+import asyncio
+from contextlib import ExitStack
+
+import pytest
+
+from services.admission import AdmissionController, AdmissionRejected, estimate_wait
+from services.job_queue import JobQueue
+
+
+def _make_controller(tmp_path, monkeypatch, max_pending=4, max_per_user=2):
+    monkeypatch.setenv("JOB_QUEUE_WORKERS_REPORT", "2")
+    monkeypatch.setenv("ADMISSION_MAX_PENDING_REPORT", str(max_pending))
+    queue = JobQueue(path=str(tmp_path / "queue.sqlite3"))
+    return queue, AdmissionController(queue, max_per_user=max_per_user)
+
+
+def test_estimate_wait_counts_worker_waves():
+    assert estimate_wait(0, 2, 90) == 0
+    assert estimate_wait(1, 2, 90) == 0
+    # 워커 2개가 모두 사용 중이면 첫 작업이 끝날 때까지 (평균의 절반씩 밀림)
+    assert estimate_wait(2, 2, 90) == 45
+    assert estimate_wait(5, 2, 90) == 180
+
+
+def test_rejects_with_retry_after_past_kind_threshold(tmp_path, monkeypatch):
+    queue, controller = _make_controller(tmp_path, monkeypatch)
+
+    async def scenario():
+        for index in range(4):
+            admission = await controller.enqueue(
+                "report", f"job-{index}", {}, dedup_key=f"r{index}", user_id=f"user-{index}"
+            )
+            assert admission.job_id == f"job-{index}"
+            assert admission.estimated_start_seconds == estimate_wait(index, 2, 90)
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.enqueue("report", "job-9", {}, user_id="user-9")
+        assert rejected.value.retry_after == 45
+
+        # 이미 대기 중인 작업에 합류하는 중복 요청은 수용
+        joined = await controller.enqueue("report", "job-10", {}, dedup_key="r0", user_id="user-0")
+        assert (joined.job_id, joined.joined, joined.estimated_start_seconds) == ("job-0", True, 0)
+
+    asyncio.run(scenario())
+    assert queue.pending_counts("report") == (4, 0, 0)
+    assert controller.get_stats()["rejected"] == {"report": 1}
+
+
+def test_per_user_cap_and_fair_claim(tmp_path, monkeypatch):
+    queue, controller = _make_controller(tmp_path, monkeypatch, max_pending=10)
+    queue.enqueue("report", "a-1", {}, user_id="heavy")
+    queue.enqueue("report", "a-2", {}, user_id="heavy")
+
+    async def scenario():
+        with pytest.raises(AdmissionRejected):
+            await controller.enqueue("report", "a-3", {}, user_id="heavy")
+        await controller.enqueue("report", "b-1", {}, user_id="light")
+
+    asyncio.run(scenario())
+
+    # heavy가 먼저 등록했어도 실행 중 작업이 없는 light 작업이 두 번째로 임대됨
+    assert queue.claim("report").job_id == "a-1"
+    assert queue.claim("report").job_id == "b-1"
+    assert queue.claim("report").job_id == "a-2"
+    assert queue.claim("report") is None
+
+
+def test_concurrent_requests_cannot_overshoot_caps(tmp_path, monkeypatch):
+    # 큐 파일을 공유하는 두 프로세스의 동시 요청 (한도 확인과 등록이 한 트랜잭션)
+    queue, controller = _make_controller(tmp_path, monkeypatch, max_pending=3, max_per_user=2)
+    other = AdmissionController(JobQueue(path=str(tmp_path / "queue.sqlite3")), max_per_user=2)
+
+    async def attempt(target, index, user_id):
+        try:
+            await target.enqueue("report", f"job-{user_id}-{index}", {}, user_id=user_id)
+            return True
+        except AdmissionRejected:
+            return False
+
+    async def scenario():
+        return await asyncio.gather(*(
+            attempt(controller if index % 2 else other, index, user_id)
+            for index in range(6) for user_id in ("heavy", "light")
+        ))
+
+    admitted = asyncio.run(scenario())
+    queued, running, heavy = queue.pending_counts("report", "heavy")
+    assert sum(admitted) == queued + running == 3
+    assert heavy <= 2
+
+
+def test_track_limits_inflight_synchronous_work(tmp_path, monkeypatch):
+    monkeypatch.setenv("ADMISSION_MAX_INFLIGHT_DAILY", "1")
+    _, controller = _make_controller(tmp_path, monkeypatch)
+
+    with controller.track("daily", "user-1"):
+        with pytest.raises(AdmissionRejected) as rejected:
+            with controller.track("daily", "user-2"):
+                pass
+        assert rejected.value.retry_after == 20
+    with controller.track("daily", "user-2"):
+        assert controller.get_stats()["inflight"] == {"daily": 1}
+
+
+def test_track_counts_coalesced_requests_once(tmp_path, monkeypatch):
+    _, controller = _make_controller(tmp_path, monkeypatch, max_per_user=1)
+    key = "user-1:p1:2026-01-01:ko"
+
+    first, retry = ExitStack(), ExitStack()
+    # 같은 운세 요청 재시도는 진행 중인 생성에 합류 (사용자 한도 1에 걸리지 않음)
+    first.enter_context(controller.track("daily", "user-1", key))
+    retry.enter_context(controller.track("daily", "user-1", key))
+    assert controller.get_stats()["inflight"] == {"daily": 1}
+    with pytest.raises(AdmissionRejected):
+        with controller.track("daily", "user-1", "user-1:p2:2026-01-01:ko"):
+            pass
+
+    # 먼저 들어온 요청이 끝나도 병합된 요청이 남아 있으면 계속 1건
+    first.close()
+    assert controller.get_stats()["inflight"] == {"daily": 1}
+    retry.close()
+    assert controller.get_stats()["inflight"] == {"daily": 0}
+    with controller.track("daily", "user-1", "user-1:p2:2026-01-01:ko"):
+        pass
@@ -0,0 +1,58 @@
+"""
+작업 단위 분석 컨텍스트 테스트
+불변성 / 단계 프롬프트 블록 재사용 / 언어 불일치 시 재계산 검증
+"""
+import dataclasses
+
+import pytest
+from prompts.analysis_context import AnalysisContext
+from prompts.builder import PromptBuilder
+from prompts.yearly_steps import YearlyStepPrompts
+
+SAMPLE_PILLARS = {
+    'year': {'stem': '庚', 'branch': '午'},
+    'month': {'stem': '辛', 'branch': '巳'},
+    'day': {'stem': '甲', 'branch': '子'},
+    'hour': {'stem': '辛', 'branch': '未'},
+}
+
+
+def test_context_is_immutable():
+    context = AnalysisContext.build(SAMPLE_PILLARS, 'ko')
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        context.language = 'en'
+    with pytest.raises(TypeError):
+        context.blocks['sinsal'] = ''
+
+
+def test_context_matches_explicit_step_arguments():
+    """컨텍스트 블록 = 개별 인자로 렌더링한 결과"""
+    context = AnalysisContext.build(SAMPLE_PILLARS, 'ko')
+
+    shared = PromptBuilder.build_step('fortune', SAMPLE_PILLARS, 'ko', analysis_context=context)
+    explicit = PromptBuilder.build_step(
+        'fortune', SAMPLE_PILLARS, 'ko',
+        ten_god_counts=dict(context.ten_god_counts),
+        interactions=dict(context.interactions),
+        sinsals=dict(context.sinsals),
+        formation=dict(context.formation),
+    )
+
+    assert shared.user_prompt == explicit.user_prompt
+    assert context.block('formation') in shared.user_prompt
+
+
+def test_basic_step_skips_analysis_blocks():
+    context = AnalysisContext.build(SAMPLE_PILLARS, 'ko')
+    response = PromptBuilder.build_step('basic', SAMPLE_PILLARS, 'ko', analysis_context=context)
+
+    assert context.block('ten_gods') not in response.user_prompt
+
+
+def test_language_mismatch_falls_back():
+    context = AnalysisContext.build(SAMPLE_PILLARS, 'ko')
+    prompt = YearlyStepPrompts.build_overview('en', 2026, SAMPLE_PILLARS, analysis_context=context)
+
+    assert '- Year: 庚午' in prompt
+    assert context.block('pillars_brief') not in prompt
@@ -0,0 +1,220 @@
+"""
+파이프라인 체크포인트 (DB 중간 저장 결과 → 단계 복원) 테스트
+"""
+import asyncio
+import copy
+
+import pytest
+
+from schemas.report import JobStatus, ReportAnalysisRequest
+from services.compatibility_service import compatibility_checkpoint_results
+from services.report_analysis import ReportAnalysisService, job_store, report_checkpoint_results
+from services.yearly_analysis import YEARLY_ADVICE_SECTIONS, yearly_checkpoint_results
+
+
+def _report_row(**kwargs):
+    row = {
+        "pillars": {"day": {"stem": "甲"}},
+        "daewun": [{"age": 5, "summary": ""}],
+        "analysis": {"basicAnalysis": {"summary": "기본"}},
+        "basic_analysis": None,
+        "personality": {"summary": "성격"},
+        "aptitude": None,
+        "fortune": None,
+    }
+    row.update(kwargs)
+    return row
+
+
+def test_report_checkpoint_restores_completed_steps():
+    restored = report_checkpoint_results(_report_row())
+
+    assert restored["manseryeok"]["pillars"] == {"day": {"stem": "甲"}}
+    assert restored["basic_analysis"] == {"summary": "기본"}
+    assert restored["personality"] == {"summary": "성격"}
+    # 빈 섹션 / summary 없는 대운은 다시 실행
+    assert "aptitude" not in restored
+    assert "daewun_analysis" not in restored
+
+    with_daewun = report_checkpoint_results(_report_row(daewun=[{"age": 5, "summary": "대운"}]))
+    assert "daewun_analysis" in with_daewun
+
+
+def test_report_checkpoint_respects_dependencies_and_retry():
+    # basic_analysis 없이 저장된 섹션은 재사용하지 않음
+    assert set(report_checkpoint_results(_report_row(analysis={}))) == {"manseryeok"}
+    assert report_checkpoint_results(_report_row(pillars=None)) == {}
+
+    restored = report_checkpoint_results(_report_row(), excluded={"basic_analysis", "personality"})
+    assert set(restored) == {"manseryeok"}
+
+
+def test_yearly_checkpoint_rebuilds_step_results():
+    analysis = {
+        "year": 2026,
+        "summary": "요약",
+        "yearlyTheme": "도약",
+        "overallScore": 70,
+        "monthlyFortunes": [{"month": m} for m in (1, 2, 3, 4, 5)],
+        "yearlyAdvice": {section: {} for section in YEARLY_ADVICE_SECTIONS},
+        "classicalReferences": [{"source": "궁통보감"}],
+    }
+    restored = yearly_checkpoint_results(analysis)
+
+    assert restored["yearly_overview"] == {
+        "year": 2026, "summary": "요약", "yearlyTheme": "도약", "overallScore": 70,
+    }
+    assert restored["monthly_1_3"] == {"monthlyFortunes": [{"month": 1}, {"month": 2}, {"month": 3}]}
+    assert "monthly_4_6" not in restored
+    assert "yearly_advice" in restored
+    # 검증 조건 (최소 2개) 미달 → 다시 실행
+    assert "classical_refs" not in restored
+
+    assert yearly_checkpoint_results({"monthlyFortunes": [{"month": 1}]}) == {}
+
+
+def test_compatibility_checkpoint_restores_saved_gemini_columns():
+    row = {"relationship_type": {"type": "동반자"}, "marriage_fit": None}
+
+    assert compatibility_checkpoint_results(row) == {"relationship_type": {"type": "동반자"}}
+
+
+def test_report_failure_is_raised_for_queue_retry(monkeypatch):
+    service = ReportAnalysisService()
+    request = ReportAnalysisRequest(
+        report_id="report-retry", profile_id="p1", user_id="u1", birth_date="1990-01-01", gender="male",
+    )
+    job_store.create("job-retry", request.report_id, request.user_id)
+    saved = []
+
+    def broken_pipeline(job_id, request):
+        raise RuntimeError("boom")
+
+    async def record_db_status(report_id, **kwargs):
+        saved.append(kwargs["status"])
+
+    monkeypatch.setattr(service, "_build_pipeline", broken_pipeline)
+    monkeypatch.setattr(service, "_update_db_status", record_db_status)
+
+    # 상태 / DB 기록 후 작업 큐로 예외 전달 (재시도 대상)
+    with pytest.raises(RuntimeError):
+        asyncio.run(service._run_analysis("job-retry", request))
+    assert job_store.get("job-retry")["status"] == JobStatus.FAILED
+    assert saved == ["failed"]
+    job_store.delete("job-retry")
+
+
+def test_daewun_analysis_returns_copy_and_saving_merges_it(monkeypatch):
+    from services.step_executor import StepContext
+
+    service = ReportAnalysisService()
+    job_store.create("job-daewun", "report-daewun", "u1")
+    daewun = [{"age": 5, "endAge": 14, "tenGod": "비견", "stem": "甲", "branch": "子"}]
+    job_store.update(
+        "job-daewun",
+        pillars={"day": {"stem": "甲", "element": "木"}, "year": {"yearNum": 1990}},
+        daewun=daewun,
+        analysis={"basicAnalysis": {"usefulGod": {"primary": "水", "harmful": "金"}}},
+    )
+    saved = []
+
+    async def fake_gemini(prompt, step_name, previous_error=None, validator=None):
+        return validator({"daewunAnalysis": [{"summary": "분석", "scoreReasoning": "근거"}]})
+
+    async def record_db_status(report_id, **kwargs):
+        saved.append(kwargs)
+        return True
+
+    monkeypatch.setattr(service, "_call_gemini", fake_gemini)
+    monkeypatch.setattr(service, "_update_db_status", record_db_status)
+
+    async def main():
+        results = {}
+        ctx = StepContext(job_id="job-daewun", step="daewun_analysis", results=results)
+        results["daewun_analysis"] = await service._step_daewun_analysis(ctx, "report-daewun", "ko")
+        # 병렬 섹션 단계가 읽는 대운 목록은 그대로
+        assert job_store.get("job-daewun")["daewun"] == [
+            {"age": 5, "endAge": 14, "tenGod": "비견", "stem": "甲", "branch": "子"}
+        ]
+        assert results["daewun_analysis"][0]["summary"] == "분석"
+        assert "favorablePercent" in results["daewun_analysis"][0]
+        await service._step_saving(StepContext(job_id="job-daewun", step="saving", results=results), "report-daewun")
+
+    asyncio.run(main())
+    assert job_store.get("job-daewun")["daewun"][0]["summary"] == "분석"
+    assert saved[-1]["status"] == "completed" and saved[-1]["daewun"][0]["summary"] == "분석"
+    job_store.delete("job-daewun")
+
+
+def test_report_failure_before_last_attempt_is_marked_retrying(monkeypatch):
+    service = ReportAnalysisService()
+    request = ReportAnalysisRequest(
+        report_id="report-retrying", profile_id="p1", user_id="u1", birth_date="1990-01-01", gender="male",
+    )
+    job_store.create("job-retrying", request.report_id, request.user_id)
+    job_store.update_step_status("job-retrying", "manseryeok", "in_progress")
+    saved = []
+
+    def broken_pipeline(job_id, request):
+        raise RuntimeError("temporary")
+
+    async def record_db_status(report_id, **kwargs):
+        saved.append(kwargs["status"])
+
+    monkeypatch.setattr(service, "_build_pipeline", broken_pipeline)
+    monkeypatch.setattr(service, "_update_db_status", record_db_status)
+
+    # 작업 큐가 다시 실행할 실패는 failed로 기록하지 않음 (SSE 스트림 / DB 행 유지)
+    with pytest.raises(RuntimeError):
+        asyncio.run(service._run_analysis("job-retrying", request, final_attempt=False))
+    job = job_store.get("job-retrying")
+    assert (job["status"], job["error"], job["retrying"]) == ("pending", "temporary", True)
+    assert job["step_statuses"]["manseryeok"] == "pending"
+    assert saved == ["pending"]
+    job_store.delete("job-retrying")
+
+
+def test_yearly_checkpoint_writes_land_in_order(monkeypatch):
+    import services.yearly_analysis as yearly_module
+    from services.yearly_analysis import YearlyAnalysisService
+
+    sent, landed = [], []
+
+    class _Response:
+        def raise_for_status(self):
+            pass
+
+    class _Rest:
+        configured = True
+
+        async def patch(self, path, json, headers=None, timeout=None):
+            # 본문은 전송 시점 스냅샷, 첫 요청이 가장 늦게 끝남 (HTTP/2 다중화)
+            body = copy.deepcopy(json)
+            sent.append(body)
+            await asyncio.sleep(0.05 if len(sent) == 1 else 0)
+            landed.append(body)
+            return _Response()
+
+    monkeypatch.setattr(yearly_module, "supabase_rest", _Rest())
+    service = YearlyAnalysisService()
+    partial_result = {"year": 2026}
+
+    async def finish_step(key, value):
+        partial_result[key] = value
+        await service._update_db_analysis("analysis-1", partial_result, "in_progress")
+
+    async def main():
+        await asyncio.gather(
+            finish_step("yearlyAdvice", {"a": 1}),
+            finish_step("classicalReferences", [{"b": 2}]),
+        )
+        await service._update_db_status("analysis-1", "pending")
+
+    asyncio.run(main())
+
+    # 늦게 끝난 이전 스냅샷이 최신 단계 결과를 덮어쓰지 않음
+    last = [body for body in landed if "analysis" in body][-1]
+    assert last["analysis"]["yearlyAdvice"] == {"a": 1}
+    assert last["analysis"]["classicalReferences"] == [{"b": 2}]
+    assert landed[-1]["status"] == "pending"
+    assert landed[-1]["analysis"]["classicalReferences"] == [{"b": 2}]
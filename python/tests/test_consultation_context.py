@@ -0,0 +1,57 @@
+"""
+상담 맥락 비동기 동시 조회 (리포트 / 최근 상담 / 세션 히스토리) 테스트
+"""
+import asyncio
+
+import httpx
+
+import services.consultation_service as consultation_module
+from services.consultation_service import ConsultationService
+from services.supabase_rest import SupabaseRestClient
+
+
+ROWS = {
+    "profile_reports": [{"profile_id": "p1", "pillars": {}, "daewun": [], "analysis": {}}],
+    "yearly_analyses": [{"target_year": 2026, "overview": {"summary": "좋은 해"}}],
+    "consultation_sessions": [
+        {"id": "s-old-1", "title": "이직", "created_at": "2026-01-02T00:00:00"},
+        {"id": "s-old-2", "title": None, "created_at": "2026-01-01T00:00:00"},
+    ],
+}
+
+
+def test_load_context_fetches_concurrently(monkeypatch):
+    in_flight = {"now": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+
+        table = request.url.path.rsplit("/", 1)[-1]
+        params = request.url.params
+        if table == "consultation_messages" and params.get("message_type") == "eq.ai_answer":
+            session_id = params["session_id"].removeprefix("eq.")
+            return httpx.Response(200, json=[{"content": f"{session_id} 답변"}])
+        if table == "consultation_messages":
+            assert params["id"] == "neq.m1" and params["order"] == "created_at.asc"
+            return httpx.Response(200, json=[{"id": "m0", "message_type": "user_question", "content": "질문"}])
+        return httpx.Response(200, json=ROWS[table])
+
+    rest = SupabaseRestClient(
+        url="https://db.example.com", key="service-key", http2=False,
+        transport=httpx.MockTransport(handler),
+    )
+    monkeypatch.setattr(consultation_module, "supabase_rest", rest)
+
+    request = {"message_id": "m1", "session_id": "s1", "profile_id": "p1", "profile_report_id": "r1"}
+    report, recent, history = asyncio.run(ConsultationService()._load_context(request))
+
+    assert report["yearly_summary"] == {"year": 2026, "summary": "좋은 해"}
+    assert [c["summary"] for c in recent] == ["s-old-1 답변", "s-old-2 답변"]
+    assert recent[1]["question"] == "(제목 없음)"
+    assert history[0]["id"] == "m0"
+    # 리포트 / 신년 요약 / 상담 세션 / 히스토리 동시 조회
+    assert in_flight["peak"] >= 4
+    assert rest.get_stats()["requests"] == 6
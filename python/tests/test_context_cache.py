@@ -0,0 +1,85 @@
+"""
+시스템 프롬프트 컨텍스트 캐싱 테스트
+등록 재사용 / 짧은 프롬프트 우회 / 만료 재등록 / 실패 폴백 검증
+"""
+import asyncio
+
+from services.context_cache import ContextCache, LocalContextBackend
+
+SYSTEM_PROMPT = "시스템 지시" * 100
+
+
+class EchoModel:
+    """전달된 프롬프트를 그대로 반환"""
+
+    async def generate_content_async(self, prompt, **kwargs):
+        return prompt
+
+
+class FailingBackend(LocalContextBackend):
+    def create(self, system_prompt, ttl_seconds):
+        raise RuntimeError("minimum token count not reached")
+
+
+def make_cache(backend=None, ttl_seconds=3600, min_chars=100):
+    backend = backend or LocalContextBackend(EchoModel())
+    return ContextCache(backend, "test-model", ttl_seconds=ttl_seconds, min_chars=min_chars), backend
+
+
+def test_registers_once_and_reuses():
+    cache, backend = make_cache()
+
+    async def scenario():
+        first = await cache.get_model(SYSTEM_PROMPT)
+        second = await cache.get_model(SYSTEM_PROMPT)
+        return first, second, await first.generate_content_async("사용자")
+
+    first, second, output = asyncio.run(scenario())
+
+    assert first is second
+    assert backend.created == 1
+    assert output == f"{SYSTEM_PROMPT}\n\n사용자"
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_concurrent_first_calls_register_once():
+    cache, backend = make_cache()
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get_model(SYSTEM_PROMPT) for _ in range(5)))
+
+    models = asyncio.run(scenario())
+
+    assert backend.created == 1
+    assert all(model is models[0] for model in models)
+
+
+def test_short_prompt_bypasses_cache():
+    cache, backend = make_cache(min_chars=10_000)
+
+    assert asyncio.run(cache.get_model(SYSTEM_PROMPT)) is None
+    assert backend.created == 0
+
+
+def test_refreshes_near_expiry():
+    # TTL이 재등록 여유보다 짧으면 매번 재등록
+    cache, backend = make_cache(ttl_seconds=1)
+
+    async def scenario():
+        await cache.get_model(SYSTEM_PROMPT)
+        await cache.get_model(SYSTEM_PROMPT)
+
+    asyncio.run(scenario())
+
+    assert backend.created == 2
+    assert cache.get_stats()["handles"] == 1
+
+
+def test_failure_falls_back_and_backs_off():
+    cache, backend = make_cache(backend=FailingBackend(EchoModel()))
+
+    async def scenario():
+        return await cache.get_model(SYSTEM_PROMPT), await cache.get_model(SYSTEM_PROMPT)
+
+    assert asyncio.run(scenario()) == (None, None)
+    assert cache.get_stats()["failed_keys"] == 1
@@ -0,0 +1,60 @@
+"""
+프롬프트 데이터 바이너리 번들 테스트 (v2.10)
+직렬화 왕복 / 중첩 Mapping 뷰 / 원본 변경 감지
+"""
+from prompts.classics.qiongtong_matrix import JohuEntry
+from prompts.data_bundles import (
+    BUNDLE_SOURCES,
+    BundleMapping,
+    PromptDataBundle,
+    open_bundle,
+    source_hash,
+    write_bundle,
+)
+from prompts.data_packs import data_packs
+
+
+def _write(tmp_path, name, digest=None):
+    source = BUNDLE_SOURCES[name]
+    table = data_packs.attr(source.module, source.attribute)
+    write_bundle(tmp_path / f"{name}.bin", name, table, source.depth, digest or source_hash(source))
+    return table
+
+
+def test_round_trip_nested(tmp_path):
+    """중첩 테이블 왕복: table[일간][월지] → JohuEntry"""
+    original = _write(tmp_path, "johu_matrix")
+    table = BundleMapping(PromptDataBundle(tmp_path / "johu_matrix.bin"), lambda data: JohuEntry(**data))
+
+    assert list(table) == list(original)
+    assert list(table["甲"]) == list(original["甲"])
+    assert table["甲"]["寅"] == original["甲"]["寅"]
+    assert table["癸"].get("丑") == original["癸"]["丑"]
+    assert table["甲"].get("없음") is None
+    assert table.get("없음") is None
+    assert "乙" in table and "寅" in table["乙"]
+
+
+def test_round_trip_flat(tmp_path):
+    """단일 깊이 테이블 (로케일 문자열)"""
+    original = _write(tmp_path, "locale_strings")
+    bundle = PromptDataBundle(tmp_path / "locale_strings.bin")
+    table = BundleMapping(bundle)
+
+    assert len(table) == len(original)
+    assert table["focus_area_header"] == original["focus_area_header"]
+    assert table.get("missing_key") is None
+    assert bundle.decoded == 1
+
+
+def test_open_bundle_rejects_stale_or_invalid(tmp_path):
+    """원본 해시가 다르거나 형식이 아니면 None (원본 모듈 폴백)"""
+    _write(tmp_path, "musang_database", digest="stale")
+    assert open_bundle("musang_database", tmp_path) is None
+
+    _write(tmp_path, "musang_database")
+    assert open_bundle("musang_database", tmp_path) is not None
+
+    (tmp_path / "destiny_advice.bin").write_bytes(b"not a bundle")
+    assert open_bundle("destiny_advice", tmp_path) is None
+    assert open_bundle("yongsin_matrix", tmp_path) is None
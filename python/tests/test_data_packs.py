@@ -0,0 +1,60 @@
+"""
+프롬프트 데이터 팩 지연 로딩 테스트 (v2.10)
+"""
+import sys
+
+from prompts.data_packs import DataPackLoader, LOCALE_PACKS, current_rss_kb
+
+
+def test_load_once_and_record_metrics():
+    """팩은 한 번만 import하고 import 시간 / RSS 증가량을 기록"""
+    loader = DataPackLoader()
+    module = loader.load("classics.qiongtong_matrix")
+
+    assert loader.load("classics.qiongtong_matrix") is module
+    assert loader.is_loaded("classics.qiongtong_matrix")
+    assert "prompts.classics.qiongtong_matrix" in sys.modules
+
+    stats = loader.get_stats()
+    assert stats["loaded"] == ["classics.qiongtong_matrix"]
+    metrics = stats["packs"]["classics.qiongtong_matrix"]
+    assert metrics["import_ms"] >= 0
+    assert metrics["rss_delta_kb"] >= 0
+    assert stats["rss_kb"] > 0
+
+
+def test_attr():
+    """팩 내부 심볼 조회"""
+    loader = DataPackLoader()
+    get_johu_entry = loader.attr("classics.qiongtong_matrix", "get_johu_entry")
+
+    entry = get_johu_entry("甲", "寅")
+    assert entry.primary_god == "丙"
+
+
+def test_locale_loads_only_requested_language():
+    """로케일은 요청한 언어 팩만 로딩, zh → zh-CN, 미지원 언어 → 한국어"""
+    loader = DataPackLoader()
+
+    assert loader.locale('en').__name__ == "EnglishLocale"
+    assert loader.get_stats()["loaded"] == ["locales.en"]
+    assert loader.locale('zh').__name__ == "ChineseSimplifiedLocale"
+    assert loader.locale('xx').__name__ == "KoreanLocale"
+    assert set(loader.get_stats()["loaded"]) <= {pack for pack, _ in LOCALE_PACKS.values()}
+
+
+def test_package_lazy_exports():
+    """기존 import 경로 호환 (prompts.classics / prompts.locales / prompts.western)"""
+    from prompts.classics import JOHU_MATRIX, ZipingPrompt
+    from prompts.locales import LOCALES, JapaneseLocale, get_locale
+    from prompts.western import DestinyCodePrompt
+
+    assert len(JOHU_MATRIX) == 10
+    assert ZipingPrompt.build('ko')
+    assert get_locale('ja') is JapaneseLocale
+    assert LOCALES['zh'] is LOCALES['zh-CN']
+    assert DestinyCodePrompt.build('en')
+
+
+def test_current_rss_kb():
+    assert current_rss_kb() > 0
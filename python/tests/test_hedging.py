@@ -0,0 +1,64 @@
+"""
+Gemini 헤징 테스트
+지연 통계 / 예산 상한 / 헤징 실행 / deadline 검증
+"""
+import asyncio
+
+import pytest
+from services.hedging import HedgePolicy, LatencyHistogram, hedged_call
+
+
+def make_policy(samples=(0.01,) * 20, budget_percent=100):
+    histogram = LatencyHistogram()
+    for value in samples:
+        histogram.record("step", value)
+    return HedgePolicy(histogram, budget_percent=budget_percent, min_samples=20)
+
+
+def test_percentile():
+    histogram = LatencyHistogram()
+    for value in range(1, 11):
+        histogram.record("step", float(value))
+
+    assert histogram.percentile("step", 50) == 5.0
+    assert histogram.percentile("step", 90) == 9.0
+    assert histogram.percentile("missing", 90) is None
+
+
+def test_no_hedge_without_enough_samples():
+    policy = make_policy(samples=(0.01,) * 5)
+    assert policy.hedge_delay("step") is None
+
+
+def test_budget_caps_hedge_ratio():
+    policy = make_policy(budget_percent=10)
+    policy.requests = 10
+    assert policy.try_acquire() is True
+    assert policy.try_acquire() is False
+
+
+def test_slow_primary_is_hedged():
+    policy = make_policy()
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        # 첫 요청만 느림
+        await asyncio.sleep(1.0 if len(calls) == 1 else 0.01)
+        return len(calls)
+
+    result = asyncio.run(hedged_call(factory, policy, "step", deadline=2))
+
+    assert result == 2
+    assert policy.hedged == 1
+    assert policy.hedge_wins == 1
+
+
+def test_deadline_enforced():
+    policy = make_policy(samples=())
+
+    async def factory():
+        await asyncio.sleep(1.0)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(hedged_call(factory, policy, "step", deadline=0.05))
@@ -0,0 +1,106 @@
+"""
+작업 진행 이벤트 스트림 (SSE / 이어받기 / heartbeat) 테스트
+"""
+import asyncio
+import json
+
+from services.job_events import JobEventLog, job_event_stream
+from services.job_store import BoundedJobStore
+from services.status_backend import SQLiteStatusBackend, StatusBackend
+
+
+class _Store(BoundedJobStore):
+    RESULT_FIELDS = ("analysis",)
+
+    def create(self, job_id: str):
+        return self._insert(job_id, {
+            "job_id": job_id, "status": "pending", "progress_percent": 0, "current_step": None,
+            "step_statuses": {}, "analysis": None,
+        })
+
+
+def _make_store(**kwargs) -> _Store:
+    kwargs.setdefault("backend", StatusBackend())
+    return _Store("test", **kwargs)
+
+
+def _parse(message: str):
+    """SSE 메시지 → (id, event, data) (주석 / retry 행은 None)"""
+    fields = dict(line.split(": ", 1) for line in message.strip().split("\n") if not line.startswith(":"))
+    if "event" not in fields:
+        return None
+    event_id = int(fields["id"]) if "id" in fields else None
+    return event_id, fields["event"], json.loads(fields["data"])
+
+
+async def _collect(stream, limit: int = 50):
+    messages = []
+    async for message in stream:
+        messages.append(message)
+        if len(messages) >= limit:
+            break
+    return messages
+
+
+def test_event_log_resume_window():
+    log = JobEventLog(maxlen=2)
+    for n in range(3):
+        log.append("progress", {"n": n})
+
+    assert [event.id for event in log.since(1)[0]] == [2, 3]
+    assert log.since(3) == ([], True)
+    # 버퍼에서 밀려난 이벤트 이후부터는 이어받기 불가
+    assert log.since(0) == ([], False)
+
+
+def test_stream_pushes_updates_until_done():
+    store = _make_store()
+    store.create("job-1")
+
+    async def main():
+        task = asyncio.create_task(_collect(job_event_stream(store, "job-1", heartbeat_seconds=5)))
+        await asyncio.sleep(0.01)
+        store.update_step_status("job-1", "basic", "completed")
+        store.update("job-1", status="in_progress", progress_percent=40, analysis={"basic": 1})
+        store.update("job-1", status="completed", progress_percent=100)
+        return await asyncio.wait_for(task, 1)
+
+    events = [event for event in map(_parse, asyncio.run(main())) if event]
+    types = [event_type for _, event_type, _ in events]
+
+    assert types == ["snapshot", "step", "progress", "partial", "progress", "done"]
+    assert events[1][2] == {"step": "basic", "status": "completed"}
+    assert events[3][2] == {"analysis": {"basic": 1}}
+    assert events[-1][2]["status"] == "completed"
+    assert [event_id for event_id, _, _ in events] == [0, 1, 2, 3, 4, 5]
+
+
+def test_stream_resumes_from_last_event_id_and_sends_heartbeat():
+    store = _make_store()
+    store.create("job-1")
+    store.update("job-1", progress_percent=10)
+    store.update("job-1", progress_percent=20)
+
+    async def main():
+        return await _collect(job_event_stream(store, "job-1", last_event_id=1, heartbeat_seconds=0.01), limit=3)
+
+    messages = asyncio.run(main())
+    assert _parse(messages[1])[:2] == (2, "progress")
+    assert messages[2] == ": ping\n\n"
+
+
+def test_stream_falls_back_to_shared_snapshots(tmp_path):
+    path = str(tmp_path / "status.sqlite3")
+    worker = _make_store(backend=SQLiteStatusBackend(path))
+    other = _make_store(backend=SQLiteStatusBackend(path))
+    worker.create("job-1")
+
+    async def main():
+        task = asyncio.create_task(_collect(job_event_stream(other, "job-1", poll_seconds=0.01)))
+        await asyncio.sleep(0.05)
+        worker.update("job-1", status="completed", progress_percent=100)
+        return await asyncio.wait_for(task, 1)
+
+    events = [event for event in map(_parse, asyncio.run(main())) if event]
+    assert [event_type for _, event_type, _ in events] == ["snapshot", "done"]
+    assert events[-1][0] is None
@@ -0,0 +1,256 @@
+"""
+영속 작업 큐 (임대 / 재시도 / 재시작 후 재개) 테스트
+"""
+import asyncio
+import time
+
+from services.job_queue import DONE, FAILED, QUEUED, RUNNING, JobQueue
+
+
+def _make_queue(tmp_path, **kwargs) -> JobQueue:
+    return JobQueue(path=str(tmp_path / "queue.sqlite3"), poll_seconds=0.01, **kwargs)
+
+
+def _status(queue: JobQueue, job_id: str) -> str:
+    return queue._db().execute("SELECT status FROM job_queue WHERE job_id = ?", (job_id,)).fetchone()[0]
+
+
+def test_enqueue_dedups_pending_jobs(tmp_path):
+    queue = _make_queue(tmp_path)
+
+    assert queue.enqueue("report", "job-1", {"a": 1}, dedup_key="r1") == "job-1"
+    assert queue.enqueue("report", "job-2", {"a": 1}, dedup_key="r1") == "job-1"
+    assert queue.active_job("report", "r1") == "job-1"
+
+    job = queue.claim("report")
+    queue.complete(job.id)
+    assert queue.active_job("report", "r1") is None
+    assert queue.enqueue("report", "job-3", {"a": 1}, dedup_key="r1") == "job-3"
+
+
+def test_claim_is_fifo_per_kind(tmp_path):
+    queue = _make_queue(tmp_path)
+    queue.enqueue("report", "r-1", {})
+    queue.enqueue("yearly", "y-1", {})
+    queue.enqueue("report", "r-2", {"n": 2})
+
+    first = queue.claim("report")
+    second = queue.claim("report")
+    assert (first.job_id, second.job_id) == ("r-1", "r-2")
+    assert second.payload == {"n": 2}
+    assert queue.claim("report") is None
+    assert queue.claim("yearly").job_id == "y-1"
+
+
+def test_expired_lease_is_recovered_by_another_process(tmp_path):
+    crashed = _make_queue(tmp_path, lease_seconds=30)
+    crashed.enqueue("report", "job-1", {})
+    job = crashed.claim("report")
+    assert _status(crashed, "job-1") == RUNNING
+
+    restarted = _make_queue(tmp_path, lease_seconds=30)
+    # 임대 유효 기간에는 가져가지 않음
+    assert restarted.claim("report") is None
+
+    recovered = restarted.claim("report", now=time.time() + 60)
+    assert recovered.job_id == "job-1"
+    assert recovered.recovered and recovered.attempts == 2
+    # 이전 소유자는 임대를 잃음
+    assert crashed.heartbeat(job.id) is False
+    assert restarted.heartbeat(recovered.id) is True
+
+
+def test_failed_jobs_retry_until_max_attempts(tmp_path):
+    queue = _make_queue(tmp_path, max_attempts=2)
+    queue.enqueue("report", "job-1", {})
+
+    queue.fail(queue.claim("report"), "boom")
+    assert _status(queue, "job-1") == QUEUED
+
+    queue.fail(queue.claim("report"), "boom")
+    assert _status(queue, "job-1") == FAILED
+    assert queue.claim("report") is None
+    assert (queue.retried, queue.failed) == (1, 1)
+
+
+def test_workers_run_handlers_and_release_on_stop(tmp_path):
+    queue = _make_queue(tmp_path, drain_seconds=0.05)
+    done = []
+    blocker = asyncio.Event()
+
+    async def handler(job_id, payload, final_attempt):
+        if payload.get("block"):
+            await blocker.wait()
+        done.append((job_id, payload["n"]))
+
+    queue.register("report", handler, workers=2)
+
+    async def main():
+        queue.start()
+        queue.enqueue("report", "job-1", {"n": 1})
+        queue.enqueue("report", "job-2", {"n": 2, "block": True})
+        for _ in range(100):
+            if done:
+                break
+            await asyncio.sleep(0.01)
+        await queue.stop()
+
+    asyncio.run(main())
+
+    assert done == [("job-1", 1)]
+    assert _status(queue, "job-1") == DONE
+    # 종료 시 실행 중 작업은 시도 횟수 차감 없이 대기열로 복귀
+    assert _status(queue, "job-2") == QUEUED
+    assert queue.claim("report").attempts == 1
+
+
+def test_worker_db_calls_run_off_the_event_loop(tmp_path):
+    queue = _make_queue(tmp_path)
+
+    def slow_claim(kind, now=None):
+        # 다른 프로세스가 큐 파일 잠금을 잡고 있는 상황
+        time.sleep(0.2)
+        return None
+
+    queue.claim = slow_claim
+
+    async def handler(job_id, payload, final_attempt):
+        pass
+
+    queue.register("report", handler, workers=4)
+
+    async def main():
+        queue.start()
+        await asyncio.sleep(0)
+        started = time.monotonic()
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+        elapsed = time.monotonic() - started
+        await queue.stop()
+        return elapsed
+
+    assert asyncio.run(main()) < 0.15
+
+
+def test_stop_drains_inflight_jobs_then_interrupts_the_rest(tmp_path):
+    queue = _make_queue(tmp_path)
+    done, interrupted = [], []
+    started = {"short": asyncio.Event(), "long": asyncio.Event()}
+
+    async def handler(job_id, payload, final_attempt):
+        started[job_id].set()
+        await asyncio.sleep(payload["seconds"])
+        done.append(job_id)
+
+    async def on_interrupt(job_id, payload):
+        interrupted.append(job_id)
+
+    queue.register("report", handler, workers=2, on_interrupt=on_interrupt)
+
+    async def main():
+        queue.start()
+        queue.enqueue("report", "short", {"seconds": 0.05})
+        queue.enqueue("report", "long", {"seconds": 10})
+        await asyncio.wait_for(asyncio.gather(*(event.wait() for event in started.values())), 1)
+        await queue.stop(drain_seconds=0.5)
+
+    asyncio.run(main())
+
+    # 대기 시간 안에 끝난 작업은 완료, 남은 작업은 중단 훅 + 대기열 복귀
+    assert done == ["short"]
+    assert _status(queue, "short") == DONE
+    assert interrupted == ["long"]
+    assert _status(queue, "long") == QUEUED
+    assert queue.get_stats()["interrupted"] == 1
+
+
+def test_legacy_queue_file_gains_user_column(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "queue.sqlite3"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """
+        CREATE TABLE job_queue (
+            id TEXT PRIMARY KEY, kind TEXT NOT NULL, job_id TEXT NOT NULL, dedup_key TEXT,
+            payload TEXT NOT NULL, status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0,
+            lease_owner TEXT, lease_expires REAL, enqueued_at REAL NOT NULL, finished_at REAL, error TEXT
+        )
+        """
+    )
+    conn.execute(
+        "INSERT INTO job_queue (id, kind, job_id, payload, status, enqueued_at) VALUES ('q1', 'report', 'old', '{}', ?, 0)",
+        (QUEUED,),
+    )
+    conn.commit()
+    conn.close()
+
+    queue = _make_queue(tmp_path)
+    queue.enqueue("report", "new", {}, user_id="user-1")
+    assert queue.pending_counts("report", "user-1") == (2, 0, 1)
+    assert queue.claim("report").job_id == "old"
+
+
+def test_lost_lease_cancels_handler_without_interrupt_hook(tmp_path):
+    queue = _make_queue(tmp_path, lease_seconds=0.3)
+    events, interrupted = [], []
+
+    async def handler(job_id, payload, final_attempt):
+        events.append("started")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    async def on_interrupt(job_id, payload):
+        interrupted.append(job_id)
+
+    queue.register("report", handler, workers=1, on_interrupt=on_interrupt)
+
+    async def main():
+        queue.start()
+        queue.enqueue("report", "job-1", {})
+        while not events:
+            await asyncio.sleep(0.01)
+        # 다른 프로세스가 만료된 임대를 회수한 상황
+        queue._db().execute("UPDATE job_queue SET lease_owner = 'other' WHERE job_id = 'job-1'")
+        for _ in range(100):
+            if "cancelled" in events:
+                break
+            await asyncio.sleep(0.01)
+        await queue.stop()
+
+    asyncio.run(main())
+
+    assert events == ["started", "cancelled"]
+    assert interrupted == []
+    assert queue.get_stats()["leases_lost"] == 1
+    # 회수한 워커의 실행 상태는 그대로
+    assert _status(queue, "job-1") == RUNNING
+
+
+def test_handler_learns_whether_a_failure_is_final(tmp_path):
+    queue = _make_queue(tmp_path, max_attempts=3)
+    attempts = []
+
+    async def handler(job_id, payload, final_attempt):
+        attempts.append(final_attempt)
+        raise RuntimeError("boom")
+
+    queue.register("report", handler, workers=1)
+
+    async def main():
+        queue.start()
+        queue.enqueue("report", "job-1", {})
+        for _ in range(200):
+            if _status(queue, "job-1") == FAILED:
+                break
+            await asyncio.sleep(0.01)
+        await queue.stop()
+
+    asyncio.run(main())
+
+    # 재시도될 실패에는 False → 마지막 시도에만 True
+    assert attempts == [False, False, True]
+    assert _status(queue, "job-1") == FAILED
@@ -0,0 +1,166 @@
+"""
+공용 작업 저장소 (상한 / TTL / DB 저장 후 결과 해제) 테스트
+"""
+import time
+
+from services.job_store import BoundedJobStore
+
+
+class _Store(BoundedJobStore):
+    def create(self, job_id: str, result=None):
+        return self._insert(job_id, {"job_id": job_id, "status": "pending", "result": result})
+
+
+def _make_store(**kwargs) -> _Store:
+    return _Store("test", **kwargs)
+
+
+def test_update_tracks_result_bytes():
+    store = _make_store()
+    store.create("a")
+    base = store.get_stats()["bytes"]
+
+    store.update("a", result={"text": "x" * 1000})
+    assert store.get_stats()["bytes"] >= base + 1000
+
+    store.delete("a")
+    assert store.get_stats()["bytes"] == 0
+    assert store.get("a") is None
+
+
+def test_capacity_evicts_terminal_jobs_persisted_first():
+    store = _make_store(max_entries=2)
+    store.create("old")
+    store.create("saved")
+    store.update("old", status="completed")
+    store.update("saved", status="completed")
+    store.mark_persisted("saved")
+
+    store.create("new")
+
+    assert "saved" not in store
+    assert "old" in store and "new" in store
+    assert store.evictions["capacity"] == 1
+
+
+def test_running_jobs_are_never_evicted_for_capacity():
+    store = _make_store(max_entries=1)
+    store.create("a")
+    store.create("b")
+
+    assert len(store) == 2
+    assert store.evictions["capacity"] == 0
+
+
+def test_byte_budget_evicts_oldest_terminal_job():
+    store = _make_store(max_bytes=5000)
+    store.create("a", result="x" * 2000)
+    store.update("a", status="completed")
+    store.create("b", result="y" * 2000)
+
+    assert "a" not in store
+    assert "b" in store
+
+
+
+def test_oversized_final_result_does_not_evict_the_updated_job():
+    store = _make_store(max_bytes=500)
+    store.create("a")
+
+    # 갱신 중인 작업은 바이트 예산을 넘어도 제거하지 않음 (done 이벤트 / 결과 유지)
+    job = store.update("a", status="completed", result={"x": "y" * 2000})
+
+    assert job["status"] == "completed" and "a" in store
+    events, _ = store.event_log("a").since(0)
+    assert [event.type for event in events][-1] == "done"
+
+    # 이후 다른 작업 갱신 때는 일반 제거 대상
+    store.create("b")
+    store.update("b", result={"x": "z"})
+    assert "a" not in store and "b" in store
+
+def test_sweep_applies_ttl_and_max_age():
+    store = _make_store(ttl_seconds=10, max_age_seconds=100)
+    store.create("done")
+    store.update("done", status="failed")
+    store.create("running")
+    now = time.monotonic()
+
+    assert store.sweep(now=now + 5) == 0
+    assert store.sweep(now=now + 20) == 1
+    assert "done" not in store and "running" in store
+
+    assert store.sweep(now=now + 200) == 1
+    assert store.evictions == {"ttl": 1, "max_age": 1, "capacity": 0}
+
+
+def test_persisted_results_released_after_grace():
+    store = _make_store(result_grace_seconds=30)
+    store.create("a", result={"big": "z" * 1000})
+    store.mark_persisted("a")
+    now = time.monotonic()
+
+    # 진행 중이면 유예 시간이 지나도 유지
+    store.sweep(now=now + 60)
+    assert store.get("a")["result"] is not None
+
+    store.update("a", status="completed")
+    store.sweep(now=time.monotonic() + 60)
+    job = store.get("a")
+    assert job["result"] is None
+    assert job["persisted"] and job["results_released"]
+    assert store.get_stats()["results_released"] == 1
+
+
+class _IndexedStore(BoundedJobStore):
+    def create(self, job_id: str, user_id: str, report_id: str):
+        return self._insert(job_id, {
+            "job_id": job_id, "status": "pending", "result": None,
+            "user_id": user_id, "report_id": report_id,
+        })
+
+
+def test_secondary_indexes_follow_create_update_delete():
+    store = _IndexedStore("test")
+    store.create("j1", "u1", "r1")
+    store.create("j2", "u1", "r1")
+    store.create("j3", "u2", "r2")
+
+    # 같은 리포트의 재시도 작업은 가장 최근 작업 반환
+    assert store.get_by("report_id", "r1")["job_id"] == "j2"
+    assert [job["job_id"] for job in store.find_by("user_id", "u1")] == ["j1", "j2"]
+
+    store.update("j2", report_id="r9")
+    assert store.get_by("report_id", "r1")["job_id"] == "j1"
+    assert store.get_by("report_id", "r9")["job_id"] == "j2"
+
+    store.delete("j1")
+    assert store.get_by("report_id", "r1") is None
+    assert store.get_by("analysis_id", "anything") is None
+
+
+def test_list_active_excludes_terminal_and_evicted_jobs():
+    store = _IndexedStore("test", max_entries=2)
+    store.create("j1", "u1", "r1")
+    store.create("j2", "u1", "r2")
+    store.update("j1", status="completed")
+
+    assert [job["job_id"] for job in store.list_active("u1")] == ["j2"]
+
+    # 용량 초과로 j1 제거 → 색인에서도 제거
+    store.create("j3", "u1", "r3")
+    assert "j1" not in store
+    assert [job["job_id"] for job in store.find_by("user_id", "u1")] == ["j2", "j3"]
+    assert store.get_by("report_id", "r1") is None
+
+
+def test_mark_interrupted_resets_running_steps():
+    store = _make_store()
+    store.create("a")
+    store.update("a", status="in_progress", step_statuses={"basic": "completed", "personality": "in_progress"})
+
+    job = store.mark_interrupted("a")
+
+    assert job["status"] == "pending" and job["interrupted"]
+    assert job["step_statuses"] == {"basic": "completed", "personality": "pending"}
+    assert store.mark_interrupted("missing") is None
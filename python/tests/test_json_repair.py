@@ -0,0 +1,72 @@
+"""
+JSON 로컬 복구 테스트
+잘린 JSON 닫기 / 스키마 타입 보정 / 부분 재생성 대상 필드 추출 검증
+"""
+import pytest
+from pydantic import BaseModel, Field, ValidationError
+
+from services.normalizers import (
+    build_partial_schema,
+    coerce_to_schema,
+    find_failed_fields,
+    parse_json_lenient,
+)
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "score": {"type": "integer", "description": "0-100 사이 점수"},
+        "summary": {"type": "string"},
+        "keywords": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["score", "summary"],
+}
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"a": 1, "b": [1, 2', {"a": 1, "b": [1, 2]}),
+    ('```json\n{"a": "잘린 문장', {"a": "잘린 문장"}),
+    ('{"a": [1, 2,], }', {"a": [1, 2]}),
+    ('응답입니다 {"a": 1} 이상입니다', {"a": 1}),
+    ('{"a": 1, "bc', {"a": 1}),
+    ('{"a": 1, "b":', {"a": 1, "b": None}),
+])
+def test_parse_json_lenient_repairs_broken_json(text, expected):
+    assert parse_json_lenient(text) == expected
+
+
+def test_parse_json_lenient_raises_when_unrecoverable():
+    with pytest.raises(ValueError):
+        parse_json_lenient("JSON이 아닌 응답")
+
+
+def test_coerce_to_schema_fixes_types_and_clamps():
+    result = coerce_to_schema(
+        {"score": "120점", "summary": 42, "keywords": "성실"}, SCHEMA
+    )
+    assert result == {"score": 100, "summary": "42", "keywords": ["성실"]}
+
+    assert coerce_to_schema({"score": 72.6, "summary": None}, SCHEMA) == {"score": 73}
+
+
+def test_find_failed_fields_combines_validation_errors_and_missing():
+    class Model(BaseModel):
+        score: int = Field(default=50, ge=0, le=100)
+        summary: str
+        keywords: list = Field(default_factory=list)
+
+    data = {"score": 50, "keywords": "not-a-list"}
+    with pytest.raises(ValidationError) as exc_info:
+        Model.model_validate(data)
+
+    assert find_failed_fields(exc_info.value, data, SCHEMA) == ["summary", "keywords"]
+
+
+def test_build_partial_schema():
+    partial = build_partial_schema(SCHEMA, ["summary"])
+    assert partial == {
+        "type": "object",
+        "properties": {"summary": {"type": "string"}},
+        "required": ["summary"],
+    }
@@ -0,0 +1,90 @@
+"""
+LLM 응답 캐시 테스트
+키 생성 / TTL / 최대 항목 수 / 통계 검증
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import services.gemini as gemini_module
+from services.llm_cache import LLMResponseCache, MISS, make_cache_key
+
+
+def test_cache_key_depends_on_all_inputs():
+    base = make_cache_key("model", "prompt", {"temperature": 0.7}, {"type": "object"})
+
+    assert base == make_cache_key("model", "prompt", {"temperature": 0.7}, {"type": "object"})
+    assert base != make_cache_key("other", "prompt", {"temperature": 0.7}, {"type": "object"})
+    assert base != make_cache_key("model", "prompt2", {"temperature": 0.7}, {"type": "object"})
+    assert base != make_cache_key("model", "prompt", {"temperature": 0.2}, {"type": "object"})
+    assert base != make_cache_key("model", "prompt", {"temperature": 0.7}, None)
+
+
+def test_hit_miss_and_stats(tmp_path):
+    cache = LLMResponseCache(path=str(tmp_path / "cache.sqlite3"))
+
+    assert cache.get("k") is MISS
+    cache.set("k", {"score": 80, "text": "좋음"}, latency=2.5)
+    assert cache.get("k") == {"score": 80, "text": "좋음"}
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["saved_seconds"] == 2.5
+    assert stats["entries"] == 1
+
+
+def test_ttl_expiry(tmp_path):
+    cache = LLMResponseCache(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=0)
+    cache.set("k", "v")
+    time.sleep(0.01)
+
+    assert cache.get("k") is MISS
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = LLMResponseCache(path=str(tmp_path / "cache.sqlite3"), max_entries=2)
+    cache.set("a", 1)
+    time.sleep(0.01)
+    cache.set("b", 2)
+    time.sleep(0.01)
+    cache.get("a")  # a를 최근 사용으로 갱신
+    time.sleep(0.01)
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISS
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_failed_validation_is_not_cached(tmp_path, monkeypatch):
+    cache = LLMResponseCache(path=str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(gemini_module, "get_llm_cache", lambda: cache)
+    service = object.__new__(gemini_module.GeminiService)
+    service.model_name = "test-model"
+    service.generation_config = {}
+    responses = iter(['{"summary": ""}', '{"summary": "좋음"}'])
+
+    async def fake_generate(prompt, timeout, step, **kwargs):
+        return SimpleNamespace(text=next(responses))
+
+    service._generate_content = fake_generate
+
+    def validate(result):
+        if not result.get("summary"):
+            raise ValueError("summary 없음")
+        return result
+
+    async def call():
+        return await service.generate_yearly_step("prompt", "yearly_overview", postprocess=validate)
+
+    # 검증 실패 응답은 캐시에 남지 않아 재시도가 새로 생성
+    with pytest.raises(ValueError):
+        asyncio.run(call())
+    assert asyncio.run(call()) == {"summary": "좋음"}
+    # 검증된 응답은 캐시에서 (추가 생성 없음)
+    assert asyncio.run(call()) == {"summary": "좋음"}
+    assert cache.get_stats()["entries"] == 1
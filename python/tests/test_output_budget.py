@@ -0,0 +1,42 @@
+"""
+단계별 max_output_tokens 자동 조정 테스트
+"""
+from types import SimpleNamespace
+
+from services.output_budget import OutputTokenBudget, extract_output_usage
+
+
+def test_default_until_enough_samples():
+    budget = OutputTokenBudget(min_samples=5)
+    for _ in range(4):
+        budget.record("daily_fortune", 900)
+
+    assert budget.budget("daily_fortune") == 8192
+
+
+def test_budget_is_p99_plus_margin_rounded():
+    budget = OutputTokenBudget(min_samples=5, margin=0.25, minimum=256)
+    for tokens in (1000, 1100, 1200, 1300, 1600):
+        budget.record("monthly_1_3", tokens)
+
+    # 1600 × 1.25 = 2000 → 256 단위 올림 2048
+    assert budget.budget("monthly_1_3") == 2048
+
+
+def test_truncation_raises_budget():
+    budget = OutputTokenBudget(min_samples=1, margin=0.0, minimum=256)
+    budget.record("classical_refs", 1024)
+    assert budget.budget("classical_refs") == 1024
+
+    budget.record("classical_refs", 1024, truncated=True)
+    assert budget.budget("classical_refs") == 2048
+    assert budget.truncations["classical_refs"] == 1
+
+
+def test_extract_output_usage():
+    response = SimpleNamespace(
+        usage_metadata=SimpleNamespace(candidates_token_count=321),
+        candidates=[SimpleNamespace(finish_reason=SimpleNamespace(name="MAX_TOKENS"))],
+    )
+    assert extract_output_usage(response) == (321, True)
+    assert extract_output_usage(SimpleNamespace()) == (0, False)
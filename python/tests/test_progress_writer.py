@@ -0,0 +1,98 @@
+"""
+진행 상태 쓰기 병합 (행별 병합 / 간격 제한 / 즉시 기록) 테스트
+"""
+import asyncio
+
+from services.progress_writer import ProgressWriter
+
+
+def _make_writer(interval_ms=50, fail=False):
+    writes = []
+
+    async def write(key, data):
+        writes.append((key, data))
+        return not fail
+
+    return ProgressWriter("test", write, interval_ms=interval_ms), writes
+
+
+def test_coalesces_updates_within_interval_and_keeps_latest_state():
+    writer, writes = _make_writer()
+    step_statuses = {"a": "in_progress"}
+
+    async def main():
+        # 첫 변경은 바로 기록
+        await writer.update("row-1", {"progress_percent": 0, "step_statuses": step_statuses})
+        for percent, step in ((10, "b"), (20, "c"), (30, "d")):
+            step_statuses[step] = "in_progress"
+            await writer.update("row-1", {"progress_percent": percent, "step_statuses": {step: "in_progress"}})
+        assert len(writes) == 1
+        # 간격이 지나면 타이머가 마지막 상태를 한 번에 기록
+        await asyncio.sleep(0.1)
+
+    asyncio.run(main())
+
+    assert len(writes) == 2
+    key, data = writes[1]
+    assert key == "row-1" and data["progress_percent"] == 30
+    assert data["step_statuses"] == {"b": "in_progress", "c": "in_progress", "d": "in_progress"}
+    # 첫 기록은 호출 시점 스냅샷 (이후 호출자 dict 변경 미반영)
+    assert writes[0][1]["step_statuses"] == {"a": "in_progress"}
+    assert writer.get_stats()["coalesced"] == 2
+
+
+def test_flush_and_final_write_pending_changes_immediately():
+    writer, writes = _make_writer(interval_ms=10_000)
+
+    async def main():
+        await writer.update("row-1", {"status": "in_progress", "progress_percent": 0})
+        await writer.update("row-1", {"progress_percent": 40, "pillars": {"day": "甲子"}})
+        await writer.update("row-1", {"progress_percent": 50}, flush=True)
+        await writer.update("row-2", {"status": "in_progress"})
+        await writer.update("row-1", {"status": "completed", "progress_percent": 100}, final=True)
+
+    asyncio.run(main())
+
+    assert [key for key, _ in writes] == ["row-1", "row-1", "row-2", "row-1"]
+    assert writes[1][1] == {"progress_percent": 50, "pillars": {"day": "甲子"}}
+    assert writes[3][1] == {"status": "completed", "progress_percent": 100}
+    stats = writer.get_stats()
+    assert (stats["updates"], stats["writes"], stats["pending_rows"]) == (5, 4, 0)
+
+
+def test_failed_write_is_counted():
+    writer, writes = _make_writer(fail=True)
+
+    assert asyncio.run(writer.update("row-1", {"status": "failed"}, final=True)) is False
+    assert writer.get_stats()["failures"] == 1
+    assert writer.get_stats()["pending_rows"] == 0
+
+
+def test_failed_write_is_requeued_and_retried():
+    writes = []
+    results = [False, True]
+
+    async def write(key, data):
+        writes.append((key, data))
+        return results.pop(0)
+
+    writer = ProgressWriter("test", write, interval_ms=50)
+
+    async def main():
+        saved = await writer.update(
+            "row-1", {"progress_percent": 10, "step_statuses": {"a": "completed"}}, flush=True
+        )
+        assert saved is False
+        # 실패한 변경은 대기 목록으로 돌아가고 이후 변경과 병합 (나중 값 우선)
+        await writer.update("row-1", {"progress_percent": 20, "step_statuses": {"b": "in_progress"}})
+        await asyncio.sleep(0.1)
+
+    asyncio.run(main())
+
+    assert len(writes) == 2
+    assert writes[1][1] == {
+        "progress_percent": 20,
+        "step_statuses": {"a": "completed", "b": "in_progress"},
+    }
+    stats = writer.get_stats()
+    assert (stats["writes"], stats["failures"], stats["pending_rows"]) == (1, 1, 0)
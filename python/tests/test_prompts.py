@@ -629,3 +629,93 @@ class TestClassicsSummaryIntegration:
         # 자평진전 + 궁통보감 핵심 내용 포함 확인
         assert '용신' in prompt or '격국' in prompt
         assert '조후' in prompt or '한난' in prompt or '寒暖' in prompt
+
+
+class TestPromptFragments:
+    """v2.10: 시스템 프롬프트 조각 레지스트리 테스트"""
+
+    SAMPLE_PILLARS = TestMultistepPrompts.SAMPLE_PILLARS
+
+    def test_system_prompt_shared_by_reference(self):
+        """같은 (언어, 단계) 조합은 같은 시스템 프롬프트 객체 재사용"""
+        first = PromptBuilder.build_step(step='basic', pillars=self.SAMPLE_PILLARS, language='ko')
+        second = PromptBuilder.build_step(step='basic', pillars=self.SAMPLE_PILLARS, language='ko')
+
+        assert first.system_prompt is second.system_prompt
+        assert first.metadata['system_prompt_hash'] == second.metadata['system_prompt_hash']
+
+    def test_fragment_matches_direct_render(self):
+        """조각 내용은 직접 렌더링한 시스템 프롬프트와 동일"""
+        from prompts.fragments import content_hash
+
+        response = PromptBuilder.build(PromptBuildRequest(language='en', pillars=self.SAMPLE_PILLARS))
+        direct = PromptBuilder._build_system_prompt('en', True, True, True)
+
+        assert response.system_prompt == direct
+        assert response.metadata['system_prompt_hash'] == content_hash(direct)
+
+    def test_hash_differs_by_options(self):
+        """모듈 옵션이 다르면 다른 조각"""
+        full = PromptBuilder.build(PromptBuildRequest(language='ko'))
+        minimal = PromptBuilder.build(PromptBuildRequest(
+            language='ko',
+            options=PromptBuildOptions(include_ziping=False, include_qiongtong=False)
+        ))
+
+        assert full.metadata['system_prompt_hash'] != minimal.metadata['system_prompt_hash']
+
+    def test_warm_fragments_registers_all_combinations(self):
+        """사전 렌더링: 5개 언어 × (8개 옵션 조합 + 4개 단계)"""
+        from prompts.fragments import fragment_registry
+
+        assert PromptBuilder.warm_fragments() >= 5 * (8 + 4)
+        response = PromptBuilder.build_step(step='fortune', pillars=self.SAMPLE_PILLARS, language='ja')
+        assert fragment_registry.get_by_hash(response.metadata['system_prompt_hash']).text == response.system_prompt
+
+    def test_fragment_id(self):
+        """조각 ID: 종류:언어:옵션 (bool은 1/0)"""
+        from prompts.fragments import fragment_registry
+
+        response = PromptBuilder.build(PromptBuildRequest(
+            language='ko',
+            options=PromptBuildOptions(include_western=False)
+        ))
+        fragment = fragment_registry.get_by_hash(response.metadata['system_prompt_hash'])
+
+        assert fragment.id == 'system:ko:1:1:0'
+
+
+class TestStepBundle:
+    """멀티스텝 전체 단계 프롬프트 일괄 빌드 (v2.10)"""
+
+    SAMPLE_PILLARS = TestMultistepPrompts.SAMPLE_PILLARS
+
+    def test_builds_all_steps_with_shared_context(self):
+        """4단계 모두 빌드, 단계별 시스템 프롬프트 조각은 build_step과 동일"""
+        bundle = PromptBuilder.build_step_bundle(pillars=self.SAMPLE_PILLARS, language='ko')
+
+        assert list(bundle) == ['basic', 'personality', 'aptitude', 'fortune']
+        for step, response in bundle.items():
+            single = PromptBuilder.build_step(step=step, pillars=self.SAMPLE_PILLARS, language='ko')
+            assert response.metadata['system_prompt_hash'] == single.metadata['system_prompt_hash']
+        # 서버 계산 분석 컨텍스트 (격국/십신) 포함
+        assert '격국' in bundle['personality'].user_prompt
+
+    def test_previous_results_placeholders(self):
+        """basic은 자리표시자 없음, 이후 단계는 자리표시자 → 치환"""
+        from prompts.builder import fill_previous_results, previous_result_placeholder
+
+        bundle = PromptBuilder.build_step_bundle(
+            pillars=self.SAMPLE_PILLARS, language='ko', steps=('basic', 'fortune')
+        )
+        marker = previous_result_placeholder('basicAnalysis.dayMaster.stem')
+
+        assert marker not in bundle['basic'].user_prompt
+        assert marker in bundle['fortune'].user_prompt
+
+        filled = fill_previous_results(
+            bundle['fortune'].user_prompt,
+            {'basicAnalysis': {'dayMaster': {'stem': '甲'}, 'structure': {'type': '식신격'}}}
+        )
+        assert '{{' not in filled
+        assert '甲' in filled and '식신격' in filled
@@ -0,0 +1,73 @@
+"""
+동일 요청 병합 (single-flight) 테스트
+"""
+import asyncio
+
+import pytest
+from services.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test")
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"value": 1}
+
+    async def main():
+        return await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert all(r == {"value": 1} for r in results)
+    # 대기자는 독립된 복사본을 받음
+    assert len({id(r) for r in results}) == 5
+    assert flight.coalesced == 4
+
+
+def test_leader_error_propagates_and_key_is_released():
+    flight = SingleFlight("test")
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def ok():
+        return "ok"
+
+    async def main():
+        results = await asyncio.gather(
+            flight.do("k", boom), flight.do("k", boom), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+        return await flight.do("k", ok)
+
+    assert asyncio.run(main()) == "ok"
+
+
+
+def test_followers_retry_when_leader_is_cancelled():
+    flight = SingleFlight("test")
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def main():
+        leader = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do("k", work)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*followers)
+
+    # 대기자는 취소되지 않고 새 leader 1개의 결과를 공유
+    assert asyncio.run(main()) == [2, 2]
+    assert len(calls) == 2
@@ -0,0 +1,140 @@
+"""
+작업 상태 공유 백엔드 (여러 워커 프로세스의 상태 폴링) 테스트
+"""
+import asyncio
+import threading
+import time
+from enum import Enum
+
+from services.job_store import BoundedJobStore
+from services.status_backend import RedisStatusBackend, SQLiteStatusBackend, StatusBackend
+
+
+class _Status(str, Enum):
+    PENDING = "pending"
+    COMPLETED = "completed"
+
+
+class _Store(BoundedJobStore):
+    LOCAL_FIELDS = ("context",)
+
+    def create(self, job_id: str):
+        return self._insert(job_id, {
+            "job_id": job_id, "status": _Status.PENDING, "result": None, "context": object(),
+        })
+
+
+class _FakeRedis:
+    """get / set(ex) / delete만 제공하는 Redis 대역"""
+
+    def __init__(self):
+        self.data = {}
+
+    def set(self, key, value, ex=None):
+        self.data[key] = (value.encode("utf-8"), time.time() + ex)
+
+    def get(self, key):
+        value, expires = self.data.get(key, (None, 0))
+        return value if expires > time.time() else None
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+def test_memory_backend_does_not_share():
+    worker_a = _Store("test", backend=StatusBackend())
+    worker_b = _Store("test", backend=StatusBackend())
+    worker_a.create("job-1")
+
+    assert asyncio.run(worker_b.fetch("job-1")) is None
+
+
+def test_sqlite_backend_shares_status_between_workers(tmp_path):
+    path = str(tmp_path / "status.sqlite3")
+    worker_a = _Store("test", backend=SQLiteStatusBackend(path))
+    worker_b = _Store("test", backend=SQLiteStatusBackend(path))
+
+    worker_a.create("job-1")
+    worker_a.update("job-1", result={"score": 40})
+
+    # 진행 중 작업은 상태 필드만 공유
+    assert asyncio.run(worker_b.fetch("job-1"))["result"] is None
+
+    worker_a.update("job-1", status=_Status.COMPLETED, result={"score": 90})
+
+    job = asyncio.run(worker_b.fetch("job-1"))
+    assert job["status"] == "completed"
+    assert job["result"] == {"score": 90}
+    # 직렬화 불가 필드는 기록하지 않음
+    assert "context" not in job
+    assert "job-1" not in worker_b
+
+    # 결과 조회 생략 (상태만)
+    assert asyncio.run(worker_b.fetch("job-1", results=False))["result"] is None
+
+    worker_a.delete("job-1")
+    assert asyncio.run(worker_b.fetch("job-1")) is None
+
+
+def test_handoff_keeps_snapshot_for_other_workers():
+    backend = RedisStatusBackend(_FakeRedis())
+    api_worker = _Store("test", backend=backend)
+    queue_worker = _Store("test", backend=backend)
+
+    api_worker.create("job-1")
+    api_worker.handoff("job-1")
+    assert "job-1" not in api_worker
+    assert asyncio.run(api_worker.fetch("job-1"))["status"] == "pending"
+
+    # 작업을 가져간 워커가 항목을 다시 만들고 갱신 → 요청을 받은 워커에서도 조회
+    queue_worker.create("job-1")
+    queue_worker.update("job-1", progress_percent=40)
+    assert asyncio.run(api_worker.fetch("job-1"))["progress_percent"] == 40
+
+
+def test_backend_errors_do_not_break_updates():
+    class _Broken(StatusBackend):
+        shared = True
+
+        def put(self, namespace, job_id, job, ttl_seconds):
+            raise ConnectionError("down")
+
+    store = _Store("test", backend=_Broken())
+    store.create("job-1")
+    store.update("job-1", status=_Status.COMPLETED)
+
+    assert store.get("job-1")["status"] == _Status.COMPLETED
+    # 생성 1회 + 종료 (상태 / 결과) 2회
+    assert store.get_stats()["backend_errors"] == 3
+
+
+def test_publishes_are_coalesced_off_the_event_loop():
+    class _Recording(StatusBackend):
+        shared = True
+
+        def __init__(self):
+            self.puts = []
+            self.threads = set()
+
+        def put(self, namespace, job_id, job, ttl_seconds):
+            self.threads.add(threading.get_ident())
+            self.puts.append((namespace, job.get("progress_percent")))
+
+    backend = _Recording()
+    store = _Store("test", backend=backend, publish_interval_ms=50)
+
+    async def main():
+        store.create("job-1")
+        await asyncio.sleep(0.01)
+        for percent in range(10, 60, 10):
+            store.update("job-1", progress_percent=percent)
+        await asyncio.sleep(0.1)
+        store.update("job-1", status=_Status.COMPLETED, result={"score": 90}, progress_percent=100)
+        await store.flush_publishes()
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+
+    # 생성 → 병합된 진행률 1회 → 종료 (상태 + 결과)
+    assert backend.puts == [("test", None), ("test", 50), ("test", 100), ("test:results", None)]
+    assert loop_thread not in backend.threads
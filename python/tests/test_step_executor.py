@@ -0,0 +1,194 @@
+"""
+DAG 단계 실행기 테스트
+의존 순서 / 병렬 실행 / 재시도 / Fallback / critical 실패 / 체크포인트 복원 검증
+"""
+import asyncio
+
+import pytest
+from services.step_executor import StepExecutor, StepSpec, downstream_steps
+
+
+class DummyStore:
+    """update() / update_step_status()만 제공하는 테스트용 작업 저장소"""
+
+    def __init__(self):
+        self.job = {"step_statuses": {}, "progress_percent": 0, "current_step": None}
+
+    def update(self, job_id, **kwargs):
+        self.job.update(kwargs)
+
+    def update_step_status(self, job_id, step, status):
+        self.job["step_statuses"][step] = status
+
+
+def run(executor):
+    return asyncio.run(executor.run())
+
+
+def test_dependencies_run_in_order():
+    order = []
+
+    def step(name):
+        async def _run(ctx):
+            order.append(name)
+            return name
+        return _run
+
+    store = DummyStore()
+    executor = StepExecutor(
+        [
+            StepSpec("c", step("c"), depends_on=("a", "b")),
+            StepSpec("a", step("a")),
+            StepSpec("b", step("b"), depends_on=("a",)),
+        ],
+        store,
+        "job",
+    )
+    results = run(executor)
+
+    assert order == ["a", "b", "c"]
+    assert results == {"a": "a", "b": "b", "c": "c"}
+    assert store.job["step_statuses"] == {"a": "completed", "b": "completed", "c": "completed"}
+    assert store.job["progress_percent"] == 99
+
+
+def test_independent_steps_run_concurrently():
+    active = {"now": 0, "max": 0}
+
+    async def slow(ctx):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+
+    executor = StepExecutor(
+        [StepSpec(name, slow) for name in ("x", "y", "z")],
+        DummyStore(),
+        "job",
+    )
+    run(executor)
+
+    assert active["max"] == 3
+
+
+def test_retry_passes_last_error():
+    errors = []
+
+    async def flaky(ctx):
+        errors.append(ctx.last_error)
+        if ctx.attempt < 3:
+            raise ValueError(f"시도 {ctx.attempt}")
+        return "ok"
+
+    executor = StepExecutor([StepSpec("s", flaky, max_attempts=3)], DummyStore(), "job")
+
+    assert run(executor) == {"s": "ok"}
+    assert errors == [None, "시도 1", "시도 2"]
+
+
+def test_fallback_and_non_critical_failure_continue():
+    failed = []
+
+    async def boom(ctx):
+        raise RuntimeError("boom")
+
+    async def on_failure(ctx, error):
+        failed.append(ctx.step)
+
+    async def after(ctx):
+        return (ctx.results["fb"], ctx.results["soft"])
+
+    store = DummyStore()
+    executor = StepExecutor(
+        [
+            StepSpec("fb", boom, fallback=lambda ctx, e: {"default": True}),
+            StepSpec("soft", boom, critical=False),
+            StepSpec("after", after, depends_on=("fb", "soft")),
+        ],
+        store,
+        "job",
+        on_failure=on_failure,
+    )
+    results = run(executor)
+
+    assert results["after"] == ({"default": True}, None)
+    assert sorted(failed) == ["fb", "soft"]
+    assert store.job["step_statuses"]["soft"] == "failed"
+
+
+def test_critical_failure_stops_pipeline():
+    ran = []
+
+    async def boom(ctx):
+        raise RuntimeError("boom")
+
+    async def never(ctx):
+        ran.append(ctx.step)
+
+    store = DummyStore()
+    executor = StepExecutor(
+        [StepSpec("a", boom), StepSpec("b", never, depends_on=("a",))],
+        store,
+        "job",
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run(executor)
+    assert ran == []
+    assert store.job["current_step"] == "a"
+
+
+def test_invalid_graph_rejected():
+    async def noop(ctx):
+        return None
+
+    with pytest.raises(ValueError):
+        StepExecutor([StepSpec("a", noop, depends_on=("missing",))], DummyStore(), "job")
+    with pytest.raises(ValueError):
+        StepExecutor(
+            [StepSpec("a", noop, depends_on=("b",)), StepSpec("b", noop, depends_on=("a",))],
+            DummyStore(),
+            "job",
+        )
+
+
+def test_restored_steps_are_skipped():
+    ran = []
+
+    async def step(ctx):
+        ran.append(ctx.step)
+        return ctx.results["a"] + 1
+
+    store = DummyStore()
+    executor = StepExecutor(
+        [
+            StepSpec("a", step, weight=50),
+            StepSpec("b", step, depends_on=("a",), weight=50),
+            StepSpec("c", step, depends_on=("a",)),
+        ],
+        store,
+        "job",
+        restored={"a": 1, "c": 5, "unknown": 0},
+    )
+    results = run(executor)
+
+    assert ran == ["b"]
+    assert results == {"a": 1, "b": 2, "c": 5}
+    assert store.job["step_statuses"] == {"a": "completed", "b": "completed", "c": "completed"}
+    assert store.job["progress_percent"] == 99
+
+
+def test_downstream_steps_include_transitive_dependents():
+    async def noop(ctx):
+        return None
+
+    steps = [
+        StepSpec("a", noop),
+        StepSpec("b", noop, depends_on=("a",)),
+        StepSpec("c", noop, depends_on=("b",)),
+        StepSpec("d", noop),
+    ]
+
+    assert downstream_steps(steps, ["b"]) == {"b", "c"}
+    assert downstream_steps(steps, ["a"]) == {"a", "b", "c"}
+    assert downstream_steps(steps, [None]) == set()
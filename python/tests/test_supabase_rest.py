@@ -0,0 +1,65 @@
+"""
+Supabase REST 공유 클라이언트 (인증 헤더 / 연결 재사용 / 풀 통계) 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from services.supabase_rest import SupabaseRestClient
+
+
+def _make_client(handler) -> SupabaseRestClient:
+    return SupabaseRestClient(
+        url="https://db.example.com", key="service-key", http2=False,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_requests_share_client_and_auth_headers():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=[{"id": "r1"}])
+
+    rest = _make_client(handler)
+
+    async def main():
+        first = await rest.get("profile_reports", params={"id": "eq.r1"})
+        await rest.patch("profile_reports?id=eq.r1", json={"status": "completed"}, headers={"Prefer": "return=minimal"})
+        await rest.aclose()
+        return first.json()
+
+    assert asyncio.run(main()) == [{"id": "r1"}]
+    assert str(seen[0].url) == "https://db.example.com/rest/v1/profile_reports?id=eq.r1"
+    assert seen[1].method == "PATCH"
+    assert all(request.headers["apikey"] == "service-key" for request in seen)
+    assert seen[1].headers["Authorization"] == "Bearer service-key"
+    assert seen[1].headers["Prefer"] == "return=minimal"
+
+    stats = rest.get_stats()
+    assert (stats["requests"], stats["in_flight"], stats["errors"], stats["clients_created"]) == (2, 0, 0, 1)
+
+
+def test_tracks_peak_in_flight_and_errors():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("broken"):
+            raise httpx.ConnectError("down", request=request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=[])
+
+    rest = _make_client(handler)
+
+    async def main():
+        await asyncio.gather(*(rest.get("daily_fortunes") for _ in range(3)))
+        with pytest.raises(httpx.ConnectError):
+            await rest.get("broken")
+
+    asyncio.run(main())
+    stats = rest.get_stats()
+    assert stats["peak_in_flight"] == 3
+    assert (stats["requests"], stats["errors"], stats["in_flight"]) == (4, 1, 0)
+    # asyncio.run마다 새 이벤트 루프 → 클라이언트 재생성
+    asyncio.run(rest.get("daily_fortunes"))
+    assert rest.get_stats()["clients_created"] == 2
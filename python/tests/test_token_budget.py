@@ -0,0 +1,79 @@
+"""
+토큰 예산 기반 프롬프트 조립 테스트
+토큰 추정 / 우선순위 제외 / 요약 대체 / 단계별 메타데이터 검증
+"""
+from prompts.builder import PromptBuilder
+from prompts.token_budget import PromptSection, assemble_sections, estimate_tokens
+
+SAMPLE_PILLARS = {
+    'year': {'stem': '庚', 'branch': '午'},
+    'month': {'stem': '辛', 'branch': '巳'},
+    'day': {'stem': '甲', 'branch': '子'},
+    'hour': {'stem': '辛', 'branch': '未'},
+}
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_tokens("가나다") == 2
+
+
+def test_within_budget_keeps_everything():
+    sections = [
+        PromptSection("a", "x" * 40, priority=10),
+        PromptSection("b", "y" * 40, priority=90),
+    ]
+    result = assemble_sections(sections, budget=100)
+
+    assert result.text() == "x" * 40 + "\n" + "y" * 40
+    assert result.dropped == [] and result.summarized == []
+    assert result.estimated_tokens == 20
+
+
+def test_drops_lowest_priority_first_and_keeps_order():
+    sections = [
+        PromptSection("head", "h" * 40, required=True),
+        PromptSection("low", "l" * 400, priority=10),
+        PromptSection("mid", "m" * 40, priority=50),
+        PromptSection("tail", "t" * 40, required=True),
+    ]
+    result = assemble_sections(sections, budget=40)
+
+    assert [s.name for s in result.sections] == ["head", "mid", "tail"]
+    assert result.dropped == ["low"]
+    assert result.report()["budget"] == 40
+
+
+def test_summary_replaces_before_drop():
+    sections = [
+        PromptSection("req", "r" * 40, required=True),
+        PromptSection("history", "h" * 400, priority=10, summary="h" * 40),
+    ]
+    result = assemble_sections(sections, budget=30)
+
+    assert result.get("history") == "h" * 40
+    assert result.summarized == ["history"]
+    assert result.dropped == []
+
+
+def test_required_sections_never_dropped():
+    result = assemble_sections([PromptSection("req", "r" * 400, required=True)], budget=10)
+
+    assert result.get("req") == "r" * 400
+    assert result.estimated_tokens > result.budget
+
+
+def test_build_step_reports_budget():
+    sinsals = {"unlucky": [{"name": f"신살{i}", "description": "설명 " * 200} for i in range(10)]}
+    response = PromptBuilder.build_step(
+        step='personality',
+        pillars=SAMPLE_PILLARS,
+        language='ko',
+        sinsals=sinsals,
+    )
+    report = response.metadata['token_budget']
+
+    assert report['dropped'] == ['sinsal']
+    assert report['estimated_tokens'] <= report['budget']
+    assert report['system_tokens'] > 0
@@ -365,6 +365,14 @@ export async function POST(request: NextRequest) {
 
       const errorData = await pythonResponse.json().catch(() => ({}));
       console.error('[API] Python API 호출 실패:', errorData);
+      if (pythonResponse.status === 429) {
+        // Python 수용 제어: 대기 작업 한도 초과 → Retry-After 전달
+        return NextResponse.json(createErrorResponse(API_ERRORS.RATE_LIMITED), {
+          status: getStatusCode(API_ERRORS.RATE_LIMITED),
+          headers: { 'Retry-After': pythonResponse.headers.get('retry-after') || '30' },
+        });
+      }
+
       return NextResponse.json(
         createErrorResponse(API_ERRORS.EXTERNAL_SERVICE_ERROR, undefined, errorData.detail),
         { status: getStatusCode(API_ERRORS.EXTERNAL_SERVICE_ERROR) }
@@ -338,6 +338,16 @@ export async function POST(request: NextRequest) {
     if (!pythonResponse.ok) {
       const errorData = await pythonResponse.json().catch(() => ({}));
       console.error('[DailyFortune] Python API 오류:', errorData);
+      if (pythonResponse.status === 429) {
+        // Python 수용 제어: 동시 생성 한도 초과 → Retry-After 전달
+        return NextResponse.json(
+          { success: false, error: errorData.detail || '요청이 많습니다. 잠시 후 다시 시도해주세요' },
+          {
+            status: 429,
+            headers: { 'Retry-After': pythonResponse.headers.get('retry-after') || '30' },
+          }
+        );
+      }
       return NextResponse.json(
         {
           success: false,
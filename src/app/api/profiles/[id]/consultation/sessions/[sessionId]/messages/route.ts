@@ -290,7 +290,7 @@ export async function POST(request: NextRequest, context: RouteContext) {
       const language = acceptLanguage.split(',')[0]?.split('-')[0] || 'ko';
 
       try {
-        await fetch(`${pythonApiUrl}/api/consultation/generate`, {
+        const pythonResponse = await fetch(`${pythonApiUrl}/api/consultation/generate`, {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
           body: JSON.stringify({
@@ -304,8 +304,19 @@ export async function POST(request: NextRequest, context: RouteContext) {
             language: language,
             profile_id: profileId,
             profile_name: profile?.name || '사용자',
+            user_id: user.id,
           }),
         });
+        if (pythonResponse.status === 429) {
+          // Python 수용 제어: 대기 작업 한도 초과 → 재시도 가능한 실패로 표시
+          await supabase
+            .from('consultation_messages')
+            .update({
+              status: 'failed',
+              error_message: '요청이 많아 응답을 생성하지 못했습니다. 잠시 후 다시 시도해주세요.',
+            })
+            .eq('id', aiMessage.id);
+        }
       } catch (err) {
         console.error('[ConsultationMessages] Python 백엔드 호출 실패:', err);
         // Python 호출 실패 시 AI 메시지를 failed로 업데이트
@@ -463,7 +474,7 @@ export async function PATCH(request: NextRequest, context: RouteContext) {
 
     if (pythonApiUrl) {
       try {
-        await fetch(`${pythonApiUrl}/api/consultation/generate`, {
+        const pythonResponse = await fetch(`${pythonApiUrl}/api/consultation/generate`, {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
           body: JSON.stringify({
@@ -477,8 +488,19 @@ export async function PATCH(request: NextRequest, context: RouteContext) {
             language: language,
             profile_id: profileId,
             profile_name: profile?.name || '사용자',
+            user_id: user.id,
           }),
         });
+        if (pythonResponse.status === 429) {
+          // Python 수용 제어: 대기 작업 한도 초과 → 재시도 가능한 실패로 표시
+          await supabase
+            .from('consultation_messages')
+            .update({
+              status: 'failed',
+              error_message: '요청이 많아 응답을 생성하지 못했습니다. 잠시 후 다시 시도해주세요.',
+            })
+            .eq('id', messageId);
+        }
         console.log(`[ConsultationMessages] 재생성 요청 전송: ${messageId}`);
       } catch (err) {
         console.error('[ConsultationMessages] 재생성 Python 호출 실패:', err);
@@ -1281,6 +1281,14 @@ export async function POST(request: NextRequest, { params }: { params: Promise<{
           })
           .eq('id', reportId);
 
+        if (pythonResponse.status === 429) {
+          // Python 수용 제어: 대기 작업 한도 초과 → Retry-After 전달
+          return NextResponse.json(createErrorResponse(API_ERRORS.RATE_LIMITED), {
+            status: getStatusCode(API_ERRORS.RATE_LIMITED),
+            headers: { 'Retry-After': pythonResponse.headers.get('retry-after') || '30' },
+          });
+        }
+
         return NextResponse.json(createErrorResponse(API_ERRORS.EXTERNAL_SERVICE_ERROR), {
           status: getStatusCode(API_ERRORS.EXTERNAL_SERVICE_ERROR),
         });
@@ -0,0 +1,75 @@
+/**
+ * GET /api/user/active-jobs
+ * 로그인 사용자의 진행 중 분석 작업 목록 (리포트 / 신년 / 궁합)
+ *
+ * v2.10: Python 작업 저장소 user_id 색인 조회 (GET /api/jobs/active)
+ */
+import { NextResponse } from 'next/server';
+import { getAuthenticatedUser } from '@/lib/supabase/server';
+import { AUTH_ERRORS, API_ERRORS, createErrorResponse, getStatusCode } from '@/lib/errors/codes';
+
+interface PythonActiveJob {
+  job_id: string;
+  job_type: 'report' | 'yearly' | 'compatibility';
+  status: string;
+  progress_percent: number;
+  current_step: string | null;
+  report_id: string | null;
+  analysis_id: string | null;
+  created_at: string;
+  updated_at: string;
+}
+
+/**
+ * Python API URL 가져오기
+ */
+function getPythonApiUrl(): string {
+  let pythonApiUrl = process.env.PYTHON_API_URL || 'http://localhost:8000';
+  if (!pythonApiUrl.startsWith('http://') && !pythonApiUrl.startsWith('https://')) {
+    pythonApiUrl = `https://${pythonApiUrl}`;
+  }
+  return pythonApiUrl;
+}
+
+export async function GET() {
+  try {
+    const user = await getAuthenticatedUser();
+    if (!user) {
+      return NextResponse.json(createErrorResponse(AUTH_ERRORS.UNAUTHORIZED), {
+        status: getStatusCode(AUTH_ERRORS.UNAUTHORIZED),
+      });
+    }
+
+    const response = await fetch(
+      `${getPythonApiUrl()}/api/jobs/active?user_id=${encodeURIComponent(user.id)}`,
+      { cache: 'no-store' }
+    );
+    if (!response.ok) {
+      console.error('[API] 진행 중 작업 조회 실패:', response.status);
+      return NextResponse.json(createErrorResponse(API_ERRORS.EXTERNAL_SERVICE_ERROR), {
+        status: getStatusCode(API_ERRORS.EXTERNAL_SERVICE_ERROR),
+      });
+    }
+
+    const data = (await response.json()) as { jobs: PythonActiveJob[] };
+    return NextResponse.json({
+      success: true,
+      data: data.jobs.map((job) => ({
+        jobId: job.job_id,
+        jobType: job.job_type,
+        status: job.status,
+        progressPercent: job.progress_percent,
+        currentStep: job.current_step,
+        reportId: job.report_id,
+        analysisId: job.analysis_id,
+        createdAt: job.created_at,
+        updatedAt: job.updated_at,
+      })),
+    });
+  } catch (error) {
+    console.error('[API] 진행 중 작업 조회 오류:', error);
+    return NextResponse.json(createErrorResponse(API_ERRORS.SERVER_ERROR), {
+      status: getStatusCode(API_ERRORS.SERVER_ERROR),
+    });
+  }
+}
@@ -0,0 +1,74 @@
+/**
+ * GET /api/user/jobs/[id]/events
+ * 분석 작업 진행 이벤트 스트림 (Server-Sent Events, 리포트 / 신년 / 궁합)
+ *
+ * v2.10: 상태 폴링 대체 - Python GET /api/jobs/{job_id}/events 스트림 중계
+ * - 이벤트: snapshot / progress / step / partial / done (주기적 ping)
+ * - 재연결 시 Last-Event-ID 헤더 전달 → 놓친 이벤트부터 이어받기
+ */
+import { NextRequest, NextResponse } from 'next/server';
+import { getAuthenticatedUser } from '@/lib/supabase/server';
+import { AUTH_ERRORS, API_ERRORS, createErrorResponse, getStatusCode } from '@/lib/errors/codes';
+
+export const dynamic = 'force-dynamic';
+
+/**
+ * Python API URL 가져오기
+ */
+function getPythonApiUrl(): string {
+  let pythonApiUrl = process.env.PYTHON_API_URL || 'http://localhost:8000';
+  if (!pythonApiUrl.startsWith('http://') && !pythonApiUrl.startsWith('https://')) {
+    pythonApiUrl = `https://${pythonApiUrl}`;
+  }
+  return pythonApiUrl;
+}
+
+export async function GET(request: NextRequest, { params }: { params: Promise<{ id: string }> }) {
+  try {
+    const user = await getAuthenticatedUser();
+    if (!user) {
+      return NextResponse.json(createErrorResponse(AUTH_ERRORS.UNAUTHORIZED), {
+        status: getStatusCode(AUTH_ERRORS.UNAUTHORIZED),
+      });
+    }
+
+    const { id: jobId } = await params;
+    const lastEventId = request.headers.get('last-event-id');
+
+    // 작업 소유자 확인은 Python이 user_id로 처리 (다르면 404)
+    const response = await fetch(
+      `${getPythonApiUrl()}/api/jobs/${encodeURIComponent(jobId)}/events?user_id=${encodeURIComponent(user.id)}`,
+      {
+        cache: 'no-store',
+        headers: lastEventId ? { 'Last-Event-ID': lastEventId } : undefined,
+        signal: request.signal,
+      }
+    );
+
+    if (response.status === 404) {
+      return NextResponse.json(createErrorResponse(API_ERRORS.NOT_FOUND), {
+        status: getStatusCode(API_ERRORS.NOT_FOUND),
+      });
+    }
+    if (!response.ok || !response.body) {
+      console.error('[API] 작업 이벤트 스트림 연결 실패:', response.status);
+      return NextResponse.json(createErrorResponse(API_ERRORS.EXTERNAL_SERVICE_ERROR), {
+        status: getStatusCode(API_ERRORS.EXTERNAL_SERVICE_ERROR),
+      });
+    }
+
+    return new Response(response.body, {
+      headers: {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache, no-transform',
+        Connection: 'keep-alive',
+        'X-Accel-Buffering': 'no',
+      },
+    });
+  } catch (error) {
+    console.error('[API] 작업 이벤트 스트림 오류:', error);
+    return NextResponse.json(createErrorResponse(API_ERRORS.SERVER_ERROR), {
+      status: getStatusCode(API_ERRORS.SERVER_ERROR),
+    });
+  }
+}
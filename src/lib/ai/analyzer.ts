@@ -5,6 +5,7 @@
  */
 import { getGeminiModel } from './gemini';
 import { generateAnalysisPrompt, generateFollowUpPrompt } from './prompts';
+import { fetchPromptFragment, type PromptFragmentRef } from './prompt-fragments';
 import type {
   GeminiAnalysisInput,
   SajuAnalysisResult,
@@ -29,10 +30,19 @@ interface PromptBuildResponse {
     version: string;
     language: string;
     includedModules: string[];
+    systemPromptHash?: string;
     generatedAt: string;
   };
 }
 
+/**
+ * reference 모드 응답 (시스템 프롬프트 본문 대신 조각 참조)
+ */
+type PromptReferenceResponse = Omit<PromptBuildResponse, 'systemPrompt'> & {
+  systemPrompt?: string | null;
+  systemPromptRef?: PromptFragmentRef | null;
+};
+
 /**
  * SajuAnalyzer 클래스
  * 사주 분석의 핵심 비즈니스 로직 담당
@@ -53,6 +63,29 @@ export class SajuAnalyzer {
     this.pythonApiUrl = apiUrl;
   }
 
+  /**
+   * reference 모드 응답의 시스템 프롬프트 조각 본문 채우기
+   * 캐시에 없는 조각만 /api/prompts/fragments/{hash}에서 1회 조회
+   */
+  private async resolveSystemPrompt(
+    data: PromptReferenceResponse
+  ): Promise<PromptBuildResponse | null> {
+    if (data.systemPrompt) {
+      return data as PromptBuildResponse;
+    }
+    const ref = data.systemPromptRef;
+    if (!ref) {
+      return null;
+    }
+
+    const systemPrompt = await fetchPromptFragment(this.pythonApiUrl, ref);
+    if (systemPrompt === null) {
+      return null;
+    }
+
+    return { ...data, systemPrompt };
+  }
+
   /**
    * Python API에서 프롬프트 빌드
    * 실패 시 null 반환 (폴백 사용)
@@ -73,6 +106,7 @@ export class SajuAnalyzer {
             includeQiongtong: true,
             includeWestern: true, // 모든 언어에 적용
           },
+          responseMode: 'reference',
         }),
       });
 
@@ -81,7 +115,7 @@ export class SajuAnalyzer {
         return null;
       }
 
-      return await response.json();
+      return await this.resolveSystemPrompt(await response.json());
     } catch (error) {
       console.warn('[SajuAnalyzer] Python 프롬프트 API 오류, 폴백 사용:', error);
       return null;
@@ -247,6 +281,7 @@ export class SajuAnalyzer {
             includeQiongtong: true,
             includeWestern: true,
           },
+          responseMode: 'reference',
         }),
       });
 
@@ -255,7 +290,7 @@ export class SajuAnalyzer {
         return null;
       }
 
-      return await response.json();
+      return await this.resolveSystemPrompt(await response.json());
     } catch (error) {
       console.warn('[SajuAnalyzer] Python 신년 프롬프트 API 오류:', error);
       return null;
@@ -18,7 +18,9 @@ import type {
   FortuneResult,
   JijangganData,
   StepPromptResponse,
+  StepBundleResponse,
 } from '../types';
+import { fetchPromptFragment } from '../prompt-fragments';
 import { extractTenGods } from '../../score/ten-gods';
 import type { TenGodCounts } from '../../score/types';
 import type {
@@ -40,6 +42,11 @@ import { StepExecutor } from './step-executor';
 export class AnalysisPipeline {
   private context: PipelineContext;
   private executor: StepExecutor;
+  /** v2.10: 단계 프롬프트 번들 (실행당 1회 요청) */
+  private stepBundle: {
+    language: SupportedLanguage;
+    promise: Promise<StepBundleResponse | null>;
+  } | null = null;
 
   constructor(options?: PipelineOptions) {
     this.context = new PipelineContext(options);
@@ -354,17 +361,16 @@ export class AnalysisPipeline {
     step: 'basic' | 'personality' | 'aptitude' | 'fortune',
     language: SupportedLanguage
   ): Promise<string> {
+    // v2.10: 단계 번들 우선 (실패 시 단계별 API)
+    const bundled = await this.promptFromBundle(step, language);
+    if (bundled) {
+      return bundled;
+    }
+
     const { manseryeok, basicAnalysis } = this.context.intermediateResults;
 
     // v3.0: 십신 분포 계산 (personality, aptitude, fortune 단계)
-    let tenGodCounts: TenGodCounts | undefined;
-    if (step !== 'basic' && manseryeok?.pillars && manseryeok?.jijanggan) {
-      try {
-        tenGodCounts = extractTenGods(manseryeok.pillars, manseryeok.jijanggan);
-      } catch (e) {
-        console.warn('[AnalysisPipeline] 십신 추출 실패:', e);
-      }
-    }
+    const tenGodCounts = step !== 'basic' ? this.computeTenGodCounts() : undefined;
 
     try {
       const response = await fetch(`${this.context.pythonApiUrl}/api/prompts/step`, {
@@ -394,6 +400,90 @@ export class AnalysisPipeline {
     }
   }
 
+  private computeTenGodCounts(): TenGodCounts | undefined {
+    const { manseryeok } = this.context.intermediateResults;
+    if (!manseryeok?.pillars || !manseryeok?.jijanggan) {
+      return undefined;
+    }
+    try {
+      return extractTenGods(manseryeok.pillars, manseryeok.jijanggan);
+    } catch (e) {
+      console.warn('[AnalysisPipeline] 십신 추출 실패:', e);
+      return undefined;
+    }
+  }
+
+  /**
+   * v2.10: 4단계 프롬프트 번들 (사주를 한 번만 전송, 언어별 1회 요청)
+   */
+  private fetchStepBundle(language: SupportedLanguage): Promise<StepBundleResponse | null> {
+    if (!this.stepBundle || this.stepBundle.language !== language) {
+      this.stepBundle = { language, promise: this.requestStepBundle(language) };
+    }
+    return this.stepBundle.promise;
+  }
+
+  private async requestStepBundle(language: SupportedLanguage): Promise<StepBundleResponse | null> {
+    const { manseryeok } = this.context.intermediateResults;
+
+    try {
+      const response = await fetch(`${this.context.pythonApiUrl}/api/prompts/steps/bundle`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+          language,
+          pillars: manseryeok?.pillars,
+          daewun: manseryeok?.daewun,
+          jijanggan: manseryeok?.jijanggan,
+          tenGodCounts: this.computeTenGodCounts(),
+          responseMode: 'reference',
+        }),
+      });
+
+      if (!response.ok) {
+        console.warn('[AnalysisPipeline] 단계 프롬프트 번들 API 실패, 단계별 API 사용');
+        return null;
+      }
+      return (await response.json()) as StepBundleResponse;
+    } catch (error) {
+      console.warn('[AnalysisPipeline] 단계 프롬프트 번들 API 오류, 단계별 API 사용:', error);
+      return null;
+    }
+  }
+
+  /**
+   * 번들에서 단계 프롬프트 조립 (시스템 프롬프트 조각 조회 + 이전 단계 결과 치환)
+   */
+  private async promptFromBundle(
+    step: 'basic' | 'personality' | 'aptitude' | 'fortune',
+    language: SupportedLanguage
+  ): Promise<string | null> {
+    const bundle = await this.fetchStepBundle(language);
+    const entry = bundle?.steps[step];
+    if (!bundle || !entry) {
+      return null;
+    }
+
+    try {
+      const systemPrompt =
+        entry.systemPrompt ??
+        (entry.systemPromptRef
+          ? await fetchPromptFragment(this.context.pythonApiUrl, entry.systemPromptRef)
+          : null);
+      if (systemPrompt === null) {
+        return null;
+      }
+
+      const userPrompt = fillPreviousResults(entry.userPrompt, bundle.placeholders, {
+        basicAnalysis: this.context.intermediateResults.basicAnalysis,
+      });
+      return `${systemPrompt}\n\n${userPrompt}`;
+    } catch (error) {
+      console.warn(`[AnalysisPipeline] ${step} 번들 프롬프트 조립 실패:`, error);
+      return null;
+    }
+  }
+
   private getFallbackPrompt(step: 'basic' | 'personality' | 'aptitude' | 'fortune'): string {
     const pillars = this.context.intermediateResults.manseryeok?.pillars;
     if (!pillars) {
@@ -519,6 +609,29 @@ export function createAnalysisPipeline(options?: PipelineOptions): AnalysisPipel
   return new AnalysisPipeline(options);
 }
 
+/**
+ * 번들 자리표시자({{basicAnalysis.dayMaster.stem}} 등)를 이전 단계 결과 값으로 치환
+ * 값이 없으면 '?' (단계별 API와 동일)
+ */
+function fillPreviousResults(
+  prompt: string,
+  placeholders: string[],
+  previousResults: Record<string, unknown>
+): string {
+  return placeholders.reduce((text, placeholder) => {
+    const value = placeholder
+      .slice(2, -2)
+      .split('.')
+      .reduce<unknown>(
+        (node, key) =>
+          node && typeof node === 'object' ? (node as Record<string, unknown>)[key] : undefined,
+        previousResults
+      );
+    const replacement = value === undefined || value === null || value === '' ? '?' : String(value);
+    return text.split(placeholder).join(replacement);
+  }, prompt);
+}
+
 // 타입 및 유틸리티 re-export
 export { PipelineContext } from './context';
 export { StepExecutor } from './step-executor';
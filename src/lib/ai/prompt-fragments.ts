@@ -0,0 +1,42 @@
+/**
+ * 시스템 프롬프트 조각 조회 (v2.10)
+ * reference 모드 응답의 조각 참조를 본문으로 변환
+ */
+
+/**
+ * 시스템 프롬프트 조각 참조 (Python API PromptFragmentRef)
+ */
+export interface PromptFragmentRef {
+  id: string;
+  hash: string;
+  size: number;
+}
+
+/**
+ * 시스템 프롬프트 조각 캐시 (내용 해시 → 본문)
+ * 조각은 해시로 주소가 정해지므로 만료 없이 재사용
+ */
+const fragmentCache = new Map<string, string>();
+
+/**
+ * 조각 본문 조회 (캐시에 없을 때만 /api/prompts/fragments/{hash}에서 1회 조회)
+ * 실패 시 null 반환
+ */
+export async function fetchPromptFragment(
+  pythonApiUrl: string,
+  ref: PromptFragmentRef
+): Promise<string | null> {
+  const cached = fragmentCache.get(ref.hash);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  const response = await fetch(`${pythonApiUrl}/api/prompts/fragments/${ref.hash}`);
+  if (!response.ok) {
+    console.warn(`[PromptFragments] 프롬프트 조각 조회 실패 (${ref.id})`);
+    return null;
+  }
+  const text = await response.text();
+  fragmentCache.set(ref.hash, text);
+  return text;
+}
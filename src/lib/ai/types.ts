@@ -628,3 +628,20 @@ export interface StepPromptResponse {
     generatedAt: string;
   };
 }
+
+/**
+ * 멀티스텝 전체 단계 프롬프트 일괄 응답 (Python API, v2.10)
+ * userPrompt의 placeholders({{basicAnalysis.dayMaster.stem}} 등)는 basic 결과 값으로 치환
+ */
+export interface StepBundleResponse {
+  steps: Record<
+    string,
+    Omit<StepPromptResponse, 'systemPrompt'> & {
+      systemPrompt?: string | null;
+      systemPromptRef?: { id: string; hash: string; size: number } | null;
+    }
+  >;
+  placeholders: string[];
+  language: string;
+  generatedAt: string;
+}